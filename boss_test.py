@@ -54,8 +54,8 @@ def boss(name, diffFunction):
         print("*** " + name + " ***")
         for presetName, diffPreset in Settings.bossesDifficultyPresets[name].items():
             print("** Diff preset :" + presetName)
-            Settings.bossesDifficulty[name] = diffPreset
-            print(str(Settings.bossesDifficulty[name]))
+            sm.ctx.bossesDifficulty[name] = diffPreset
+            print(str(sm.ctx.bossesDifficulty[name]))
             for setName, itemSet in itemSets[name].items():
                 print('* Item set ' + setName)
                 #        print(str(itemSet))
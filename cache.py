@@ -1,24 +1,115 @@
 # the caching decorator for helpers functions
 
-class Cache:
-    cache = {}
+from collections import OrderedDict
 
-    @staticmethod
-    def reset():
-        Cache.cache = {}
+class Cache(object):
+    # helpers results, keyed on (function name, state key).
+    # the state key is a snapshot of the inventory (items, counts, active
+    # patches, dead bosses) given by the SMBoolManager, so results computed
+    # for an inventory are reused when the same inventory comes back (which
+    # happens all the time with the add/eval/remove cycles of the randomizer).
+    #
+    # the size is bounded using two generations: new results go in 'cache',
+    # when it's full it becomes 'old' and the previous 'old' is dropped.
+    # results found in 'old' are moved back in 'cache', so the least recently
+    # used results are the ones evicted.
+    #
+    # each logic context has its own cache (see LogicContext).
+
+    # max number of results in a generation
+    maxSize = 20000
+
+    # number of previous presets whose results are kept
+    maxPresets = 4
+
+    def __init__(self):
+        self.cache = {}
+        self.old = {}
+
+        # stats
+        self.hits = 0
+        self.misses = 0
+
+        # incremented at each reset, for the other caches depending on the
+        # knows/settings (see AccessGraph reachability checkpoints)
+        self.version = 0
+
+        # the results of the last presets loaded, to reuse them when switching back
+        # to a preset: {preset key: (cache, old)}, least recently used first
+        self.presets = OrderedDict()
+        # key of the preset the current results are for, None if unknown
+        self.presetKey = None
+
+    def reset(self):
+        # to call when the knows/settings change, as they're not part of the key
+        self.cache = {}
+        self.old = {}
+        self.presetKey = None
+        self.version += 1
+
+    def switch(self, presetKey):
+        # to call when a preset setting all the knows/settings is loaded
+        if presetKey == self.presetKey:
+            return
+        if self.presetKey is not None:
+            self.presets[self.presetKey] = (self.cache, self.old)
+            if len(self.presets) > Cache.maxPresets:
+                self.presets.popitem(last=False)
+        (self.cache, self.old) = self.presets.pop(presetKey, ({}, {}))
+        self.presetKey = presetKey
+        # the other caches are not kept per preset
+        self.version += 1
+
+    def resetStats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self.cache) + len(self.old),
+            'hitRate': float(self.hits)/total if total > 0 else 0.0
+        }
+
+    def get(self, key):
+        # return None if the key is not in the cache
+        ret = self.cache.get(key)
+        if ret is None:
+            ret = self.old.pop(key, None)
+            if ret is None:
+                self.misses += 1
+                return None
+            self.add(key, ret)
+        self.hits += 1
+        return ret
+
+    def add(self, key, value):
+        if len(self.cache) >= Cache.maxSize:
+            self.old = self.cache
+            self.cache = {}
+        self.cache[key] = value
 
     @staticmethod
     def decorator(func):
+        name = func.__name__
         def _decorator(self):
-            if func.__name__ in Cache.cache:
-#                print("cache found for {}: {}".format(func.__name__, Cache.cache[func.__name__]))
-#                ret = func(self)
-#                if ret != Cache.cache[func.__name__]:
-#                    print("ERROR: cache ({}) != current ({}) for {}".format(Cache.cache[func.__name__], ret, func.__name__))
-                return Cache.cache[func.__name__]
+            cache = self.smbm.ctx.cache
+            key = (name, self.smbm.getStateKey())
+            # helpers never return None
+            ret = cache.cache.get(key)
+            if ret is None:
+                ret = cache.old.pop(key, None)
+                if ret is None:
+                    cache.misses += 1
+                    ret = func(self)
+                else:
+                    cache.hits += 1
+                cache.add(key, ret)
             else:
-                ret = func(self)
-                Cache.cache[func.__name__] = ret
-#                print("cache added for {}: {}".format(func.__name__, Cache.cache[func.__name__]))
-                return ret
+                cache.hits += 1
+            return ret
+        _decorator.__name__ = name
+        _decorator.cached = True
         return _decorator
@@ -61,6 +61,7 @@ class DB:
             self.dbAvailable = False
 
     def addSolverResult(self, id, returnCode, duration, result):
+        # duration is None for the results from the solver cache
         if self.dbAvailable == False:
             return
 
@@ -70,6 +71,11 @@ class DB:
             else:
                 return len(var)
 
+        if duration == None:
+            durationSql = 'null'
+        else:
+            durationSql = '%f' % duration
+
         try:
             if returnCode == 0:
                 sql = "insert into solver_collected_items values (%d, '%s', %d);"
@@ -77,9 +83,9 @@ class DB:
                     if count > 0:
                         self.cursor.execute(sql % (id, item, count))
 
-                sql = "insert into solver_result values (%d, %d, %f, %d, %d, %d, %s, %d, %d, %d, %d, %d);" % (id, returnCode, duration, result['difficulty'], result['knowsUsed'][0], result['knowsUsed'][1], result['itemsOk'], lenNone(result['remainTry']), lenNone(result['remainMajors']), lenNone(result['remainMinors']), lenNone(result['skippedMajors']), lenNone(result['unavailMajors']))
+                sql = "insert into solver_result values (%d, %d, %s, %d, %d, %d, %s, %d, %d, %d, %d, %d);" % (id, returnCode, durationSql, result['difficulty'], result['knowsUsed'][0], result['knowsUsed'][1], result['itemsOk'], lenNone(result['remainTry']), lenNone(result['remainMajors']), lenNone(result['remainMinors']), lenNone(result['skippedMajors']), lenNone(result['unavailMajors']))
             else:
-                sql = "insert into solver_result (solver_id, return_code, duration) values (%d, %d, %f);" % (id, returnCode, duration)
+                sql = "insert into solver_result (solver_id, return_code, duration) values (%d, %d, %s);" % (id, returnCode, durationSql)
 
             self.cursor.execute(sql)
         except Exception as e:
@@ -235,7 +241,8 @@ class DB:
         return self.execSelect(sql, (weeks,))
 
     def getSolverDurations(self, weeks):
-        sql = "select s.action_time, sr.duration from solver s join solver_result sr on s.id = sr.solver_id where s.action_time > DATE_SUB(CURDATE(), INTERVAL %d WEEK) order by 1;"
+        # without the results from the solver cache
+        sql = "select s.action_time, sr.duration from solver s join solver_result sr on s.id = sr.solver_id where s.action_time > DATE_SUB(CURDATE(), INTERVAL %d WEEK) and sr.duration is not null order by 1;"
         return self.execSelect(sql, (weeks,))
 
     def getRandomizerPresets(self, weeks):
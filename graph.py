@@ -1,9 +1,10 @@
 #!/usr/bin/python
 
 import copy
-from smbool import SMBool
+from smbool import SMBool, smboolTrue
 from rom import RomPatches
 from parameters import infinity
+from smboolmanager import SMBoolManager
 import log
 
 class AccessPoint(object):
@@ -18,7 +19,7 @@ class AccessPoint(object):
     # shortName : short name for the credits
     # internal : if true, shall not be used for connecting areas
     def __init__(self, name, graphArea, transitions,
-                 traverse=lambda sm: SMBool(True),
+                 traverse=lambda sm: smboolTrue,
                  exitInfo=None, entryInfo=None, roomInfo=None, shortName=None, internal=False):
         self.Name = name
         self.GraphArea = graphArea
@@ -50,12 +51,19 @@ class AccessPoint(object):
             raise RuntimeError("Cannot add an internal access point as inter-are transition")
 
 class AccessGraph(object):
+    # max number of reachability checkpoints for each (root, maxDiff)
+    maxCheckpoints = 16
+
     def __init__(self, accessPointList, transitions, bidir=True, dotFile=None):
         self.log = log.get('Graph')
 
         self.accessPoints = {}
         self.InterAreaTransitions = []
         self.bidir = bidir
+        # reachability checkpoints, see getReachableAccessPoints
+        self.checkpoints = {}
+        # {dst name: [src names]}, see getReverseTransitions
+        self.reverseTransitions = None
         for ap in accessPointList:
             ap.distance = 0
             self.accessPoints[ap.Name] = ap
@@ -143,6 +151,8 @@ class AccessGraph(object):
         src = self.accessPoints[srcName]
         dst = self.accessPoints[dstName]
         src.connect(dstName)
+        self.checkpoints = {}
+        self.reverseTransitions = None
         self.InterAreaTransitions.append((src, dst))
         if both is True:
             self.addTransition(dstName, srcName, False)
@@ -233,7 +243,8 @@ class AccessGraph(object):
     # maxDiff: difficulty limit
     # rootNode: starting AccessPoint
     # return available locations list, also stores difficulty in locations
-    def getAvailableLocations(self, locations, smbm, maxDiff, rootNode='Landing Site'):
+    # rulesCache: optional, to reuse the locations rules results (see solver LocationsRulesCache)
+    def getAvailableLocations(self, locations, smbm, maxDiff, rootNode='Landing Site', rulesCache=None):
         rootAp = self.accessPoints[rootNode]
         availAccessPoints = self.getAvailableAccessPoints(rootAp, smbm, maxDiff)
         availAreas = set([ap.GraphArea for ap in availAccessPoints.keys()])
@@ -266,11 +277,17 @@ class AccessGraph(object):
 
                 tFunc = loc['AccessFrom'][apName]
                 ap = self.accessPoints[apName]
-                tdiff = smbm.eval(tFunc)
+                if rulesCache is None:
+                    tdiff = smbm.eval(tFunc)
+                else:
+                    tdiff = rulesCache.eval(loc, apName, tFunc)
                 #if loc['Name'] == "Right Super, Wrecked Ship":
                 #    print("{} root: {} ap: {}".format(loc['Name'], rootNode, apName))
                 if tdiff.bool == True and tdiff.difficulty <= maxDiff:
-                    diff = smbm.eval(loc['Available'])
+                    if rulesCache is None:
+                        diff = smbm.eval(loc['Available'])
+                    else:
+                        diff = rulesCache.eval(loc, 'Available', loc['Available'])
                     path = availAPPaths[apName]["path"]
                     #if loc['Name'] == "Right Super, Wrecked Ship":
                     #    print("{} path: {}".format(loc['Name'], [a.Name for a in path]))
@@ -306,16 +323,124 @@ class AccessGraph(object):
         #print("availableLocs: {}".format([loc["Name"] for loc in availLocs]))
         return availLocs
 
+    # rootNode: starting AccessPoint instance
+    # maxDiff: difficulty limit
+    # reverse: if true, get the access points from which rootNode is reachable
+    # return the set of the names of the reachable access points.
+    # unlike getAvailableAccessPoints it doesn't compute the paths, and it's
+    # incremental: for each (root, maxDiff) the reachable access points and
+    # the transitions which were not passable are kept for the last smbm
+    # states (the checkpoints). as adding items or killing bosses can only
+    # open transitions, when the current state has more items than a
+    # checkpoint we start from the checkpoint and only check again its
+    # blocked transitions. going back to a previous state (removeItem,
+    # randomizer rollback) reuses its checkpoint if it's still there.
+    def getReachableAccessPoints(self, rootNode, smbm, maxDiff, reverse=False):
+        (state, reachable, blocked) = self.getCheckpoint(rootNode, smbm, maxDiff, reverse)
+        return reachable
+
+    # return [(src name, dst name)]: the transitions from the reachable
+    # access points to the not reachable ones which are not passable
+    def getBlockedTransitions(self, rootNode, smbm, maxDiff):
+        (state, reachable, blocked) = self.getCheckpoint(rootNode, smbm, maxDiff)
+        return [(srcName, dstName) for (srcName, dstName) in blocked if dstName not in reachable]
+
+    def getCheckpoint(self, rootNode, smbm, maxDiff, reverse=False):
+        state = smbm.getStateKey()
+        key = (rootNode.Name, maxDiff, reverse, smbm.ctx, smbm.ctx.cache.version)
+        if key not in self.checkpoints:
+            # the checkpoints of the previous knows/settings of the context
+            # can't be used any more
+            for oldKey in [oldKey for oldKey in self.checkpoints if oldKey[3] is key[3] and oldKey[4] != key[4]]:
+                del self.checkpoints[oldKey]
+            self.checkpoints[key] = []
+        checkpoints = self.checkpoints[key]
+
+        base = None
+        for checkpoint in checkpoints:
+            (cpState, cpReachable, cpBlocked) = checkpoint
+            if cpState == state:
+                # move it at the end, the first ones are evicted
+                checkpoints.remove(checkpoint)
+                checkpoints.append(checkpoint)
+                return checkpoint
+            if SMBoolManager.isSubState(cpState, state) and (base is None or len(cpReachable) > len(base[1])):
+                base = checkpoint
+
+        # the transitions from (or to, in reverse) an access point
+        if reverse == False:
+            getTransitions = lambda name: [(name, dstName) for dstName in self.accessPoints[name].transitions]
+        else:
+            reverseTransitions = self.getReverseTransitions()
+            getTransitions = lambda name: [(srcName, name) for srcName in reverseTransitions.get(name, [])]
+
+        if base is None:
+            reachable = set([rootNode.Name])
+            toCheck = getTransitions(rootNode.Name)
+        else:
+            reachable = set(base[1])
+            toCheck = base[2]
+        blocked = []
+
+        while len(toCheck) > 0:
+            newToCheck = []
+            for (srcName, dstName) in toCheck:
+                newName = srcName if reverse == True else dstName
+                if newName in reachable:
+                    continue
+                diff = smbm.eval(self.accessPoints[srcName].transitions[dstName])
+                if diff.bool == True and diff.difficulty <= maxDiff:
+                    reachable.add(newName)
+                    newToCheck += getTransitions(newName)
+                else:
+                    blocked.append((srcName, dstName))
+            toCheck = newToCheck
+
+        checkpoint = (state, reachable, blocked)
+        checkpoints.append(checkpoint)
+        if len(checkpoints) > self.maxCheckpoints:
+            checkpoints.pop(0)
+
+        return checkpoint
+
+    def getReverseTransitions(self):
+        if self.reverseTransitions is None:
+            self.reverseTransitions = {}
+            for ap in self.accessPoints.values():
+                for dstName in ap.transitions:
+                    if dstName not in self.reverseTransitions:
+                        self.reverseTransitions[dstName] = []
+                    self.reverseTransitions[dstName].append(ap.Name)
+        return self.reverseTransitions
+
+    # destAccessPointName: access point to reach
+    # maxDiff: difficulty limit
+    # items: list of items to test (None for no item)
+    # return a dict {item: set of the names of the access points from which
+    # destAccessPointName is reachable with the item}.
+    # it's canAccess for all the source access points at once: one reverse
+    # search from the destination for each item, each one starting from the
+    # search without item.
+    def getAccessPointsReaching(self, smbm, destAccessPointName, maxDiff, items):
+        destAccessPoint = self.accessPoints[destAccessPointName]
+        ret = {}
+        # checkpoint without the items
+        ret[None] = self.getReachableAccessPoints(destAccessPoint, smbm, maxDiff, reverse=True)
+        for item in items:
+            if item is None:
+                continue
+            smbm.addItem(item)
+            ret[item] = self.getReachableAccessPoints(destAccessPoint, smbm, maxDiff, reverse=True)
+            smbm.removeItem(item)
+        return ret
+
     # test access from an access point to another, given an optional item
     def canAccess(self, smbm, srcAccessPointName, destAccessPointName, maxDiff, item=None):
         if item is not None:
             smbm.addItem(item)
         #print("canAccess: item: {}, src: {}, dest: {}".format(item, srcAccessPointName, destAccessPointName))
-        destAccessPoint = self.accessPoints[destAccessPointName]
         srcAccessPoint = self.accessPoints[srcAccessPointName]
-        availAccessPoints = self.getAvailableAccessPoints(srcAccessPoint, smbm, maxDiff)
-        can = destAccessPoint in availAccessPoints
-        #self.log.debug("canAccess: avail = {}".format([ap.Name for ap in availAccessPoints.keys()]))
+        can = destAccessPointName in self.getReachableAccessPoints(srcAccessPoint, smbm, maxDiff)
         if item is not None:
             smbm.removeItem(item)
         #print("canAccess: {}".format(can))
@@ -1,7 +1,7 @@
 from parameters import Knows, Settings, easy, medium, hard, harder, hardcore, mania
 from helpers import Bosses
 from rom import RomPatches
-from smbool import SMBool
+from smbool import smboolTrue
 
 # all the items locations with the prerequisites to access them
 locations = [
@@ -17,7 +17,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Gauntlet Energy Tank Room',
     'AccessFrom' : {
-        'Landing Site': lambda sm: SMBool(True)
+        'Landing Site': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wor(sm.canEnterAndLeaveGauntlet(),
                                    sm.wand(sm.haveItem('SpeedBooster'),
@@ -35,7 +35,7 @@ locations = [
     'Visibility': "Chozo",
     'Room': 'Bomb Torizo Room',
     'AccessFrom' : {
-        'Landing Site': lambda sm: SMBool(True)
+        'Landing Site': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.haveItem('Morph'),
                                     sm.canOpenRedDoors()),
@@ -53,9 +53,9 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Terminator Room',
     'AccessFrom' : {
-        'Lower Mushrooms Left': lambda sm: SMBool(True)
+        'Lower Mushrooms Left': lambda sm: smboolTrue
     },
-    'Available': lambda sm: SMBool(True)
+    'Available': lambda sm: smboolTrue
 },
 {
     'Area': "Brinstar",
@@ -68,7 +68,7 @@ locations = [
     'Visibility': "Chozo",
     'Room': 'Brinstar Reserve Tank Room',
     'AccessFrom' : {
-        'Green Brinstar Elevator Right': lambda sm: SMBool(True)
+        'Green Brinstar Elevator Right': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.canOpenRedDoors(),
                                     sm.wor(sm.wand(sm.knowsMockball(),
@@ -86,7 +86,7 @@ locations = [
     'Visibility': "Chozo",
     'Room': 'Big Pink',
     'AccessFrom' : {
-        'Big Pink': lambda sm: SMBool(True)
+        'Big Pink': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.canPassBombPassages()
 },
@@ -101,9 +101,9 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Morph Ball Room',
     'AccessFrom' : {
-        'Landing Site': lambda sm: SMBool(True)
+        'Landing Site': lambda sm: smboolTrue
     },
-    'Available': lambda sm: SMBool(True)
+    'Available': lambda sm: smboolTrue
 },
 {
     'Area': "Brinstar",
@@ -141,7 +141,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Etecoon Energy Tank Room',
     'AccessFrom' : {
-        'Green Brinstar Elevator Right': lambda sm: SMBool(True)
+        'Green Brinstar Elevator Right': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.canAccessEtecoons(),
     'PostAvailable': lambda sm: sm.canUsePowerBombs()
@@ -157,7 +157,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Waterway Energy Tank Room',
     'AccessFrom' : {
-        'Big Pink': lambda sm: SMBool(True)
+        'Big Pink': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.canUsePowerBombs(),
                                     sm.canOpenRedDoors(),
@@ -177,7 +177,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Hopper Energy Tank Room',
     'AccessFrom' : {
-        'Big Pink': lambda sm: SMBool(True)
+        'Big Pink': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.canUsePowerBombs(),
                                     sm.wor(sm.haveItem('Wave'),
@@ -198,7 +198,7 @@ locations = [
     'Visibility': "Chozo",
     'Room': 'X-Ray Scope Room',
     'AccessFrom' : {
-        'Red Tower Top Left': lambda sm: SMBool(True)
+        'Red Tower Top Left': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.canUsePowerBombs(),
                                     sm.wor(sm.haveItem('Grapple'),
@@ -220,7 +220,7 @@ locations = [
     'Visibility': "Chozo",
     'Room': 'Spazer Room',
     'AccessFrom' : {
-        'East Tunnel Right': lambda sm: SMBool(True)
+        'East Tunnel Right': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.canOpenGreenDoors(),
                                     sm.wor(sm.canPassBombPassages(),
@@ -237,7 +237,7 @@ locations = [
     'Visibility': "Hidden",
     'Room': 'Warehouse Energy Tank Room',
     'AccessFrom' : {
-        'Warehouse Zeela Room Left': lambda sm: SMBool(True)
+        'Warehouse Zeela Room Left': lambda sm: smboolTrue
     },
     'Available': lambda sm: Bosses.bossDead('Kraid')
 },
@@ -252,7 +252,7 @@ locations = [
     'Visibility': "Chozo",
     'Room': 'Varia Suit Room',
     'AccessFrom' : {
-        'Warehouse Zeela Room Left': lambda sm: SMBool(True)
+        'Warehouse Zeela Room Left': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.canPassBombPassages(),
                                     sm.enoughStuffsKraid()),
@@ -270,7 +270,7 @@ locations = [
     'Visibility': "Chozo",
     'Room': 'Ice Beam Room',
     'AccessFrom' : {
-        'Warehouse Entrance Left': lambda sm: SMBool(True)
+        'Warehouse Entrance Left': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.canOpenGreenDoors(),
                                     sm.canHellRun('Ice'),
@@ -290,7 +290,7 @@ locations = [
     'Visibility': "Visible",
     'Room': "Crocomire's Room",
     'AccessFrom' : {
-        'Croc Zone': lambda sm: SMBool(True)
+        'Croc Zone': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.enoughStuffCroc(),
                                     sm.wor(sm.haveItem('Grapple'),
@@ -308,7 +308,7 @@ locations = [
     'Visibility': "Chozo",
     'Room': 'Hi Jump Boots Room',
     'AccessFrom' : {
-        'Warehouse Entrance Left': lambda sm: SMBool(True)
+        'Warehouse Entrance Left': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.canOpenRedDoors(), sm.haveItem('Morph')),
     'PostAvailable': lambda sm: sm.wor(sm.canPassBombPassages(),
@@ -325,7 +325,7 @@ locations = [
     'Visibility': "Chozo",
     'Room': 'Grapple Beam Room',
     'AccessFrom' : {
-        'Croc Zone': lambda sm: SMBool(True)
+        'Croc Zone': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.enoughStuffCroc(),
                                     sm.wor(sm.wand(sm.haveItem('Morph'),
@@ -444,7 +444,7 @@ locations = [
         'Lava Dive Right': lambda sm: sm.wand(sm.canHellRun('LowerNorfair'), sm.canPassLavaPit(), sm.canPassWorstRoom()),
         'Three Muskateers Room Left': lambda sm: sm.wand(sm.haveItem('Morph'), sm.canHellRun('LowerNorfair'))
     },
-    'Available': lambda sm: SMBool(True)
+    'Available': lambda sm: smboolTrue
 },
 {
     'Area': "WreckedShip",
@@ -555,8 +555,8 @@ locations = [
     'Visibility': "Chozo",
     'Room': 'Plasma Room',
     'AccessFrom' : { # simple because if draygon is dead, you can get there
-        'Main Street Bottom': lambda sm: SMBool(True), # green gate+toilet
-        'Le Coude Right': lambda sm: SMBool(True)
+        'Main Street Bottom': lambda sm: smboolTrue, # green gate+toilet
+        'Le Coude Right': lambda sm: smboolTrue
     },
     # DONE: to leave the Plasma Beam room you have to kill the space pirates and return to the door
     # to unlock the door:
@@ -708,7 +708,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Crateria Power Bomb Room',
     'AccessFrom' : {
-        'Landing Site': lambda sm: SMBool(True)
+        'Landing Site': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.canUsePowerBombs(),
                                     sm.wor(sm.haveItem('SpeedBooster'),
@@ -725,7 +725,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'West Ocean',
     'AccessFrom' : {
-        'West Ocean Left': lambda sm: SMBool(True)
+        'West Ocean Left': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.canPassBombPassages()
 },
@@ -774,7 +774,7 @@ locations = [
     'AccessFrom' : {
         'Keyhunter Room Bottom': lambda sm: sm.canOpenYellowDoors()
     },
-    'Available': lambda sm: SMBool(True)
+    'Available': lambda sm: smboolTrue
 },
 {
     'Area': "Crateria",
@@ -787,7 +787,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Pit Room',
     'AccessFrom' : {
-        'Landing Site': lambda sm: SMBool(True)
+        'Landing Site': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.canDestroyBombWalls()
 },
@@ -802,7 +802,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Green Pirates Shaft',
     'AccessFrom' : {
-        'Landing Site': lambda sm: SMBool(True)
+        'Landing Site': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.canEnterAndLeaveGauntlet(),
                                     sm.canPassBombPassages())
@@ -818,7 +818,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Green Pirates Shaft',
     'AccessFrom' : {
-        'Landing Site': lambda sm: SMBool(True)
+        'Landing Site': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.canEnterAndLeaveGauntlet(),
                                     sm.canPassBombPassages())
@@ -834,7 +834,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Crateria Super Room',
     'AccessFrom' : {
-        'Landing Site': lambda sm: SMBool(True)
+        'Landing Site': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.canUsePowerBombs(),
                                     sm.haveItem('SpeedBooster'),
@@ -854,7 +854,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'The Final Missile',
     'AccessFrom' : {
-        'Landing Site': lambda sm: SMBool(True)
+        'Landing Site': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.canPassBombPassages()
 },
@@ -869,7 +869,7 @@ locations = [
     'Visibility': "Chozo",
     'Room': 'Green Brinstar Main Shaft',
     'AccessFrom' : {
-        'Green Brinstar Elevator Right': lambda sm: SMBool(True)
+        'Green Brinstar Elevator Right': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.canAccessEtecoons(),
     'PostAvailable': lambda sm: sm.canUsePowerBombs()
@@ -885,7 +885,7 @@ locations = [
     'Visibility': "Chozo",
     'Room': 'Spore Spawn Super Room',
     'AccessFrom' : {
-        'Big Pink': lambda sm: SMBool(True)
+        'Big Pink': lambda sm: smboolTrue
     },
     # either you go the back way, using a super and the camera glitch,
     # or just beat spore spawn (so no sm.knows() setting needed for the glitch)
@@ -904,7 +904,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Early Supers Room',
     'AccessFrom' : {
-        'Green Brinstar Elevator Right': lambda sm: SMBool(True)
+        'Green Brinstar Elevator Right': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.canOpenRedDoors(),
     'PostAvailable': lambda sm: sm.wor(sm.canPassBombPassages(),
@@ -921,7 +921,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Early Supers Room',
     'AccessFrom' : {
-        'Green Brinstar Elevator Right': lambda sm: SMBool(True)
+        'Green Brinstar Elevator Right': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.canOpenRedDoors(),
                                     sm.wor(sm.wand(sm.haveItem('Morph'), sm.knowsMockball()),
@@ -938,7 +938,7 @@ locations = [
     'Visibility': "Hidden",
     'Room': 'Brinstar Reserve Tank Room',
     'AccessFrom' : {
-        'Green Brinstar Elevator Right': lambda sm: SMBool(True)
+        'Green Brinstar Elevator Right': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.haveItem('Morph'),
                                     sm.wor(sm.knowsMockball(),
@@ -959,7 +959,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Brinstar Reserve Tank Room',
     'AccessFrom' : {
-        'Green Brinstar Elevator Right': lambda sm: SMBool(True)
+        'Green Brinstar Elevator Right': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.canOpenRedDoors(),
                                     sm.haveItem('Morph'),
@@ -977,9 +977,9 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Big Pink',
     'AccessFrom' : {
-        'Big Pink': lambda sm: SMBool(True)
+        'Big Pink': lambda sm: smboolTrue
     },
-    'Available': lambda sm: SMBool(True)
+    'Available': lambda sm: smboolTrue
 },
 {
     'Area': "Brinstar",
@@ -992,9 +992,9 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Big Pink',
     'AccessFrom' : {
-        'Big Pink': lambda sm: SMBool(True)
+        'Big Pink': lambda sm: smboolTrue
     },
-    'Available': lambda sm: SMBool(True)
+    'Available': lambda sm: smboolTrue
 },
 {
     'Area': "Brinstar",
@@ -1007,7 +1007,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Pink Brinstar Power Bomb Room',
     'AccessFrom' : {
-        'Big Pink': lambda sm: SMBool(True)
+        'Big Pink': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.canUsePowerBombs(),
                                     sm.haveItem('Super'))
@@ -1023,7 +1023,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Green Hill Zone',
     'AccessFrom' : {
-        'Green Hill Zone Top Right': lambda sm: SMBool(True)
+        'Green Hill Zone Top Right': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.haveItem('Morph')
 },
@@ -1038,7 +1038,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Morph Ball Room',
     'AccessFrom' : {
-        'Landing Site': lambda sm: SMBool(True)
+        'Landing Site': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.canUsePowerBombs()
 },
@@ -1053,7 +1053,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Blue Brinstar Energy Tank Room',
     'AccessFrom' : {
-        'Landing Site': lambda sm: SMBool(True)
+        'Landing Site': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.wor(sm.haveItem('Morph'), RomPatches.has(RomPatches.BlueBrinstarMissile)),
                                     sm.wor(sm.canOpenRedDoors(),
@@ -1086,7 +1086,7 @@ locations = [
     'Visibility': "Chozo",
     'Room': 'First Missile Room',
     'AccessFrom' : {
-        'Landing Site': lambda sm: SMBool(True)
+        'Landing Site': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.haveItem('Morph')
 },
@@ -1101,7 +1101,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Billy Mays Room',
     'AccessFrom' : {
-        'Landing Site': lambda sm: SMBool(True)
+        'Landing Site': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.canUsePowerBombs()
 },
@@ -1116,7 +1116,7 @@ locations = [
     'Visibility': "Hidden",
     'Room': 'Billy Mays Room',
     'AccessFrom' : {
-        'Landing Site': lambda sm: SMBool(True)
+        'Landing Site': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.canUsePowerBombs()
 },
@@ -1131,7 +1131,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Beta Power Bomb Room',
     'AccessFrom' : {
-        'Red Brinstar Elevator': lambda sm: SMBool(True)
+        'Red Brinstar Elevator': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.canOpenGreenDoors(),
                                     sm.canUsePowerBombs())
@@ -1147,7 +1147,7 @@ locations = [
     'Visibility': "Chozo",
     'Room': 'Alpha Power Bomb Room',
     'AccessFrom' : {
-        'Red Brinstar Elevator': lambda sm: SMBool(True)
+        'Red Brinstar Elevator': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.canOpenGreenDoors()
 },
@@ -1162,7 +1162,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Alpha Power Bomb Room',
     'AccessFrom' : {
-        'Red Brinstar Elevator': lambda sm: SMBool(True)
+        'Red Brinstar Elevator': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.canOpenGreenDoors(),
                                     sm.canUsePowerBombs())
@@ -1178,7 +1178,7 @@ locations = [
     'Visibility': "Hidden",
     'Room': 'Warehouse Keyhunter Room',
     'AccessFrom' : {
-        'Warehouse Zeela Room Left': lambda sm: SMBool(True)
+        'Warehouse Zeela Room Left': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.canUsePowerBombs()
 },
@@ -1209,7 +1209,7 @@ locations = [
     'Visibility': "Hidden",
     'Room': 'Crumble Shaft',
     'AccessFrom' : {
-        'Warehouse Entrance Left': lambda sm: SMBool(True)
+        'Warehouse Entrance Left': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.canOpenGreenDoors(),
                                     sm.canUsePowerBombs(),
@@ -1241,7 +1241,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Hi Jump Energy Tank Room',
     'AccessFrom' : {
-        'Warehouse Entrance Left': lambda sm: SMBool(True)
+        'Warehouse Entrance Left': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.canOpenRedDoors(), sm.haveItem('Morph')),
     'PostAvailable': lambda sm: sm.wor(sm.canPassBombPassages(),
@@ -1258,7 +1258,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Hi Jump Energy Tank Room',
     'AccessFrom' : {
-        'Warehouse Entrance Left': lambda sm: SMBool(True)
+        'Warehouse Entrance Left': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.canOpenRedDoors()
 },
@@ -1295,7 +1295,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Post Crocomire Missile Room',
     'AccessFrom' : {
-        'Croc Zone': lambda sm: SMBool(True)
+        'Croc Zone': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.canOpenRedDoors(), sm.enoughStuffCroc(), sm.haveItem('Morph'))
 },
@@ -1310,7 +1310,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Post Crocomire Jump Room',
     'AccessFrom' : {
-        'Croc Zone': lambda sm: SMBool(True)
+        'Croc Zone': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.enoughStuffCroc(),
                                     sm.wor(sm.wor(sm.wand(sm.haveItem('Morph'), # from below
@@ -1367,9 +1367,9 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Bubble Mountain',
     'AccessFrom' : {
-        'Bubble Mountain': lambda sm: SMBool(True)
+        'Bubble Mountain': lambda sm: smboolTrue
     },
-    'Available': lambda sm: SMBool(True)
+    'Available': lambda sm: smboolTrue
 },
 {
     'Area': "Norfair",
@@ -1599,7 +1599,7 @@ locations = [
     'Visibility': "Visible",
     'Room': 'Main Street',
     'AccessFrom' : {
-        'Main Street Bottom': lambda sm: SMBool(True)
+        'Main Street Bottom': lambda sm: smboolTrue
     },
     'Available': lambda sm: sm.wand(sm.haveItem('Gravity'),
                                     sm.haveItem('SpeedBooster'),
@@ -1682,7 +1682,7 @@ locations = [
     'AccessFrom' : {
         'Main Street Bottom': lambda sm: sm.canPassMtEverest()
     },
-    'Available': lambda sm: SMBool(True)
+    'Available': lambda sm: smboolTrue
 },
 {
     'Area': "Maridia",
@@ -1778,6 +1778,6 @@ locations = [
     'AccessFrom' : {
         'Main Street Bottom': lambda sm: sm.canAccessDraygonFromMainStreet()
     },
-    'Available': lambda sm: SMBool(True)
+    'Available': lambda sm: smboolTrue
 }
 ]
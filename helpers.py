@@ -1,9 +1,10 @@
 
 import math
-from smbool import SMBool
+from smbool import SMBool, smboolFalse
 from rom import RomPatches
 from parameters import Settings, easy, medium, hard, harder, hardcore, mania, diff2text
 from cache import Cache
+from logic_context import getContext
 
 class Helpers(object):
     def __init__(self, smbm):
@@ -20,7 +21,7 @@ class Helpers(object):
 
     def energyReserveCountOkDiff(self, difficulties, mult=1.0):
         if difficulties is None or len(difficulties) == 0:
-            return SMBool(False)
+            return smboolFalse
         def f(difficulty):
             return self.smbm.energyReserveCountOk(difficulty[0] / mult, difficulty=difficulty[1])
         result = reduce(lambda result, difficulty: self.smbm.wor(result, f(difficulty)),
@@ -28,11 +29,11 @@ class Helpers(object):
         return result
 
     def energyReserveCountOkHellRun(self, hellRunName, mult=1.0):
-        difficulties = Settings.hellRuns[hellRunName]
+        difficulties = self.smbm.ctx.hellRuns[hellRunName]
         result = self.energyReserveCountOkDiff(difficulties, mult)
 
         if result == True:
-            result.knows = [hellRunName+'HellRun']
+            result = SMBool(True, result.difficulty, [hellRunName+'HellRun'], result.items)
         return result
 
     # gives damage reduction factor with the current suits
@@ -59,12 +60,12 @@ class Helpers(object):
 
     # higher values for mult means room is that much "easier" (HP mult)
     def energyReserveCountOkHardRoom(self, roomName, mult=1.0):
-        difficulties = Settings.hardRooms[roomName]
+        difficulties = self.smbm.ctx.hardRooms[roomName]
         mult *= self.getDmgReduction()
         result = self.energyReserveCountOkDiff(difficulties, mult)
 
         if result == True:
-            result.knows = ['HardRoom-'+roomName]
+            result = SMBool(True, result.difficulty, ['HardRoom-'+roomName], result.items)
         return result
 
     @Cache.decorator
@@ -91,7 +92,7 @@ class Helpers(object):
                               self.canCrystalFlash(int(math.ceil(2/mult))))
                 return ret
         else:
-            return SMBool(False)
+            return smboolFalse
 
     @Cache.decorator
     def canFly(self):
@@ -103,7 +104,7 @@ class Helpers(object):
                      sm.knowsInfiniteBombJump()) == True:
             return sm.knowsInfiniteBombJump()
         else:
-            return SMBool(False)
+            return smboolFalse
 
     @Cache.decorator
     def canFlyDiagonally(self):
@@ -115,7 +116,7 @@ class Helpers(object):
                      sm.knowsDiagonalBombJump()) == True:
             return sm.knowsDiagonalBombJump()
         else:
-            return SMBool(False)
+            return smboolFalse
 
     @Cache.decorator
     def canUseBombs(self):
@@ -400,7 +401,7 @@ class Helpers(object):
         # say croc has ~5000 energy, and ignore its useless drops
         (ammoMargin, secs) = self.canInflictEnoughDamages(5000, givesDrops=False)
         if ammoMargin == 0:
-            return SMBool(False)
+            return smboolFalse
         else:
             return SMBool(True, easy)
 
@@ -409,7 +410,7 @@ class Helpers(object):
         # say botwoon has 5000 energy : it is actually 3000 but account for missed shots
         (ammoMargin, secs) = self.canInflictEnoughDamages(5000, givesDrops=False)
         if ammoMargin == 0:
-            return SMBool(False)
+            return smboolFalse
         else:
             return SMBool(True, easy)
 
@@ -417,13 +418,13 @@ class Helpers(object):
     def enoughStuffsRidley(self):
         (ammoMargin, secs) = self.canInflictEnoughDamages(18000, doubleSuper=True, power=True, givesDrops=False)
         if ammoMargin == 0:
-            return SMBool(False)
+            return smboolFalse
 
         # print('RIDLEY', ammoMargin, secs)
         diff = self.computeBossDifficulty(ammoMargin, secs,
-                                          Settings.bossesDifficulty['Ridley'])
+                                          self.smbm.ctx.bossesDifficulty['Ridley'])
         if diff < 0:
-            return SMBool(False)
+            return smboolFalse
         else:
             return SMBool(True, diff)
 
@@ -432,16 +433,16 @@ class Helpers(object):
         sm = self.smbm
         (ammoMargin, secs) = self.canInflictEnoughDamages(1000)
         if ammoMargin == 0:
-            return SMBool(False)
+            return smboolFalse
         #print('KRAID True ', ammoMargin, secs)
         diff = self.computeBossDifficulty(ammoMargin, secs,
-                                          Settings.bossesDifficulty['Kraid'])
+                                          self.smbm.ctx.bossesDifficulty['Kraid'])
         if diff < 0:
-            return SMBool(False)
+            return smboolFalse
 
         # need missile or super to open the eye door
         if sm.wor(sm.haveItem('Missile'), sm.haveItem('Super')) == False:
-            return SMBool(False)
+            return smboolFalse
         else:
             return SMBool(True, diff)
 
@@ -462,7 +463,7 @@ class Helpers(object):
         # print('DRAY', ammoMargin, secs)
         if ammoMargin > 0:
             diff = self.computeBossDifficulty(ammoMargin, secs,
-                                              Settings.bossesDifficulty['Draygon'])
+                                              self.smbm.ctx.bossesDifficulty['Draygon'])
             if diff < 0:
                 fight = SMBool(False)
             else:
@@ -471,7 +472,7 @@ class Helpers(object):
                 fight.difficulty *= Settings.algoSettings['draygonNoGravityMalus']
             fight.difficulty = self.adjustHealthDropDiff(fight.difficulty)
         else:
-            fight = SMBool(False)
+            fight = smboolFalse
         return sm.wor(fight,
                       sm.wand(sm.knowsDraygonGrappleKill(),
                               sm.haveItem('Grapple')),
@@ -488,12 +489,12 @@ class Helpers(object):
         sm = self.smbm
         (ammoMargin, secs) = self.canInflictEnoughDamages(2500, doubleSuper=True)
         if ammoMargin == 0:
-            return SMBool(False)
+            return smboolFalse
         # print('PHANTOON', ammoMargin, secs)
         difficulty = self.computeBossDifficulty(ammoMargin, secs,
-                                                Settings.bossesDifficulty['Phantoon'])
+                                                self.smbm.ctx.bossesDifficulty['Phantoon'])
         if difficulty < 0:
-            return SMBool(False)
+            return smboolFalse
         hasCharge = sm.haveItem('Charge')
         hasScrew = sm.haveItem('ScrewAttack')
         if hasScrew:
@@ -518,13 +519,13 @@ class Helpers(object):
         # MB1 can't be hit by charge beam
         (ammoMargin, secs) = self.canInflictEnoughDamages(3000, charge=False, givesDrops=False)
         if ammoMargin == 0:
-            return SMBool(False)
+            return smboolFalse
 
         # we actually don't give a shit about MB1 difficulty,
         # since we embark its health in the following calc
         (ammoMargin, secs) = self.canInflictEnoughDamages(18000 + 3000, givesDrops=False)
         if ammoMargin == 0:
-            return SMBool(False)
+            return smboolFalse
 
         # print('MB2', ammoMargin, secs)
         nTanks = sm.energyReserveCount()
@@ -532,15 +533,15 @@ class Helpers(object):
         if sm.haveItem('Varia') == False:
             # "remove" 3 etanks (accounting for rainbow beam damage without varia)
             if nTanks < 6:
-                return SMBool(False, 0)
+                return smboolFalse
             energyDiff = -3
         elif nTanks < 3:
-            return SMBool(False, 0)
+            return smboolFalse
 
-        #print("ammoMargin: {}, secs: {}, settings: {}, energyDiff: {}".format(ammoMargin, secs, Settings.bossesDifficulty['MotherBrain'], energyDiff))
-        diff = self.computeBossDifficulty(ammoMargin, secs, Settings.bossesDifficulty['MotherBrain'], energyDiff)
+        #print("ammoMargin: {}, secs: {}, settings: {}, energyDiff: {}".format(ammoMargin, secs, self.smbm.ctx.bossesDifficulty['MotherBrain'], energyDiff))
+        diff = self.computeBossDifficulty(ammoMargin, secs, self.smbm.ctx.bossesDifficulty['MotherBrain'], energyDiff)
         if diff < 0:
-            return SMBool(False)
+            return smboolFalse
         return SMBool(True, diff)
 
     @Cache.decorator
@@ -659,35 +660,46 @@ class Bosses:
         'WreckedShip Top': 'Phantoon'
     }
 
-    golden4Dead = {
-        'Kraid' : False,
-        'Phantoon' : False,
-        'Draygon' : False,
-        'Ridley' : False
-    }
+    # the dead bosses are in the logic context
+
+    @staticmethod
+    def updateDeadKey(ctx):
+        # the dead bosses, used in the helpers cache key
+        ctx.deadKey = frozenset(boss for boss in ctx.golden4Dead if ctx.golden4Dead[boss] == True)
 
     @staticmethod
     def reset():
-        for boss in Bosses.golden4Dead:
-            Bosses.golden4Dead[boss] = False
+        ctx = getContext()
+        for boss in ctx.golden4Dead:
+            ctx.golden4Dead[boss] = False
+        Bosses.updateDeadKey(ctx)
 
     @staticmethod
     def bossDead(boss):
-        return SMBool(Bosses.golden4Dead[boss], 0)
+        return SMBool(getContext().golden4Dead[boss], 0)
 
     @staticmethod
     def beatBoss(boss):
-        Bosses.golden4Dead[boss] = True
+        ctx = getContext()
+        ctx.golden4Dead[boss] = True
+        Bosses.updateDeadKey(ctx)
 
     @staticmethod
     def unbeatBoss(boss):
-        Bosses.golden4Dead[boss] = False
+        ctx = getContext()
+        ctx.golden4Dead[boss] = False
+        Bosses.updateDeadKey(ctx)
+
+    @staticmethod
+    def deadBosses():
+        golden4Dead = getContext().golden4Dead
+        return [boss for boss in golden4Dead if golden4Dead[boss] == True]
 
     @staticmethod
     def areaBossDead(area):
         if area not in Bosses.areaBosses:
             return True
-        return Bosses.golden4Dead[Bosses.areaBosses[area]]
+        return getContext().golden4Dead[Bosses.areaBosses[area]]
 
     @staticmethod
     def allBossesDead(smbm):
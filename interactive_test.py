@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+# check the interactive solver paths used by the web site item tracker:
+# init, then add a location from the saved state with solver.py (the fallback
+# of each tracker click) and with the solver daemon in a fresh process (the
+# daemon restarted, the web site sends the whole state).
+# both results must be the same state.
+# then add a second location with the daemon after the first one was added
+# by solver.py: the daemon must not use its outdated state.
+#
+# usage: interactive_test.py ROM [PRESET] [LOC] [LOC2]
+
+import sys, os, json, subprocess, tempfile
+
+from solver_daemon import SolverSessions, getStateHash
+from logic_compiler import compileLogic
+
+def callSolver(params):
+    (fd, outFileName) = tempfile.mkstemp()
+    os.close(fd)
+    try:
+        ret = subprocess.call([sys.executable, 'solver.py', '--interactive', '--output', outFileName] + params)
+        if ret != 0:
+            print("solver.py {} failed: {}".format(' '.join(params), ret))
+            sys.exit(1)
+        with open(outFileName) as jsonFile:
+            return json.load(jsonFile)
+    finally:
+        os.remove(outFileName)
+
+def callSolverState(state, action, locName):
+    (fd, stateFileName) = tempfile.mkstemp()
+    with os.fdopen(fd, 'w') as stateFile:
+        json.dump(state, stateFile)
+    try:
+        return callSolver(['--state', stateFileName, '--action', action, '--loc', locName])
+    finally:
+        os.remove(stateFileName)
+
+def callDaemon(sessions, session, state, action, locName):
+    # like the web site: the full state is sent only if the daemon asks for it
+    request = {'session': session, 'action': action, 'loc': locName, 'stateHash': getStateHash(state)}
+    response = sessions.handle(request)
+    if response.get('unknownSession') == True:
+        request['state'] = state
+        response = sessions.handle(request)
+    if 'diff' not in response:
+        print("daemon failed: {}".format(response))
+        sys.exit(1)
+    newState = dict(state)
+    newState.update(response['diff'])
+    return newState
+
+def checkSame(solverState, daemonState):
+    diffKeys = [key for key in solverState if solverState[key] != daemonState.get(key)]
+    if len(diffKeys) > 0:
+        print("solver.py and daemon states differ: {}".format(diffKeys))
+        sys.exit(1)
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("usage: {} ROM [PRESET] [LOC] [LOC2]".format(sys.argv[0]))
+        sys.exit(1)
+    romFileName = sys.argv[1]
+    presetFileName = sys.argv[2] if len(sys.argv) > 2 else 'standard_presets/regular.json'
+    locName = sys.argv[3] if len(sys.argv) > 3 else 'MorphingBall'
+    locName2 = sys.argv[4] if len(sys.argv) > 4 else 'EnergyTankBrinstarCeiling'
+
+    initState = callSolver(['--romFileName', romFileName, '--preset', presetFileName])
+    solverState = callSolverState(initState, 'add', locName)
+
+    compileLogic()
+    sessions = SolverSessions(2)
+    # the daemon doesn't have the session
+    daemonState = callDaemon(sessions, 'test1', initState, 'add', locName)
+    checkSame(solverState, daemonState)
+
+    # the daemon has the session, with the state before the first add
+    sessions.handle({'session': 'test2', 'action': 'get', 'state': initState})
+    solverState2 = callSolverState(solverState, 'add', locName2)
+    daemonState2 = callDaemon(sessions, 'test2', solverState, 'add', locName2)
+    checkSame(solverState2, daemonState2)
+
+    print("OK: {} visited locations".format(len(solverState2['visitedLocations'])))
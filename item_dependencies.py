@@ -0,0 +1,202 @@
+# index of the items each transition and location rule depends on.
+#
+# built by static analysis of the lambdas source and of the helpers they
+# call (Helpers, HelpersGraph, SMBoolManager): the dependencies of a function
+# are the items given to haveItem/itemCount/itemCountOk/haveItemCount and the
+# dependencies of the helpers it calls. it's conservative: when an item
+# function is called with a non constant item, or when a lambda source can't
+# be found, the rule depends on all the items.
+#
+# all the counts of an item are considered, most of the counts checks are
+# computed (ammo for the bosses, energy for the hell runs). the items whose
+# count is used (not only haveItem) are also indexed, for the users which
+# need to know if a rule can change when an item count changes.
+
+import ast, inspect
+
+from smboolmanager import SMBoolManager
+from helpers import Helpers
+from graph_helpers import HelpersGraph
+import log
+
+class ItemDependencies(object):
+    # functions taking an item as first parameter
+    itemFunctions = ['haveItem', 'itemCount', 'itemCountOk', 'haveItemCount']
+    # the ones only checking if the item is collected
+    presenceFunctions = ['haveItem']
+
+    def __init__(self, locations, accessPoints):
+        self.log = log.get('ItemDependencies')
+        self.allItems = frozenset(SMBoolManager.items)
+
+        # direct dependencies and called functions of the helpers
+        self.functions = {}
+        for cls in [Helpers, HelpersGraph, SMBoolManager]:
+            self.parseClass(cls)
+        self.functionsItems = {}
+        self.functionsCountItems = {}
+        self.computeFunctionsItems()
+
+        # {loc name: items} for the Available and AccessFrom rules
+        self.locations = {}
+        # {loc name: items} for the PostAvailable rules
+        self.postLocations = {}
+        # same with only the items whose count is used
+        self.locationsCounts = {}
+        self.postLocationsCounts = {}
+        # {(src ap name, dst ap name): items} for the intra area transitions
+        self.transitions = {}
+        # {ap name: items} for the traverse functions (inter area transitions)
+        self.traverses = {}
+        # parsed lambdas for each source file: {file: {line: [lambda ast]}}
+        self.sources = {}
+
+        for loc in locations:
+            items = set()
+            countItems = set()
+            rules = [loc['AccessFrom'][apName] for apName in loc.get('AccessFrom', {})]
+            if 'Available' in loc:
+                rules.append(loc['Available'])
+            for rule in rules:
+                (ruleItems, ruleCountItems) = self.getRuleDependencies(rule)
+                items |= ruleItems
+                countItems |= ruleCountItems
+            self.locations[loc['Name']] = frozenset(items)
+            self.locationsCounts[loc['Name']] = frozenset(countItems)
+            if 'PostAvailable' in loc:
+                (self.postLocations[loc['Name']], self.postLocationsCounts[loc['Name']]) = self.getRuleDependencies(loc['PostAvailable'])
+
+        for ap in accessPoints:
+            self.traverses[ap.Name] = self.getRuleItems(ap.traverse)
+            for dstName in ap.transitions:
+                self.transitions[(ap.Name, dstName)] = self.getRuleItems(ap.transitions[dstName])
+
+        # reverse index: {item: locations names}
+        self.itemsLocations = dict((item, set()) for item in self.allItems)
+        for (locName, items) in self.locations.items():
+            for item in items:
+                self.itemsLocations[item].add(locName)
+
+    def parseClass(self, cls):
+        tree = ast.parse(inspect.getsource(cls).strip())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.FunctionDef):
+                (items, countItems, calls) = self.parseFunction(node)
+                if node.name not in self.functions:
+                    self.functions[node.name] = (set(), set(), set())
+                # same name in several classes: keep everything
+                self.functions[node.name][0].update(items)
+                self.functions[node.name][1].update(countItems)
+                self.functions[node.name][2].update(calls)
+
+    def parseFunction(self, function):
+        items = set()
+        countItems = set()
+        calls = set()
+        if isinstance(function, ast.FunctionDef) and function.name in self.itemFunctions:
+            # the items are given by the callers
+            return (items, countItems, calls)
+        for node in ast.walk(function):
+            if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr in self.itemFunctions:
+                if len(node.args) > 0 and isinstance(node.args[0], ast.Str) and node.args[0].s in self.allItems:
+                    nodeItems = set([node.args[0].s])
+                else:
+                    nodeItems = self.allItems
+                items |= nodeItems
+                if node.func.attr not in self.presenceFunctions:
+                    countItems |= nodeItems
+            elif isinstance(node, ast.Attribute):
+                # called or given as parameter
+                calls.add(node.attr)
+        return (items, countItems, calls)
+
+    def computeFunctionsItems(self):
+        # items of each helper, including the items of the helpers it calls.
+        # iterate until nothing changes as helpers can call each other.
+        for name in self.functions:
+            self.functionsItems[name] = set(self.functions[name][0])
+            self.functionsCountItems[name] = set(self.functions[name][1])
+        changed = True
+        while changed == True:
+            changed = False
+            for name in self.functions:
+                items = self.functionsItems[name]
+                countItems = self.functionsCountItems[name]
+                for call in self.functions[name][2]:
+                    if call in self.functionsItems and not self.functionsItems[call] <= items:
+                        items |= self.functionsItems[call]
+                        changed = True
+                    if call in self.functionsCountItems and not self.functionsCountItems[call] <= countItems:
+                        countItems |= self.functionsCountItems[call]
+                        changed = True
+
+    def getRuleItems(self, function):
+        return self.getRuleDependencies(function)[0]
+
+    # return (items, items whose count is used)
+    def getRuleDependencies(self, function):
+        try:
+            lambdaAst = self.getLambdaAst(function)
+        except ValueError as e:
+            self.log.debug("{}, depends on all the items".format(e))
+            return (self.allItems, self.allItems)
+        (items, countItems, calls) = self.parseFunction(lambdaAst.body)
+        for call in calls:
+            if call in self.functionsItems:
+                items |= self.functionsItems[call]
+                countItems |= self.functionsCountItems[call]
+        return (frozenset(items), frozenset(countItems))
+
+    def getLambdaAst(self, function):
+        code = getattr(function, '__code__', None)
+        if code is None or function.__name__ != '<lambda>' or function.__closure__ is not None:
+            raise ValueError("{} is not a lambda".format(function))
+
+        fileName = code.co_filename
+        if fileName not in self.sources:
+            lambdas = {}
+            try:
+                tree = ast.parse(inspect.getsource(inspect.getmodule(function)))
+            except (IOError, TypeError):
+                tree = None
+            if tree is not None:
+                for node in ast.walk(tree):
+                    if isinstance(node, ast.Lambda):
+                        if node.lineno not in lambdas:
+                            lambdas[node.lineno] = []
+                        lambdas[node.lineno].append(node)
+            self.sources[fileName] = lambdas
+
+        candidates = self.sources[fileName].get(code.co_firstlineno, [])
+        if len(candidates) != 1:
+            raise ValueError("{} lambdas at {}:{}".format(len(candidates), fileName, code.co_firstlineno))
+        return candidates[0]
+
+    def getTransitionItems(self, srcAp, dstName):
+        if srcAp.ConnectedTo == dstName:
+            # inter area transition, calls the traverse function
+            return self.traverses.get(srcAp.Name, self.allItems)
+        return self.transitions.get((srcAp.Name, dstName), self.allItems)
+
+    # can the item give access to new locations ?
+    # blockedTransitions: [(src AccessPoint, dst ap name)] not passable from the reachable access points
+    # locations: the locations not available
+    def canOpen(self, itemType, blockedTransitions, locations):
+        for (srcAp, dstName) in blockedTransitions:
+            if itemType in self.getTransitionItems(srcAp, dstName):
+                return True
+        for loc in locations:
+            if itemType in self.locations.get(loc['Name'], self.allItems):
+                return True
+        return False
+
+# built once, from the lambdas (before they're replaced by the logic compiler)
+itemDependencies = None
+
+def getItemDependencies():
+    global itemDependencies
+    if itemDependencies is None:
+        from graph_locations import locations
+        from graph_access import accessPoints
+        itemDependencies = ItemDependencies(locations, accessPoints)
+    return itemDependencies
@@ -1,58 +1,170 @@
 import random
 from itemrandomizerweb.Randomizer import Randomizer
 from graph_access import vanillaTransitions, accessPoints
+from smboolmanager import SMBoolManager
+from helpers import Bosses
+import log
 
 def getAccessPoint(apName):
     return next(ap for ap in accessPoints if ap.Name == apName)
 
-def createTransitions(bidir=True):
-    tFrom = []
-    tTo = []
+# fast check of the area layouts, done before building a Randomizer.
+# SuperFunProvider.checkPool needs all the access points to be reachable from
+# the landing site with the item pool and all the bosses dead. the item pool
+# can't have more than all the items (with the max counts), so a layout where
+# an access point can't be reached with them is invalid.
+# the intra area transitions and the traverse functions are evaluated once
+# with all the items, then each layout is checked with a reachability on
+# bitsets of the access points.
+class LayoutChecker(object):
+    # more than the max counts of the items pool
+    itemsCounts = {'ETank': 14, 'Reserve': 4, 'Missile': 100, 'Super': 100, 'PowerBomb': 100}
+
+    def __init__(self, maxDiff):
+        self.apNames = [ap.Name for ap in accessPoints]
+        self.apBits = dict((apName, 1 << i) for i, apName in enumerate(self.apNames))
+        self.allBits = (1 << len(self.apNames)) - 1
+
+        sm = SMBoolManager()
+        for item in SMBoolManager.items:
+            sm.addItems([item] * self.itemsCounts.get(item, 1))
+        for boss in ['Kraid', 'Phantoon', 'Draygon', 'Ridley']:
+            Bosses.beatBoss(boss)
+
+        isOk = lambda result: result.bool == True and result.difficulty <= maxDiff
+        # {ap name: bits of the access points reachable with the intra area transitions}
+        self.intraTransitions = {}
+        # ap names of the access points whose inter area transition can be taken
+        self.traversable = set()
+        for ap in accessPoints:
+            bits = 0
+            for (dstName, tFunc) in ap.transitions.items():
+                # the global access points can be connected to another area
+                if dstName != ap.ConnectedTo and isOk(sm.eval(tFunc)):
+                    bits |= self.apBits[dstName]
+            self.intraTransitions[ap.Name] = bits
+            if ap.Internal == False and isOk(sm.eval(ap.traverse)):
+                self.traversable.add(ap.Name)
+
+        Bosses.reset()
+
+    def addTransition(self, edges, src, dst, bidir=True):
+        if src in self.traversable:
+            edges[src] |= self.apBits[dst]
+        if bidir == True and dst in self.traversable:
+            edges[dst] |= self.apBits[src]
+
+    def getReached(self, edges):
+        # bits of the access points reachable from the landing site
+        reached = self.apBits['Landing Site']
+        newBits = reached
+        while newBits != 0:
+            toCheck = newBits
+            newBits = 0
+            for apName in self.apNames:
+                if toCheck & self.apBits[apName] != 0:
+                    newBits |= edges[apName]
+            newBits &= ~reached
+            reached |= newBits
+        return reached
+
+    def check(self, transitions, bidir=True):
+        edges = dict(self.intraTransitions)
+        for (src, dst) in transitions:
+            self.addTransition(edges, src, dst, bidir)
+        return self.getReached(edges) == self.allBits
+
+# rnd: the random generator of the seed
+# checker: the LayoutChecker of the settings, if given the layout is built
+#          so that all the access points are reachable with all the items.
+#          until it's the case the transitions are taken from the reached
+#          access points to the not reached ones, and a transition is not
+#          proposed if no reached access point would be left to continue.
+def createTransitions(bidir=True, rnd=random, checker=None):
     apNames = [ap.Name for ap in accessPoints if ap.Internal == False]
+    apAreas = dict((ap.Name, ap.GraphArea) for ap in accessPoints)
+    # access points not yet used as source/destination of a transition
+    freeFrom = set(apNames)
+    freeTo = set(apNames)
     transitions = []
 
-    def findTo(trFrom):
-        ap = getAccessPoint(trFrom)
-        fromArea = ap.GraphArea
-        targets = [apName for apName in apNames if apName not in tTo and getAccessPoint(apName).GraphArea != fromArea]
-        if len(targets) == 0: # fallback if no area transition is found
-            targets = [apName for apName in apNames if apName != ap.Name]
-        return targets[random.randint(0, len(targets)-1)]
+    if checker is not None:
+        edges = dict(checker.intraTransitions)
+        reached = checker.getReached(edges)
+
+    def isReached(apName, reachedBits):
+        return reachedBits & checker.apBits[apName] != 0
+
+    def canContinue(src, dst):
+        # after the src->dst transition, all the access points are reached
+        # or there's a reached access point to add another transition from
+        newEdges = dict(edges)
+        checker.addTransition(newEdges, src, dst, bidir)
+        newReached = checker.getReached(newEdges)
+        if newReached == checker.allBits:
+            return True
+        for apName in apNames:
+            if (apName in freeFrom and apName != src and (bidir == False or apName != dst)
+                and apName in checker.traversable and isReached(apName, newReached)):
+                return True
+        return False
 
-    def addTransition(src, dst):
-        tFrom.append(src)
-        tTo.append(dst)
+    def chooseFrom(candidates):
+        return candidates[rnd.randint(0, len(candidates)-1)]
+
+    while len(freeFrom) > 0:
+        sources = [apName for apName in apNames if apName in freeFrom]
+        if checker is not None and reached != checker.allBits:
+            reachedSources = [apName for apName in sources if apName in checker.traversable and isReached(apName, reached)]
+            if len(reachedSources) > 0:
+                sources = reachedSources
+        src = chooseFrom(sources)
+
+        targets = [apName for apName in apNames if apName in freeTo and apAreas[apName] != apAreas[src]]
+        if len(targets) == 0: # fallback if no area transition is found
+            targets = [apName for apName in apNames if apName in freeTo and apName != src]
+        if checker is not None and reached != checker.allBits:
+            newTargets = [apName for apName in targets if not isReached(apName, reached) and canContinue(src, apName)]
+            if len(newTargets) > 0:
+                targets = newTargets
+        dst = chooseFrom(targets)
 
-    while len(apNames) > 0:
-        sources = [apName for apName in apNames if apName not in tFrom]
-        src = sources[random.randint(0, len(sources)-1)]
-        dst = findTo(src)
         transitions.append((src, dst))
-        addTransition(src, dst)
+        freeFrom.discard(src)
+        freeTo.discard(dst)
         if bidir is True:
-            addTransition(dst, src)
-        toRemove = [apName for apName in apNames if apName in tFrom and apName in tTo]
-        for apName in toRemove:
-            apNames.remove(apName)
+            freeFrom.discard(dst)
+            freeTo.discard(src)
+        if checker is not None:
+            checker.addTransition(edges, src, dst, bidir)
+            reached = checker.getReached(edges)
     return transitions
 
 class AreaRandomizer(Randomizer):
-    def __init__(self, locations, settings, seedName, bidir=True, dotDir=None):
+    def __init__(self, locations, settings, seedName, bidir=True, dotDir=None, rnd=random):
+        checker = LayoutChecker(settings.maxDiff)
         transitionsOk = False
         attempts = 0
+        # number of layouts rejected by the checker, without building a Randomizer
+        self.attemptsSaved = 0
         while not transitionsOk and attempts < 10:
+            attempts += 1
+            self.transitions = createTransitions(bidir, rnd, checker)
+            if not checker.check(self.transitions, bidir):
+                self.attemptsSaved += 1
+                continue
             try:
-                self.transitions = createTransitions(bidir)
                 super(AreaRandomizer, self).__init__(locations,
                                                      settings,
                                                      seedName,
                                                      self.transitions,
                                                      bidir,
-                                                     dotDir)
+                                                     dotDir,
+                                                     rnd)
                 transitionsOk = True
             except RuntimeError:
                 transitionsOk = False
-                attempts += 1
+        log.get('AreaRando').debug("{} layouts generated, {} rejected without building the randomizer".format(attempts, self.attemptsSaved))
         if not transitionsOk:
             raise RuntimeError("Impossible seed! (too much fun in the settings, probably)")
 
@@ -240,7 +240,7 @@ def removeItem(itemType, itemPool):
     itemPool.remove(List.find(lambda item: item["Type"] == itemType, Items))
 
 # add ammo given quantity settings
-def addAmmo(qty, itemPool):
+def addAmmo(qty, itemPool, rnd=random):
     # always add enough minors to pass zebetites (1100 damages) and mother brain 1 (3000 damages)
     # accounting for missile refill. so 15-5.
     # refill after each zeb, refill after breaking the glass.
@@ -254,7 +254,7 @@ def addAmmo(qty, itemPool):
     if not qty['strictMinors']:
         rangeDict = getRangeDict(ammoQty)
         while len(itemPool) < maxItems:
-            item = chooseFromRange(rangeDict)
+            item = chooseFromRange(rangeDict, rnd)
             addItem(item, itemPool)
     else:
         totalProps = ammoQty['Missile'] + ammoQty['Super'] + ammoQty['PowerBomb']
@@ -280,16 +280,16 @@ def removeForbiddenItems(forbiddenItems, itemPool):
         removeItem(item, itemPool)
         itemPool.append(NoEnergy)
 
-def addEnergy(qty, itemPool):
+def addEnergy(qty, itemPool, rnd=random):
     energyQty = qty['energy']
     if energyQty == 'sparse':
         # 4-6
-        if random.random() < 0.5:
+        if rnd.random() < 0.5:
             addItem('Reserve', itemPool)
         else:
             addItem('ETank', itemPool)
         # 3 in the pool (1 E, 1 R + the previous one)
-        rest = 1 + randGaussBounds(2, 5)
+        rest = 1 + randGaussBounds(2, 5, rnd)
         for i in range(rest):
             addItem('ETank', itemPool)
         # complete up to 18 energies with nothing item
@@ -299,12 +299,12 @@ def addEnergy(qty, itemPool):
         # 8-12
         # add up to 3 Reserves or ETanks (cannot add more than 3 reserves)
         for i in range(3):
-            if random.random() < 0.5:
+            if rnd.random() < 0.5:
                 addItem('Reserve', itemPool)
             else:
                 addItem('ETank', itemPool)
         # 5 already in the pool (1 E, 1 R, + the previous 3)
-        rest = 3 + randGaussBounds(4, 3.7)
+        rest = 3 + randGaussBounds(4, 3.7, rnd)
         for i in range(rest):
             addItem('ETank', itemPool)
         # fill the rest with NoEnergy
@@ -317,12 +317,13 @@ def addEnergy(qty, itemPool):
         for i in range(13):
             addItem('ETank', itemPool)
 
-def getItemPool(qty, forbiddenItems):
+# rnd: the random generator of the seed
+def getItemPool(qty, forbiddenItems, rnd=random):
     # copy original items list (does not contain the 'nothing' types)
     itemPool = Items[:]
     # always add energy before ammo, as addAmmo will fill up item pool
-    addEnergy(qty, itemPool)
-    addAmmo(qty, itemPool)
+    addEnergy(qty, itemPool, rnd)
+    addAmmo(qty, itemPool, rnd)
     removeForbiddenItems(forbiddenItems, itemPool)
 
     return itemPool
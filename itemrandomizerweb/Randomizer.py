@@ -7,6 +7,7 @@ from utils import randGaussBounds, getRangeDict, chooseFromRange
 from graph import AccessGraph
 from graph_access import accessPoints
 from smboolmanager import SMBoolManager
+from item_dependencies import getItemDependencies
 import log, logging
 
 class RandoSettings(object):
@@ -188,7 +189,7 @@ class SuperFunProvider(object):
         self.combatItems = ['ScrewAttack', 'Plasma', 'Wave', 'Spazer']
 
     def getItemPool(self, forbidden=[]):
-        return Items.getItemPool(self.qty, self.forbiddenItems + forbidden)
+        return Items.getItemPool(self.qty, self.forbiddenItems + forbidden, self.rando.rnd)
 
     def checkPool(self, forbidden=None):
         ret = True
@@ -235,9 +236,9 @@ class SuperFunProvider(object):
 
     def getForbiddenItemsFromList(self, itemList):
         remove = []
-        n = randGaussBounds(len(itemList))
+        n = randGaussBounds(len(itemList), rnd=self.rando.rnd)
         for i in range(n):
-            idx = random.randint(0, len(itemList) - 1)
+            idx = self.rando.rnd.randint(0, len(itemList) - 1)
             item = itemList.pop(idx)
             if item is not None:
                 remove.append(item)
@@ -298,6 +299,63 @@ class SuperFunProvider(object):
         if 'Combat' in self.superFun:
             self.getForbiddenCombat()
 
+# log of the changes made to the randomizer lists by the item placements
+# (unused locations, item pool, collected items, item locations, progression
+# item locations). the lists are not copied in the states, the states only
+# keep their position in the log, and going back or forward to a state
+# undoes or replays the changes in between.
+class RandoChanges(object):
+    def __init__(self, rando):
+        self.rando = rando
+        # [(itemLocation, location index, pool item, pool item index, collected, progression)]
+        self.changes = []
+        self.position = 0
+
+    # remove item location from the unused locations and the item from the
+    # item pool, add them to the placed/collected lists
+    def getItem(self, itemLocation, collect, isProg):
+        rando = self.rando
+        # the changes after the current position are not reachable anymore
+        del self.changes[self.position:]
+        locIndex = rando.unusedLocations.index(itemLocation['Location'])
+        poolItem = rando.getNextItemInPool(itemLocation['Item']['Type'])
+        poolIndex = rando.itemPool.index(poolItem)
+        change = (itemLocation, locIndex, poolItem, poolIndex, collect, isProg)
+        self.changes.append(change)
+        self.redo(change)
+        self.position += 1
+
+    def redo(self, change):
+        rando = self.rando
+        (itemLocation, locIndex, poolItem, poolIndex, collect, isProg) = change
+        del rando.unusedLocations[locIndex]
+        del rando.itemPool[poolIndex]
+        rando.itemLocations.append(itemLocation)
+        if collect == True:
+            rando.currentItems.append(itemLocation['Item'])
+            if isProg == True:
+                rando.progressionItemLocs.append(itemLocation)
+
+    def undo(self, change):
+        rando = self.rando
+        (itemLocation, locIndex, poolItem, poolIndex, collect, isProg) = change
+        if collect == True:
+            if isProg == True:
+                rando.progressionItemLocs.pop()
+            rando.currentItems.pop()
+        rando.itemLocations.pop()
+        rando.itemPool.insert(poolIndex, poolItem)
+        rando.unusedLocations.insert(locIndex, itemLocation['Location'])
+
+    # go back or forward to the given position
+    def seek(self, position):
+        while self.position > position:
+            self.position -= 1
+            self.undo(self.changes[self.position])
+        while self.position < position:
+            self.redo(self.changes[self.position])
+            self.position += 1
+
 # current state of randomizer algorithm. can be saved and restored at any point.
 # useful to rollback state when algorithm is stuck
 class RandoState(object):
@@ -305,31 +363,26 @@ class RandoState(object):
     # rando: Randomizer instance
     # curLocs: current accessible locations at the time
     def __init__(self, rando, curLocs):
-        self.unusedLocations = rando.unusedLocations[:]
-        self.itemPool = rando.itemPool[:]
+        # the lists are restored from the changes log
+        self.changesPosition = rando.changes.position
         self.curAccessPoint = rando.curAccessPoint
-        self.currentItems = rando.currentItems[:]
-        self.itemLocations = rando.itemLocations[:]
-        self.states = rando.states[:]
-        self.progressionItemLocs = rando.progressionItemLocs[:]
+        self.smbmState = rando.smbm.getItemsState()
+        # the previous states are the ones before this one in the states list
+        self.statesIndex = len(rando.states)
+        # small, one index per progression item
         self.progressionStatesIndices = rando.progressionStatesIndices[:]
-        self.bosses = [boss for boss in Bosses.golden4Dead if Bosses.golden4Dead[boss] == True]
+        self.bosses = Bosses.deadBosses()
         self.curLocs = curLocs
 
     # apply this state to a randomizer object
     def apply(self, rando):
         rando.progTypesCache = []
         rando.nonProgTypesCache = []
-        rando.unusedLocations = self.unusedLocations
-        rando.currentItems = self.currentItems
-        rando.itemLocations = self.itemLocations
+        rando.changes.seek(self.changesPosition)
         rando.setCurAccessPoint(self.curAccessPoint)
-        rando.states = self.states
-        rando.itemPool = self.itemPool
-        rando.progressionStatesIndices = self.progressionStatesIndices
-        rando.progressionItemLocs = self.progressionItemLocs
-        rando.smbm.resetItems()
-        rando.smbm.addItems([item['Type'] for item in self.currentItems])
+        del rando.states[self.statesIndex:]
+        rando.progressionStatesIndices = self.progressionStatesIndices[:]
+        rando.smbm.setItemsState(self.smbmState)
         Bosses.reset()
         for boss in self.bosses:
             Bosses.beatBoss(boss)
@@ -338,10 +391,15 @@ class RandoState(object):
 
 # randomizer algorithm main class. generateItems method will generate a complete seed, or fail (depending on settings) 
 class Randomizer(object):
+    # score the candidate items of the min/max progression in one pass
+    batchScoring = True
+
     # locations : items locations
     # settings : RandoSettings instance
-    def __init__(self, locations, settings, seedName, graphTransitions, bidir=True, dotDir=None):
+    # rnd : the random generator of the seed (random.Random or the random module)
+    def __init__(self, locations, settings, seedName, graphTransitions, bidir=True, dotDir=None, rnd=random):
         self.errorMsg = ''
+        self.rnd = rnd
         # create graph
         dotFile = None
         if dotDir is not None:
@@ -373,7 +431,9 @@ class Randomizer(object):
         self.runtimeLimit_s = settings.runtimeLimit_s
         # init everything
         self.smbm = SMBoolManager()
-        self.unusedLocations = locations
+        self.itemDependencies = getItemDependencies()
+        # the list is changed in place by the items placement
+        self.unusedLocations = locations[:]
         # collected items
         self.currentItems = []
         # progresion/non progression types cache
@@ -388,6 +448,9 @@ class Randomizer(object):
         # indices in states list that mark a progression item collection
         self.progressionStatesIndices = []
         self.progressionItemLocs = []
+        self.itemLocations = []
+        # changes made by the items placement, to restore the states
+        self.changes = RandoChanges(self)
         # progression items tried for a given rollback point
         self.rollbackItemsTried = {}
         # handle super fun settings
@@ -399,7 +462,7 @@ class Randomizer(object):
         # store unapplied super fun messages
         if len(fun.errorMsgs) > 0:
             self.errorMsg += "Super Fun: " + ', '.join(fun.errorMsgs) + ' '
-        self.itemPool = Items.getItemPool(settings.qty, fun.forbiddenItems)
+        self.itemPool = Items.getItemPool(settings.qty, fun.forbiddenItems, self.rnd)
         self.restrictedLocations = fun.restrictedLocs
 
     def setCurAccessPoint(self, ap='Landing Site'):
@@ -477,55 +540,174 @@ class Randomizer(object):
     def possibleItems(self, curLocs, itemPool):
         result = []
         poolDict = self.getPoolDict(itemPool)
-        for itemType,items in poolDict.iteritems():
-            if self.checkItem(curLocs, items[0], self.currentItems):
-                for item in items:
+        itemTypes = [itemType for itemType,items in poolDict.iteritems() if self.canCheckItem(curLocs, items[0])]
+        # the last item is always checked as the locations keep the
+        # difficulty/access point computed during the last check
+        (uselessItemTypes, availLocs) = self.getUselessItemTypes(itemTypes[:-1])
+        if len(uselessItemTypes) > 0:
+            # an item opening nothing gives the locations available without it
+            uselessResult = self.checkLocations(curLocs, availLocs)
+        for itemType in itemTypes:
+            if itemType in uselessItemTypes:
+                ok = uselessResult
+            else:
+                ok = self.checkItem(curLocs, poolDict[itemType][0], self.currentItems)
+            if ok == True:
+                for item in poolDict[itemType]:
                     result.append(item)
-        random.shuffle(result)
+        self.rnd.shuffle(result)
         return result
 
-    # removes an item of given type from the pool.
-    def removeItem(self, itemType):
-        item = self.getNextItemInPool(itemType)
-        self.itemPool.remove(item)
+    # items which can't give access to new locations, using the items
+    # dependencies of the blocked transitions and of the unavailable locations.
+    # return (items types, locations available without them)
+    def getUselessItemTypes(self, itemTypes):
+        ap = self.areaGraph.accessPoints[self.curAccessPoint]
+        blocked = [(self.areaGraph.accessPoints[src], dst) for (src, dst) in self.areaGraph.getBlockedTransitions(ap, self.smbm, self.difficultyTarget)]
+        uselessItemTypes = [itemType for itemType in itemTypes if not self.itemDependencies.canOpen(itemType, blocked, [])]
+        # checking the locations costs a locations computation, not worth it
+        # if it can't save at least two checks
+        if len(uselessItemTypes) < 2:
+            return ([], None)
+        availLocs = self.currentLocations(locs=self.unusedLocations)
+        unavailLocs = [loc for loc in self.unusedLocations if loc not in availLocs]
+        return ([itemType for itemType in uselessItemTypes if not self.itemDependencies.canOpen(itemType, [], unavailLocs)], availLocs)
 
     # get choose function from a weighted dict
     def getChooseFunc(self, rangeDict, funcDict):
-        v = chooseFromRange(rangeDict)
+        v = chooseFromRange(rangeDict, self.rnd)
 
         return funcDict[v]
 
     def chooseItemRandom(self, items):
-        return items[random.randint(0, len(items)-1)]
+        return items[self.rnd.randint(0, len(items)-1)]
+
+    # number of locations available with each candidate item type, computed
+    # in one pass: the access points reachable with the current items are
+    # extended with each item (see AccessGraph.getReachableAccessPoints), and
+    # only the locations whose rules depend on the item or whose access
+    # points reachability has changed are evaluated again.
+    # return {item type: locations count} for the items not in failItems
+    def getNewLocsCounts(self, items):
+        itemTypes = []
+        for item in items:
+            if item not in self.failItems and item['Type'] not in itemTypes:
+                itemTypes.append(item['Type'])
+        rootAp = self.areaGraph.accessPoints[self.curAccessPoint]
+        locs = self.unusedLocations
+
+        (baseReachable, baseAreas) = self.getReachableAccessPoints(rootAp)
+        baseAvail = [self.isLocAvailable(loc, baseReachable, baseAreas) for loc in locs]
+        baseCount = sum(baseAvail)
+
+        # locations indices by name, access point and graph area
+        locsIndices = {}
+        apLocs = {}
+        areaLocs = {}
+        unknownLocs = []
+        for i in range(len(locs)):
+            loc = locs[i]
+            locsIndices[loc['Name']] = i
+            for apName in loc['AccessFrom']:
+                apLocs.setdefault(apName, []).append(i)
+            areaLocs.setdefault(loc['GraphArea'], []).append(i)
+            if loc['Name'] not in self.itemDependencies.locations:
+                unknownLocs.append(i)
+
+        counts = {}
+        for itemType in itemTypes:
+            self.smbm.addItem(itemType)
+            (reachable, areas) = self.getReachableAccessPoints(rootAp)
+            itemLocs = self.itemDependencies.itemsLocations.get(itemType)
+            if itemLocs is None:
+                toCheck = range(len(locs))
+            else:
+                toCheck = set(unknownLocs)
+                toCheck.update([locsIndices[name] for name in itemLocs if name in locsIndices])
+                for apName in reachable ^ baseReachable:
+                    toCheck.update(apLocs.get(apName, []))
+                for area in areas ^ baseAreas:
+                    toCheck.update(areaLocs.get(area, []))
+            count = baseCount
+            for i in toCheck:
+                count += self.isLocAvailable(locs[i], reachable, areas) - baseAvail[i]
+            self.smbm.removeItem(itemType)
+            counts[itemType] = count
+        return counts
+
+    # return the names and the graph areas of the reachable access points
+    def getReachableAccessPoints(self, rootAp):
+        reachable = self.areaGraph.getReachableAccessPoints(rootAp, self.smbm, self.difficultyTarget)
+        areas = set([self.areaGraph.accessPoints[name].GraphArea for name in reachable])
+        return (reachable, areas)
+
+    # same condition as AccessGraph.getAvailableLocations, without storing the difficulty
+    def isLocAvailable(self, loc, reachable, areas):
+        if loc['GraphArea'] not in areas:
+            return False
+        for apName in loc['AccessFrom']:
+            if apName not in reachable:
+                continue
+            tdiff = self.smbm.eval(loc['AccessFrom'][apName])
+            if tdiff.bool == True and tdiff.difficulty <= self.difficultyTarget:
+                diff = self.smbm.eval(loc['Available'])
+                if diff.bool == True and diff.difficulty <= self.difficultyTarget:
+                    return True
+        return False
+
+    # scores the items with getNewLocsCounts instead of a currentLocations call per item
+    def getItemsScores(self, items):
+        if self.batchScoring == False:
+            return None
+        return self.getNewLocsCounts(items)
+
+    def getItemScore(self, item, scores):
+        if scores is None:
+            return len(self.currentLocations(item))
+        return scores[item['Type']]
 
     def chooseItemMinProgression(self, items):
         minNewLocs = 1000
         ret = None
 
+        scores = self.getItemsScores(items)
+        lastItem = None
         for item in items:
             if item in self.failItems:
                 continue
-            newLocs = len(self.currentLocations(item))
+            newLocs = self.getItemScore(item, scores)
+            lastItem = item
             if newLocs < minNewLocs:
                 minNewLocs = newLocs
                 ret = item
+        self.restoreLocsDiff(lastItem, scores)
         return ret
 
     def chooseItemMaxProgression(self, items):
         maxNewLocs = 0
         ret = None
 
+        scores = self.getItemsScores(items)
+        lastItem = None
         for item in items:
             if item in self.failItems:
                 continue
-            newLocs = len(self.currentLocations(item))
+            newLocs = self.getItemScore(item, scores)
+            lastItem = item
             if newLocs > maxNewLocs:
                 maxNewLocs = newLocs
                 ret = item
+        self.restoreLocsDiff(lastItem, scores)
         return ret
 
+    def restoreLocsDiff(self, lastItem, scores):
+        # the locations difficulties used to choose the location are the ones
+        # stored by the currentLocations call of the last item
+        if scores is not None and lastItem is not None:
+            self.currentLocations(lastItem)
+
     def chooseItem(self, items):
-        random.shuffle(items)
+        self.rnd.shuffle(items)
         item = self.getChooseFunc(self.chooseItemRanges, self.chooseItemFuncs)(items)
         if item is None:
             item = self.chooseItemRandom(items)
@@ -534,7 +716,7 @@ class Randomizer(object):
     def chooseLocationRandom(self, availableLocations, item):
         self.log.debug("RANDOM")
         self.log.debug("chooseLocationRandom: {}".format([l['Name'] for l in availableLocations]))
-        return availableLocations[random.randint(0, len(availableLocations)-1)]
+        return availableLocations[self.rnd.randint(0, len(availableLocations)-1)]
 
     def getLocDiff(self, loc):
         # avail difficulty already stored by graph algorithm        
@@ -616,7 +798,7 @@ class Randomizer(object):
         isProg = self.isProgItem(item)
         if self.isSpreadProgression == True and isProg == True:
             locs = self.getLocsSpreadProgression(availableLocations)
-        random.shuffle(locs)
+        self.rnd.shuffle(locs)
         self.log.debug("chooseLocation: {}".format([l['Name'] for l in locs]))
         self.log.debug("chooseLocation isProg: {}".format(isProg))
         if isProg == True:
@@ -634,7 +816,7 @@ class Randomizer(object):
         itemsLen = len(items)
         if itemsLen == 0:
             fixedPool = [item for item in itemPool if item not in self.failItems]
-            item = List.item(random.randint(0, len(fixedPool)-1), fixedPool)
+            item = List.item(self.rnd.randint(0, len(fixedPool)-1), fixedPool)
         else:
             item = self.chooseItem(items)
         return item
@@ -668,15 +850,16 @@ class Randomizer(object):
     # items : already placed items
     #
     # return bool
-    def checkItem(self, curLocs, item, items):
+    def canCheckItem(self, curLocs, item):
         # no need to test nothing items
         if item['Type'] in ['Nothing', 'NoEnergy']:
             return False
-        oldLocations = curLocs
-        canPlaceIt = self.canPlaceItem(item, oldLocations)
-        if canPlaceIt == False:
-            return False
-        newLocations = self.currentLocations(item)
+        return self.canPlaceItem(item, curLocs)
+
+    def checkItem(self, curLocs, item, items):
+        return self.checkLocations(curLocs, self.currentLocations(item))
+
+    def checkLocations(self, oldLocations, newLocations):
         if self.restrictions["MajorMinor"] == True:
             newLocationsHasMajor = List.exists(lambda l: l["Class"] == 'Major', newLocations)
         else:
@@ -732,7 +915,7 @@ class Randomizer(object):
         comeBack = self.areaGraph.canAccess(self.smbm, loc['accessPoint'], self.curAccessPoint, self.difficultyTarget, item['Type'])
         if not comeBack:
             return True
-        if self.isProgItemNow(item) and random.random() >= self.possibleSoftlockProb: # depends on prog speed
+        if self.isProgItemNow(item) and self.rnd.random() >= self.possibleSoftlockProb: # depends on prog speed
             # we know that loc is avail and post avail with the item
             # if it is not post avail without it, then the item prevents the
             # possible softlock
@@ -800,20 +983,17 @@ class Randomizer(object):
             curLocs = self.currentLocations(item)
             self.log.debug("getItem: loc: {} ap: {}".format(location['Name'], location['accessPoint']))
             self.setCurAccessPoint(location['accessPoint'])
-            self.currentItems.append(item)
             self.smbm.addItem(item['Type'])
             self.nonProgTypesCache = []
             self.progTypesCache = []
-        self.unusedLocations.remove(location)
-        self.itemLocations.append(itemLocation)
+        # update the locations and items lists
+        self.changes.getItem(itemLocation, collect, isProg)
         self.log.debug("{}: {} at {} diff: {}".format(len(self.currentItems), item['Type'], location['Name'], location['difficulty']))
         if curLocs != None:
            self.log.debug("PLACEMENT, curLocs={}".format([loc['Name'] for loc in curLocs]))
-        self.removeItem(item['Type'])
         if collect == True:
             if isProg == True:
                 self.progressionStatesIndices.append(len(self.states))
-                self.progressionItemLocs.append(itemLocation)
             if location in curLocs:
                 curLocs.remove(location)
             self.curLocs = None
@@ -870,7 +1050,7 @@ class Randomizer(object):
         self.log.debug("NON-PROG")
         minLimit = self.itemLimit - int(self.itemLimit/5)
         maxLimit = self.itemLimit + int(self.itemLimit/5)
-        itemLimit = random.randint(minLimit, maxLimit)
+        itemLimit = self.rnd.randint(minLimit, maxLimit)
         while len(pool) > 0 and nItems < itemLimit and locPoolOk:
             curLocs = self.currentLocations()
             itemLocation = self.generateItem(curLocs, pool)
@@ -950,8 +1130,10 @@ class Randomizer(object):
                 sys.stdout.flush()
                 self.progressionStatesIndices.pop()
         if len(possibleStates) > 0:
-            (state, itemLoc) = possibleStates[random.randint(0, len(possibleStates)-1)]
+            (state, itemLoc) = possibleStates[self.rnd.randint(0, len(possibleStates)-1)]
             self.updateRollbackItemsTried(itemLoc, i)
+            # the states list has been truncated by the states applied after this one
+            self.states = states
             state.apply(self)
             sys.stdout.write('<'*(nStatesAtStart - len(self.states)))
             sys.stdout.flush()
@@ -1026,7 +1208,6 @@ class Randomizer(object):
     # only function to use (once) from outside of the Randomizer class.
     # returns a list of item/location dicts with 'Item' and 'Location' as keys.
     def generateItems(self):
-        self.itemLocations = []
         isStuck = False
         # if major items are removed from the pool (super fun setting), fill not accessible locations with
         # items that are as useless as possible
@@ -1073,7 +1254,7 @@ class Randomizer(object):
                 while len(self.itemPool) > 0:
                     itemLocation = {
                         'Item' : self.itemPool[0],
-                        'Location' : self.unusedLocations[random.randint(0, len(self.unusedLocations) - 1)]
+                        'Location' : self.unusedLocations[self.rnd.randint(0, len(self.unusedLocations) - 1)]
                     }
                     self.log.debug("Fill: {} at {}".format(itemLocation['Item']['Type'], itemLocation['Location']['Name']))
                     self.getItem(itemLocation, False)
@@ -1,2151 +1,96 @@
-patches = {
-'AimAnyButton.ips': {0x175CA: [0x60],
-0x88202: [0xA4,0x8F,0x98,0x2C,0xB2,0x9,0xF0,0x6,0xA9,0x40,0x0,0x4,0x12,0x98,0x2C,0xB4,0x9,0xF0,0x6,0xA9,0x80,0x0,0x4,0x12,0x98,0x2C,0xB6,0x9,0xF0,0x6,0xA9,0x0,0x80,0x4,0x12,0x98,0x2C,0xB8,0x9,
-0xF0,0x6,0xA9,0x0,0x40,0x4,0x12,0x98,0x2C,0xBC,0x9,0xF0,0x5,0xA9,0x20,0x0,0x4,0x12,0x2C,0xBE,0x9,0xF0,0x5,0xA9,0x10,0x0,0x4,0x12,0xA5,0x12,0x49,0xFF,0xFF,0x85,0x12,0xA4,0x8B,0x98,
-0x2C,0xB2,0x9,0xF0,0x6,0xA9,0x40,0x0,0x4,0x14,0x98,0x2C,0xB4,0x9,0xF0,0x6,0xA9,0x80,0x0,0x4,0x14,0x98,0x2C,0xB6,0x9,0xF0,0x6,0xA9,0x0,0x80,0x4,0x14,0x98,0x2C,0xB8,0x9,0xF0,0x6,
-0xA9,0x0,0x40,0x4,0x14,0x98,0x2C,0xBC,0x9,0xF0,0x6,0xA9,0x20,0x0,0x4,0x14,0x98,0x2C,0xBE,0x9,0xF0,0x5,0xA9,0x10,0x0,0x4,0x14,0xA5,0x14,0x49,0xFF,0xFF,0x85,0x14,0x60]},
-'animal_enemies.ips': {0x78418: [0x3B,0xB6,0x0,0x0,0x1C,0x8C],
-0x79861: [0xBB,0x91,0x12,0x84,0x5,0xB9,0xBB],
-0x1072D7: [0x1,0x0,0x58,0x2],
-0x1072FB: [0x0,0x0],
-0x107303: [0x23,0x80,0x2D],
-0x10730F: [0xC6,0xEE,0x0,0x0,0x0,0xC,0x44,0xE9,0x1,0x0,0x58,0x2],
-0x10733B: [0x0,0x0],
-0x107343: [0x23,0x80,0x2D],
-0x10734F: [0xC6,0xEE],
-0x108ED5: [0xDF,0x0,0xBA,0x0,0x0,0x0,0x0,0x20],
-0x19E6E6: [0xA0],
-0x21E0DB: [0x0,0x87,0xD9,0x6,0x3,0xB3,0x83,0xB2,0x83,0x59,0xFF,0x0,0x3,0xB3,0x83,0xB3,0x8B,0xDC,0x20,0x0,0x8B,0x43,0x92,0x83,0xD9,0x40,0x5,0x92,0x83,0x40,0x94,0xC,0xC4,0xD9,0x60,0x5,0xB2,0x83,0x60,
-0x94,0x2C,0xD4,0xDB,0x80,0x3,0x60,0x9C,0x2C,0xDC,0xDB,0x80,0x2,0x40,0x9C,0xC,0xDA,0x20,0x0,0xB2,0x44,0x83,0x92,0xDB,0xA0,0xF0,0x3F,0x62,0x0,0x0,0xAF,0x5C,0x83,0xB0,0x1,0xB1,0x83,0xE4,
-0x3F,0x80,0xE4,0x60,0x0,0x0,0x41,0x2E,0x0,0x0,0xFF,0x2E,0x0,0x0,0xFE,0x2E,0x0,0x0,0xFD,0xE4,0x6D,0x0],
-0x21E13F: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF]},
-'animals.ips': {0x7841D: [0x8C],
-0x79861: [0xBB,0x91,0x12,0x84,0x5,0xB9,0xBB],
-0x1072D7: [0x1,0x0],
-0x1072FB: [0x0,0x0],
-0x107305: [0x2D],
-0x107317: [0x1,0x0],
-0x10733B: [0x0,0x0],
-0x107345: [0x2D],
-0x108EDC: [0x20],
-0x19E6E6: [0xA0],
-0x21E0DB: [0x0,0x87,0xD9,0x6,0x3,0xB3,0x83,0xB2,0x83,0x59,0xFF,0x0,0x3,0xB3,0x83,0xB3,0x8B,0xDC,0x20,0x0,0x8B,0x43,0x92,0x83,0xD9,0x40,0x5,0x92,0x83,0x40,0x94,0xC,0xC4,0xD9,0x60,0x5,0xB2,0x83,0x60,
-0x94,0x2C,0xD4,0xDB,0x80,0x3,0x60,0x9C,0x2C,0xDC,0xDB,0x80,0x2,0x40,0x9C,0xC,0xDA,0x20,0x0,0xB2,0x44,0x83,0x92,0xDB,0xA0,0xF0,0x3F,0x62,0x0,0x0,0xAF,0x5C,0x83,0xB0,0x1,0xB1,0x83,0xE4,
-0x3F,0x80,0xE4,0x60,0x0,0x0,0x41,0x2E,0x0,0x0,0xFF,0x2E,0x0,0x0,0xFE,0x2E,0x0,0x0,0xFD,0xE4,0x6D,0x0],
-0x21E13F: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF]},
-'area_rando_blue_doors.ips': {0x7823E: [0x3B,0xB6,0xE,0xE],
-0x78672: [0x2D],
-0x787A6: [0x3B,0xB6,0x5F,0xE],
-0x78D50: [0x4],
-0x219008: [0xF8,0x65,0x60,0xC4,0x68,0x5,0x14,0x8D,0x18,0x89,0x14,0x89,0xC6,0x94,0xC6,0x14,0xD2,0x1E,0xC4,0xF2,0x1,0x14,0x8D,0xC2,0x2A,0xCC,0xA6,0xD2,0x3E,0xCA,0xC0,0xC2,0x5C,0xA,0x19,0x17,0x1D,0x31,0x1,
-0x17,0x19,0x18,0x19,0x14,0x89,0xCD,0x4C,0xD2,0x1E,0xC2,0x2C,0x0,0x17,0xC2,0x28,0xCA,0x9A,0xC3,0x3E,0x0,0x9,0xC7,0x3E,0xC6,0x7C,0xCA,0xE4,0x7,0x19,0x85,0x31,0x1,0x34,0xD,0x34,0x9,0x43,
-0x31,0x1,0x0,0x17,0xC6,0x6A,0xC5,0xAE,0xC3,0xAA,0xC3,0x1E,0xC3,0x1A,0xC3,0x22,0xC5,0x1E,0xC3,0x28,0x0,0x19,0xC8,0xCA,0xC4,0x20,0x2,0x5,0x31,0x5,0xC7,0x20,0xC2,0x7C,0x0,0x19,0xC5,0xD8,
-0x2,0x18,0x89,0xF,0x43,0x89,0x18,0xC2,0xBC,0x4,0x34,0xD,0x37,0xD,0x39,0x46,0x1,0x31,0xC3,0x6A,0x1,0x34,0xD,0xC5,0x40,0x1,0x19,0x85,0xC5,0x70,0xC3,0x7E,0x3,0x39,0x5,0x37,0x9,0xC5,
-0x84,0xC5,0x88,0xC3,0xE4,0xC6,0x20,0xC4,0x5E,0xC3,0x42,0xC4,0xA6,0x0,0x5,0xC3,0xEA,0x7,0xF,0x19,0x18,0x89,0x40,0x94,0xC,0xC4,0xC5,0x34,0x3,0x39,0x5,0xFF,0x0,0xC5,0x3E,0xC3,0x6A,0x4,
-0x37,0x9,0x37,0xD,0x10,0xC4,0xFA,0xC5,0xAE,0xC7,0x14,0x1,0xFF,0x0,0xC6,0x42,0xC4,0xCE,0x0,0x19,0xCA,0x20,0xC3,0x7E,0xC3,0x42,0xC5,0x64,0x0,0x38,0xC2,0x40,0x7,0xC,0xC0,0x40,0x90,0x60,
-0x94,0x2C,0xD4,0xC5,0x34,0xC3,0x3C,0xC3,0x3E,0xC5,0x6A,0xC3,0xC,0x0,0xE,0xC2,0xE6,0x1,0x10,0x85,0xC9,0x7E,0xC5,0x16,0xC5,0x42,0xC5,0x86,0x1,0x10,0x81,0xC9,0x20,0xC5,0x7E,0xC5,0x44,0xC5,
-0x42,0x7,0x2C,0xD0,0x60,0x90,0x60,0x9C,0x2C,0xDC,0xC5,0x76,0xC7,0x3E,0xC5,0x88,0xC7,0x62,0x1,0xE,0x1D,0xCB,0x7E,0xC6,0x62,0x43,0x1,0x34,0xC4,0x90,0xD6,0x20,0xC6,0x6A,0xB,0x2C,0xD8,0x60,
-0x98,0x40,0x9C,0xC,0xDC,0x2D,0x1,0x2E,0x1,0xD1,0x1E,0xCB,0x4E,0xC9,0xBE,0xC7,0xE4,0x2,0x34,0x5,0x37,0xC8,0xD2,0xC7,0xB0,0xCB,0x36,0x16,0x2D,0x5,0x2B,0x5,0xC,0xD8,0x40,0x98,0x18,0x81,
-0xF,0x81,0xC,0x11,0xC,0x15,0xE,0x15,0x2D,0x5,0x2F,0x1,0x2D,0xCA,0x68,0xD7,0x4E,0x87,0x4E,0x2,0x8D,0xCA,0x2,0xC7,0xF2,0x1,0x2B,0x5,0xC3,0x44,0x0,0xD,0x43,0x81,0xC,0x3,0x85,0xF,
-0x81,0x18,0x88,0x41,0x0,0x5,0x14,0x85,0xC,0x81,0xB,0x15,0xC6,0x68,0x0,0x5,0xCD,0xD0,0x83,0xFA,0x1,0xCE,0xD4,0x8C,0x13,0x3,0xC5,0x58,0x0,0x2F,0xC2,0xB2,0xC7,0x58,0x0,0x14,0xC8,0x58,
-0x8F,0x36,0x0,0xCB,0x68,0x0,0x2E,0xC2,0xF6,0x2,0xE,0x11,0xF,0x44,0x11,0x18,0x1,0xE,0x15,0xC7,0xDE,0xC3,0xE8,0x0,0xE,0xC4,0x14,0x0,0xF,0xC2,0x16,0x2,0x2D,0x1,0x2B,0xC6,0xB0,0x3,
-0xB,0x85,0xC,0x85,0xCA,0x58,0x99,0x5B,0x0,0xC8,0xD0,0xCB,0x8A,0xC6,0x10,0x2,0xC1,0xF,0x51,0xC3,0xFA,0xCE,0x16,0xCB,0xB0,0xF8,0x26,0x60,0xD3,0x30,0x1,0x14,0x8D,0x43,0xF,0xD9,0x88,0xD2,
-0x0,0xF8,0x25,0x4,0xF0,0x23,0x25,0x0,0x84,0xCB,0x0,0x1,0xF,0x1D,0x83,0x22,0x3,0x83,0xBC,0x2,0x0,0xF,0x83,0x5D,0x1,0xF8,0x47,0x60,0xC2,0xFA,0xC9,0x5C,0x89,0x18,0x3,0xC7,0x64,0x5F,
-0xFF,0x83,0xF8,0x23,0xC0,0x1,0x10,0x85,0x53,0xFF,0x0,0x0,0x10,0xC4,0xDE,0xF8,0x41,0x60,0x1,0x14,0x8D,0xCD,0xBC,0xC9,0xC4,0xC3,0xC2,0xF8,0x3E,0xC0,0xC2,0xC2,0xC9,0xBE,0x1,0x30,0x1,0x83,
-0x36,0x4,0x0,0x30,0x88,0xCB,0x2,0xC3,0xC2,0xF8,0x4B,0x60,0x0,0x1A,0x44,0x81,0x1B,0x0,0x1A,0xC8,0x70,0xF8,0x42,0x60,0x2,0x85,0x11,0x81,0x95,0x86,0x6,0xF8,0x49,0x60,0x3,0x39,0x87,0x2F,
-0x83,0xD3,0x62,0x3,0x2E,0x83,0x39,0x83,0xF8,0x41,0xC0,0x4,0x14,0x8D,0xE,0x8D,0x37,0xD4,0x60,0x5,0x37,0x83,0xE,0x89,0x14,0x89,0xF8,0x3F,0xC0,0x5,0x39,0x87,0x38,0x87,0xB9,0x82,0xD1,0xC0,
-0x7,0xE,0x11,0x36,0x83,0xF,0x85,0x14,0x81,0xF8,0x40,0xC0,0x2,0x85,0xF,0x85,0xC2,0x4A,0x4,0x15,0xE,0x15,0x2E,0x5,0x87,0x54,0x7,0x2,0xB8,0x82,0x38,0x83,0x7D,0x8,0xC4,0xE0,0xF0,0x41,
-0xC2,0x7,0xC5,0xE2,0x3,0x1C,0x85,0x1B,0x85,0x89,0xB4,0x7,0x85,0xBC,0x2,0xF8,0x45,0x60,0x3,0x14,0x8D,0x36,0x8B,0x8F,0x28,0x6,0xC5,0x62,0x1,0x36,0x8B,0xF0,0x41,0xE0,0x8,0x83,0x2,0x8,
-0x1,0x37,0x8B,0x55,0xFF,0x0,0x2,0xB9,0x82,0x39,0xE8,0x20,0x83,0xFF,0xF0,0x23,0x42,0x8,0x0,0xB8,0x8A,0x27,0x9,0x2,0x30,0x1,0x2F,0x88,0x53,0x7,0x2,0x37,0x83,0x10,0xF0,0x3F,0x41,0x9,
-0xC2,0xDE,0x8D,0x86,0x6,0x1,0x1A,0x81,0x89,0xEC,0x9,0x0,0xB8,0xF8,0x41,0xC0,0x4,0x81,0x14,0x8D,0xD,0x8D,0x57,0xFF,0x0,0x1,0xD,0x81,0xF0,0x21,0x40,0x9,0xDF,0xE0,0x0,0x39,0x94,0x25,
-0x9,0x88,0x96,0x6,0xF8,0x40,0x60,0x2,0x14,0x85,0xD,0x86,0x87,0x6,0x1,0x30,0x1,0x8B,0x52,0x7,0xF8,0x48,0x60,0x88,0xC3,0xB,0x83,0xAE,0x7,0x8C,0xEE,0x9,0x1,0x11,0x14,0xF8,0x42,0xC0,
-0x97,0x64,0x8,0x2,0xFF,0x0,0xD,0x84,0xD1,0x0,0xF8,0x3F,0xC0,0x1,0x10,0x85,0x93,0xC6,0x8,0x3,0xB9,0x82,0x38,0x83,0x83,0x7E,0xB,0xF0,0x43,0x40,0xC,0x3,0x36,0x83,0xE,0x15,0x97,0xCA,
-0xB,0xF8,0x41,0xC0,0x43,0x11,0x81,0x83,0x22,0x9,0x8B,0x6,0xB,0xF0,0x2B,0x56,0xA,0xF8,0x23,0x60,0x8B,0x86,0x6,0x8B,0x8C,0xC,0xF0,0x23,0x7E,0xB,0xF0,0x21,0xC2,0xC,0x1,0x36,0x8B,0x8B,
-0x2A,0x6,0x8B,0xEC,0xC,0x1,0x37,0x8B,0xF0,0x21,0x20,0xB,0xF0,0x21,0x2,0xC,0x91,0x6A,0xE,0xF0,0x2B,0xB6,0xA,0xF0,0x35,0x82,0xD,0xF0,0x29,0x18,0xB,0xF0,0x3B,0x2,0xC,0xF0,0x44,0xDE,
-0xE,0x98,0x3,0xE,0x83,0x3A,0x9,0xF0,0x41,0xE0,0xB,0x85,0x62,0xE,0x83,0x96,0x9,0xD,0x2F,0x83,0x1D,0xC4,0x1C,0x54,0x1C,0x50,0x1D,0x50,0x2E,0x83,0x38,0x83,0x83,0xBE,0xA,0xC3,0x1C,0xF8,
-0x43,0x60,0xC2,0xC4,0x5,0x87,0xE,0x85,0x37,0x83,0x43,0x43,0x4,0x42,0x1,0x0,0x43,0x83,0xDB,0x8,0x0,0x81,0xC3,0xBC,0xF8,0x47,0x60,0xC5,0xC4,0x2,0xB9,0x82,0x63,0x43,0x94,0x62,0x2,0x90,
-0x63,0x90,0xC7,0xBC,0xF8,0x23,0xC0,0xE4,0x94,0x0,0x4,0xD3,0xD2,0x0,0x92,0xD3,0xD0,0xF,0x2,0xD3,0xD2,0x92,0x25,0x0,0x0,0x93,0xC2,0x1F,0x0,0x93,0x30,0x0,0x0,0x92,0xC2,0x35,0xCD,0xF,
-0xCE,0x1F,0xC7,0x34,0xC2,0x5E,0xCE,0x38,0xC9,0x44,0xC5,0x5E,0xC7,0x52,0x0,0x93,0xC2,0x66,0x0,0x41,0x2E,0x0,0xCE,0x57,0xCD,0x10,0x3,0x40,0x1,0x0,0xFF,0xCC,0x94,0xCA,0xC6,0x33,0x0,0x3,
-0xFF,0x1,0x0,0xFE,0xD8,0x8D,0xD2,0xC6,0x3,0xFE,0x1,0x0,0xFD,0xE4,0x2B,0x0,0x6,0xFD,0x1,0x0,0x0,0x53,0x53,0x52,0xE4,0x30,0x0,0xF8,0x39,0x34,0x1,0x12,0x13,0xC8,0x70,0xCA,0xB,0xE4,
-0x20,0x0,0x0,0x3,0x8C,0x53,0x13,0xE4,0x21,0x0,0xA3,0xB7,0x14,0xF0,0x2C,0x6D,0x12,0xF0,0x20,0x5F,0x13,0xCD,0x2E,0xF0,0x23,0x5C,0x13,0xE4,0x36,0x0,0x8E,0x5,0x13,0xE5,0x1A,0x0,0x0,0x12,
-0xE4,0x25,0x0,0xF0,0x32,0xE5,0x13,0xF0,0x2C,0x17,0x15,0x89,0xF5,0x12,0xF1,0x1E,0x7F,0x15,0xF0,0x57,0x6D,0x16,0xE4,0x5D,0x0,0xF0,0x37,0xC6,0x16,0xF0,0x57,0x7C,0x15,0x8F,0x33,0x13,0xE4,0xAF,
-0x0,0x8A,0xE6,0x13,0xF0,0x28,0x7F,0x18,0x2,0x42,0xFF,0xFE,0xF0,0x2C,0xB3,0x13,0xE4,0x2F,0x0,0x23,0x2,0x35,0x0,0x47,0x3F,0x1,0x0,0x3E,0xC4,0x4,0xC3,0x6,0x3,0xD6,0x2,0xD7,0x2,0x49,
-0x3F,0x1,0x5F,0xFF,0x0,0xDF,0x40,0xC9,0x4A,0x47,0x3E,0x1,0xC9,0x70,0xF8,0x2B,0x60,0xD7,0x40,0xC9,0x5A,0x0,0x3D,0xCA,0x5C,0xC9,0x6C,0xF8,0x23,0xC0,0xDB,0x40,0xC7,0xD6,0xC7,0xBC,0xC7,0x6C,
-0xC3,0x6E,0xF8,0x25,0x60,0xDD,0x40,0xCB,0xDE,0xC7,0xE8,0x5,0x3D,0x1,0xB4,0x2,0xB5,0x2,0xC5,0x62,0xF0,0x29,0x22,0x1B,0xD5,0x40,0xD1,0x62,0xC3,0xEA,0x2,0xD4,0x2,0xD5,0xF8,0x2E,0x60,0xD7,
-0x40,0xC5,0xDE,0x3,0xB6,0x2,0xB7,0x2,0x87,0x78,0x1B,0xCB,0xE0,0xF8,0x21,0xC0,0xDF,0x40,0x93,0xE,0x1B,0xF0,0x2B,0xD6,0x1B,0xDF,0x40,0xC9,0xD8,0xC7,0xC4,0xCD,0x16,0xF0,0x27,0x42,0x1C,0xD7,
-0x40,0xC3,0xD8,0xC5,0xDA,0xC5,0xC4,0x8D,0x6C,0x1B,0x1,0xB6,0x2,0xDF,0xC0,0xDF,0x40,0xC5,0xD8,0x8D,0xCE,0x1B,0x87,0x3C,0x1D,0xC3,0xF8,0xDF,0xC0,0xDF,0x40,0x8B,0x20,0x1C,0x8F,0x66,0x1B,0xF0,
-0x2B,0xDE,0x1B,0xD7,0x40,0x89,0x34,0x1C,0x8B,0xEA,0x1C,0xC9,0xCC,0xF0,0x23,0x62,0x1D,0xDB,0x40,0x85,0x92,0x1C,0xC9,0x60,0x8B,0x7C,0x1C,0xF0,0x25,0x9E,0x1C,0xDD,0x40,0xCF,0x8,0xCB,0xE6,0xF0,
-0x27,0x1E,0x1B,0xDB,0x40,0xCD,0x6C,0x8F,0x44,0x1D,0xF0,0x2B,0x20,0x1B,0xF8,0x35,0x40,0xFA,0x1F,0x20,0x43,0x12,0x1,0x0,0x13,0x84,0x47,0x1D,0x0,0x13,0xC4,0xA,0xC3,0x6,0x0,0x12,0x44,0x1,
-0x11,0x49,0x12,0x1,0xDB,0x20,0xF8,0x25,0x60,0x83,0x14,0x1B,0x49,0x13,0x1,0xCB,0x5A,0xDF,0x20,0xDF,0xFE,0xC7,0x42,0xC9,0xC4,0xC9,0xC6,0xC9,0x6E,0xD9,0x20,0xF0,0x21,0x82,0x1E,0xC5,0xF4,0xC7,
-0xC4,0xC9,0xBA,0xC9,0x74,0xDB,0x20,0xF0,0x21,0xE2,0x1E,0xC7,0x60,0xC9,0xFA,0x87,0x5A,0x23,0x89,0xA6,0x23,0xD9,0x20,0xF0,0x21,0xE2,0x23,0xC7,0xF4,0xCD,0x64,0xCF,0x12,0xD7,0x20,0xF0,0x23,0x22,
-0x23,0x85,0x58,0x23,0x8B,0x10,0x24,0x8D,0xB2,0x23,0xDB,0x20,0xF0,0x23,0xE2,0x23,0xCB,0x60,0x89,0x1A,0x24,0xC9,0xD8,0xDB,0x20,0xF0,0x29,0x2,0x25,0xC7,0xFA,0x8D,0x1E,0x24,0xDF,0x20,0xF8,0x23,
-0x60,0x8D,0x22,0x25,0x8B,0x48,0x23,0x8D,0xAC,0x23,0xD3,0x20,0xE8,0x3F,0xFF,0x0,0xF0,0x3F,0x2,0x1B,0xF0,0x3F,0x82,0x1B,0xF8,0x43,0xC0,0xF0,0x3B,0xC6,0x1B,0xF0,0x3F,0x42,0x1C,0xF0,0x49,0xE2,
-0x26,0xF0,0x35,0x8C,0x1C,0xF0,0x3F,0x2,0x1D,0xF8,0x3F,0xC0,0xF0,0x3F,0x42,0x1D,0xF0,0x3F,0xC2,0x1D,0xF0,0x47,0x2,0x28,0xF0,0x37,0xA,0x1E,0xF0,0x3F,0x82,0x1E,0xF8,0x3F,0xC0,0xF0,0x3F,0xC2,
-0x1E,0xF0,0x3F,0x42,0x1F,0xF0,0x43,0x22,0x29,0xF0,0x3B,0x86,0x1F,0xF0,0x3F,0x2,0x20,0xF0,0x49,0x2,0x2B,0xF0,0x35,0x4C,0x20,0xF0,0x5F,0xC2,0x20,0x0,0x0],
-0x2196B1: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF],
-0x21BBA7: [0xDB,0x1E,0x3,0xE,0x8D,0xE,0x89,0xCF,0x22,0x3,0x14,0x8D,0x36,0x8B,0xC5,0x36,0xC,0x39,0x87,0xB8,0x82,0x38,0x83,0x39,0x83,0x14,0x8D,0xF,0x89,0x18,0xC8,0x48,0x3,0x10,0x85,0x37,0x8B,0xC5,0x36,
-0x1,0x10,0x85,0x43,0xFF,0x0,0x7,0xE,0x19,0xE,0x1D,0xC,0xC0,0x40,0x90,0xC7,0xE0,0x2,0x39,0x87,0xB9,0xC5,0x36,0x2,0x1D,0xE,0x1D,0x47,0xFF,0x0,0x2,0x2C,0xD0,0x60,0xC8,0x20,0xC9,0x36,
-0x49,0xFF,0x0,0x3,0x2C,0xD8,0x60,0x98,0xC6,0x7C,0x0,0x8F,0xCB,0x18,0xC7,0x40,0x2,0xC,0xD8,0x40,0xC4,0x20,0xC3,0x92,0xCF,0x1E,0x6,0x2E,0x83,0x38,0x83,0xB9,0x82,0xD,0xC5,0x3C,0x2,0x8D,
-0x37,0x8B,0xCF,0x3E,0x6,0x37,0x83,0xE,0x81,0x36,0x83,0x14,0xC6,0x98,0xCF,0x40,0x1,0xE,0x11,0xC3,0x1C,0xC4,0xF8,0x4,0x85,0x36,0x87,0xE,0x85,0xC3,0xBC,0xA,0x2F,0x83,0x1D,0xC4,0x1C,0x54,
-0x1C,0x50,0x1D,0x50,0x2E,0xC2,0xFE,0x8C,0x6A,0x0,0xC4,0x24,0x2,0x37,0x83,0x43,0x43,0x4,0x42,0x1,0x0,0x43,0xC3,0x5C,0x1,0x89,0xF,0x87,0x99,0x0,0x46,0x85,0x11,0xC3,0x68,0x0,0x63,0x43,
-0x94,0x62,0x2,0x90,0x63,0x90,0x83,0xB6,0x0,0x1,0xB9,0x82,0xC5,0x44,0xE4,0x6B,0x0,0x2,0x92,0xD2,0x40,0x28,0x0,0x1,0x93,0xD2,0x23,0x0,0x0,0xFF,0xC9,0x1B,0x24,0x0,0x0,0xFE,0x24,0x0,
-0xC5,0xC,0x23,0x0,0x0,0xFD,0xE4,0x2B,0x0,0x0,0x12,0x29,0x0,0x2,0x42,0xFF,0xFE,0xDC,0x3B,0x23,0x1,0x25,0x0],
-0x21BCA3: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF],
-0x22D564: [0xF2,0x1,0x2,0x0,0x5,0x92,0x85,0x8F,0x89,0x8F,0x8D,0xC6,0x4,0xC9,0xA,0xF8,0x22,0x8,0x1,0x92,0x81,0xF0,0xC3,0x40,0x0,0x9,0x7B,0x81,0x6F,0x81,0x77,0x15,0x8C,0x81,0x77,0x11,0x43,0x8C,0x81,
-0xC5,0x6,0xC5,0x4,0xC7,0xC,0x47,0x8D,0x11,0x4B,0x8A,0x11,0x5,0x8C,0x81,0x6E,0x81,0x7B,0x85,0xF0,0xC1,0x40,0x0,0x5,0x8F,0x89,0x93,0x89,0x79,0x81,0xE8,0x33,0xFF,0x0,0x5,0x77,0x11,0x93,
-0x8D,0x8F,0x89,0xE8,0xBF,0xFF,0x83,0x3,0x40,0x94,0xC,0xC4,0xE8,0x37,0xFF,0x0,0x3,0xC,0xC0,0x40,0x90,0xE8,0xBF,0xFF,0x83,0x3,0x60,0x94,0x2C,0xD4,0xF8,0x29,0xFE,0x1,0xC0,0x2,0xCB,0x2C,
-0x2,0x2C,0xD0,0x60,0xF0,0xC1,0x41,0x6,0x2,0x9C,0x2C,0xDC,0xE8,0x29,0xFF,0x0,0x4,0xE1,0x2,0xFF,0x0,0xA2,0x88,0x31,0x7,0x3,0x2C,0xD8,0x60,0x98,0xF0,0xC0,0x42,0x5,0x1,0x9C,0xC,0xF0,
-0x26,0x5,0x8,0x4,0xA3,0x2,0xC0,0x2,0xE0,0xC4,0x4,0x87,0x2E,0x7,0x2,0xC,0xD8,0x40,0xF0,0xC0,0x41,0x8,0x6,0x93,0x81,0x8E,0x81,0x6B,0x81,0x6C,0xF0,0x20,0x7,0x5,0x0,0x6A,0x52,0x81,
-0x6B,0x3,0x8E,0x85,0x93,0x85,0xE8,0xBF,0xFF,0x83,0x0,0x7B,0x44,0x81,0x6E,0x0,0x6F,0xF0,0x20,0x7,0x5,0x1,0x75,0x11,0x45,0x6E,0x81,0x4,0x93,0x85,0x8F,0x81,0x8F,0xC8,0x4,0x0,0x92,0xF0,
-0xC0,0x41,0x5,0x2,0x92,0x8D,0x93,0xF0,0x24,0x5,0xB,0x1,0xFF,0x0,0x43,0x8C,0x81,0x85,0x3C,0x4,0xF0,0xCE,0x36,0x2,0x1,0x8D,0x93,0xF0,0x24,0x7,0xC,0xC3,0x22,0x3,0x6F,0x85,0x7B,0x8D,
-0xF0,0xD1,0x34,0x0,0x83,0x4,0x4,0x8F,0x2E,0x7,0x98,0x1A,0xD,0xF0,0xD0,0x33,0xC,0x87,0x4,0xE,0x1,0xE0,0x6,0xF0,0xF7,0xE,0xD,0x1,0x92,0x8D,0xF0,0x25,0x4,0xA,0x93,0x2E,0xD,0xF0,
-0xBF,0x2,0x0,0xC5,0xCE,0xF0,0x25,0x4,0xD,0x3,0xA6,0x86,0x6E,0x81,0xF0,0xD5,0x32,0x10,0x3,0x81,0x80,0x7B,0x89,0x87,0x8,0xB,0x99,0xC,0xE,0x3,0xA6,0x8E,0x6E,0x81,0x83,0x3E,0x5,0x8C,
-0x12,0x3,0x94,0x2D,0x3,0xF0,0xB2,0x58,0x11,0x2,0x81,0x6F,0x81,0xC5,0xFA,0x1,0xE1,0x2,0x89,0x30,0x7,0x0,0xA3,0x8E,0xD,0xE,0x1,0x77,0x11,0x5D,0x96,0x81,0x84,0x2E,0xB,0xF0,0x2C,0x51,
-0x12,0xF0,0x8B,0x82,0x11,0x83,0x30,0x9,0x0,0xA2,0x43,0x2,0xE0,0x0,0x6,0x83,0x2C,0x9,0xC3,0xFA,0x1,0xE1,0x6,0x89,0x34,0x8,0xF0,0x25,0xC,0xD,0x47,0x6E,0x81,0x9D,0x54,0x12,0x1,0x92,
-0x85,0x83,0x8,0x3,0x3,0x90,0x89,0x92,0x81,0xF0,0x89,0x82,0x12,0x83,0x4,0xA,0xD3,0x2,0x5,0x6C,0x81,0x6C,0xF5,0x6C,0x51,0xF0,0x27,0xA,0xD,0x0,0x70,0x46,0x81,0x6E,0x8C,0x32,0x12,0x85,
-0xF,0x3,0x0,0x8D,0x89,0x54,0x12,0x0,0x7B,0x46,0x81,0x96,0x0,0x7B,0xF0,0x80,0x41,0xA,0xC7,0x92,0x1,0x92,0x8D,0x8B,0x34,0xB,0xC4,0xC,0xC3,0xE,0x0,0x81,0xF0,0x29,0x6,0xD,0xC3,0x26,
-0x4F,0x96,0x81,0x87,0x52,0x15,0xC7,0x6,0x46,0x8F,0x8D,0x2,0x89,0x6E,0x89,0xC5,0x54,0xF0,0x89,0x80,0x15,0xD7,0x8,0x89,0xA,0x12,0xF8,0x33,0x6,0x1,0xA6,0x6,0x4B,0x6E,0x1,0x1,0x93,0x5,
-0x47,0xF0,0x2,0x0,0xA6,0x86,0x31,0x7,0xF0,0xA2,0x80,0x16,0x8A,0x7,0xB,0x0,0xA3,0xF0,0x22,0xD,0xF,0xCD,0x22,0x1,0xA6,0xE,0x8C,0x62,0x17,0x0,0xD,0x47,0xF0,0xA,0x1,0xA6,0xA,0xF0,
-0xAD,0x7A,0x16,0x87,0xE,0x13,0xE8,0x2F,0xFF,0x0,0x1,0x6F,0x85,0x48,0x6E,0x8D,0x85,0x6B,0x16,0xC3,0x2,0x1,0x85,0x8F,0xC2,0xC,0x5,0x6C,0x81,0x5D,0x80,0x6C,0x85,0xF0,0xA7,0x80,0x17,0x85,
-0x14,0x13,0x1,0xE1,0x2,0x89,0x20,0x13,0x87,0x30,0x7,0x9D,0xC,0xE,0x1,0x6F,0x85,0x4A,0x6E,0x89,0x3,0x81,0x70,0x81,0x93,0x86,0x6D,0x15,0x84,0xA,0x16,0x2,0x81,0x90,0x81,0xF0,0x81,0x40,
-0xB,0xF0,0x23,0x2,0x17,0x83,0x12,0x14,0x83,0x14,0x13,0xC3,0x6,0xC4,0xFC,0x0,0x6,0x83,0xA,0xF,0x85,0x18,0x14,0x83,0x30,0x9,0xF0,0x20,0x36,0x14,0xC4,0xFE,0x0,0x6F,0x84,0x69,0x19,0x87,
-0x70,0x1A,0xF0,0x8F,0x7A,0x11,0x99,0xA,0x18,0x97,0xC,0x15,0x8D,0x18,0x15,0x9E,0x4A,0x1B,0x86,0x65,0x1B,0xC3,0xE,0x8D,0x32,0xC,0xF0,0x9F,0x82,0x0,0x8A,0xA,0x16,0xC7,0x6,0x8E,0xF,0x16,
-0x83,0x4,0xC,0x1,0xA6,0x82,0x98,0x3A,0x14,0xC5,0x2,0x83,0x65,0x1B,0xC2,0x6,0x83,0x52,0x15,0x8D,0x72,0x1B,0xF0,0xBF,0x82,0x0,0x83,0x2,0x4,0x3,0x6E,0x81,0xA6,0x8A,0xC5,0xFE,0x0,0xA2,
-0x8E,0xD,0xF,0x89,0x50,0x14,0xCB,0x8,0x8B,0x32,0xC,0xF0,0xC2,0x82,0x1D,0x86,0xB,0x12,0x85,0x2A,0x1A,0xF0,0x23,0x52,0x1E,0x8B,0x54,0x13,0xF0,0xC5,0x42,0x3,0x83,0x20,0x13,0x83,0x14,0x13,
-0x8F,0x2E,0x19,0x4F,0x96,0x81,0x85,0x50,0x14,0xC3,0x6,0x8F,0x72,0x1B,0xF8,0x77,0xC,0xF0,0x42,0xC2,0x3,0x84,0xB,0x14,0x0,0xA3,0xC2,0xFC,0x43,0xE0,0x2,0x9D,0xC,0xE,0x83,0x2E,0x11,0x0,
-0x70,0x86,0x6F,0x20,0x84,0x32,0x12,0xF0,0x40,0x41,0x12,0xF0,0x82,0xC2,0x20,0x8C,0xB,0x15,0x9D,0x8,0xA,0x83,0x2E,0x12,0xC7,0x2,0x97,0x3C,0x13,0xF0,0x4F,0x32,0x10,0xF0,0x5F,0xE4,0x20,0x1,
-0x92,0x8D,0x88,0x36,0xB,0xF0,0x22,0x21,0x16,0xC9,0xF6,0x97,0x3C,0x14,0x8F,0x32,0xC,0xF0,0x9F,0xA4,0x20,0x91,0x16,0x18,0x0,0xC0,0x8A,0x2F,0x1A,0xF0,0x30,0x32,0x19,0xF0,0xB0,0x93,0x22,0x93,
-0x16,0x1B,0x83,0x48,0x21,0x85,0x30,0x7,0xF0,0x23,0xC,0xE,0x8D,0x46,0x14,0xF0,0x6D,0x7A,0x20,0xF0,0x4F,0x2,0x24,0x93,0xC,0x15,0xF0,0x23,0xC,0x10,0x8B,0x4A,0x14,0xF0,0x6B,0x7A,0x20,0xF0,
-0x4D,0xC2,0x0,0x84,0x44,0x23,0xCC,0x2,0x83,0x4,0xC,0x97,0x18,0x13,0xF0,0x39,0x3E,0x14,0xF0,0x97,0xB8,0x23,0x95,0x32,0x1E,0x8B,0x28,0x8,0xF0,0x27,0x32,0x14,0xF0,0x67,0x7A,0x20,0xF0,0x77,
-0x2,0x28,0x95,0xC,0xE,0x89,0x50,0x15,0x84,0x30,0x12,0x90,0x37,0x12,0xF0,0x51,0x7C,0x20,0xF0,0x69,0x2,0x28,0x8D,0x4E,0x20,0x87,0x30,0x8,0x8D,0x30,0x7,0x9D,0x34,0x13,0x89,0x6E,0x1A,0xF0,
-0xAA,0xB8,0x27,0x0,0x89,0x87,0xC,0x13,0x85,0x56,0x25,0xC3,0xF2,0x85,0x3E,0x1B,0x83,0x12,0x14,0x9F,0x40,0x1B,0xF0,0x61,0x84,0x26,0xF0,0x83,0xC2,0x1B,0xF0,0x25,0x66,0x26,0x87,0x50,0x14,0xF0,
-0x4D,0x94,0x23,0xF0,0x62,0xC2,0x1C,0x8F,0x33,0x1D,0xCE,0xC,0x8F,0x6,0xD,0x97,0x58,0x24,0x85,0x70,0x21,0xF0,0x4F,0x78,0x20,0xF0,0x83,0xC2,0x1D,0x8D,0x8,0xB,0x97,0x2E,0x19,0x89,0x70,0x22,
-0xF0,0x4B,0x94,0x23,0xF0,0x89,0xC2,0x1E,0xF0,0x21,0x66,0x29,0x47,0x96,0x81,0xF0,0x2D,0x54,0x13,0xF0,0x9F,0x64,0x10,0x87,0x22,0x18,0x87,0x34,0x8,0x85,0x14,0x13,0x9B,0x28,0x19,0xF0,0x4B,0x76,
-0x20,0xF0,0x82,0x82,0x3,0x86,0x63,0x2B,0x87,0x58,0x25,0x85,0x2E,0x1B,0x83,0x34,0x9,0x9B,0x9E,0x30,0x8D,0x7A,0x21,0xF0,0x39,0x7C,0x20,0xF0,0x83,0x82,0x3,0x9B,0x24,0x1C,0x93,0x8,0xA,0x4D,
-0x96,0x81,0x83,0x3A,0x4,0x90,0x32,0x12,0xF0,0x28,0x17,0x3,0xF0,0x83,0x82,0xC,0x97,0x66,0x2D,0x83,0x6,0xD,0x97,0x48,0x1D,0x90,0x54,0x1D,0x96,0x79,0x22,0x9D,0x92,0x2A,0xF0,0x9D,0x80,0x16,
-0x83,0x4,0x4,0x87,0x48,0x1E,0xF0,0x21,0xAA,0x33,0xF0,0x2F,0x24,0x17,0x85,0x90,0x24,0xF0,0x9C,0x2,0x34,0xF0,0x26,0x23,0x17,0xF0,0x35,0xC6,0x34,0x2,0x79,0x85,0x78,0xF0,0xA2,0xFF,0x33,0x85,
-0x34,0x1B,0xF8,0x21,0xCA,0xF0,0x31,0xCA,0x34,0xF0,0x85,0x3C,0x6,0x9F,0x6,0x17,0x1,0xA3,0x2,0x87,0xC,0xF,0x8B,0x30,0x7,0x3,0x6A,0x81,0x6A,0x85,0xCF,0xEE,0xF0,0x31,0x6,0x5,0xF0,0x83,
-0x3E,0x7,0xF0,0x23,0x6,0x1C,0x85,0x8,0xA,0x8B,0x2E,0x19,0x1,0x6F,0x85,0x9D,0x8,0xB,0x9F,0x22,0x14,0x85,0x30,0x7,0xF0,0x83,0x3E,0x8,0x9F,0x46,0x2D,0x0,0x93,0x83,0x73,0x21,0x8A,0xA7,
-0x38,0x85,0xA4,0x36,0x9F,0xB8,0x38,0x87,0x2E,0x19,0xC5,0xE8,0x91,0x58,0x24,0x85,0x9A,0x31,0xF0,0x83,0x3E,0x9,0xF0,0x23,0x24,0x1E,0xC3,0xEC,0x83,0x4A,0x21,0xC4,0xDA,0x0,0x6,0xC3,0xD6,0x8B,
-0xB8,0x38,0x93,0xC,0xE,0x87,0x14,0x13,0xC6,0x34,0x8C,0x31,0x1A,0x83,0x20,0x13,0x85,0x2A,0xA,0x2,0x8E,0x85,0x91,0xF0,0x88,0x81,0x14,0x9B,0xA,0x17,0x83,0xC,0x13,0x83,0x4C,0x21,0x83,0x34,
-0x8,0x1,0xE0,0x6,0x83,0x2E,0x9,0x85,0xB8,0x38,0x83,0x10,0x14,0x87,0x98,0x31,0xC5,0xC,0xC7,0xE6,0x43,0xE0,0x2,0x43,0xA2,0x2,0x87,0xE0,0x3A,0x87,0x30,0x7,0x83,0x2E,0x1A,0xC3,0x4,0x1,
-0x6F,0x85,0x84,0x32,0xB,0xF0,0xA3,0x7F,0x1A,0xC2,0xFE,0x91,0xC,0x15,0x1,0x8E,0x85,0xF0,0x23,0x24,0x1C,0xD9,0x22,0x0,0x8E,0x88,0x31,0xE,0xF0,0xA2,0x82,0x1C,0x9E,0x65,0x2D,0xDA,0x1C,0xD3,
-0xA,0xC6,0x4C,0x1,0x92,0x89,0xF0,0xC7,0x7C,0x1D,0xF0,0xC5,0x44,0x11,0xF8,0x77,0x8,0xE6,0x2,0x0,0x3,0xC3,0x0,0x83,0x0,0xC3,0x3,0x22,0x0,0xC3,0x6,0x29,0x80,0xE4,0x80,0x0,0xC5,0x95,
-0xE4,0x5D,0x0,0x0,0x41,0x3B,0x0,0x1,0x40,0x1,0xE4,0x60,0x0,0x0,0xFF,0xDC,0x1D,0xF8,0x61,0x80,0x0,0xFE,0xDC,0x1D,0xF8,0x61,0x80,0x0,0xFD,0xDC,0x1D,0xF8,0x61,0x80,0xE4,0x92,0x0,0xF8,
-0xF4,0xF5,0xE7,0xD,0x0,0xF0,0x63,0x9F,0x42,0xE4,0x96,0x0,0x0,0x1,0x9C,0x83,0x43,0xE7,0xFF,0x0,0xE7,0xFF,0x0,0xE7,0xFF,0x0,0xE7,0xFF,0x0,0xE4,0xCD,0x0,0x1,0x40,0x2,0xE4,0x7D,0x0,
-0x0,0xFF,0xF8,0x7E,0x80,0x0,0xFE,0xF8,0x7E,0x80,0x0,0xFD,0xF8,0x7E,0x80,0xE6,0x81,0x0],
-0x22DBB3: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF],
-0x22DEF0: [0xC7,0x18,0xE8,0xDF,0xFF,0x83,0x8E,0xA2,0x0,0x2,0x0,0x6B,0x4,0xF3,0xFF,0xB4,0x0,0xF3,0xFF,0xB4,0x0,0xF3,0xFF,0xB4,0x0,0xF3,0xFF,0xB4,0x0,0xF3,0xFF,0xB4,0x0,0xF3,0xFF,0xB4,0x0,0xF3,0xFF,
-0xB4,0x0,0xF1,0xF5,0xB4,0x0,0xF,0x6C,0x88,0x6D,0x88,0x6E,0x88,0x6B,0x80,0x6B,0x84,0x6E,0x8C,0x6D,0x8C,0x6C,0x8C,0xF0,0x47,0xBA,0x0,0xE8,0x7F,0x81,0x80,0x1,0xEB,0x81,0xCF,0xA,0xC3,0x12,
-0xC5,0x16,0xC5,0xA,0xC3,0x2,0xC7,0x8,0x43,0x44,0x0,0xC3,0x12,0x0,0xEC,0xC8,0x20,0xF8,0xC1,0x2,0x4,0xEB,0x81,0xE9,0x89,0xEC,0xC4,0xD4,0xC5,0xD8,0xC3,0xE,0x2,0xE9,0x89,0xEA,0xC4,0x6,
-0xC3,0x2,0xC5,0xF0,0xC5,0x16,0x43,0x44,0x0,0xC3,0x12,0xC3,0x22,0xC3,0x38,0x1,0xE9,0x89,0xF8,0x42,0x80,0x2,0x85,0xEB,0x85,0xC3,0x6,0x1,0xEC,0x8D,0xC3,0x70,0xC2,0x78,0xC4,0x8,0xC5,0x7C,
-0x0,0xEC,0xC5,0x6,0xC4,0x90,0xC5,0x10,0xC2,0x2E,0xC9,0xE,0xC2,0xB6,0xD7,0x20,0xC7,0xD6,0x0,0xEB,0xCA,0x4C,0xC3,0x4E,0x0,0xEB,0xC6,0x54,0xC3,0xA,0xC5,0xE0,0x7,0xBE,0x11,0xBD,0x11,0xE9,
-0x19,0xBE,0x11,0xC3,0x62,0x1,0xBE,0x11,0xC3,0xF4,0x4D,0xFF,0x0,0xC2,0x1E,0xC4,0x98,0x4B,0xE9,0x89,0xC5,0x2C,0xC3,0x28,0xC3,0x3A,0xC5,0x40,0xC5,0xA8,0xC3,0x30,0xC3,0x46,0xC9,0x9A,0xC7,0x64,
-0xC3,0x30,0x89,0x9E,0x21,0xC6,0x6,0x0,0x81,0xC5,0xF8,0x43,0xEA,0x89,0xC3,0xFC,0xC7,0x72,0xC5,0x5C,0xC2,0xF4,0x0,0x81,0xC7,0xC,0xC3,0xE,0xC2,0xA8,0xC2,0x2,0xC5,0x4C,0xC5,0x96,0xC3,0xE2,
-0x5,0xE9,0x8D,0xE9,0x1D,0xBD,0x15,0xC7,0x1C,0xC3,0xC6,0xC4,0xB2,0xC4,0x98,0xC3,0xDC,0xC3,0x46,0xDB,0x2,0xC9,0xEE,0xC3,0xFA,0xC3,0xE8,0x51,0xFF,0x0,0xC4,0xD8,0x0,0x81,0xC5,0xF2,0xC2,0xE0,
-0xC2,0x34,0xC7,0xAC,0xDB,0x6,0xC7,0x4A,0xD3,0x52,0xC4,0x70,0x4,0x81,0x9D,0x81,0xEB,0x85,0xD7,0x1E,0xC5,0xF4,0x8F,0x96,0x22,0x87,0x24,0x23,0x85,0xA2,0x22,0x84,0xA6,0x21,0x2,0x8D,0xBD,0x15,
-0xCF,0x1C,0xCD,0x9E,0xC2,0xD4,0x44,0x81,0x9F,0xC5,0xFE,0x0,0x9D,0xC2,0xFE,0x83,0xFE,0x22,0xC2,0x7C,0xCC,0xFE,0xCF,0xB6,0xCD,0xE0,0x2,0x7F,0x11,0xBC,0xC8,0x2C,0x2,0xBC,0x81,0x7F,0xC8,0x86,
-0xF8,0x3B,0x8,0x43,0x9D,0x81,0x9D,0x2,0x24,0xDD,0x66,0xC3,0xD0,0xC2,0xCA,0x0,0x85,0xF8,0x23,0x6A,0xC5,0xFC,0xC3,0xF8,0xC7,0x2,0xC5,0x14,0x95,0xE,0x24,0x87,0x68,0x24,0xC9,0xE6,0x0,0xBC,
-0xCA,0x2C,0x1,0xE9,0x81,0x89,0xAC,0x24,0xF8,0x3B,0x8,0xC3,0xC0,0x3,0x40,0x94,0xC,0xC4,0xF8,0x3B,0x40,0x43,0xE9,0x85,0xF8,0x26,0x2A,0xC4,0xF2,0x0,0xEC,0xC4,0xFE,0x89,0x6C,0x24,0x97,0xE8,
-0x24,0x85,0x78,0x24,0x8D,0xF4,0x23,0xD3,0xC,0xF8,0x3B,0x8,0x7,0xC,0xC0,0x40,0x90,0x60,0x94,0x2C,0xD4,0xF0,0x39,0x6,0x25,0xC2,0xA6,0xF0,0x2E,0x43,0x26,0x85,0x3E,0x25,0xC3,0xDE,0x85,0x70,
-0x25,0x99,0x52,0x25,0x0,0xEC,0xCC,0xE6,0x43,0x9D,0x81,0xD3,0xC,0xF8,0x3B,0x8,0x7,0x2C,0xD0,0x60,0x90,0x60,0x9C,0x2C,0xDC,0xF0,0x3B,0x6,0x25,0x0,0xEC,0xF0,0x24,0x43,0x25,0x5,0xE9,0xC1,
-0xEB,0xC1,0xEC,0xC1,0xC3,0x6,0x2,0xEB,0xC1,0x9D,0xC4,0x6,0x45,0xE9,0xC1,0x1,0x9D,0xC1,0xD9,0x5A,0x8D,0x9A,0x25,0x8B,0x80,0x23,0x99,0x7E,0x27,0xF8,0x2D,0xCA,0x6,0x2C,0xD8,0x60,0x98,0x40,
-0x9C,0xC,0xF0,0x3C,0x5,0x28,0xF0,0x25,0x42,0x26,0x0,0x9D,0xC4,0xFC,0xC7,0xF4,0xC3,0xFE,0x85,0x6A,0x28,0x0,0xE9,0x9A,0x81,0x28,0x83,0xB6,0x20,0xF0,0x45,0xB8,0x26,0xD7,0xE0,0x3,0xC,0xD8,
-0x40,0x98,0x85,0x70,0x25,0x0,0xEA,0xF0,0x34,0xB7,0x28,0x85,0x40,0x28,0xF0,0x25,0x44,0x28,0x0,0xE9,0x86,0x6B,0x28,0xC3,0xF4,0x89,0x78,0x28,0x8B,0x80,0x29,0x0,0xBF,0xCC,0xEC,0x87,0x68,0x25,
-0xF8,0x53,0xFE,0x43,0xEA,0x81,0xC5,0x5E,0x84,0x5E,0x22,0x44,0x81,0xEC,0xF8,0x33,0x6A,0x1,0xE9,0xF1,0x43,0xEB,0x1,0x1,0xE9,0xF5,0xCB,0xFE,0x1,0x5D,0x80,0x97,0x54,0x2A,0x83,0x72,0x28,0x85,
-0x6C,0x28,0x0,0xEC,0xC4,0xFA,0xC3,0x10,0x8B,0x80,0x29,0x0,0x9C,0xCC,0xEC,0x91,0x7C,0x23,0xF8,0x49,0xA,0xC5,0xF8,0xC3,0xFC,0x89,0x7A,0x20,0x83,0x72,0x26,0x47,0xEA,0x81,0xD3,0xA,0x85,0xF8,
-0x2A,0xCD,0xA,0x85,0x70,0x26,0xC7,0x3A,0xC3,0xB2,0x45,0xBF,0x81,0xCD,0x20,0xF0,0x21,0x66,0x23,0xC3,0x36,0x83,0xFC,0x24,0xC7,0xA,0xC3,0xF4,0x0,0x9A,0x8E,0x81,0x28,0xC5,0x5A,0x43,0xFF,0x90,
-0xC6,0xA,0xF0,0x3E,0xBB,0x2B,0x1,0x81,0x80,0xC7,0x4,0xC5,0x2,0x43,0xEC,0x81,0x85,0x8,0x2C,0xC3,0xD6,0x85,0x0,0x2B,0x8D,0x6C,0x25,0x85,0x6,0x2B,0xC7,0x24,0xC7,0x1A,0xF8,0x3F,0x20,0x9B,
-0x22,0x2C,0xCB,0x4,0x4F,0xBF,0x81,0x8B,0x12,0x2C,0x89,0x46,0x2C,0xC9,0xA,0x91,0x1E,0x2C,0xCB,0x60,0x87,0xA2,0x20,0xF8,0x81,0x2,0x87,0x98,0x29,0x89,0x6E,0x25,0x87,0x1A,0x2D,0x89,0x60,0x2C,
-0x86,0xA4,0x21,0x92,0x37,0x2D,0xC5,0x24,0xC7,0x40,0xC7,0x1C,0xDF,0x40,0xC7,0xFC,0xF0,0xC5,0xBE,0x20,0xF8,0x3D,0xC4,0xE4,0x56,0x0,0x1,0x2,0x2,0xE7,0xFF,0x0,0xE7,0xFF,0x0,0xE7,0xFF,0x0,
-0xE7,0xFF,0x0,0xE4,0xE7,0x0,0x3,0xD2,0x92,0x93,0xD2,0xC2,0x6,0x28,0x0,0x0,0x92,0xCB,0x1C,0x2,0x0,0x0,0x93,0xC5,0x20,0xC2,0x18,0xC8,0x23,0x0,0xD2,0xC9,0xB,0x2B,0x0,0xC5,0x21,0xC6,
-0x6,0x0,0x93,0xC2,0x38,0x0,0xD2,0xC5,0x4B,0xC3,0x42,0xC3,0x63,0x0,0x92,0xC3,0x4C,0xC6,0x14,0xF8,0x20,0x95,0xCD,0x88,0xE4,0x31,0x0,0xC6,0x8D,0xC7,0x4C,0xD4,0xB1,0xE4,0xC5,0x0,0x0,0x41,
-0xE4,0x7B,0x0,0x3,0x40,0x1,0x0,0xFF,0xE4,0x7B,0x0,0x3,0xFF,0x1,0x0,0xFE,0xE4,0x30,0x0,0x2C,0x9,0xE4,0x3D,0x0,0x3,0xFE,0x1,0x0,0xFD,0xF8,0x7B,0x80,0x1,0xFD,0x1,0xE4,0x32,0x0,
-0xF8,0x4A,0x80,0x3F,0x0,0x0,0x4,0xC4,0x3,0xF8,0x79,0x80,0xF8,0x30,0xAE,0x27,0x0,0x1,0x3,0x3,0xE5,0xA6,0x0],
-0x22E2E4: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF],
-0x22ECD8: [0xF8,0x35,0x82,0x1,0x6F,0x85,0xF8,0x2B,0xC0,0x2,0xC0,0x2,0xA3,0xC8,0x68,0x0,0xC0,0xF8,0x36,0x72,0xD5,0x3C,0x1,0xE1,0x2,0xC3,0x50,0xF8,0x31,0x54,0x6,0x6F,0x85,0x93,0x8D,0x91,0x85,0x79,0xF8,
-0x24,0xC0,0x4,0xA3,0x2,0xE0,0x2,0xE1,0xC6,0xC0,0x0,0xC0,0xC2,0xC,0x1,0xA2,0x6,0xF8,0x37,0xC2,0xC2,0x3C,0xC4,0xB0,0x89,0xBE,0x2,0xC3,0x5A,0xC3,0x54,0x89,0x2E,0x3,0xF8,0x25,0xCA,0x7,
-0x79,0x85,0x78,0x81,0x40,0x94,0xC,0xC4,0xDB,0xF8,0x0,0x6A,0x56,0x81,0x6B,0x2,0x6C,0x81,0x6A,0xE8,0x32,0xB1,0x6B,0x1,0x6C,0xB1,0xD7,0x50,0xC7,0x56,0xF8,0x2B,0xC2,0x7,0xC,0xC0,0x40,0x90,
-0x60,0x94,0x2C,0xD4,0xE8,0x89,0xFF,0x0,0x0,0x73,0xDA,0xC0,0x91,0x4E,0x4,0x7,0x2C,0xD0,0x60,0x90,0x60,0x9C,0x2C,0xDC,0xD1,0xF4,0xF0,0x2D,0xFA,0x3,0xF0,0x37,0xC6,0x2,0xF8,0x2D,0xC0,0x87,
-0xEE,0x3,0xCA,0xC0,0x5,0xD8,0x60,0x98,0x40,0x9C,0xC,0xC8,0xC0,0x89,0x38,0x3,0xD1,0x2C,0x99,0xE4,0x5,0xDB,0x2E,0x93,0x38,0x3,0xD3,0xEE,0xC7,0x7A,0xDB,0xC0,0x0,0xE0,0xD0,0xC0,0x4,0xC,
-0xD8,0x40,0x98,0x8E,0x88,0xF,0x5,0x0,0xC0,0x88,0xED,0x3,0xCF,0xEC,0xC9,0xD8,0xC9,0x24,0xD3,0x14,0xD1,0xE2,0xC3,0xDA,0xCD,0xC4,0xC5,0x66,0xD3,0x14,0xC5,0xC0,0xC3,0x3E,0xCF,0xF6,0xC5,0xDE,
-0xC9,0x9E,0xC3,0xEE,0x83,0xA2,0x4,0x4,0x8E,0x85,0x7B,0x85,0x93,0x88,0x43,0x2,0x83,0xEC,0x3,0x87,0x36,0x4,0xC3,0xA,0xC7,0x8C,0x83,0xF6,0x3,0x89,0x2C,0x4,0x0,0xE0,0xC6,0x22,0xC3,0x14,
-0x85,0xFA,0x3,0xC3,0x14,0x89,0xC6,0x2,0x0,0xA3,0xCA,0xCE,0xC3,0xEE,0xCB,0x3E,0xC9,0x2E,0xCD,0xF2,0xC5,0x7A,0xC5,0xC0,0x83,0x4C,0x4,0xCB,0x50,0x85,0xE8,0x3,0xC3,0x8E,0xC7,0x86,0xC5,0xEE,
-0x4,0x6F,0x85,0x70,0x81,0x6E,0x84,0x3F,0x2,0x0,0x8E,0xE8,0x8A,0x81,0x6B,0x0,0x6E,0xF8,0x28,0x8C,0xD,0x8E,0x85,0x6E,0x81,0x93,0x85,0x92,0x89,0x92,0x8D,0x8F,0x81,0x8F,0x85,0xF8,0x3A,0x4,
-0x43,0x81,0x90,0x43,0x85,0x8F,0xF8,0x6E,0x8,0xC3,0x74,0x1,0x92,0x89,0xE9,0x81,0x81,0x80,0xE6,0x40,0x0,0x0,0x41,0xE4,0x5B,0x0,0x3,0x40,0x1,0x0,0xFF,0xE4,0x5B,0x0,0x3,0xFF,0x1,0x0,
-0xFE,0xE4,0x5B,0x0,0x3,0xFE,0x1,0x0,0xFD,0xE4,0x5B,0x0,0x1,0xFD,0x1,0xE6,0x3F,0x0],
-0x22EE67: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF],
-0x241443: [0xF8,0x9F,0x40,0x9,0x16,0x8D,0x13,0x8D,0x32,0x81,0x36,0x89,0x32,0x85,0x43,0x13,0x8D,0xC7,0xA,0xC7,0x12,0x1,0x16,0x89,0xDF,0xC0,0xD,0x1A,0x8D,0x8,0x81,0x23,0x15,0x3,0x11,0x23,0x11,0x8,0x15,
-0xC,0x15,0xC3,0xC,0xC3,0xA,0xC6,0x12,0x1,0x85,0x1A,0xF8,0x20,0x40,0x3,0xC,0x85,0x2,0x81,0x45,0xFF,0x0,0x5,0x9,0x5,0xFF,0x0,0xA,0x85,0xC7,0xA,0xC3,0x14,0x3,0x2,0x85,0xC,0x85,
-0xDF,0xC0,0x3,0x40,0x94,0xC,0xC4,0x49,0xFF,0x0,0x0,0xB,0xC6,0x3A,0xC5,0x52,0x3,0xC,0xC0,0x40,0x90,0xDF,0xC0,0x3,0x60,0x94,0x2C,0xD4,0x57,0xFF,0x0,0x2,0x2C,0xD0,0x60,0xF8,0x21,0x40,
-0x2,0x9C,0x2C,0xDC,0xD8,0x40,0x2,0xD8,0x60,0x98,0xF8,0x20,0xC0,0x1,0x9C,0xC,0xD8,0x40,0x2,0xC,0xD8,0x40,0xF8,0x20,0x40,0x9,0x1C,0x85,0x1D,0x81,0x0,0x81,0x2,0x81,0x4,0x11,0xCB,0xFA,
-0x8,0x4,0x15,0x2,0x85,0x0,0x85,0x1D,0x85,0x1C,0xF0,0x20,0x41,0x0,0x5,0x1A,0x85,0x8,0x81,0x22,0x15,0xC7,0xFE,0x3,0x52,0x12,0x53,0x12,0xC7,0xFE,0x0,0x22,0x83,0x3D,0x1,0xF8,0x20,0x40,
-0x2,0x14,0x85,0x5,0x86,0x65,0x1,0xD1,0xC6,0x2,0x5,0x85,0x14,0xF8,0x22,0x40,0x0,0x7,0xD8,0x40,0x0,0x7,0xF8,0x24,0x40,0xF8,0x3F,0x80,0x8,0x1C,0x81,0x1D,0x15,0x1C,0x11,0x20,0x11,0x29,
-0x44,0x15,0x28,0x0,0x21,0x8A,0xAB,0x2,0xC3,0x80,0x5F,0xD,0x81,0x1,0x16,0x85,0x45,0x13,0x81,0x2,0x2E,0x85,0x37,0x44,0x85,0xE,0x8B,0xA6,0x2,0xC3,0x80,0xE8,0x21,0xD,0x81,0x1,0x16,0x8D,
-0x43,0x13,0x89,0x3,0x1A,0x8D,0x8,0x11,0x83,0x26,0x1,0x89,0xE6,0x2,0xCD,0x80,0xC5,0x26,0xC3,0x2A,0x1,0x16,0x89,0xCD,0x3E,0xD3,0x3A,0xCB,0x80,0xC8,0x60,0x43,0x81,0xC,0x0,0x85,0x83,0x3E,
-0x1,0xC9,0x48,0xC4,0x3E,0x1,0x81,0x25,0xD0,0x3A,0x87,0xB6,0x2,0xC3,0x2C,0xC7,0x9A,0xC5,0xD6,0x1,0x2,0x85,0x87,0x38,0x1,0xC3,0xDC,0x3,0x14,0x85,0xE,0x81,0x99,0x24,0x3,0x0,0x25,0xC2,
-0x26,0xC2,0x74,0x0,0x11,0xD3,0x60,0x0,0x6,0xC2,0x88,0x1,0x16,0x89,0xC3,0x40,0x99,0x64,0x3,0xC3,0xC2,0x8D,0xA2,0x1,0xC9,0xE2,0x0,0x2,0xC2,0xCA,0x2,0x12,0x89,0x12,0xC2,0xD6,0x0,0x2B,
-0xDA,0x40,0x1,0x7,0x85,0x99,0xE2,0x1,0x1,0x7,0x5,0x43,0xE,0x1,0x1,0x5,0x1,0x5B,0xFF,0x0,0x1,0x5,0x85,0x91,0x22,0x2,0x8,0x21,0x15,0x20,0x15,0x1D,0x11,0x1C,0x11,0x1D,0x43,0x81,
-0x12,0x0,0x85,0x95,0xA2,0x2,0x3,0x21,0x15,0x29,0x11,0xC2,0x26,0x2,0x15,0x1C,0x81,0x87,0x62,0x2,0xC9,0x36,0x2,0x1C,0x81,0x1A,0x46,0x81,0x13,0x3,0x16,0x81,0x16,0x85,0x83,0xE2,0x2,0x8D,
-0xE6,0x4,0x85,0xB8,0x2,0x0,0x37,0x44,0x81,0x18,0x0,0x2E,0xC2,0x2E,0xC3,0x32,0xCB,0x36,0xC3,0x38,0x8B,0x9A,0x4,0x93,0x24,0x3,0x1,0x22,0x11,0x87,0x16,0x5,0x49,0x13,0x81,0xC9,0x36,0xC9,
-0x8,0x0,0x14,0xD0,0x7E,0xCD,0xFE,0x0,0x1A,0x8C,0x95,0x4,0xD3,0x40,0x99,0x24,0x3,0x85,0x3C,0x5,0xDF,0x40,0x89,0x64,0x3,0x3,0x52,0x12,0x1,0x81,0x89,0xF2,0x2,0xC7,0x82,0xF8,0x3B,0x80,
-0x83,0x7C,0x3,0xF8,0x29,0x80,0x95,0x2A,0x3,0x5F,0xFF,0x83,0xDD,0x80,0xF8,0x21,0x40,0xD1,0x80,0x8B,0xF0,0x2,0x0,0x7,0xF8,0x60,0x80,0x83,0x82,0x6,0x91,0xA6,0x2,0xF8,0x29,0x80,0x1,0xE,
-0x81,0x9D,0xE2,0x6,0xDF,0xC0,0x0,0xC,0xC2,0x7C,0xD3,0xC2,0x86,0xB8,0x2,0xF0,0x20,0x41,0x0,0x8D,0xA2,0x1,0x8B,0xF0,0x2,0x83,0x3C,0x5,0x0,0xC,0xF8,0x20,0x40,0x9B,0xE2,0x1,0x2,0xFF,
-0x0,0x45,0xF8,0x21,0x40,0x9A,0x23,0x2,0x2,0xFF,0x0,0x43,0xF8,0x21,0xC0,0x9A,0x63,0x2,0xF8,0x23,0x80,0x5F,0x40,0x81,0xDF,0xC0,0x3,0x45,0x81,0x28,0x86,0x45,0xFF,0x80,0xC7,0x8,0xC4,0xC,
-0x0,0x82,0xC5,0x14,0xF8,0x21,0x80,0x2,0x42,0x81,0x43,0xC4,0x42,0x1,0x28,0x86,0xC2,0xAC,0xC4,0x44,0xC3,0x3C,0xC2,0x56,0xC2,0x42,0x1,0x28,0x82,0xF0,0x21,0x40,0xA,0x3,0x43,0x81,0x42,0x81,
-0xC3,0x84,0x0,0x45,0xC4,0x48,0xC2,0x4C,0x0,0x82,0xC3,0x3C,0x0,0x43,0xC3,0x14,0xC2,0xA,0x0,0x42,0xF8,0x24,0x80,0x0,0xD,0xC2,0x42,0xC3,0x88,0xC3,0x30,0xC5,0xA,0xC3,0x96,0xC5,0x6,0xF0,
-0x21,0x2,0x0,0xC5,0x30,0xC5,0x8,0xC5,0xA,0xC3,0x52,0xC7,0x4,0xE4,0x91,0x0,0x8,0xD7,0x80,0x97,0x93,0x93,0x0,0xD7,0x97,0x93,0xC2,0x9,0xE4,0x32,0x0,0x0,0x41,0x2B,0x0,0x1,0x40,0x1,
-0x30,0x0,0x0,0xFF,0xCC,0xD,0xD1,0x20,0x0,0xFE,0xCC,0xD,0xD1,0x40,0x0,0xFD,0xCC,0xD,0xD1,0x60,0x22,0x0,0x0,0xC0,0x25,0x0,0x0,0x80,0x35,0x0,0x0,0xD6,0x23,0x0,0x1,0x83,0xC3,0x23,
-0x0,0x0,0x96,0xE4,0x73,0x0,0x6,0x13,0x13,0x57,0x0,0x7,0x7,0x56,0xE4,0x20,0x0,0xC6,0xC6,0x33,0x0,0x2,0x93,0xD7,0xC7,0xC4,0xC6,0xF8,0x31,0x1D,0x22,0x0,0x0,0xD2,0x28,0x0,0x85,0x5D,
-0xD,0x2,0x93,0xD7,0x87,0xC3,0x9,0x94,0x9D,0xC,0x0,0x92,0xC2,0x6C,0xC9,0x30,0x33,0x0,0x0,0x3,0x8C,0xD3,0xC,0xD2,0x20,0x8C,0xF3,0xC,0xD2,0x40,0x87,0x13,0xD,0x3,0x16,0x17,0x13,0x13,
-0xCC,0x98,0x7,0x0,0x16,0x7,0x17,0x13,0x0,0x3,0xFD,0xCC,0x1B,0xC9,0xC0,0x96,0x5D,0xD,0x2A,0x0,0x1,0x96,0x87,0xD2,0xD2,0xCA,0xFF,0xE4,0x22,0x0,0x0,0x92,0x35,0x0,0x1,0x83,0x0,0x84,
-0x7A,0xD,0xE4,0x7C,0x0,0x85,0x79,0xD,0xE4,0x34,0x0,0x9D,0x3B,0xF,0xF0,0x29,0x73,0xF,0xD3,0x48,0x0,0x2,0x85,0xD3,0xC,0xC6,0x9E,0x91,0xA0,0xF,0x0,0x2,0x9E,0xE3,0xE,0x0,0x2,0x8C,
-0x13,0xD,0xD2,0x60,0x8C,0x33,0xD,0xE4,0xC1,0x0,0xE8,0x23,0xFF,0x0,0x5,0xD,0x3,0x2E,0x7,0x5,0x3,0xC3,0x8,0xC6,0x10,0x22,0x7,0x2,0xFF,0x0,0xE,0xC6,0xE,0xDF,0x42,0x0,0x24,0xC2,
-0x3E,0x3,0xFF,0x0,0x7,0x3,0xC3,0x46,0xC5,0x6E,0x2,0x2E,0x3,0x5,0xC2,0x40,0x0,0x2E,0xF8,0x26,0x40,0x0,0x25,0xC4,0x36,0x2,0xE,0x7,0x2D,0xC8,0x7E,0xC3,0x7C,0xC3,0x6,0xF8,0x27,0x2,
-0xC3,0xB8,0x2,0x2E,0x7,0xE,0xC8,0x7E,0x5,0xD,0x7,0x2E,0x3,0x2C,0x7,0xF8,0x29,0x42,0x0,0x2D,0xC2,0xBC,0xC3,0x42,0xC8,0x10,0xC2,0xFE,0x43,0x2D,0x7,0xF8,0x27,0x84,0xC3,0xBC,0xC3,0x84,
-0x87,0x2E,0x12,0x83,0x3C,0x12,0x2,0xE,0x3,0x5,0xC2,0x42,0xF0,0x27,0x2,0x12,0x1,0x7,0x3,0xC3,0xFE,0x89,0x6E,0x12,0x2,0xD,0x7,0x2C,0x22,0x7,0xF0,0x25,0x3C,0x12,0x0,0x2C,0xC2,0xFE,
-0x1,0x7,0x3,0xC7,0xFE,0xC4,0x52,0xC2,0xBC,0x2,0x2E,0x3,0x6,0xC2,0x4,0xF8,0x25,0xFE,0x2,0xFF,0x0,0x6,0xC2,0x84,0x89,0x2E,0x12,0xC3,0x3C,0x1,0xFF,0x0,0x83,0x78,0x12,0xF8,0x23,0xFE,
-0x0,0x7,0xC2,0xFA,0x83,0x2A,0x12,0xC9,0xBE,0xC2,0x90,0xC2,0xFA,0x0,0x7,0xF0,0x26,0xFB,0x12,0x0,0x6,0xC4,0xC0,0xCB,0xEA,0x1,0xD,0x7,0xC3,0x80,0x0,0x6,0xF0,0x26,0x7D,0x13,0xC3,0x7C,
-0x0,0xE,0xC4,0xBE,0xC7,0xC2,0x0,0x2D,0x84,0xBD,0x13,0x83,0x7A,0x13,0xF8,0x25,0xC0,0x83,0x26,0x12,0x83,0x2A,0x14,0xC7,0xC2,0x1,0xE,0x3,0x85,0xF4,0x12,0xC3,0xC6,0xF8,0x23,0xC0,0x83,0xAC,
-0x12,0x0,0xD,0xC4,0x6,0x89,0xEE,0x12,0xC3,0xBC,0xF8,0x25,0x40,0x43,0xE,0x7,0xC2,0xB4,0x88,0xE9,0x13,0x83,0xB4,0x12,0xC3,0xC2,0x0,0xD,0xF0,0x26,0xBD,0x13,0xC5,0xBC,0x0,0x5,0x8A,0x6D,
-0x12,0xC2,0x94,0xC2,0xBE,0x83,0xF8,0x13,0xC5,0xFE,0x43,0xC,0x3,0xC9,0xFE,0x0,0xA,0xC4,0xA8,0x2,0x22,0x3,0x23,0xC8,0xB0,0x9B,0x26,0x12,0x2,0x23,0x7,0x22,0xC4,0xC6,0xC3,0x30,0xC5,0x48,
-0x0,0xB,0xC4,0xE8,0xC3,0x52,0x0,0x25,0xC4,0x58,0x9D,0x64,0x12,0x45,0xC,0x3,0xC5,0x3E,0x4,0xB,0x3,0x22,0x7,0x22,0x24,0x3,0xC3,0x54,0xC5,0x52,0xF0,0x23,0xA2,0x12,0x0,0x25,0xC2,0x36,
-0xC5,0x2C,0xC5,0xC8,0xC9,0x44,0x0,0x9,0xC4,0xE2,0x9B,0xE6,0x12,0x0,0x2,0xC2,0x74,0xC7,0xEA,0xC3,0x2E,0x0,0xA,0xC4,0x8C,0xC3,0xC0,0x2,0x23,0x7,0x3,0x86,0x1B,0x16,0xF0,0x21,0x26,0x13,
-0x1,0xA,0x3,0xC5,0x6A,0xC7,0xFE,0x85,0x14,0x16,0xC7,0x14,0xF0,0x21,0x66,0x13,0xC5,0x36,0xC9,0xD2,0xCB,0x10,0xF0,0x9D,0xA4,0x13,0x8,0x20,0x7,0x20,0x3,0x28,0x3,0x29,0x3,0x21,0xC8,0xC2,
-0x1,0x21,0x7,0xC3,0x10,0x1,0x20,0x7,0x43,0x2A,0x3,0x0,0x20,0x86,0xA5,0x14,0x99,0x68,0x14,0x0,0x28,0xC8,0x3A,0x0,0x20,0xC2,0x46,0xCD,0x4A,0xC3,0x4C,0x9F,0xA2,0x14,0x2,0x21,0x3,0x2B,
-0xC2,0x66,0xC3,0x7E,0xC5,0x4A,0xC5,0x8E,0x0,0x28,0xC4,0x80,0xC3,0x8A,0xF0,0x21,0xE2,0x14,0x0,0x24,0xCA,0x70,0xC3,0xB2,0xC5,0x40,0xC3,0xC2,0xF0,0x27,0x1E,0x15,0xC9,0x34,0xC9,0xCE,0xF0,0xAB,
-0x5A,0x15,0xF3,0xFB,0x6,0x12,0x0,0x0],
-0x241A16: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF]},
-'area_rando_door_transition.ips': {0x7FDC: [0x9A,0x92,0x65,0x6D],
-0x7EA00: [0x9C,0x2C,0xB,0x9C,0x2E,0xB,0x9C,0x42,0xB,0x9C,0x44,0xB,0x9C,0x46,0xB,0x9C,0x48,0xB,0xA2,0x0,0x0,0x9E,0x1C,0xA,0xE8,0xE8,0xE0,0xC,0x0,0xD0,0xF6,0xA9,0xFF,0xFF,0xA2,0x0,0x0,0x9D,0x2A,
-0xA,0xE8,0xE8,0xE0,0x6,0x0,0xD0,0xF6,0x9C,0x96,0xA,0xAD,0x6E,0xA,0xC9,0x2,0x0,0xD0,0x6,0xA9,0xCA,0xCA,0x8D,0x41,0x7,0xA9,0x80,0x0,0x8D,0xA8,0x18,0x60,0x48,0xA9,0x0,0x0,0x22,0xC1,
-0x8F,0x80,0x68,0x22,0xC1,0x8F,0x80,0xA9,0x5,0x0,0x22,0xC1,0x8F,0x80,0x60,0xAD,0xC4,0x9,0x8D,0xC2,0x9,0xAD,0xD4,0x9,0x8D,0xD6,0x9,0xAD,0xC8,0x9,0x8D,0xC6,0x9,0xAD,0xCC,0x9,0x8D,0xCA,
-0x9,0xAD,0xD0,0x9,0x8D,0xCE,0x9,0x60],
-0x852BA: [0x20,0x0,0xF7],
-0x87700: [0xAD,0x41,0x7,0xC9,0xCA,0xCA,0xF0,0x4,0xAD,0xC2,0x9,0x60,0xA9,0x10,0x0,0x9C,0x41,0x7,0x60]},
-'area_rando_layout.ips': {0x78666: [0x62,0x12,0x0,0x80,0x36,0xC8,0x62,0x12],
-0x788A0: [0x2B,0x4A,0x0,0x80,0x36,0xC8,0x2B,0x4A],
-0x7C41F: [0x1C,0x15,0x0,0x80,0x36,0xC8,0x1C,0x15],
-0x7C48E: [0x10,0x0,0x80,0x36,0xC8,0xF,0x11],
-0x21BBA7: [0xDB,0x1E,0x3,0xE,0x8D,0xE,0x89,0xCF,0x22,0x3,0x14,0x8D,0x36,0x8B,0xC5,0x36,0xC,0x39,0x87,0xB8,0x82,0x38,0x83,0x39,0x83,0x14,0x8D,0xF,0x89,0x18,0xC8,0x48,0x3,0x10,0x85,0x37,0x8B,0xC5,0x36,
-0x1,0x10,0x85,0x43,0xFF,0x0,0x7,0xE,0x19,0xE,0x1D,0xC,0xC0,0x40,0x90,0xC7,0xE0,0x2,0x39,0x87,0xB9,0xC5,0x36,0x2,0x1D,0xE,0x1D,0x47,0xFF,0x0,0x2,0x2C,0xD0,0x60,0xC8,0x20,0xC9,0x36,
-0x49,0xFF,0x0,0x3,0x2C,0xD8,0x60,0x98,0xC6,0x7C,0x0,0x8F,0xCB,0x18,0xC7,0x40,0x2,0xC,0xD8,0x40,0xC4,0x20,0xC3,0x92,0xCF,0x1E,0x6,0x2E,0x83,0x38,0x83,0xB9,0x82,0xD,0xC5,0x3C,0x2,0x8D,
-0x37,0x8B,0xCF,0x3E,0x6,0x37,0x83,0xE,0x81,0x36,0x83,0x14,0xC6,0x98,0xCF,0x40,0x1,0xE,0x11,0xC3,0x1C,0xC4,0xF8,0x4,0x85,0x36,0x87,0xE,0x85,0xC3,0xBC,0xA,0x2F,0x83,0x1D,0xC4,0x1C,0x54,
-0x1C,0x50,0x1D,0x50,0x2E,0xC2,0xFE,0x8C,0x6A,0x0,0xC4,0x24,0x2,0x37,0x83,0x43,0x43,0x4,0x42,0x1,0x0,0x43,0xC3,0x5C,0x1,0x89,0xF,0x87,0x99,0x0,0x46,0x85,0x11,0xC3,0x68,0x0,0x63,0x43,
-0x94,0x62,0x2,0x90,0x63,0x90,0x83,0xB6,0x0,0x1,0xB9,0x82,0xC5,0x44,0xE4,0x6B,0x0,0x2,0x92,0xD2,0x40,0x28,0x0,0x1,0x93,0xD2,0x23,0x0,0x0,0xFF,0xC9,0x1B,0x24,0x0,0x0,0xFE,0x24,0x0,
-0xC5,0xC,0x23,0x0,0x0,0xFD,0xE4,0x2B,0x0,0x0,0x12,0x29,0x0,0x2,0x42,0xFF,0xFE,0xDC,0x3B,0x23,0x1,0x25,0x0],
-0x21BCA3: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF],
-0x22D564: [0xF2,0x1,0x2,0x0,0x5,0x92,0x85,0x8F,0x89,0x8F,0x8D,0xC6,0x4,0xC9,0xA,0xF8,0x22,0x8,0x1,0x92,0x81,0xF0,0xC3,0x40,0x0,0x9,0x7B,0x81,0x6F,0x81,0x77,0x15,0x8C,0x81,0x77,0x11,0x43,0x8C,0x81,
-0xC5,0x6,0xC5,0x4,0xC7,0xC,0x47,0x8D,0x11,0x4B,0x8A,0x11,0x5,0x8C,0x81,0x6E,0x81,0x7B,0x85,0xF0,0xC1,0x40,0x0,0x5,0x8F,0x89,0x93,0x89,0x79,0x81,0xE8,0x33,0xFF,0x0,0x5,0x77,0x11,0x93,
-0x8D,0x8F,0x89,0xE8,0xBF,0xFF,0x83,0x3,0x40,0x94,0xC,0xC4,0xE8,0x37,0xFF,0x0,0x3,0xC,0xC0,0x40,0x90,0xE8,0xBF,0xFF,0x83,0x3,0x60,0x94,0x2C,0xD4,0xF8,0x29,0xFE,0x1,0xC0,0x2,0xCB,0x2C,
-0x2,0x2C,0xD0,0x60,0xF0,0xC1,0x41,0x6,0x2,0x9C,0x2C,0xDC,0xE8,0x29,0xFF,0x0,0x4,0xE1,0x2,0xFF,0x0,0xA2,0x88,0x31,0x7,0x3,0x2C,0xD8,0x60,0x98,0xF0,0xC0,0x42,0x5,0x1,0x9C,0xC,0xF0,
-0x26,0x5,0x8,0x4,0xA3,0x2,0xC0,0x2,0xE0,0xC4,0x4,0x87,0x2E,0x7,0x2,0xC,0xD8,0x40,0xF0,0xC0,0x41,0x8,0x6,0x93,0x81,0x8E,0x81,0x6B,0x81,0x6C,0xF0,0x20,0x7,0x5,0x0,0x6A,0x52,0x81,
-0x6B,0x3,0x8E,0x85,0x93,0x85,0xE8,0xBF,0xFF,0x83,0x0,0x7B,0x44,0x81,0x6E,0x0,0x6F,0xF0,0x20,0x7,0x5,0x1,0x75,0x11,0x45,0x6E,0x81,0x4,0x93,0x85,0x8F,0x81,0x8F,0xC8,0x4,0x0,0x92,0xF0,
-0xC0,0x41,0x5,0x2,0x92,0x8D,0x93,0xF0,0x24,0x5,0xB,0x1,0xFF,0x0,0x43,0x8C,0x81,0x85,0x3C,0x4,0xF0,0xCE,0x36,0x2,0x1,0x8D,0x93,0xF0,0x24,0x7,0xC,0xC3,0x22,0x3,0x6F,0x85,0x7B,0x8D,
-0xF0,0xD1,0x34,0x0,0x83,0x4,0x4,0x8F,0x2E,0x7,0x98,0x1A,0xD,0xF0,0xD0,0x33,0xC,0x87,0x4,0xE,0x1,0xE0,0x6,0x97,0x14,0xA,0x89,0x8,0xA,0xF0,0xD5,0x30,0xD,0x1,0x92,0x8D,0xF0,0x25,
-0x4,0xA,0x93,0x2E,0xD,0xF0,0xBF,0x2,0x0,0xC5,0xCE,0xF0,0x25,0x4,0xD,0x3,0xA6,0x86,0x6E,0x81,0xF0,0xD5,0x32,0x10,0x3,0x81,0x80,0x7B,0x89,0x87,0x8,0xB,0x99,0xC,0xE,0x3,0xA6,0x8E,
-0x6E,0x81,0x83,0x3E,0x5,0x8C,0x12,0x3,0x94,0x2D,0x3,0xF0,0xB2,0x58,0x11,0x2,0x81,0x6F,0x81,0xC5,0xFA,0x1,0xE1,0x2,0x89,0x30,0x7,0x0,0xA3,0x8E,0xD,0xE,0x1,0x77,0x11,0x5D,0x96,0x81,
-0x84,0x2E,0xB,0xF0,0x2C,0x51,0x12,0xF0,0x8B,0x82,0x11,0x83,0x30,0x9,0x0,0xA2,0x43,0x2,0xE0,0x0,0x6,0x83,0x2C,0x9,0xC3,0xFA,0x1,0xE1,0x6,0x89,0x34,0x8,0xF0,0x25,0xC,0xD,0x47,0x6E,
-0x81,0x9D,0x54,0x12,0x1,0x92,0x85,0x83,0x8,0x3,0x3,0x90,0x89,0x92,0x81,0xF0,0x89,0x82,0x12,0x83,0x4,0xA,0xD3,0x2,0x5,0x6C,0x81,0x6C,0xF5,0x6C,0x51,0xF0,0x27,0xA,0xD,0x0,0x70,0x46,
-0x81,0x6E,0x8C,0x32,0x12,0x85,0xF,0x3,0x0,0x8D,0x89,0x54,0x12,0x0,0x7B,0x46,0x81,0x96,0x0,0x7B,0xF0,0x80,0x41,0xA,0xC7,0x92,0x1,0x92,0x8D,0x8B,0x34,0xB,0xC4,0xC,0xC3,0xE,0x0,0x81,
-0xF0,0x29,0x6,0xD,0xC3,0x26,0x4F,0x96,0x81,0x87,0x52,0x15,0xC7,0x6,0x46,0x8F,0x8D,0x2,0x89,0x6E,0x89,0xC5,0x54,0xF0,0x89,0x80,0x15,0xD7,0x8,0x89,0xA,0x12,0xF8,0x33,0x6,0x1,0xA6,0x6,
-0x4B,0x6E,0x1,0x1,0x93,0x5,0x47,0xF0,0x2,0x0,0xA6,0x86,0x31,0x7,0xF0,0xA2,0x80,0x16,0x8A,0x7,0xB,0x0,0xA3,0x96,0xD,0xF,0xD9,0x16,0x1,0xA6,0xE,0x8C,0x62,0x17,0x0,0xD,0x47,0xF0,
-0xA,0x1,0xA6,0xA,0xF0,0xAD,0x7A,0x16,0x87,0xE,0x13,0xE8,0x2F,0xFF,0x0,0x1,0x6F,0x85,0x48,0x6E,0x8D,0x85,0x6B,0x16,0xC3,0x2,0x1,0x85,0x8F,0xC2,0xC,0x5,0x6C,0x81,0x5D,0x80,0x6C,0x85,
-0xF0,0xA7,0x80,0x17,0x85,0x14,0x13,0x1,0xE1,0x2,0x89,0x20,0x13,0x87,0x30,0x7,0x9D,0xC,0xE,0x1,0x6F,0x85,0x4A,0x6E,0x89,0x3,0x81,0x70,0x81,0x93,0x86,0x6D,0x15,0x84,0xA,0x16,0x2,0x81,
-0x90,0x81,0xF0,0x81,0x40,0xB,0xF0,0x23,0x2,0x17,0x83,0x12,0x14,0x83,0x14,0x13,0xC3,0x6,0xC4,0xFC,0x0,0x6,0x83,0xA,0xF,0x85,0x18,0x14,0x83,0x30,0x9,0xF0,0x20,0x36,0x14,0xC4,0xFE,0x0,
-0x6F,0x84,0x69,0x19,0x87,0x70,0x1A,0xF0,0x8F,0x7A,0x11,0x99,0xA,0x18,0x97,0xC,0x15,0x8D,0x18,0x15,0x9E,0x4A,0x1B,0x86,0x65,0x1B,0xC3,0xE,0x8D,0x32,0xC,0xF0,0x9F,0x82,0x0,0x8A,0xA,0x16,
-0xC7,0x6,0x8E,0xF,0x16,0x83,0x4,0xC,0x1,0xA6,0x82,0x98,0x3A,0x14,0xC5,0x2,0x83,0x65,0x1B,0xC2,0x6,0x83,0x52,0x15,0x8D,0x72,0x1B,0xF0,0xBF,0x82,0x0,0x83,0x2,0x4,0x3,0x6E,0x81,0xA6,
-0x8A,0xC5,0xFE,0x0,0xA2,0x8E,0xD,0xF,0x89,0x50,0x14,0xCB,0x8,0x8B,0x32,0xC,0xF0,0xC2,0x82,0x1D,0x86,0xB,0x12,0x85,0x2A,0x1A,0xF0,0x23,0x52,0x1E,0x8B,0x54,0x13,0xF0,0xC5,0x42,0x3,0x83,
-0x20,0x13,0x83,0x14,0x13,0x8F,0x2E,0x19,0x4F,0x96,0x81,0x85,0x50,0x14,0xC3,0x6,0x8F,0x72,0x1B,0xF8,0x77,0xC,0xF0,0x42,0xC2,0x3,0x84,0xB,0x14,0x0,0xA3,0xC2,0xFC,0x43,0xE0,0x2,0x9D,0xC,
-0xE,0x83,0x2E,0x11,0x0,0x70,0x86,0x6F,0x20,0x84,0x32,0x12,0xF0,0x40,0x41,0x12,0xF0,0x82,0xC2,0x20,0x8C,0xB,0x15,0x9D,0x8,0xA,0x83,0x2E,0x12,0xC7,0x2,0x97,0x3C,0x13,0xF0,0x4F,0x32,0x10,
-0xF0,0x5F,0xE4,0x20,0x1,0x92,0x8D,0x88,0x36,0xB,0xF0,0x22,0x21,0x16,0xC9,0xF6,0x97,0x3C,0x14,0x8F,0x32,0xC,0xF0,0x9F,0xA4,0x20,0x91,0x16,0x18,0x0,0xC0,0x8A,0x2F,0x1A,0xF0,0x30,0x32,0x19,
-0xF0,0xB0,0x93,0x22,0x93,0x16,0x1B,0x83,0x48,0x21,0x85,0x30,0x7,0xF0,0x23,0xC,0xE,0x8D,0x46,0x14,0xF0,0x6D,0x7A,0x20,0xF0,0x4F,0x2,0x24,0x93,0xC,0x15,0xF0,0x23,0xC,0x10,0x8B,0x4A,0x14,
-0xF0,0x6B,0x7A,0x20,0xF0,0x4D,0xC2,0x0,0x84,0x44,0x23,0xCC,0x2,0x83,0x4,0xC,0x97,0x18,0x13,0xF0,0x39,0x3E,0x14,0xF0,0x97,0xB8,0x23,0x95,0x32,0x1E,0x8B,0x28,0x8,0xF0,0x27,0x32,0x14,0xF0,
-0x67,0x7A,0x20,0xF0,0x77,0x2,0x28,0x95,0xC,0xE,0x89,0x50,0x15,0x84,0x30,0x12,0x90,0x37,0x12,0xF0,0x51,0x7C,0x20,0xF0,0x69,0x2,0x28,0x8D,0x4E,0x20,0x87,0x30,0x8,0x8D,0x30,0x7,0x9D,0x34,
-0x13,0x89,0x6E,0x1A,0xF0,0xAA,0xB8,0x27,0x0,0x89,0x87,0xC,0x13,0x85,0x56,0x25,0xC3,0xF2,0x85,0x3E,0x1B,0x83,0x12,0x14,0x9F,0x40,0x1B,0xF0,0x61,0x84,0x26,0xF0,0x83,0xC2,0x1B,0xF0,0x25,0x66,
-0x26,0x87,0x50,0x14,0xF0,0x4D,0x94,0x23,0xF0,0x62,0xC2,0x1C,0x8F,0x33,0x1D,0xCE,0xC,0x8F,0x6,0xD,0x97,0x58,0x24,0x85,0x70,0x21,0xF0,0x4F,0x78,0x20,0xF0,0x83,0xC2,0x1D,0x8D,0x8,0xB,0x97,
-0x2E,0x19,0x89,0x70,0x22,0xF0,0x4B,0x94,0x23,0xF0,0x89,0xC2,0x1E,0xF0,0x21,0x66,0x29,0x47,0x96,0x81,0xF0,0x2D,0x54,0x13,0xF0,0x9F,0x64,0x10,0x87,0x22,0x18,0x87,0x34,0x8,0x85,0x14,0x13,0x9B,
-0x28,0x19,0xF0,0x4B,0x76,0x20,0xF0,0x82,0x82,0x3,0x86,0x63,0x2B,0x87,0x58,0x25,0x85,0x2E,0x1B,0x83,0x34,0x9,0x9B,0x9E,0x30,0x8D,0x7A,0x21,0xF0,0x39,0x7C,0x20,0xF0,0x83,0x82,0x3,0x9B,0x24,
-0x1C,0x93,0x8,0xA,0x4D,0x96,0x81,0x83,0x3A,0x4,0x90,0x32,0x12,0xF0,0x28,0x17,0x3,0xF0,0x83,0x82,0xC,0x97,0x66,0x2D,0x83,0x6,0xD,0x97,0x48,0x1D,0x90,0x54,0x1D,0x96,0x79,0x22,0x9D,0x92,
-0x2A,0xF0,0x9D,0x80,0x16,0x83,0x4,0x4,0x87,0x48,0x1E,0xF0,0x21,0xAA,0x33,0xF0,0x2F,0x24,0x17,0x85,0x90,0x24,0xF0,0x9C,0x2,0x34,0xF0,0x26,0x23,0x17,0xF0,0x35,0xC6,0x34,0x2,0x79,0x85,0x78,
-0xF0,0xA2,0xFF,0x33,0x85,0x34,0x1B,0xF8,0x21,0xCA,0xC3,0x2,0xF0,0xB3,0xE,0x6,0x9F,0x6,0x17,0x1,0xA3,0x2,0x87,0xC,0xF,0x8B,0x30,0x7,0x3,0x6A,0x81,0x6A,0x85,0xE8,0x41,0xFF,0x0,0xF0,
-0x83,0x3E,0x7,0xF0,0x23,0x6,0x1C,0x85,0x8,0xA,0x8B,0x2E,0x19,0x1,0x6F,0x85,0x9D,0x8,0xB,0x9F,0x22,0x14,0x85,0x30,0x7,0xF0,0x83,0x3E,0x8,0x9F,0x46,0x2D,0x0,0x93,0x83,0x73,0x21,0x8A,
-0xA7,0x38,0x85,0xA4,0x36,0x9F,0xB8,0x38,0x87,0x2E,0x19,0xC5,0xE8,0x91,0x58,0x24,0x85,0x9A,0x31,0xF0,0x83,0x3E,0x9,0xF0,0x23,0x24,0x1E,0xC3,0xEC,0x83,0x4A,0x21,0xC4,0xDA,0x0,0x6,0xC3,0xD6,
-0x8B,0xB8,0x38,0x93,0xC,0xE,0x87,0x14,0x13,0xC6,0x34,0x8C,0x31,0x1A,0x83,0x20,0x13,0x85,0x2A,0xA,0x2,0x8E,0x85,0x91,0xF0,0x88,0x81,0x14,0x9B,0xA,0x17,0x83,0xC,0x13,0x83,0x4C,0x21,0x83,
-0x34,0x8,0x1,0xE0,0x6,0x83,0x2E,0x9,0x85,0xB8,0x38,0x83,0x10,0x14,0x87,0x98,0x31,0xC5,0xC,0xC7,0xE6,0x43,0xE0,0x2,0x43,0xA2,0x2,0x87,0xE0,0x3A,0x87,0x30,0x7,0x83,0x2E,0x1A,0xC3,0x4,
-0x1,0x6F,0x85,0x84,0x32,0xB,0xF0,0xA3,0x7F,0x1A,0xC2,0xFE,0x91,0xC,0x15,0x1,0x8E,0x85,0xF0,0x23,0x24,0x1C,0xD9,0x22,0x0,0x8E,0x88,0x31,0xE,0xF0,0xA2,0x82,0x1C,0x9E,0x65,0x2D,0xDA,0x1C,
-0xD3,0xA,0xC6,0x4C,0x1,0x92,0x89,0xF0,0xC7,0x7C,0x1D,0xF0,0xC5,0x44,0x11,0xF8,0x77,0x8,0xE6,0x2,0x0,0x3,0xC3,0x0,0x83,0x0,0xC3,0x3,0x22,0x0,0xC3,0x6,0x29,0x80,0xE4,0x80,0x0,0xC5,
-0x95,0xE4,0x5D,0x0,0x0,0x41,0x3B,0x0,0x1,0x40,0x1,0xE4,0x60,0x0,0x0,0xFF,0xDC,0x1D,0xF8,0x61,0x80,0x0,0xFE,0xDC,0x1D,0xF8,0x61,0x80,0x0,0xFD,0xDC,0x1D,0xF8,0x61,0x80,0xE4,0x92,0x0,
-0xF8,0xF4,0xF5,0xE7,0xD,0x0,0xF0,0x63,0x9F,0x42,0xE4,0x96,0x0,0x0,0x1,0x9C,0x83,0x43,0xE7,0xFF,0x0,0xE7,0xFF,0x0,0xE7,0xFF,0x0,0xE7,0xFF,0x0,0xE4,0xCD,0x0,0x1,0x40,0x2,0xE4,0x7D,
-0x0,0x0,0xFF,0xF8,0x7E,0x80,0x0,0xFE,0xF8,0x7E,0x80,0x0,0xFD,0xF8,0x7E,0x80,0xE6,0x81,0x0],
-0x22DBB4: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF],
-0x231F62: [0xC7,0x18,0xE8,0x3F,0xFF,0x83,0xCE,0x60,0x2,0x0,0x6B,0x4,0xFB,0xFF,0x60,0xFB,0xFF,0xC0,0xFB,0x35,0xC0,0xF,0x6C,0x88,0x6D,0x88,0x6E,0x88,0x6B,0x80,0x6B,0x84,0x6E,0x8C,0x6D,0x8C,0x6C,0x8C,0xF8,
-0x47,0xC0,0x2,0x81,0x80,0x0,0x48,0x81,0x4,0x1,0x1,0x81,0x43,0xFF,0x0,0x0,0x1,0x48,0x85,0x4,0x2,0x0,0x85,0x81,0xF8,0x42,0x60,0xA,0x2,0x81,0x66,0x81,0x47,0x81,0x7,0x85,0x27,0x8D,
-0x3,0xC4,0x60,0xA,0x3,0x85,0x66,0x81,0x27,0x8D,0x7,0x8D,0x65,0x85,0x2,0xF8,0x44,0x60,0x0,0x20,0x48,0x81,0x24,0x0,0x21,0xC4,0xC0,0x0,0x21,0x48,0x85,0x24,0x0,0x20,0xF8,0x44,0xC0,0xF1,
-0x1F,0x4,0xC,0x0,0x22,0x4A,0x81,0x42,0x2,0x43,0x81,0x43,0x4A,0x85,0x42,0x0,0x22,0xF8,0x44,0xC0,0x2,0x40,0x81,0x41,0xC6,0x5C,0x47,0xFF,0x0,0xC7,0x64,0x3,0x41,0x85,0x40,0x85,0xF8,0x41,
-0xC0,0x4,0x60,0x81,0x61,0x81,0x2E,0x52,0x1,0x2D,0x4,0x2E,0x5,0x61,0x85,0x60,0xF8,0x40,0x60,0x83,0x4,0xC,0x5,0x1,0x81,0x4D,0x1,0x4C,0x5,0xC3,0xBE,0x0,0x4A,0xC2,0x6,0x1,0x4A,0x1,
-0xC5,0xE,0x4,0x4A,0x5,0x1,0x85,0x2,0xF8,0x40,0xC0,0xE,0x2,0x81,0x67,0x81,0x3,0x81,0x4E,0x1,0x69,0x1,0xFF,0x0,0x69,0x5,0x4B,0xC2,0x66,0x2,0x4B,0x1,0x4E,0xC6,0xC,0x0,0x3,0xF8,
-0x44,0x60,0x0,0x7,0xC4,0x60,0x0,0x4A,0xC2,0x60,0xC3,0xBE,0xC3,0xC6,0xC3,0x60,0xC3,0xCA,0x2,0x21,0x85,0x20,0xF8,0x42,0xC0,0x0,0x66,0xC4,0xC0,0x5,0x4B,0x1,0x6B,0x9,0x85,0x80,0x43,0xFF,
-0x90,0x2,0x85,0x80,0x4E,0xC2,0xC,0xC3,0xCA,0x2,0x62,0x85,0x64,0xF8,0x40,0xC0,0x83,0xC4,0xC,0x0,0x21,0xC2,0xC0,0x4,0xFF,0x0,0x6C,0x1,0x88,0x43,0x80,0x89,0x5,0x84,0x88,0x84,0x4E,0x1,
-0x6C,0xC2,0xCE,0xF8,0x45,0x60,0x0,0x0,0x84,0xD,0xC,0xC2,0xC0,0x4,0x9,0x6B,0x1,0x4B,0xD,0x87,0x30,0x10,0xC5,0xC,0x2,0x1,0x85,0x0,0xF8,0x42,0xC0,0x83,0xCE,0xC,0x6,0x4E,0x1,0x4A,
-0x9,0xFF,0x0,0x4A,0xC8,0x60,0xC5,0xC,0xF0,0x43,0x3E,0x10,0x0,0x22,0x84,0xAB,0xE,0x2,0x4E,0x1,0x69,0xC2,0x60,0x1,0x69,0xD,0xC3,0xC2,0x1,0x69,0x5,0xC3,0x60,0xC3,0xC,0x0,0x43,0x84,
-0x5D,0xE,0xF8,0x3D,0x2,0x87,0x42,0x11,0xC5,0xBA,0xC3,0xC2,0x0,0x4A,0xC4,0x60,0xC3,0xCE,0x83,0x5E,0x11,0xF8,0x3F,0x60,0x1,0x2,0x81,0x83,0x6E,0xC,0xC7,0x60,0x83,0x8A,0x10,0x0,0x4B,0xC6,
-0x60,0x1,0x69,0xD,0x83,0xDE,0xF,0xD5,0xC0,0x43,0x98,0x81,0xC7,0xA,0xC7,0xE,0xC7,0x6,0xC9,0x20,0xC3,0x24,0xC9,0x60,0x1,0x43,0x85,0x89,0x48,0xE,0xC5,0xCE,0xC5,0x60,0xCF,0x4C,0x1,0x81,
-0x80,0xE8,0x29,0x99,0x81,0xD0,0xC0,0x84,0x4B,0x11,0xC6,0xC0,0x84,0xDD,0xF,0xC7,0xAA,0xC9,0xA4,0x4,0x98,0x81,0x94,0x81,0x95,0xE8,0x22,0x81,0x96,0x0,0x97,0xC2,0x28,0x1,0x98,0x81,0x87,0xA2,
-0x11,0xC5,0xB2,0x85,0xAA,0x11,0xC5,0x6E,0x1,0x4A,0x5,0x83,0x3E,0x10,0xD3,0xAC,0x0,0x94,0x88,0xAD,0xE,0xDD,0x8,0x43,0x94,0x81,0x3,0x40,0x94,0xC,0xC4,0xC3,0xC0,0x83,0x4E,0x11,0x1,0x4B,
-0x9,0x85,0xA,0x12,0x87,0xD6,0xF,0x43,0x62,0x85,0xD1,0xAA,0xC3,0x98,0xF8,0x25,0x60,0x7,0xC,0xC0,0x40,0x90,0x60,0x94,0x2C,0xD4,0xC3,0xC0,0x84,0x70,0x12,0xC2,0xBE,0x8B,0x32,0x10,0xF8,0x3F,
-0x2,0x7,0x2C,0xD0,0x60,0x90,0x60,0x9C,0x2C,0xDC,0xC3,0xC0,0x2,0x69,0xD,0x6B,0xC4,0xBE,0xC5,0x60,0x87,0x98,0x10,0xD3,0xC0,0xF8,0x29,0xC4,0x6,0x2C,0xD8,0x60,0x98,0x40,0x9C,0xC,0xC4,0x60,
-0x83,0xEA,0x10,0xC7,0xF6,0x87,0xF6,0x10,0x83,0x1E,0x12,0x57,0x99,0x81,0xF8,0x23,0x60,0x3,0xC,0xD8,0x40,0x98,0x87,0xA4,0xE,0x83,0x4E,0xE,0x87,0x4E,0x11,0x87,0x2C,0x13,0x83,0xBE,0xE,0x87,
-0xE,0x13,0x8D,0x2,0x13,0xF0,0x23,0xB4,0x13,0xC3,0xE4,0x1,0x94,0x81,0x83,0x4,0xF,0x97,0xA6,0x11,0x83,0x1E,0xF,0x87,0x10,0x13,0x8B,0xA,0x13,0xF0,0x29,0x52,0x13,0x1,0x98,0x81,0x87,0x42,
-0x11,0x93,0xA,0x12,0x99,0x7E,0x12,0xD3,0xD6,0x89,0x10,0x13,0xC7,0x8E,0xC3,0xFC,0x8E,0xE2,0x13,0x8C,0x71,0x12,0x83,0x3E,0x10,0xE8,0x41,0x81,0x80,0x0,0x64,0xCA,0x60,0x83,0xA,0x15,0x89,0xD4,
-0x12,0x0,0x64,0xF8,0x42,0x5E,0xCD,0x60,0x85,0x6A,0x15,0xC7,0xCE,0xF8,0x45,0x60,0x0,0x5,0x96,0x85,0x13,0x1,0x4B,0x9,0xF0,0x43,0x5E,0x11,0x2,0x81,0x80,0x25,0x97,0xE5,0x13,0x0,0x9,0xF0,
-0x43,0x3E,0x10,0x88,0x42,0x11,0x84,0x4B,0x14,0x3,0x43,0x85,0x43,0x81,0x85,0x54,0x14,0x83,0x4E,0x14,0xF0,0x4C,0x5E,0x11,0x8F,0xAB,0x14,0xC2,0xCA,0xF0,0x43,0xDE,0xF,0x83,0x44,0x17,0x93,0x6,
-0x15,0xC3,0xC,0xF8,0x43,0x60,0x83,0x4,0x18,0x97,0x66,0x15,0xF0,0x43,0x3E,0x10,0x0,0x45,0xC6,0xC0,0x93,0x4A,0x11,0x83,0x9E,0x14,0xF8,0x47,0x60,0x93,0xAA,0x11,0x83,0xFE,0x14,0xF8,0x41,0xC0,
-0xC3,0xB6,0x1,0x4E,0x1,0x8B,0x2C,0x13,0x87,0x16,0x12,0x83,0x5E,0x15,0xF8,0x3F,0xC0,0x1,0x25,0x81,0xC3,0xB6,0x8C,0x68,0x12,0x0,0x9,0x87,0x76,0x12,0x83,0xBE,0x15,0xF0,0x41,0xA2,0x19,0x83,
-0xA,0x15,0x8B,0x48,0x17,0x0,0x69,0xC4,0x60,0x0,0x43,0x44,0x85,0x41,0xF0,0x41,0xC0,0xE,0x83,0x64,0x18,0x0,0x6C,0x84,0xD5,0xF,0x91,0xAC,0x17,0xF0,0x43,0x5E,0x11,0x1,0x5,0x81,0x83,0x4A,
-0x11,0x95,0x8,0x18,0xF0,0x43,0xDE,0xF,0x1,0x25,0x81,0x83,0xAA,0x11,0xF0,0x59,0x68,0x18,0x2,0x64,0x81,0x62,0x8A,0xC5,0x18,0x89,0x50,0x14,0xC3,0xC,0x83,0x5E,0x17,0xF8,0x47,0x60,0x93,0x2A,
-0x19,0xF8,0x43,0x60,0x88,0x2,0x12,0x92,0x8B,0x19,0xF8,0x43,0xC0,0x85,0xA4,0xE,0xC3,0x64,0x89,0x6C,0x15,0x1,0x1,0x85,0x45,0x4,0x81,0xF0,0x43,0x1E,0xC,0x87,0x22,0x16,0x8B,0x4A,0x11,0x1,
-0x21,0x85,0x45,0x24,0x81,0xF0,0x43,0xDE,0xC,0x87,0x42,0x11,0x8B,0xAA,0x11,0xF8,0x4B,0xC0,0x87,0xA2,0x11,0x89,0xA,0x12,0x1,0x4B,0x9,0xF8,0x4B,0xC0,0x87,0x2,0x12,0x8B,0x6A,0x1B,0x8B,0x1E,
-0x12,0xF8,0x3F,0xC0,0x87,0x42,0x14,0x8B,0xCA,0x1B,0xF8,0x4B,0x60,0x87,0xA2,0x14,0x8B,0xAA,0x17,0x83,0x5E,0x17,0x0,0x8E,0x86,0xFB,0x12,0xF8,0x40,0x60,0x86,0x3,0x15,0x8B,0x8A,0x13,0xC3,0x60,
-0x0,0x8C,0xF8,0x46,0x60,0x83,0x62,0x15,0x4,0x4C,0x9,0x4E,0x1,0x4C,0x84,0x4F,0x11,0x85,0xAA,0x11,0xF8,0x4B,0x60,0x87,0x4,0xC,0x5,0x1,0x81,0x1,0xC5,0x1,0x51,0x85,0x76,0x1E,0x83,0x1E,
-0xC,0xF8,0x47,0xC0,0x0,0x2,0x46,0x81,0x65,0x7,0x3,0x81,0x21,0xD5,0x21,0xD1,0x3,0x85,0xC3,0xE,0x83,0x7E,0xC,0xF8,0x51,0x60,0xC3,0xC0,0xF8,0x51,0x60,0x87,0xC4,0xC,0x0,0x21,0xC4,0xC0,
-0x85,0xD6,0x1E,0x83,0xDE,0xC,0xF8,0x47,0xC0,0x0,0x5,0x84,0x7,0xF,0x0,0x4D,0x8A,0x13,0xF,0x0,0x5,0x84,0x21,0x12,0xF8,0x47,0xC0,0x0,0x45,0x8D,0x63,0x1B,0x3,0x9,0xFF,0x0,0x45,0xF8,
-0x4E,0x60,0x83,0xE,0x12,0x87,0x16,0x18,0x83,0xA,0x12,0xF8,0x4F,0x60,0x87,0xF2,0x13,0x83,0xD0,0x18,0xC3,0xC6,0xF8,0x51,0x60,0x89,0xD4,0x18,0xF8,0x55,0x60,0x89,0x34,0x19,0xF8,0x59,0x60,0x89,
-0xC,0x15,0xF8,0x4D,0xC0,0x83,0x64,0x18,0x89,0x74,0x15,0xF8,0x51,0xC0,0x8A,0x44,0xE,0x2,0xC1,0x42,0x51,0xC3,0xC,0x85,0x20,0x12,0xF0,0x49,0xFA,0x22,0x8B,0xB2,0x11,0x85,0x5C,0x11,0xF0,0x4F,
-0x16,0x24,0x0,0x4B,0x84,0x75,0x1B,0x83,0xE,0x12,0x1,0xF3,0x1,0x87,0xDE,0x12,0xF8,0x4B,0x60,0x89,0x74,0x1B,0x0,0xF4,0xF8,0x52,0x60,0x87,0xD2,0x1B,0x85,0x4E,0x17,0xF8,0x51,0xC0,0x8B,0xB2,
-0x17,0x0,0x6C,0xF8,0x53,0xC0,0x8A,0x13,0x18,0x0,0x6B,0xF8,0x50,0x60,0x3,0x25,0x81,0xF3,0x5,0x83,0xF4,0x13,0x83,0x2C,0x13,0x83,0xAC,0xE,0xF8,0x4F,0xC0,0x3,0x5,0x81,0xF4,0x5,0x8B,0xC6,
-0x24,0xF8,0x51,0xC0,0x8D,0x24,0x25,0xF8,0x51,0xC0,0x8D,0x84,0x25,0x87,0xFE,0x16,0xF0,0x59,0x9A,0x25,0xF0,0x4D,0x54,0x23,0x87,0x42,0x11,0x89,0x4C,0x11,0x83,0xB4,0x23,0x1,0x8E,0x81,0xF0,0x49,
-0x9A,0x22,0x87,0xE4,0x13,0x87,0xAE,0x11,0xC3,0x60,0x43,0x8C,0x81,0xF8,0x45,0xC0,0x0,0x40,0x88,0xA7,0xE,0x85,0xE,0x12,0xF8,0x4F,0x60,0x87,0x22,0x16,0x87,0x6C,0x12,0xF8,0x50,0xC0,0x8A,0x43,
-0x20,0xC5,0xC2,0xF8,0x4E,0xC0,0x8C,0xA3,0x20,0xC3,0xC2,0xF8,0x4E,0x60,0x88,0x3,0x21,0x3,0xF1,0x1,0xF2,0x1,0xC3,0xC2,0x0,0x25,0xF8,0x4C,0xC0,0x89,0x62,0x21,0x0,0x48,0x46,0x81,0x68,0x0,
-0x49,0xC2,0xBA,0xF8,0x49,0xC0,0x1,0x49,0x85,0x47,0x68,0x81,0xC3,0x58,0xC7,0x2,0xF8,0x49,0xC0,0x55,0x81,0x80,0xF9,0xC9,0x60,0x26,0x0,0x1,0x3,0x3,0xE7,0xFF,0x0,0xE7,0xFF,0x0,0xE4,0x3D,
-0x0,0x1,0x5,0x5,0xE5,0xD6,0x0,0x1,0x1,0x41,0xE4,0x2B,0x0,0x3,0x40,0x4,0x1,0xFF,0xE4,0x2B,0x0,0x3,0xFF,0x4,0x1,0xFE,0xE4,0x2B,0x0,0x3,0xFE,0x4,0x1,0xFD,0xE4,0x2B,0x0,0x1,
-0xFD,0x4,0xE6,0x4D,0x0,0x1,0x40,0x6,0xE4,0x2D,0x0,0x0,0xFF,0xF8,0x2E,0x30,0x0,0xFE,0xF8,0x2E,0x60,0x0,0xFD,0xF8,0x2E,0x90,0xE6,0x31,0x0,0x0,0x2,0xF0,0x2C,0x23,0x3A,0xC2,0x30,0xF0,
-0x2C,0x53,0x3A,0xC2,0x60,0xF0,0x2C,0x83,0x3A,0xC2,0x90,0xF0,0x2C,0xB3,0x3A,0x26,0x0,0x0,0x7,0xF8,0x2E,0x95,0xA3,0x15,0x41,0xF8,0x8B,0x60,0xE5,0x7F,0x0,0x0,0x5,0xF1,0xAE,0x78,0x41,0xE5,
-0x4B,0x0,0xF0,0x2E,0x23,0x40,0x0,0x0,0xF0,0x2F,0x78,0x41,0xF0,0x2E,0x83,0x40,0x0,0x0,0xF0,0x33,0xB3,0x40,0xE5,0x1A,0x0,0x5F,0x44,0x0,0xE8,0x3F,0xFF,0x0,0xFB,0xFF,0x60,0xFB,0xFF,0xC0,
-0xFB,0x9F,0xC0,0x43,0xE0,0x2,0x16,0xE1,0x2,0xE2,0x2,0xE3,0x2,0xE4,0x2,0x44,0x0,0x5,0x3,0x5,0x7,0x44,0x0,0xE4,0x6,0xE3,0x6,0xE2,0x6,0xE1,0x44,0x6,0xE0,0xF8,0x3F,0xC0,0x43,0x0,
-0x3,0x2,0x1,0x3,0x2,0x22,0x3,0x1,0x4,0x3,0xC7,0x60,0x9,0x4,0x7,0x3,0x7,0x2,0x7,0x1,0x7,0x0,0xF,0x83,0xE6,0x40,0xF8,0xBA,0xC0,0xC2,0x2,0xFB,0xFF,0xC0,0xF8,0xDF,0xC0,0x0,
-0x5,0x43,0x3,0x6,0x0,0x7,0xC3,0xD6,0xC3,0xDC,0xC2,0xE,0x43,0x7,0x5,0xC2,0xE6,0x3,0xE5,0x2,0xE8,0x2,0xC3,0xEE,0xF8,0x3F,0xC0,0xC9,0x60,0x6,0xE5,0x2,0xE5,0x6,0xE5,0x2,0xE6,0x43,
-0x6,0xE5,0xC2,0xA,0x3,0x5,0x3,0x8,0x3,0xC3,0x12,0xF8,0xA9,0xC0,0xCD,0x60,0xC3,0xC0,0xF8,0x23,0x60,0xF8,0x7F,0xC0,0x0,0xE5,0x43,0x2,0xE6,0x2,0x6,0xE5,0x6,0xF8,0x61,0xC0,0x8D,0x8C,
-0x5A,0xC3,0xC0,0xF0,0x23,0x9E,0x5A,0xF2,0x9,0x22,0x5B,0x85,0x96,0x5A,0xF1,0xF,0xF2,0x5A,0xF8,0x5F,0xC0,0xF3,0xFF,0x22,0x54,0xFB,0xFF,0xC0,0xFB,0xFF,0xC0,0xF3,0xFF,0x22,0x54,0xFB,0xFF,0xC0,
-0xFB,0xDF,0xC0,0x0,0x0],
-0x232688: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF],
-0x23EC11: [0xC6,0x6,0x0,0x43,0xC6,0xE,0xC3,0x10,0xC3,0xC,0xC5,0x18,0xC5,0xA,0xC5,0x1C,0xC3,0x22,0x43,0x43,0x81,0xC5,0x34,0xC5,0x2A,0xC5,0x2C,0xCD,0x28,0xCF,0x44,0xF8,0x4F,0xC0,0xC5,0x7E,0xC3,0xA6,0x1,
-0x42,0x81,0x43,0x13,0x89,0xC5,0x94,0xC3,0xE,0xC5,0xC6,0xC3,0x18,0xCB,0x12,0xC5,0x10,0xC9,0xD8,0xCD,0x12,0xC9,0x22,0xCD,0x44,0xC9,0xDA,0x0,0x63,0xC2,0xC2,0x0,0x62,0xC2,0xC6,0x0,0x8,0xC3,
-0x4,0x0,0x85,0xC3,0x4,0x0,0x60,0xDA,0xC0,0xC5,0xF4,0xC7,0x3E,0xC7,0xE,0xC9,0x14,0xC5,0xB4,0xC5,0x4,0x1,0x1A,0x8D,0x43,0x8,0x81,0x2,0x45,0x81,0x40,0xC6,0x4,0xC7,0xA,0xC7,0x6,0xC7,
-0x18,0xCB,0x16,0xC5,0x26,0xC5,0x32,0x0,0x42,0xCE,0x20,0x0,0x40,0xC6,0xF4,0x87,0x12,0x1,0xC5,0xA,0x2,0x60,0x81,0x64,0xC2,0xC2,0x43,0x64,0x81,0x0,0x62,0xC2,0xCC,0x2,0x8,0x85,0x63,0xC2,
-0x10,0xC3,0xC8,0xC3,0xD4,0xF0,0x27,0x1E,0x0,0xC3,0xCE,0x1,0x33,0x8D,0xC4,0xB2,0x3,0x11,0x23,0x15,0x23,0x43,0x11,0x8,0xC,0x85,0x23,0x15,0x3,0x11,0x22,0x15,0xFF,0x0,0x40,0xF1,0x40,0x51,
-0x55,0xFF,0x0,0xD9,0x1A,0xC3,0x30,0x0,0x45,0xC2,0xA6,0x1,0x40,0x81,0xC3,0x3A,0x1,0xC1,0xA,0xC5,0x4,0x47,0x40,0x81,0x8B,0xBC,0x1,0x0,0x43,0xC3,0xAE,0xC2,0xC2,0x6,0x63,0x81,0x82,0x11,
-0x64,0x81,0x84,0xC4,0x4,0x2,0x83,0x11,0x61,0x86,0x8D,0x1,0xCD,0xC0,0xCB,0x36,0x8B,0x78,0x0,0xC,0x16,0x8D,0x32,0x81,0x36,0x89,0x3D,0x85,0x8,0x81,0x8,0x15,0x25,0xC2,0xB2,0x4,0xFF,0x0,
-0x9,0x1,0xA,0xC4,0x7A,0xC4,0xA6,0x2,0xD1,0x40,0xD1,0xD6,0xC0,0xD8,0x1A,0xC4,0xDE,0xC2,0x9C,0xC6,0xC0,0x0,0x2,0xC5,0x4,0xC7,0x18,0xC5,0xC8,0x87,0x32,0x2,0x83,0x52,0x2,0x6,0x83,0x11,
-0x84,0x11,0xA2,0x6,0xA1,0xC2,0x28,0x0,0xA2,0xC4,0x4,0x1,0xA1,0x2,0xC3,0xD2,0x83,0x86,0x1,0x91,0x20,0x0,0x8B,0x9A,0x0,0xC5,0xBE,0x83,0xDC,0x1,0x1,0x2,0x81,0x83,0x9C,0x2,0x1,0x9,
-0x1,0xC7,0xB6,0x0,0xB,0xC8,0xA,0xF0,0x37,0xA2,0x2,0x85,0x1A,0x2,0xC3,0xFA,0x0,0xC0,0xC2,0xC0,0xC3,0x4,0xCD,0xDE,0xC8,0x2,0x2,0x94,0xC,0xC4,0xC3,0xBA,0xCD,0xFE,0x1,0xA2,0x6,0x83,
-0x54,0x2,0x0,0x63,0xC2,0xC0,0x1,0x16,0x8D,0x5D,0x13,0x89,0xC5,0xBE,0xDA,0x88,0xF0,0x36,0x63,0x3,0x8A,0xDA,0x2,0x8C,0xA5,0x3,0xCB,0xF2,0x7,0xC,0xC0,0x40,0x90,0x60,0x94,0x2C,0xD4,0xD3,
-0x7E,0x5,0xA1,0x6,0x25,0x11,0x8,0x85,0xE8,0x23,0xC,0x81,0xDB,0xBE,0xF0,0x3D,0x20,0x4,0xC5,0xC0,0x47,0x40,0x81,0xD1,0xEC,0x7,0x2C,0xD0,0x60,0x90,0x60,0x9C,0x2C,0xDC,0xE8,0x5B,0xFF,0x0,
-0x89,0x62,0x3,0x1,0x4A,0xB1,0xCD,0x8,0x8B,0x62,0x3,0xCF,0x1C,0x83,0xD8,0x2,0x87,0x5C,0x4,0xC3,0xA,0xC3,0xCC,0xD1,0xC6,0x6,0x2C,0xD8,0x60,0x98,0x40,0x9C,0xC,0xDA,0xC0,0x0,0xC,0xE8,
-0x22,0x81,0x1C,0x0,0x1D,0xC8,0x4,0x0,0x6,0x92,0xC7,0x4,0x89,0xA2,0x2,0x0,0x4B,0xC6,0xC8,0xC7,0x8,0x8B,0xA2,0x2,0xCF,0x1C,0xC2,0xF8,0x84,0xE1,0x1,0xC5,0xA,0x89,0x74,0x1,0xCD,0xC6,
-0x4,0xC,0xD8,0x40,0x98,0x62,0x83,0x53,0x2,0x0,0x89,0x84,0x52,0x2,0x3,0x89,0x8,0x8D,0x0,0x8E,0xC5,0x4,0x3,0x5,0x85,0x16,0x85,0xE8,0x27,0x13,0x81,0x1,0x1A,0x85,0xD3,0xC4,0x87,0x62,
-0x3,0x5,0x28,0x6,0x45,0x81,0x28,0x2,0xC9,0x8,0x8B,0x60,0x3,0xD1,0x1C,0x8B,0xA2,0x3,0x83,0x9A,0x6,0x89,0x14,0x1,0xC3,0xCC,0x4B,0x40,0x81,0x83,0x6,0x3,0x83,0x88,0x1,0x7,0xC,0x11,
-0xC,0x15,0x23,0x15,0x4,0x11,0x83,0xD0,0x3,0xCB,0xC0,0x91,0x78,0x2,0xC7,0x4C,0x8B,0xF4,0x3,0xC3,0x18,0xC3,0xEA,0xD1,0xC4,0x85,0xA2,0x2,0xC3,0xBE,0x85,0x5C,0x4,0x0,0x45,0xC2,0x86,0xC5,
-0xCA,0x87,0xA2,0x2,0xCB,0x1C,0xC3,0x24,0xC5,0xDE,0x89,0x64,0x4,0x83,0x2C,0x2,0xC9,0xBC,0x89,0x28,0x1,0xC5,0xD0,0xB,0x1A,0x85,0x8,0x81,0x23,0x15,0x22,0x15,0xA2,0x6,0xA0,0x2,0xCD,0xBC,
-0xCF,0xC0,0x8D,0xBE,0x1,0xD3,0x12,0x0,0x43,0xD2,0xC4,0x85,0x62,0x3,0xC3,0xBE,0xC3,0x7C,0xC5,0x8,0xC5,0xCA,0x87,0x62,0x3,0xD3,0x1C,0x8D,0x18,0x8,0x89,0x14,0x1,0x87,0x7E,0x0,0xC7,0x4,
-0x4,0xD,0x81,0x14,0x85,0x5,0x9A,0xC7,0x4,0x8F,0x60,0x8,0x8B,0xF4,0x3,0x95,0x52,0x0,0x8B,0x8A,0x8,0x3,0x1D,0x81,0x8,0x89,0x87,0x10,0x2,0xC5,0x7E,0xC9,0x8,0x89,0xF8,0x1,0xC3,0x1C,
-0xC3,0xD4,0x87,0x2C,0x2,0x51,0x40,0x81,0x89,0x24,0x1,0x89,0x34,0x3,0x87,0x94,0x0,0x2,0x14,0x85,0x7,0xD8,0xC0,0x2,0xC,0x81,0x14,0xE8,0x2C,0x81,0xD,0x89,0x84,0x0,0x89,0xA2,0x7,0x89,
-0x70,0x0,0x87,0x32,0x2,0x8D,0x36,0x3,0xC5,0x10,0x8B,0xB4,0x9,0x8B,0x12,0x1,0x87,0xB0,0x1,0x89,0x60,0x0,0x89,0x76,0x8,0xC5,0xC2,0x9B,0xC2,0x9,0x1,0x5,0x85,0xF8,0x2D,0xC0,0x91,0xA6,
-0x1,0xC7,0x78,0xC7,0xC6,0x8D,0x6A,0xA,0x89,0x2E,0x1,0x8B,0xA8,0x9,0x8B,0xB6,0x9,0xCB,0x2C,0xCB,0x28,0xC9,0x42,0x9B,0x82,0xA,0x0,0x7,0xC2,0xC0,0xE8,0x9F,0xFF,0x83,0x9F,0x42,0xB,0xF8,
-0xA1,0xC0,0x85,0x84,0xA,0x3,0x2,0x85,0x0,0x85,0x89,0x4,0x7,0xC7,0x8,0xF0,0xAB,0x20,0xC,0x6,0x25,0x11,0x8,0x15,0xE,0x81,0x12,0x46,0x81,0x13,0x1,0x2E,0x85,0x43,0x18,0x81,0x1,0x2E,
-0x89,0xF0,0xA7,0xE2,0xC,0xC3,0xC4,0x4,0x2,0x15,0x8,0x15,0x1A,0x8A,0xD5,0x1,0x43,0xC,0x81,0xF0,0xAD,0x22,0xC,0x0,0x22,0x43,0x11,0x23,0x0,0x15,0xC5,0x4,0x5,0x2,0x11,0x5F,0x10,0x9D,
-0x80,0xF0,0xAB,0x62,0xE,0x93,0x2E,0x5,0xF0,0xBB,0x22,0xC,0x83,0xFE,0x5,0xF0,0xBB,0xE2,0xF,0x83,0xBE,0x6,0xF0,0xBB,0x22,0xC,0x83,0x7E,0x7,0xF8,0xA1,0xC0,0x87,0x4,0x7,0x3,0x1C,0x85,
-0x1D,0x85,0x87,0x90,0x7,0x83,0x8A,0xD,0x3,0x8,0x89,0x5F,0x80,0xF0,0xA3,0xE0,0xF,0x43,0xE,0x81,0x8F,0x48,0x8,0x8,0xA2,0x6,0x4,0x15,0x23,0x11,0xC,0x81,0x1A,0xF0,0xA2,0x21,0xC,0x89,
-0x4,0x9,0xF0,0xBB,0xCE,0xC,0xF1,0x7F,0xA,0xC,0xF0,0xB9,0xA,0xC,0x93,0xE,0x7,0xF0,0xC5,0x18,0x15,0x0,0x6,0xF0,0xAA,0x1F,0xC,0x8B,0x8A,0xD,0x89,0x2,0x7,0xF0,0xAB,0x60,0x17,0x8D,
-0x4C,0xE,0xC5,0x6,0x0,0x16,0xF0,0xAC,0x21,0x15,0x8B,0xE,0xF,0xC7,0x6,0xF0,0xB7,0x22,0xF,0x0,0x3,0xC2,0xA,0x1,0xC,0x11,0xF0,0xA3,0x20,0xF,0x99,0x4,0x18,0xF0,0xA5,0x9E,0x10,0x9A,
-0x4,0x12,0xF0,0xA4,0x5F,0x11,0x9A,0x44,0x11,0xF0,0xA4,0x1F,0x12,0x9A,0x84,0x1C,0xF0,0xBC,0xDF,0x12,0xC5,0x18,0xF8,0xA1,0xC0,0x0,0xE,0x83,0x8F,0x1,0x0,0x81,0x43,0xC,0x15,0x8F,0x4E,0x14,
-0x1,0x8,0x85,0xF0,0xBB,0x60,0x14,0x1,0xA2,0x6,0xF1,0x6B,0x1E,0x18,0xF0,0xB9,0xA,0xC,0x99,0x84,0xA,0xF0,0xA5,0xDE,0xC,0x99,0xC4,0x9,0xF0,0xA5,0xDE,0x18,0xF0,0xC5,0x4,0xC,0xF0,0xB9,
-0x8A,0x19,0x87,0x84,0xA,0xF0,0xB7,0x4C,0x1A,0x89,0xC4,0x9,0xF0,0xB5,0xE,0x1B,0x8B,0x84,0xA,0xF0,0xB3,0xD0,0x1B,0x9A,0xC4,0x12,0xF1,0x64,0x9F,0x1C,0x83,0x8C,0x13,0x7,0x1C,0x15,0x1D,0x15,
-0x20,0x11,0x21,0x11,0xF0,0xB1,0x10,0x12,0x89,0xA2,0x7,0x0,0x1A,0xD0,0xC8,0xF0,0xA3,0xDE,0x12,0x49,0xD,0x81,0xC7,0xCA,0xC4,0xC8,0xC8,0x4,0xF8,0xA9,0xC0,0xCF,0xC8,0xC5,0xCE,0xF8,0xB1,0xC0,
-0xCD,0xD2,0xFA,0xDF,0xC0,0xE5,0x46,0x0,0xA,0x93,0xD7,0x97,0x93,0x0,0xD7,0x87,0xD6,0x0,0x7,0xFF,0x2A,0x0,0xCC,0xD,0x39,0x0,0x0,0x83,0x43,0x0,0x80,0x0,0xC3,0xDC,0x5F,0x0,0xD2,0x27,
-0x0,0xA3,0xB0,0x31,0x28,0x0,0xCC,0xD,0x37,0x0,0x1,0xC3,0x80,0x3F,0x0,0xC2,0xB7,0xD5,0xB3,0xF8,0x23,0xC0,0x0,0x41,0xE4,0x2D,0x0,0xF8,0x2D,0xC0,0x2,0x40,0x4,0x0,0xCB,0xF0,0x0,0x92,
-0xE4,0x21,0x0,0xF8,0x2D,0xC0,0x3,0xFF,0x4,0x0,0xFE,0xF8,0x32,0xC0,0x0,0x6,0xC6,0x4,0xC5,0xCD,0xC7,0xE,0x32,0x0,0x3,0xFE,0x4,0x0,0xFD,0xE4,0x2D,0x0,0xC4,0xC0,0xC7,0x4,0xC5,0xCD,
-0xC7,0x12,0x32,0x0,0x1,0xFD,0x4,0xE4,0x2F,0x0,0xF0,0x31,0xB2,0x31,0x4,0x0,0x0,0x93,0x93,0xD7,0x8A,0x7,0x32,0xF0,0x4B,0xB4,0x32,0x23,0x0,0xF8,0x29,0x5C,0xF8,0x37,0xC0,0xE6,0x40,0x0,
-0x1,0x92,0x93,0xE4,0x5E,0x0,0x0,0x95,0xF8,0x5F,0x61,0x0,0x96,0x44,0x97,0xD7,0x0,0x93,0xF8,0x5F,0xC8,0x1,0x40,0x1,0xE4,0x5D,0x0,0x0,0xFF,0xF8,0x5E,0x60,0x0,0xFE,0xF8,0x5E,0xC0,0x0,
-0xFD,0xF8,0x5E,0xC0,0xE4,0x55,0x0,0x87,0x26,0x34,0x1,0x96,0x97,0xE4,0x53,0x0,0xF0,0x2D,0x84,0x34,0xE6,0x74,0x0,0xF0,0xC6,0x27,0x37,0x1,0x87,0x97,0xF8,0x5F,0xC8,0x1,0x40,0x2,0xE4,0x5D,
-0x0,0x0,0xFF,0xF8,0x5E,0x60,0x0,0xFE,0xF8,0x5E,0xC0,0x0,0xFD,0xF8,0x5E,0xC0,0xF3,0xFF,0xD0,0x39,0xF0,0x80,0xD0,0x3D,0x0,0x3,0xE4,0x5D,0x0,0x0,0xFF,0xF8,0x53,0x60,0x3,0x13,0x13,0x57,
-0x56,0x26,0x0,0x0,0xFE,0xF8,0x57,0xC0,0xC6,0x64,0x0,0xFD,0xF0,0x5E,0x51,0x44,0xE6,0x31,0x0,0x43,0xFF,0x0,0x5,0xD,0x3,0x2E,0x7,0x5,0x3,0xC3,0x8,0x45,0xFF,0x0,0x0,0xD,0x22,0x7,
-0x2,0xFF,0x0,0xE,0xC4,0xE,0x45,0x80,0x0,0x1,0xE5,0x3,0xC5,0x4,0x2,0x80,0x0,0xE6,0xCC,0x6,0xC5,0x14,0xF8,0x7B,0x20,0x2,0xFF,0x0,0x24,0xC2,0xBE,0x3,0xFF,0x0,0x7,0x3,0xC3,0xC6,
-0xC5,0xC0,0x2,0x2E,0x3,0x5,0xC2,0xC0,0x0,0x2E,0xC6,0xC0,0xC5,0xA6,0xC3,0xC2,0xC3,0xBC,0xCB,0xC,0xC5,0xCE,0xF8,0x7D,0x20,0x2,0xFF,0x0,0x25,0xC4,0xB6,0x2,0xE,0x7,0x2D,0x88,0xF,0x48,
-0xC2,0xE,0x0,0x3,0xC3,0x6,0xC3,0xCE,0xC5,0xFA,0x87,0x3E,0x48,0x91,0x32,0x48,0xF8,0x7F,0x20,0xC4,0xB2,0xC2,0xC6,0x2,0x2E,0x7,0xE,0x88,0xCF,0x48,0x5,0xD,0x7,0x2E,0x3,0x2C,0x7,0xC5,
-0xC2,0x87,0x40,0x48,0xC3,0xFE,0x8D,0x38,0x48,0x85,0xEA,0x48,0xF8,0x7F,0x20,0xC3,0xC0,0x1,0x2D,0x3,0xC5,0xC2,0x47,0xFF,0x0,0x0,0x2D,0xC2,0xCA,0x43,0x2D,0x7,0xC3,0xC2,0xC5,0xFE,0x8B,0xA8,
-0x49,0x8D,0x32,0x48,0xF8,0x7F,0x20,0x87,0x86,0x49,0xC3,0xC2,0x87,0xE,0x48,0x83,0x1C,0x48,0x2,0xE,0x3,0x5,0xC2,0xC2,0x85,0x20,0x48,0x43,0xE5,0x3,0xC7,0x6,0x89,0x68,0x4A,0xC5,0xC8,0xF8,
-0x7F,0x20,0x85,0x4,0x48,0x1,0x7,0x3,0x83,0x8C,0x49,0x89,0xCE,0x48,0x2,0xD,0x7,0x2C,0x22,0x7,0xC3,0xC8,0x8D,0xF8,0x48,0x8B,0xE2,0x48,0x91,0x2C,0x4B,0xF8,0x73,0x20,0x2,0xFF,0x0,0x2C,
-0xC2,0xBA,0x1,0x7,0x3,0x87,0x4C,0x4A,0x85,0x12,0x48,0x4,0x2D,0x7,0x2E,0x3,0x6,0xC2,0x4,0x8B,0xA0,0x49,0x89,0xBE,0x49,0x8B,0xA4,0x49,0xF8,0x7F,0x20,0x83,0x4,0x4B,0x5,0xFF,0x0,0x6,
-0x3,0x2E,0x7,0x89,0xE,0x48,0xC3,0xBC,0x1,0xFF,0x0,0x83,0xD8,0x48,0x85,0x20,0x4B,0xC5,0xC2,0x89,0x3A,0x48,0x87,0xEE,0x48,0x8D,0xBC,0x49,0xF8,0x75,0x20,0x83,0xC8,0x48,0xC2,0xAC,0x8C,0x8B,
-0x4C,0xC2,0x14,0xC2,0xC0,0x0,0x7,0x84,0x5B,0x4A,0x89,0x40,0x48,0xC5,0xC2,0xD1,0x8,0xF8,0x7D,0x20,0x83,0x6,0x4E,0xC5,0xC4,0x8B,0x4C,0x4D,0x83,0x18,0x4E,0x0,0x6,0x86,0xDD,0x4B,0x8B,0x0,
-0x49,0x8B,0x2C,0x48,0x93,0xA6,0x4C,0xF8,0x71,0x20,0x85,0xC6,0x4E,0x0,0xE,0x84,0xB,0x4E,0x87,0xE,0x48,0x0,0x2D,0x84,0x9D,0x4C,0x83,0xDA,0x4B,0x0,0xFF,0xC8,0xBE,0x8F,0x36,0x4E,0xC7,0x14,
-0xF8,0x7F,0x20,0x87,0xC8,0x48,0x83,0xA,0x4E,0x87,0xCE,0x48,0x1,0xE,0x3,0x85,0x54,0x4A,0x83,0x18,0x48,0x8B,0x0,0x4F,0x8D,0xEA,0x4B,0x89,0xFE,0x4B,0xF8,0x7B,0x20,0x83,0x6,0x4E,0x83,0x8C,
-0x49,0x0,0xD,0xC4,0x6,0x89,0x4E,0x4A,0x83,0x16,0x4B,0xC3,0xC0,0x87,0x32,0x48,0x87,0xEE,0x48,0x87,0x26,0x4E,0x85,0x66,0x50,0x89,0x28,0x4E,0xF8,0x77,0x20,0x83,0x88,0x49,0x83,0x4C,0x4A,0x0,
-0x2D,0x88,0x49,0x4D,0x83,0x94,0x49,0x83,0x56,0x50,0x0,0xD,0x86,0x9D,0x4C,0x8B,0x62,0x4A,0x89,0x2E,0x4E,0x89,0x2C,0x48,0xF8,0x7D,0x20,0x83,0x48,0x4A,0x83,0xA,0x4E,0x0,0x5,0x8A,0xCD,0x48,
-0x83,0x9A,0x4F,0x1,0x2E,0x3,0x83,0x58,0x4D,0x85,0x20,0x48,0x87,0x30,0x4B,0x89,0x28,0x4E,0x8B,0xFE,0x4E,0xF8,0x7D,0x20,0x9F,0x2,0x48,0xF8,0xA1,0x4,0x9D,0xC4,0x48,0xF8,0xA1,0xC4,0x9D,0x84,
-0x49,0xF8,0xA3,0xC4,0x9B,0x46,0x4A,0xF8,0xA3,0xC6,0x9B,0x6,0x4B,0xF8,0xA3,0xC4,0x9B,0xC6,0x4B,0xF0,0xA3,0xA4,0x55,0x9B,0x86,0x4C,0xF8,0xA1,0xC2,0x9D,0x44,0x4D,0xF0,0xA3,0x64,0x56,0x9B,0x6,
-0x4E,0xF8,0xA1,0xC2,0x9D,0xC4,0x4E,0xF8,0xA1,0xC4,0x9D,0x84,0x4F,0xF8,0xA1,0xC2,0x9D,0x44,0x50,0xF0,0xA3,0x22,0x5A,0x9B,0x6,0x51,0xF0,0xA3,0xE2,0x5A,0x9B,0xC6,0x51,0xF0,0xA3,0x24,0x57,0x9B,
-0x86,0x52,0xF8,0xA1,0xC2,0x9D,0x44,0x53,0xF0,0xA7,0xE0,0x57,0xF3,0xFF,0xA,0x54,0xF3,0xFF,0xA,0x58,0xF3,0xFF,0xA,0x5C,0xF3,0xFF,0xA,0x54,0xF3,0xFF,0xA,0x58,0xF3,0xF7,0xA,0x5C,0x0,0x0
-],
-0x23F4AE: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF],
-0x241443: [0xF8,0x9F,0x40,0x9,0x16,0x8D,0x13,0x8D,0x32,0x81,0x36,0x89,0x32,0x85,0x43,0x13,0x8D,0xC7,0xA,0xC7,0x12,0x1,0x16,0x89,0xDF,0xC0,0xD,0x1A,0x8D,0x8,0x81,0x23,0x15,0x3,0x11,0x23,0x11,0x8,0x15,
-0xC,0x15,0xC3,0xC,0xC3,0xA,0xC6,0x12,0x1,0x85,0x1A,0xF8,0x20,0x40,0x3,0xC,0x85,0x2,0x81,0x45,0xFF,0x0,0x5,0x9,0x5,0xFF,0x0,0xA,0x85,0xC7,0xA,0xC3,0x14,0x3,0x2,0x85,0xC,0x85,
-0xDF,0xC0,0x3,0x40,0x94,0xC,0xC4,0x49,0xFF,0x0,0x0,0xB,0xC6,0x3A,0xC5,0x52,0x3,0xC,0xC0,0x40,0x90,0xDF,0xC0,0x3,0x60,0x94,0x2C,0xD4,0x57,0xFF,0x0,0x2,0x2C,0xD0,0x60,0xF8,0x21,0x40,
-0x2,0x9C,0x2C,0xDC,0xD8,0x40,0x2,0xD8,0x60,0x98,0xF8,0x20,0xC0,0x1,0x9C,0xC,0xD8,0x40,0x2,0xC,0xD8,0x40,0xF8,0x20,0x40,0x9,0x1C,0x85,0x1D,0x81,0x0,0x81,0x2,0x81,0x4,0x11,0xCB,0xFA,
-0x8,0x4,0x15,0x2,0x85,0x0,0x85,0x1D,0x85,0x1C,0xF0,0x20,0x41,0x0,0x5,0x1A,0x85,0x8,0x81,0x22,0x15,0xC7,0xFE,0x3,0x52,0x12,0x53,0x12,0xC7,0xFE,0x0,0x22,0x83,0x3D,0x1,0xF8,0x20,0x40,
-0x2,0x14,0x85,0x5,0x86,0x65,0x1,0xD1,0xC6,0x2,0x5,0x85,0x14,0xF8,0x22,0x40,0x0,0x7,0xD8,0x40,0x0,0x7,0xF8,0x24,0x40,0xF8,0x3F,0x80,0x8,0x1C,0x81,0x1D,0x15,0x1C,0x11,0x20,0x11,0x29,
-0x44,0x15,0x28,0x0,0x21,0x8A,0xAB,0x2,0xC3,0x80,0x5F,0xD,0x81,0x1,0x16,0x85,0x45,0x13,0x81,0x2,0x2E,0x85,0x37,0x44,0x85,0xE,0x8B,0xA6,0x2,0xC3,0x80,0xE8,0x21,0xD,0x81,0x1,0x16,0x8D,
-0x43,0x13,0x89,0x3,0x1A,0x8D,0x8,0x11,0x83,0x26,0x1,0x89,0xE6,0x2,0xCD,0x80,0xC5,0x26,0xC3,0x2A,0x1,0x16,0x89,0xCD,0x3E,0xD3,0x3A,0xCB,0x80,0xC8,0x60,0x43,0x81,0xC,0x0,0x85,0x83,0x3E,
-0x1,0xC9,0x48,0xC4,0x3E,0x1,0x81,0x25,0xD0,0x3A,0x87,0xB6,0x2,0xC3,0x2C,0xC7,0x9A,0xC5,0xD6,0x1,0x2,0x85,0x87,0x38,0x1,0xC3,0xDC,0x3,0x14,0x85,0xE,0x81,0x99,0x24,0x3,0x0,0x25,0xC2,
-0x26,0xC2,0x74,0x0,0x11,0xD3,0x60,0x0,0x6,0xC2,0x88,0x1,0x16,0x89,0xC3,0x40,0x99,0x64,0x3,0xC3,0xC2,0x8D,0xA2,0x1,0xC9,0xE2,0x0,0x2,0xC2,0xCA,0x2,0x12,0x89,0x12,0xC2,0xD6,0x0,0x2B,
-0xDA,0x40,0x1,0x7,0x85,0x99,0xE2,0x1,0x1,0x7,0x5,0x43,0xE,0x1,0x1,0x5,0x1,0x5B,0xFF,0x0,0x1,0x5,0x85,0x91,0x22,0x2,0x8,0x21,0x15,0x20,0x15,0x1D,0x11,0x1C,0x11,0x1D,0x43,0x81,
-0x12,0x0,0x85,0x95,0xA2,0x2,0x3,0x21,0x15,0x29,0x11,0xC2,0x26,0x2,0x15,0x1C,0x81,0x87,0x62,0x2,0xC9,0x36,0x2,0x1C,0x81,0x1A,0x46,0x81,0x13,0x3,0x16,0x81,0x16,0x85,0x83,0xE2,0x2,0x8D,
-0xE6,0x4,0x85,0xB8,0x2,0x0,0x37,0x44,0x81,0x18,0x0,0x2E,0xC2,0x2E,0xC3,0x32,0xCB,0x36,0xC3,0x38,0x8B,0x9A,0x4,0x93,0x24,0x3,0x1,0x22,0x11,0x87,0x16,0x5,0x49,0x13,0x81,0xC9,0x36,0xC9,
-0x8,0x0,0x14,0xD0,0x7E,0xCD,0xFE,0x0,0x1A,0x8C,0x95,0x4,0xD3,0x40,0x99,0x24,0x3,0x85,0x3C,0x5,0xDF,0x40,0x89,0x64,0x3,0x3,0x52,0x12,0x1,0x81,0x89,0xF2,0x2,0xC7,0x82,0xF8,0x3B,0x80,
-0x83,0x7C,0x3,0xF8,0x29,0x80,0x95,0x2A,0x3,0x5F,0xFF,0x83,0xDD,0x80,0xF8,0x21,0x40,0xD1,0x80,0x8B,0xF0,0x2,0x0,0x7,0xF8,0x60,0x80,0x83,0x82,0x6,0x91,0xA6,0x2,0xF8,0x29,0x80,0x1,0xE,
-0x81,0x9D,0xE2,0x6,0xDF,0xC0,0x0,0xC,0xC2,0x7C,0xD3,0xC2,0x86,0xB8,0x2,0xF0,0x20,0x41,0x0,0x8D,0xA2,0x1,0x8B,0xF0,0x2,0x83,0x3C,0x5,0x0,0xC,0xF8,0x20,0x40,0x9B,0xE2,0x1,0x2,0xFF,
-0x0,0x45,0xF8,0x21,0x40,0x9A,0x23,0x2,0x2,0xFF,0x0,0x43,0xF8,0x21,0xC0,0x9A,0x63,0x2,0xF8,0x23,0x80,0x5F,0x40,0x81,0xDF,0xC0,0x3,0x45,0x81,0x28,0x86,0x45,0xFF,0x80,0xC7,0x8,0xC4,0xC,
-0x0,0x82,0xC5,0x14,0xF8,0x21,0x80,0x2,0x42,0x81,0x43,0xC4,0x42,0x1,0x28,0x86,0xC2,0xAC,0xC4,0x44,0xC3,0x3C,0xC2,0x56,0xC2,0x42,0x1,0x28,0x82,0xF0,0x21,0x40,0xA,0x3,0x43,0x81,0x42,0x81,
-0xC3,0x84,0x0,0x45,0xC4,0x48,0xC2,0x4C,0x0,0x82,0xC3,0x3C,0x0,0x43,0xC3,0x14,0xC2,0xA,0x0,0x42,0xF8,0x24,0x80,0x0,0xD,0xC2,0x42,0xC3,0x88,0xC3,0x30,0xC5,0xA,0xC3,0x96,0xC5,0x6,0xF0,
-0x21,0x2,0x0,0xC5,0x30,0xC5,0x8,0xC5,0xA,0xC3,0x52,0xC7,0x4,0xE4,0x91,0x0,0x8,0xD7,0x80,0x97,0x93,0x93,0x0,0xD7,0x97,0x93,0xC2,0x9,0xE4,0x32,0x0,0x0,0x41,0x2B,0x0,0x1,0x40,0x1,
-0x30,0x0,0x0,0xFF,0xCC,0xD,0xD1,0x20,0x0,0xFE,0xCC,0xD,0xD1,0x40,0x0,0xFD,0xCC,0xD,0xD1,0x60,0x22,0x0,0x0,0xC0,0x25,0x0,0x0,0x80,0x35,0x0,0x0,0xD6,0x23,0x0,0x1,0x83,0xC3,0x23,
-0x0,0x0,0x96,0xE4,0x73,0x0,0x6,0x13,0x13,0x57,0x0,0x7,0x7,0x56,0xE4,0x20,0x0,0xC6,0xC6,0x33,0x0,0x2,0x93,0xD7,0xC7,0xC4,0xC6,0xF8,0x31,0x1D,0x22,0x0,0x0,0xD2,0x28,0x0,0x85,0x5D,
-0xD,0x2,0x93,0xD7,0x87,0xC3,0x9,0x94,0x9D,0xC,0x0,0x92,0xC2,0x6C,0xC9,0x30,0x33,0x0,0x0,0x3,0x8C,0xD3,0xC,0xD2,0x20,0x8C,0xF3,0xC,0xD2,0x40,0x87,0x13,0xD,0x3,0x16,0x17,0x13,0x13,
-0xCC,0x98,0x7,0x0,0x16,0x7,0x17,0x13,0x0,0x3,0xFD,0xCC,0x1B,0xC9,0xC0,0x96,0x5D,0xD,0x2A,0x0,0x1,0x96,0x87,0xD2,0xD2,0xCA,0xFF,0xE4,0x22,0x0,0x0,0x92,0x35,0x0,0x1,0x83,0x0,0x84,
-0x7A,0xD,0xE4,0x7C,0x0,0x85,0x79,0xD,0xE4,0x34,0x0,0x9D,0x3B,0xF,0xF0,0x29,0x73,0xF,0xD3,0x48,0x0,0x2,0x85,0xD3,0xC,0xC6,0x9E,0x91,0xA0,0xF,0x0,0x2,0x9E,0xE3,0xE,0x0,0x2,0x8C,
-0x13,0xD,0xD2,0x60,0x8C,0x33,0xD,0xE4,0xC1,0x0,0xE8,0x23,0xFF,0x0,0x5,0xD,0x3,0x2E,0x7,0x5,0x3,0xC3,0x8,0xC6,0x10,0x22,0x7,0x2,0xFF,0x0,0xE,0xC6,0xE,0xDF,0x42,0x0,0x24,0xC2,
-0x3E,0x3,0xFF,0x0,0x7,0x3,0xC3,0x46,0xC5,0x6E,0x2,0x2E,0x3,0x5,0xC2,0x40,0x0,0x2E,0xF8,0x26,0x40,0x0,0x25,0xC4,0x36,0x2,0xE,0x7,0x2D,0xC8,0x7E,0xC3,0x7C,0xC3,0x6,0xF8,0x27,0x2,
-0xC3,0xB8,0x2,0x2E,0x7,0xE,0xC8,0x7E,0x5,0xD,0x7,0x2E,0x3,0x2C,0x7,0xF8,0x29,0x42,0x0,0x2D,0xC2,0xBC,0xC3,0x42,0xC8,0x10,0xC2,0xFE,0x43,0x2D,0x7,0xF8,0x27,0x84,0xC3,0xBC,0xC3,0x84,
-0x87,0x2E,0x12,0x83,0x3C,0x12,0x2,0xE,0x3,0x5,0xC2,0x42,0xF0,0x27,0x2,0x12,0x1,0x7,0x3,0xC3,0xFE,0x89,0x6E,0x12,0x2,0xD,0x7,0x2C,0x22,0x7,0xF0,0x25,0x3C,0x12,0x0,0x2C,0xC2,0xFE,
-0x1,0x7,0x3,0xC7,0xFE,0xC4,0x52,0xC2,0xBC,0x2,0x2E,0x3,0x6,0xC2,0x4,0xF8,0x25,0xFE,0x2,0xFF,0x0,0x6,0xC2,0x84,0x89,0x2E,0x12,0xC3,0x3C,0x1,0xFF,0x0,0x83,0x78,0x12,0xF8,0x23,0xFE,
-0x0,0x7,0xC2,0xFA,0x83,0x2A,0x12,0xC9,0xBE,0xC2,0x90,0xC2,0xFA,0x0,0x7,0xF0,0x26,0xFB,0x12,0x0,0x6,0xC4,0xC0,0xCB,0xEA,0x1,0xD,0x7,0xC3,0x80,0x0,0x6,0xF0,0x26,0x7D,0x13,0xC3,0x7C,
-0x0,0xE,0xC4,0xBE,0xC7,0xC2,0x0,0x2D,0x84,0xBD,0x13,0x83,0x7A,0x13,0xF8,0x25,0xC0,0x83,0x26,0x12,0x83,0x2A,0x14,0xC7,0xC2,0x1,0xE,0x3,0x85,0xF4,0x12,0xC3,0xC6,0xF8,0x23,0xC0,0x83,0xAC,
-0x12,0x0,0xD,0xC4,0x6,0x89,0xEE,0x12,0xC3,0xBC,0xF8,0x25,0x40,0x43,0xE,0x7,0xC2,0xB4,0x88,0xE9,0x13,0x83,0xB4,0x12,0xC3,0xC2,0x0,0xD,0xF0,0x26,0xBD,0x13,0xC5,0xBC,0x0,0x5,0x8A,0x6D,
-0x12,0xC2,0x94,0xC2,0xBE,0x83,0xF8,0x13,0xC5,0xFE,0x43,0xC,0x3,0xC9,0xFE,0x0,0xA,0xC4,0xA8,0x2,0x22,0x3,0x23,0xC8,0xB0,0x9B,0x26,0x12,0x2,0x23,0x7,0x22,0xC4,0xC6,0xC3,0x30,0xC5,0x48,
-0x0,0xB,0xC4,0xE8,0xC3,0x52,0x0,0x25,0xC4,0x58,0x9D,0x64,0x12,0x45,0xC,0x3,0xC5,0x3E,0x4,0xB,0x3,0x22,0x7,0x22,0x24,0x3,0xC3,0x54,0xC5,0x52,0xF0,0x23,0xA2,0x12,0x0,0x25,0xC2,0x36,
-0xC5,0x2C,0xC5,0xC8,0xC9,0x44,0x0,0x9,0xC4,0xE2,0x9B,0xE6,0x12,0x0,0x2,0xC2,0x74,0xC7,0xEA,0xC3,0x2E,0x0,0xA,0xC4,0x8C,0xC3,0xC0,0x2,0x23,0x7,0x3,0x86,0x1B,0x16,0xF0,0x21,0x26,0x13,
-0x1,0xA,0x3,0xC5,0x6A,0xC7,0xFE,0x85,0x14,0x16,0xC7,0x14,0xF0,0x21,0x66,0x13,0xC5,0x36,0xC9,0xD2,0xCB,0x10,0xF0,0x9D,0xA4,0x13,0x8,0x20,0x7,0x20,0x3,0x28,0x3,0x29,0x3,0x21,0xC8,0xC2,
-0x1,0x21,0x7,0xC3,0x10,0x1,0x20,0x7,0x43,0x2A,0x3,0x0,0x20,0x86,0xA5,0x14,0x99,0x68,0x14,0x0,0x28,0xC8,0x3A,0x0,0x20,0xC2,0x46,0xCD,0x4A,0xC3,0x4C,0x9F,0xA2,0x14,0x2,0x21,0x3,0x2B,
-0xC2,0x66,0xC3,0x7E,0xC5,0x4A,0xC5,0x8E,0x0,0x28,0xC4,0x80,0xC3,0x8A,0xF0,0x21,0xE2,0x14,0x0,0x24,0xCA,0x70,0xC3,0xB2,0xC5,0x40,0xC3,0xC2,0xF0,0x27,0x1E,0x15,0xC9,0x34,0xC9,0xCE,0xF0,0xAB,
-0x5A,0x15,0xF3,0xFB,0x6,0x12,0x0,0x0],
-0x241A16: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF],
-0x24E816: [0xF8,0x64,0x80,0x0,0x85,0xDD,0x80,0x1,0x28,0x8D,0x45,0x2D,0x89,0x2,0x26,0x89,0x26,0xCC,0xA,0x1,0x28,0x89,0xDD,0xFE,0xC3,0x38,0xC3,0x34,0x3,0x26,0x89,0x1D,0x85,0xC5,0x3A,0xC5,0x42,0xC3,0x10,
-0xC7,0x12,0xC5,0xE,0xC5,0x58,0xCD,0x50,0xC7,0x80,0x10,0x29,0x8D,0x27,0x1D,0xCF,0x6,0xCB,0x2,0xD0,0x2,0x24,0x19,0x24,0x1D,0xCC,0x2,0xCD,0xC6,0xA,0x4,0xCB,0x2,0x27,0x19,0x29,0xD9,0x82,
-0x0,0x85,0xC4,0x38,0xC4,0x34,0x2,0x24,0x19,0x30,0xC4,0x30,0xC5,0xE,0xC3,0x48,0x43,0x30,0x19,0x6,0x24,0x1D,0xD1,0x2,0xCE,0x2,0xD2,0xC4,0xE,0xC5,0x58,0xCD,0x50,0xC7,0x80,0x3,0x22,0x85,
-0xD3,0x6,0x55,0xFF,0x0,0x2,0xD8,0x2,0xA9,0xCA,0xB2,0x1,0x86,0x8D,0x43,0x82,0x89,0x0,0x86,0xC8,0xC4,0x1,0xA9,0x8D,0xE8,0x31,0xFF,0x0,0xCB,0x50,0x1,0xA6,0x8D,0xC5,0x80,0x1,0xA9,0x85,
-0xD9,0x48,0x2,0x8C,0x89,0xA0,0x43,0x89,0xA3,0x5,0x8D,0xA3,0x8D,0xA0,0x8D,0x85,0xC4,0x70,0x0,0x85,0xC6,0x12,0x2,0xA0,0x8D,0x8C,0xF8,0x32,0x80,0xC6,0x50,0xC4,0x40,0x45,0x5F,0x80,0xC2,0x88,
-0x1,0x85,0xD8,0x96,0x7,0x2,0xC3,0xE0,0x83,0x92,0x1,0x3,0xCF,0x6,0xD0,0x2,0xC9,0xEC,0x0,0xCB,0xC2,0xC,0x0,0xD0,0xC2,0x14,0xF8,0x21,0xFE,0x3,0xCC,0xA,0xCD,0xA,0xD1,0xDC,0x43,0xD0,
-0x2,0xC3,0x56,0x5,0xFF,0x0,0xC,0xC0,0x40,0x90,0xC3,0x80,0x0,0xD7,0xF8,0x22,0x4C,0xF8,0x21,0xEC,0x0,0xCF,0xCE,0x6C,0x4,0xD4,0x2,0x23,0x81,0x23,0x9A,0x85,0x2,0x4,0xFF,0x0,0x2C,0xD0,
-0x60,0xC4,0x80,0x97,0x6,0x2,0xF8,0x2D,0x96,0xCB,0x6E,0x8,0xCF,0xA,0xCF,0xE,0xD6,0x2,0x22,0x81,0x22,0x9C,0x5,0x3,0x9,0x2C,0xD8,0x60,0x98,0x1D,0x81,0x8D,0x85,0xD7,0x6,0x85,0x5E,0x3,
-0xC3,0x36,0x87,0x5C,0x3,0x89,0x5E,0x3,0x1,0xD0,0xA,0xC3,0x1E,0xC9,0xDE,0x2,0xCC,0xA,0xD2,0xC4,0x2C,0x8D,0x54,0x3,0x0,0xD3,0xC4,0x6E,0x0,0xD9,0xC6,0x4A,0xC3,0xFA,0x0,0xD5,0xC4,0x80,
-0x83,0x86,0x3,0xC9,0x56,0xC5,0x5E,0x2,0xCB,0xA,0xD0,0xC4,0x5C,0x2,0xC,0xD8,0x40,0xC2,0x80,0x3,0xA6,0x85,0xD4,0x6,0xC3,0xBC,0x0,0xD7,0x84,0xDD,0x3,0xC5,0x6,0xC5,0x12,0x4,0xFF,0x0,
-0x8C,0x81,0xA0,0x43,0x81,0xA3,0x1,0x85,0xA3,0x43,0x85,0xA0,0xC2,0x8,0xC4,0x6,0xC4,0x12,0x2,0xA0,0x85,0x8C,0xC4,0xEE,0xC3,0xB2,0xC4,0x3E,0x0,0x6,0xC3,0xEE,0x0,0xD5,0xC4,0x4A,0x0,0xD8,
-0xC6,0xFA,0xC3,0x92,0x0,0xD3,0xCA,0x5C,0xC8,0x50,0xC4,0x4A,0x87,0xFC,0x2,0x0,0xA9,0xC2,0x36,0xC5,0x2A,0xC4,0xB0,0x0,0xA,0xC5,0x48,0xC5,0x42,0x8A,0x20,0x2,0x50,0x85,0x1D,0x1,0xA9,0x8D,
-0xC5,0xB2,0xC3,0x6E,0x83,0x84,0x2,0x0,0xA9,0xC6,0x44,0xC7,0xC,0x0,0xD4,0xC5,0x86,0xC4,0x8C,0xC5,0x56,0xC2,0x50,0x4A,0x81,0x1D,0x86,0x7C,0x2,0x1,0x85,0xA9,0xC2,0xFA,0xC3,0x3C,0xC3,0xB6,
-0x2,0x26,0x85,0xA3,0x43,0x81,0x26,0xC4,0x6,0xC5,0x92,0x8E,0xDA,0x0,0xCA,0x86,0xC2,0xAC,0x0,0xE,0xC7,0x7A,0xC5,0x38,0xC2,0x4A,0x0,0xA,0xC9,0xC,0x0,0xDA,0xC2,0x56,0xCD,0x1E,0xC3,0xA4,
-0x90,0x72,0x0,0x0,0x85,0xC7,0x6E,0xC3,0xB0,0xCB,0x6E,0xC5,0x8C,0xD9,0x80,0xCB,0xAC,0xD1,0x32,0xDD,0x1E,0x91,0x78,0x0,0x0,0x22,0x84,0xDB,0x4,0xF0,0x79,0x10,0x0,0x3,0x22,0x85,0xFF,0x0,
-0xF8,0x83,0x80,0x1,0x1F,0x83,0xCD,0xFE,0xE8,0x5F,0xFF,0x83,0xF9,0x95,0x80,0x2,0x88,0x8D,0x80,0x84,0xA1,0x2,0x1,0x21,0x89,0xF8,0x5F,0x80,0xC2,0x6A,0x0,0x8D,0x43,0xA0,0x89,0x83,0xAC,0x2,
-0x0,0x85,0x88,0xF3,0x2,0x0,0x8C,0x86,0xFB,0x2,0x1,0x5F,0x80,0xF8,0x5F,0x80,0x3,0xAC,0x95,0xC,0xC4,0x8A,0xC2,0x3,0x0,0x6,0x83,0x20,0x3,0x0,0xD2,0x84,0x29,0x3,0x1,0xCF,0x6,0x83,
-0x7E,0x3,0xF8,0x5F,0x80,0x3,0xAD,0x95,0x2C,0xD4,0x9B,0xE6,0x3,0xF8,0x60,0x80,0x2,0x9D,0x2C,0xDC,0x9B,0x66,0x4,0xF8,0x5F,0x80,0x2,0xAC,0x9D,0xC,0xC6,0x80,0x83,0x90,0x4,0x89,0x5C,0x3,
-0x83,0xCC,0x3,0x83,0xFE,0x4,0xF8,0x5F,0x80,0x0,0x88,0x44,0x85,0x80,0x43,0xA0,0x85,0x48,0xA3,0x81,0x84,0x39,0x5,0xF0,0x67,0x9A,0xA,0x55,0x1D,0x81,0xC2,0x96,0x84,0x21,0x5,0x0,0x21,0xF0,
-0x68,0x21,0x8,0xD7,0x8,0xF9,0xDF,0x80,0xE4,0xC1,0x0,0x0,0xD4,0x22,0x0,0x1,0x96,0xD6,0xC5,0x5,0x0,0x94,0xD0,0x1C,0x3,0x96,0xD6,0x96,0x87,0xC2,0x1D,0xC2,0x21,0x1,0x96,0x87,0xC3,0x9,
-0xC2,0x7,0xC2,0x2C,0xCF,0x28,0xE4,0xB7,0x0,0x1,0x40,0x2,0xE4,0x3D,0x0,0x0,0xFF,0xF8,0x3E,0x40,0x0,0xFE,0xF8,0x3E,0x80,0x0,0xFD,0xF8,0x3E,0xC0,0xE6,0xC2,0x0,0x0,0x41,0x2B,0x0,0x1,
-0x40,0x1,0xE4,0x30,0x0,0x0,0xFF,0xCC,0xD,0xF8,0x31,0x40,0x0,0xFE,0xCC,0xD,0xF8,0x31,0x80,0x0,0xFD,0xCC,0xD,0xF8,0x31,0xC0,0xE5,0x7E,0x0,0x43,0xE2,0x2,0x43,0xE1,0x2,0xC3,0x6,0x43,
-0xE0,0x2,0xC3,0xA,0xC5,0x2,0xC9,0x16,0xC5,0x14,0xC9,0x20,0xD9,0x2A,0xF8,0x33,0x40,0xC7,0x78,0x47,0xE0,0x2,0xCD,0x6E,0xC5,0x80,0xDB,0x82,0xF8,0x3F,0x40,0xC5,0xEA,0xC5,0x82,0xC7,0xF4,0xC9,
-0xF0,0xC7,0x9A,0xC9,0xF8,0xC7,0xC4,0xCD,0xEA,0xF8,0x3B,0x40,0xC7,0x82,0xCD,0xF2,0xC7,0x92,0xCB,0xF4,0x8D,0x22,0x18,0xCF,0x82,0xF8,0x37,0x40,0xC9,0x72,0xC9,0x2,0x47,0xE1,0x2,0x91,0xFA,0x18,
-0xCB,0x2C,0xCB,0x8C,0xF8,0x3B,0x40,0xCB,0xEE,0xCB,0xF6,0xCB,0x8E,0xC9,0xA8,0xCD,0x7E,0xF8,0x3F,0x40,0xCD,0x6C,0xCB,0xDC,0xC7,0x84,0xCD,0xF6,0xC9,0xDA,0xF8,0x45,0x40,0x8B,0x1A,0x19,0x87,0x36,
-0x19,0xCD,0x90,0xCB,0xA4,0x89,0xA0,0x18,0x8B,0x12,0x18,0xF8,0x3B,0x40,0xC9,0xCE,0xD3,0xEC,0xCF,0xC4,0x8B,0x10,0x1A,0x85,0x14,0x19,0xF8,0x3D,0x40,0x93,0x4,0x1B,0x8B,0x1E,0x1A,0x8F,0x2E,0x1B,
-0xC9,0xC6,0xCD,0xB0,0xF8,0x37,0x40,0xD3,0x78,0xC9,0x70,0x8D,0x2C,0x19,0xC9,0xEC,0xCD,0xCA,0xF8,0x3B,0x40,0x87,0x22,0x18,0xCB,0xE8,0xCF,0xC2,0xC9,0xC4,0x91,0x28,0x1A,0xF8,0x3F,0x40,0x87,0x3E,
-0x1C,0x8D,0x32,0x1B,0x8F,0xFE,0x1C,0x8B,0x24,0x1B,0x91,0x74,0x18,0xF8,0x3D,0x40,0xCD,0x46,0x95,0x86,0x18,0x8D,0x30,0x1C,0x8D,0xBA,0x19,0xF8,0x45,0x40,0x91,0x2C,0x19,0xCD,0xA2,0x8D,0xA6,0x1D,
-0xD1,0x3E,0xF8,0x3F,0x40,0x8F,0xA6,0x1D,0xD1,0x64,0x8D,0x7A,0x19,0xF8,0x47,0x40,0x91,0x10,0x1A,0xCD,0xDA,0xE8,0x5F,0xFF,0x0,0xCF,0x80,0xCF,0xE2,0xF9,0xE7,0x80,0xD5,0xFE,0xF8,0x65,0x80,0x95,
-0xC,0x20,0xF0,0x6B,0x1C,0x20,0x8B,0x18,0x1D,0xCD,0x88,0xF8,0x67,0x80,0x8B,0xB6,0x1B,0xCB,0x82,0xF0,0x6D,0x22,0x22,0xF0,0x7F,0x10,0x20,0xF0,0x77,0x10,0x23,0xF1,0x9,0x88,0x20,0xF0,0x7F,0x12,
-0x20,0xF8,0x81,0x80,0xF0,0x6D,0x94,0x23,0x0,0x0],
-0x24EC95: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF],
-0x252FA7: [0xF8,0x27,0x2A,0x0,0xA2,0xC8,0x2C,0xCB,0x38,0x3,0x86,0x1D,0xA2,0x19,0xC5,0x46,0xC9,0x4E,0xC5,0x2E,0xC7,0x18,0xD4,0xFE,0xE,0x85,0x88,0x8D,0x80,0x1D,0x85,0x1D,0x81,0x19,0x85,0x19,0x80,0x1D,0x88,
-0x89,0xD9,0xFE,0x5,0x88,0x8D,0xA0,0x1D,0x80,0x19,0xC3,0x2A,0x0,0xA1,0xC3,0x2C,0x0,0x19,0xC7,0xE,0xC4,0xC,0xC2,0x10,0x3,0x85,0x1D,0xA1,0x19,0xC3,0x46,0x0,0xA0,0xC9,0x16,0xC4,0x58,0x43,
-0xA1,0x19,0xC5,0x18,0xC2,0x34,0x4,0x89,0xA0,0x89,0x80,0x89,0xCB,0x66,0x3,0x88,0x1D,0x87,0x1D,0x49,0xFF,0x0,0x1,0x87,0x19,0xD6,0x82,0x4,0x85,0x95,0x85,0x94,0x15,0xE8,0x47,0xFF,0x0,0xC2,
-0x66,0x84,0x11,0x1,0x0,0x80,0xC2,0xFA,0xCB,0x7E,0xC3,0x88,0x0,0x8D,0xD5,0xFE,0x2,0x85,0x8D,0x85,0xE8,0x4B,0xFF,0x0,0x2,0x87,0x19,0x80,0xC2,0xEA,0x3,0x40,0x94,0xC,0xC4,0xCF,0xD4,0x5,
-0x94,0x11,0x95,0x11,0x86,0x8D,0x43,0x82,0x89,0x0,0x86,0x8A,0x95,0x1,0x1,0x95,0x15,0xF8,0x49,0xFE,0xC5,0xF0,0x7,0xC,0xC0,0xAC,0x91,0x60,0x94,0x2C,0xD4,0xD3,0x9C,0x5,0x85,0x1D,0x87,0x1D,
-0x94,0x11,0x83,0xF6,0x1,0x84,0xF4,0x1,0x2,0x19,0xA0,0x19,0x8F,0x86,0x2,0xF8,0x41,0x8C,0x7,0x2C,0xD0,0xAD,0x91,0x60,0x9C,0x2C,0xDC,0xE8,0x77,0xFF,0x0,0x6,0x2C,0xD8,0xAD,0x99,0x40,0x9C,
-0xC,0xF8,0x72,0x80,0xB,0xC4,0x2,0xC6,0x2,0xFF,0x0,0xC,0xD8,0xAC,0x99,0x80,0x81,0x43,0x80,0x11,0x2,0x85,0x15,0x83,0xF0,0x4E,0x2F,0x3,0xDB,0xFE,0x4,0x8C,0x81,0xA0,0x81,0x80,0x44,0x81,
-0xA0,0x0,0x88,0x87,0x5,0x1,0x3,0x15,0x84,0x15,0x87,0xCC,0x82,0x0,0xC8,0xC2,0xA0,0x1,0xFF,0x0,0x43,0xC6,0x2,0x6,0xC5,0x2,0xC3,0x2,0xC4,0x2,0xC7,0xC4,0xB2,0xF8,0x45,0xFE,0x94,0x96,
-0x2,0x1,0x11,0x88,0xC2,0x82,0xC3,0x68,0x7,0xC4,0x2,0x87,0x11,0x80,0x11,0xA0,0x15,0xC3,0xA2,0xC5,0xA6,0xC4,0xA,0xC2,0x14,0xC3,0xA2,0x85,0xF8,0x4,0x0,0xC4,0x44,0x2,0xC5,0x0,0xC8,0xC4,
-0x94,0x0,0xC5,0xC2,0x9E,0xC3,0xAA,0xC3,0x6,0xC7,0x1A,0xC5,0x12,0xC3,0x2E,0x1,0xFF,0x0,0xC5,0xBA,0x0,0xC3,0xC2,0xD0,0x0,0xC8,0xC2,0xC8,0xC3,0xC6,0xD4,0x80,0x7,0x85,0x1D,0x85,0x88,0x85,
-0xA0,0x81,0xA3,0x87,0x7D,0x5,0x49,0x85,0x1D,0xC8,0xAE,0xC3,0x20,0xC3,0x22,0xC3,0x24,0xCB,0x9E,0xC5,0xA6,0xC5,0xA,0xC3,0xB6,0xC5,0x20,0xC7,0x18,0x49,0xA3,0x81,0xC7,0x2E,0x87,0x80,0x5,0xF9,
-0x3,0x6,0xE4,0x84,0x0,0x22,0x93,0xD4,0x15,0xC3,0x16,0x22,0xD3,0xC5,0x6,0x0,0xD3,0xC5,0xB,0x25,0xD3,0xCD,0x3F,0x2,0xD7,0x87,0x97,0xCF,0x41,0x0,0x93,0xC2,0x15,0xC2,0x16,0x1,0x93,0xD3,
-0xC2,0x1C,0x22,0xD3,0xC3,0xD,0xC5,0xB,0xC2,0x17,0xC3,0xC,0xC9,0x42,0x1,0x93,0xD2,0x24,0x0,0x0,0x92,0x2C,0x0,0xC5,0x14,0x3E,0x0,0x0,0x92,0xC3,0x9A,0xC6,0x3F,0xE4,0x34,0x0,0xC3,0x41,
-0x0,0x41,0xC8,0x4E,0xC9,0xC3,0xF8,0x28,0x54,0x3,0x40,0x1,0x0,0xFF,0xC9,0x8F,0x1,0x93,0xD2,0xC4,0xC5,0x0,0x93,0xF8,0x29,0x93,0x3,0xFF,0x1,0x0,0xFE,0xE4,0x3B,0x0,0x3,0xFE,0x1,0x0,
-0xFD,0xE4,0x3B,0x0,0x6,0xFD,0x1,0x0,0x13,0x13,0x57,0x56,0xE4,0x3D,0x0,0x2,0x13,0x13,0x52,0xF8,0x43,0x41,0x2,0x12,0x13,0x13,0xF8,0x47,0x51,0xE4,0xAA,0x0],
-0x2531DC: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF]},
-'area_rando_layout_base.ips': {0x788A0: [0x2B,0x4A,0x0,0x80,0x36,0xC8,0x2B,0x4A],
-0x7C41F: [0x1C,0x15,0x0,0x80,0x36,0xC8,0x1C,0x15],
-0x231F62: [0xC7,0x18,0xE8,0x3F,0xFF,0x83,0xCE,0x60,0x2,0x0,0x6B,0x4,0xFB,0xFF,0x60,0xFB,0xFF,0xC0,0xFB,0x35,0xC0,0xF,0x6C,0x88,0x6D,0x88,0x6E,0x88,0x6B,0x80,0x6B,0x84,0x6E,0x8C,0x6D,0x8C,0x6C,0x8C,0xF8,
-0x47,0xC0,0x2,0x81,0x80,0x0,0x48,0x81,0x4,0x1,0x1,0x81,0x43,0xFF,0x0,0x0,0x1,0x48,0x85,0x4,0x2,0x0,0x85,0x81,0xF8,0x42,0x60,0xA,0x2,0x81,0x66,0x81,0x47,0x81,0x7,0x85,0x27,0x8D,
-0x3,0xC4,0x60,0xA,0x3,0x85,0x66,0x81,0x27,0x8D,0x7,0x8D,0x65,0x85,0x2,0xF8,0x44,0x60,0x0,0x20,0x48,0x81,0x24,0x0,0x21,0xC4,0xC0,0x0,0x21,0x48,0x85,0x24,0x0,0x20,0xF8,0x44,0xC0,0xF1,
-0x1F,0x4,0xC,0x0,0x22,0x4A,0x81,0x42,0x2,0x43,0x81,0x43,0x4A,0x85,0x42,0x0,0x22,0xF8,0x44,0xC0,0x2,0x40,0x81,0x41,0xC6,0x5C,0x47,0xFF,0x0,0xC7,0x64,0x3,0x41,0x85,0x40,0x85,0xF8,0x41,
-0xC0,0x4,0x60,0x81,0x61,0x81,0x2E,0x52,0x1,0x2D,0x4,0x2E,0x5,0x61,0x85,0x60,0xF8,0x40,0x60,0x83,0x4,0xC,0x5,0x1,0x81,0x4D,0x1,0x4C,0x5,0xC3,0xBE,0x0,0x4A,0xC2,0x6,0x1,0x4A,0x1,
-0xC5,0xE,0x4,0x4A,0x5,0x1,0x85,0x2,0xF8,0x40,0xC0,0xE,0x2,0x81,0x67,0x81,0x3,0x81,0x4E,0x1,0x69,0x1,0xFF,0x0,0x69,0x5,0x4B,0xC2,0x66,0x2,0x4B,0x1,0x4E,0xC6,0xC,0x0,0x3,0xF8,
-0x44,0x60,0x0,0x7,0xC4,0x60,0x0,0x4A,0xC2,0x60,0xC3,0xBE,0xC3,0xC6,0xC3,0x60,0xC3,0xCA,0x2,0x21,0x85,0x20,0xF8,0x42,0xC0,0x0,0x66,0xC4,0xC0,0x5,0x4B,0x1,0x6B,0x9,0x85,0x80,0x43,0xFF,
-0x90,0x2,0x85,0x80,0x4E,0xC2,0xC,0xC3,0xCA,0x2,0x62,0x85,0x64,0xF8,0x40,0xC0,0x83,0xC4,0xC,0x0,0x21,0xC2,0xC0,0x4,0xFF,0x0,0x6C,0x1,0x88,0x43,0x80,0x89,0x5,0x84,0x88,0x84,0x4E,0x1,
-0x6C,0xC2,0xCE,0xF8,0x45,0x60,0x0,0x0,0x84,0xD,0xC,0xC2,0xC0,0x4,0x9,0x6B,0x1,0x4B,0xD,0x87,0x30,0x10,0xC5,0xC,0x2,0x1,0x85,0x0,0xF8,0x42,0xC0,0x83,0xCE,0xC,0x6,0x4E,0x1,0x4A,
-0x9,0xFF,0x0,0x4A,0xC8,0x60,0xC5,0xC,0xF0,0x43,0x3E,0x10,0x0,0x22,0x84,0xAB,0xE,0x2,0x4E,0x1,0x69,0xC2,0x60,0x1,0x69,0xD,0xC3,0xC2,0x1,0x69,0x5,0xC3,0x60,0xC3,0xC,0x0,0x43,0x84,
-0x5D,0xE,0xF8,0x3D,0x2,0x87,0x42,0x11,0xC5,0xBA,0xC3,0xC2,0x0,0x4A,0xC4,0x60,0xC3,0xCE,0x83,0x5E,0x11,0xF8,0x3F,0x60,0x1,0x2,0x81,0x83,0x6E,0xC,0xC7,0x60,0x83,0x8A,0x10,0x0,0x4B,0xC6,
-0x60,0x1,0x69,0xD,0x83,0xDE,0xF,0xD5,0xC0,0x43,0x98,0x81,0xC7,0xA,0xC7,0xE,0xC7,0x6,0xC9,0x20,0xC3,0x24,0xC9,0x60,0x1,0x43,0x85,0x89,0x48,0xE,0xC5,0xCE,0xC5,0x60,0xCF,0x4C,0x1,0x81,
-0x80,0xE8,0x29,0x99,0x81,0xD0,0xC0,0x84,0x4B,0x11,0xC6,0xC0,0x84,0xDD,0xF,0xC7,0xAA,0xC9,0xA4,0x4,0x98,0x81,0x94,0x81,0x95,0xE8,0x22,0x81,0x96,0x0,0x97,0xC2,0x28,0x1,0x98,0x81,0x87,0xA2,
-0x11,0xC5,0xB2,0x85,0xAA,0x11,0xC5,0x6E,0x1,0x4A,0x5,0x83,0x3E,0x10,0xD3,0xAC,0x0,0x94,0x88,0xAD,0xE,0xDD,0x8,0x43,0x94,0x81,0x3,0x40,0x94,0xC,0xC4,0xC3,0xC0,0x83,0x4E,0x11,0x1,0x4B,
-0x9,0x85,0xA,0x12,0x87,0xD6,0xF,0x0,0x43,0xC2,0x60,0xD1,0xAA,0xC3,0x98,0xF8,0x25,0x60,0x7,0xC,0xC0,0x40,0x90,0x60,0x94,0x2C,0xD4,0xC3,0xC0,0x84,0x70,0x12,0xC2,0xBE,0x8B,0x32,0x10,0x2,
-0x62,0x5,0x64,0x86,0x2F,0x10,0xF8,0x35,0x6,0x7,0x2C,0xD0,0x60,0x90,0x60,0x9C,0x2C,0xDC,0xC3,0xC0,0x2,0x69,0xD,0x6B,0xC4,0xBE,0xC5,0x60,0x85,0x98,0x10,0x83,0x5E,0x11,0x95,0xB8,0x13,0xF8,
-0x25,0xC4,0x6,0x2C,0xD8,0x60,0x98,0x40,0x9C,0xC,0xC4,0x60,0x83,0xEA,0x10,0xC7,0xF6,0x87,0xF6,0x10,0x97,0xFE,0x13,0xF0,0x27,0x12,0x14,0x3,0xC,0xD8,0x40,0x98,0x87,0xA4,0xE,0x83,0x4E,0xE,
-0x87,0x4E,0x11,0x87,0x2C,0x13,0x83,0xBE,0xE,0x87,0xE,0x13,0x8D,0x2,0x13,0xF0,0x23,0xB4,0x13,0xC3,0xE4,0x1,0x94,0x81,0x83,0x4,0xF,0x97,0xA6,0x11,0x83,0x1E,0xF,0x87,0x10,0x13,0x8B,0xA,
-0x13,0xF0,0x29,0x52,0x13,0x1,0x98,0x81,0x87,0x42,0x11,0x93,0xA,0x12,0x99,0x7E,0x12,0xD3,0xD6,0x89,0x10,0x13,0xC7,0x8E,0xC3,0xFC,0x8E,0xE2,0x13,0x8C,0x71,0x12,0x83,0x3E,0x10,0xE8,0x41,0x81,
-0x80,0x0,0x64,0xCA,0x60,0x83,0xA,0x15,0x89,0xD4,0x12,0x0,0x64,0xF8,0x42,0x5E,0xCD,0x60,0x85,0x6A,0x15,0xC7,0xCE,0xF8,0x45,0x60,0x0,0x5,0x96,0x85,0x13,0x1,0x4B,0x9,0xF0,0x43,0x5E,0x11,
-0x2,0x81,0x80,0x25,0x97,0xE5,0x13,0x0,0x9,0xF0,0x43,0x3E,0x10,0x88,0x42,0x11,0x84,0x4B,0x14,0x3,0x43,0x85,0x43,0x81,0x85,0x54,0x14,0x83,0x4E,0x14,0xF0,0x4C,0x5E,0x11,0x8F,0xAB,0x14,0xC2,
-0xCA,0xF0,0x43,0xDE,0xF,0x83,0x44,0x17,0x93,0x6,0x15,0xC3,0xC,0xF8,0x43,0x60,0x83,0x4,0x18,0x9B,0x66,0x15,0xF8,0x3F,0xC0,0x0,0x45,0xC6,0xC0,0x93,0x4A,0x11,0x83,0x9E,0x14,0xF8,0x47,0x60,
-0x93,0xAA,0x11,0x83,0xFE,0x14,0xF8,0x41,0xC0,0xC3,0xB6,0x1,0x4E,0x1,0x8B,0x2C,0x13,0x87,0x16,0x12,0x83,0x5E,0x15,0xF8,0x3F,0xC0,0x1,0x25,0x81,0xC3,0xB6,0x8C,0x68,0x12,0x0,0x9,0x87,0x76,
-0x12,0x83,0xBE,0x15,0xF0,0x41,0xA2,0x19,0x83,0xA,0x15,0x8B,0x48,0x17,0x0,0x69,0xC4,0x60,0x0,0x43,0x44,0x85,0x41,0xF0,0x41,0xC0,0xE,0x83,0x64,0x18,0x0,0x6C,0x84,0xD5,0xF,0x91,0xAC,0x17,
-0xF0,0x43,0x5E,0x11,0x1,0x5,0x81,0x83,0x4A,0x11,0x95,0x8,0x18,0xF0,0x43,0xDE,0xF,0x1,0x25,0x81,0x83,0xAA,0x11,0xF0,0x59,0x68,0x18,0x2,0x64,0x81,0x62,0x8A,0xC5,0x18,0x89,0x50,0x14,0xC3,
-0xC,0x83,0x5E,0x17,0xF8,0x47,0x60,0x93,0x2A,0x19,0xF8,0x43,0x60,0x88,0x2,0x12,0x92,0x8B,0x19,0xF8,0x43,0xC0,0x85,0xA4,0xE,0xC3,0x64,0x89,0x6C,0x15,0x1,0x1,0x85,0x45,0x4,0x81,0xF0,0x43,
-0x1E,0xC,0x87,0x22,0x16,0x8B,0x4A,0x11,0x1,0x21,0x85,0x45,0x24,0x81,0xF0,0x43,0xDE,0xC,0x87,0x42,0x11,0x8B,0xAA,0x11,0xF8,0x4B,0xC0,0x87,0xA2,0x11,0x89,0xA,0x12,0x1,0x4B,0x9,0xF8,0x4B,
-0xC0,0x87,0x2,0x12,0x8B,0x6A,0x1B,0x8B,0x1E,0x12,0xF8,0x3F,0xC0,0x87,0x42,0x14,0x8B,0xCA,0x1B,0xF8,0x4B,0x60,0x87,0xA2,0x14,0x8B,0xAA,0x17,0x83,0x5E,0x17,0x0,0x8E,0x86,0xFB,0x12,0xF8,0x40,
-0x60,0x86,0x3,0x15,0x8B,0x8A,0x13,0xC3,0x60,0x0,0x8C,0xF8,0x46,0x60,0x83,0x62,0x15,0x4,0x4C,0x9,0x4E,0x1,0x4C,0x84,0x4F,0x11,0x85,0xAA,0x11,0xF8,0x4B,0x60,0x87,0x4,0xC,0x5,0x1,0x81,
-0x1,0xC5,0x1,0x51,0x85,0x76,0x1E,0x83,0x1E,0xC,0xF8,0x47,0xC0,0x0,0x2,0x46,0x81,0x65,0x7,0x3,0x81,0x21,0xD5,0x21,0xD1,0x3,0x85,0xC3,0xE,0x83,0x7E,0xC,0xF8,0x51,0x60,0xC3,0xC0,0xF8,
-0x51,0x60,0x87,0xC4,0xC,0x0,0x21,0xC4,0xC0,0x85,0xD6,0x1E,0x83,0xDE,0xC,0xF8,0x47,0xC0,0x0,0x5,0x84,0x7,0xF,0x0,0x4D,0x8A,0x13,0xF,0x0,0x5,0x84,0x21,0x12,0xF8,0x47,0xC0,0x0,0x45,
-0x8D,0x63,0x1B,0x3,0x9,0xFF,0x0,0x45,0xF8,0x4E,0x60,0x83,0xE,0x12,0x87,0x16,0x18,0x83,0xA,0x12,0xF8,0x4F,0x60,0x87,0xF2,0x13,0x83,0xD0,0x18,0xC3,0xC6,0xF8,0x51,0x60,0x89,0xD4,0x18,0xF8,
-0x55,0x60,0x89,0x34,0x19,0xF8,0x59,0x60,0x89,0xC,0x15,0xF8,0x4D,0xC0,0x83,0x64,0x18,0x89,0x74,0x15,0xF8,0x51,0xC0,0x8A,0x44,0xE,0x2,0xC1,0x42,0x51,0xC3,0xC,0x85,0x20,0x12,0xF0,0x49,0xFA,
-0x22,0x8B,0xB2,0x11,0x85,0x5C,0x11,0xF0,0x4F,0x16,0x24,0x0,0x4B,0x84,0x75,0x1B,0x83,0xE,0x12,0x1,0xF3,0x1,0x87,0xDE,0x12,0xF8,0x4B,0x60,0x89,0x74,0x1B,0x0,0xF4,0xF8,0x52,0x60,0x87,0xD2,
-0x1B,0x85,0x4E,0x17,0xF8,0x51,0xC0,0x8B,0xB2,0x17,0x0,0x6C,0xF8,0x53,0xC0,0x8A,0x13,0x18,0x0,0x6B,0xF8,0x50,0x60,0x3,0x25,0x81,0xF3,0x5,0x83,0xF4,0x13,0x83,0x2C,0x13,0x83,0xAC,0xE,0xF8,
-0x4F,0xC0,0x3,0x5,0x81,0xF4,0x5,0x8B,0xC6,0x24,0xF8,0x51,0xC0,0x8D,0x24,0x25,0xF8,0x51,0xC0,0x8D,0x84,0x25,0x87,0xFE,0x16,0xF0,0x59,0x9A,0x25,0xF0,0x4D,0x54,0x23,0x87,0x42,0x11,0x89,0x4C,
-0x11,0x83,0xB4,0x23,0x1,0x8E,0x81,0xF0,0x49,0x9A,0x22,0x87,0xE4,0x13,0x87,0xAE,0x11,0xC3,0x60,0x43,0x8C,0x81,0xF8,0x45,0xC0,0x0,0x40,0x88,0xA7,0xE,0x85,0xE,0x12,0xF8,0x4F,0x60,0x87,0x22,
-0x16,0x87,0x6C,0x12,0xF8,0x50,0xC0,0x8A,0x43,0x20,0xC5,0xC2,0xF8,0x4E,0xC0,0x8C,0xA3,0x20,0xC3,0xC2,0xF8,0x4E,0x60,0x88,0x3,0x21,0x3,0xF1,0x1,0xF2,0x1,0xC3,0xC2,0x0,0x25,0xF8,0x4C,0xC0,
-0x89,0x62,0x21,0x0,0x48,0x46,0x81,0x68,0x0,0x49,0xC2,0xBA,0xF8,0x49,0xC0,0x1,0x49,0x85,0x47,0x68,0x81,0xC3,0x58,0xC7,0x2,0xF8,0x49,0xC0,0x55,0x81,0x80,0xF9,0xC9,0x60,0x26,0x0,0x1,0x3,
-0x3,0xE7,0xFF,0x0,0xE7,0xFF,0x0,0xE4,0x3D,0x0,0x1,0x5,0x5,0xE5,0xD6,0x0,0x1,0x1,0x41,0xE4,0x2B,0x0,0x3,0x40,0x4,0x1,0xFF,0xE4,0x2B,0x0,0x3,0xFF,0x4,0x1,0xFE,0xE4,0x2B,0x0,
-0x3,0xFE,0x4,0x1,0xFD,0xE4,0x2B,0x0,0x1,0xFD,0x4,0xE6,0x4D,0x0,0x1,0x40,0x6,0xE4,0x2D,0x0,0x0,0xFF,0xF8,0x2E,0x30,0x0,0xFE,0xF8,0x2E,0x60,0x0,0xFD,0xF8,0x2E,0x90,0xE6,0x31,0x0,
-0x0,0x2,0xF0,0x2C,0x23,0x3A,0xC2,0x30,0xF0,0x2C,0x53,0x3A,0xC2,0x60,0xF0,0x2C,0x83,0x3A,0xC2,0x90,0xF0,0x2C,0xB3,0x3A,0x26,0x0,0x0,0x7,0xF8,0x2E,0x95,0xA3,0x15,0x41,0xF8,0x8B,0x60,0xE5,
-0x7F,0x0,0x0,0x5,0xF1,0xAE,0x78,0x41,0xE5,0x4B,0x0,0xF0,0x2E,0x23,0x40,0x0,0x0,0xF0,0x2F,0x78,0x41,0xF0,0x2E,0x83,0x40,0x0,0x0,0xF0,0x33,0xB3,0x40,0xE5,0x1A,0x0,0x5F,0x44,0x0,0xE8,
-0x3F,0xFF,0x0,0xFB,0xFF,0x60,0xFB,0xFF,0xC0,0xFB,0x9F,0xC0,0x43,0xE0,0x2,0x16,0xE1,0x2,0xE2,0x2,0xE3,0x2,0xE4,0x2,0x44,0x0,0x5,0x3,0x5,0x7,0x44,0x0,0xE4,0x6,0xE3,0x6,0xE2,0x6,
-0xE1,0x44,0x6,0xE0,0xF8,0x3F,0xC0,0x43,0x0,0x3,0x2,0x1,0x3,0x2,0x22,0x3,0x1,0x4,0x3,0xC7,0x60,0x9,0x4,0x7,0x3,0x7,0x2,0x7,0x1,0x7,0x0,0xF,0x83,0xE6,0x40,0xF8,0xBA,0xC0,
-0xC2,0x2,0xFB,0xFF,0xC0,0xF8,0xDF,0xC0,0x0,0x5,0x43,0x3,0x6,0x0,0x7,0xC3,0xD6,0xC3,0xDC,0xC2,0xE,0x43,0x7,0x5,0xC2,0xE6,0x3,0xE5,0x2,0xE8,0x2,0xC3,0xEE,0xF8,0x3F,0xC0,0xC9,0x60,
-0x6,0xE5,0x2,0xE5,0x6,0xE5,0x2,0xE6,0x43,0x6,0xE5,0xC2,0xA,0x3,0x5,0x3,0x8,0x3,0xC3,0x12,0xF8,0xA9,0xC0,0xCD,0x60,0xC3,0xC0,0xF8,0x23,0x60,0xF8,0x7F,0xC0,0x0,0xE5,0x43,0x2,0xE6,
-0x2,0x6,0xE5,0x6,0xF8,0x61,0xC0,0x8D,0x8C,0x5A,0xC3,0xC0,0xF0,0x23,0x9E,0x5A,0xF2,0x9,0x22,0x5B,0x85,0x96,0x5A,0xF1,0xF,0xF2,0x5A,0xF8,0x5F,0xC0,0xF3,0xFF,0x22,0x54,0xFB,0xFF,0xC0,0xFB,
-0xFF,0xC0,0xF3,0xFF,0x22,0x54,0xFB,0xFF,0xC0,0xFB,0xDF,0xC0,0x0,0x0],
-0x232691: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF],
-0x23EC11: [0xC6,0x6,0x0,0x43,0xC6,0xE,0xC3,0x10,0xC3,0xC,0xC5,0x18,0xC5,0xA,0xC5,0x1C,0xC3,0x22,0x43,0x43,0x81,0xC5,0x34,0xC5,0x2A,0xC5,0x2C,0xCD,0x28,0xCF,0x44,0xF8,0x4F,0xC0,0xC5,0x7E,0xC3,0xA6,0x1,
-0x42,0x81,0x43,0x13,0x89,0xC5,0x94,0xC3,0xE,0xC5,0xC6,0xC3,0x18,0xCB,0x12,0xC5,0x10,0xC9,0xD8,0xCD,0x12,0xC9,0x22,0xCD,0x44,0xC9,0xDA,0x0,0x63,0xC2,0xC2,0x0,0x62,0xC2,0xC6,0x0,0x8,0xC3,
-0x4,0x0,0x85,0xC3,0x4,0x0,0x60,0xDA,0xC0,0xC5,0xF4,0xC7,0x3E,0xC7,0xE,0xC9,0x14,0xC5,0xB4,0xC5,0x4,0x1,0x1A,0x8D,0x43,0x8,0x81,0x2,0x45,0x81,0x40,0xC6,0x4,0xC7,0xA,0xC7,0x6,0xC7,
-0x18,0xCB,0x16,0xC5,0x26,0xC5,0x32,0x0,0x42,0xCE,0x20,0x0,0x40,0xC6,0xF4,0x87,0x12,0x1,0xC5,0xA,0x2,0x60,0x81,0x64,0xC2,0xC2,0x43,0x64,0x81,0x0,0x62,0xC2,0xCC,0x2,0x8,0x85,0x63,0xC2,
-0x10,0xC3,0xC8,0xC3,0xD4,0xF0,0x27,0x1E,0x0,0xC3,0xCE,0x1,0x33,0x8D,0xC4,0xB2,0x3,0x11,0x23,0x15,0x23,0x43,0x11,0x8,0xC,0x85,0x23,0x15,0x3,0x11,0x22,0x15,0xFF,0x0,0x40,0xF1,0x40,0x51,
-0x55,0xFF,0x0,0xD9,0x1A,0xC3,0x30,0x0,0x45,0xC2,0xA6,0x1,0x40,0x81,0xC3,0x3A,0x1,0xC1,0xA,0xC5,0x4,0x47,0x40,0x81,0x8B,0xBC,0x1,0x0,0x43,0xC3,0xAE,0xC2,0xC2,0x6,0x63,0x81,0x82,0x11,
-0x64,0x81,0x84,0xC4,0x4,0x2,0x83,0x11,0x61,0x86,0x8D,0x1,0xCD,0xC0,0xCB,0x36,0x8B,0x78,0x0,0xC,0x16,0x8D,0x32,0x81,0x36,0x89,0x3D,0x85,0x8,0x81,0x8,0x15,0x25,0xC2,0xB2,0x4,0xFF,0x0,
-0x9,0x1,0xA,0xC4,0x7A,0xC4,0xA6,0x2,0xD1,0x40,0xD1,0xD6,0xC0,0xD8,0x1A,0xC4,0xDE,0xC2,0x9C,0xC6,0xC0,0x0,0x2,0xC5,0x4,0xC7,0x18,0xC5,0xC8,0x87,0x32,0x2,0x83,0x52,0x2,0x6,0x83,0x11,
-0x84,0x11,0xA2,0x6,0xA1,0xC2,0x28,0x0,0xA2,0xC4,0x4,0x1,0xA1,0x2,0xC3,0xD2,0x83,0x86,0x1,0x91,0x20,0x0,0x8B,0x9A,0x0,0xC5,0xBE,0x83,0xDC,0x1,0x1,0x2,0x81,0x83,0x9C,0x2,0x1,0x9,
-0x1,0xC7,0xB6,0x0,0xB,0xC8,0xA,0xF0,0x37,0xA2,0x2,0x85,0x1A,0x2,0xC3,0xFA,0x0,0xC0,0xC2,0xC0,0xC3,0x4,0xCD,0xDE,0xC8,0x2,0x2,0x94,0xC,0xC4,0xC3,0xBA,0xCD,0xFE,0x1,0xA2,0x6,0x83,
-0x54,0x2,0x0,0x63,0xC2,0xC0,0x1,0x16,0x8D,0x5D,0x13,0x89,0xC5,0xBE,0xDA,0x88,0xF0,0x36,0x63,0x3,0x8A,0xDA,0x2,0x8C,0xA5,0x3,0xCB,0xF2,0x7,0xC,0xC0,0x40,0x90,0x60,0x94,0x2C,0xD4,0xD3,
-0x7E,0xA,0xA1,0x6,0x25,0x11,0x8,0x85,0x31,0x8D,0x31,0x81,0x8,0x5E,0x81,0xC,0xDB,0xBE,0xF0,0x3D,0x20,0x4,0xC5,0xC0,0x47,0x40,0x81,0xD1,0xEC,0x7,0x2C,0xD0,0x60,0x90,0x60,0x9C,0x2C,0xDC,
-0xD7,0x80,0x6,0x7,0x5,0x14,0x1,0x35,0x5,0x7,0x88,0xF,0x4,0xF8,0x33,0x8,0x89,0x62,0x3,0x1,0x4A,0xB1,0xCD,0x8,0x8B,0x62,0x3,0xCF,0x1C,0x83,0xD8,0x2,0x87,0x5C,0x4,0xC3,0xA,0xC3,
-0xCC,0xD1,0xC6,0x6,0x2C,0xD8,0x60,0x98,0x40,0x9C,0xC,0xD8,0xC0,0x5,0x5,0x85,0x14,0x81,0x31,0x89,0x5F,0x1C,0x81,0x0,0x1D,0xC8,0x4,0x0,0x6,0x92,0xC7,0x4,0x89,0xA2,0x2,0x0,0x4B,0xC6,
-0xC8,0xC7,0x8,0x8B,0xA2,0x2,0xCF,0x1C,0xC2,0xF8,0x84,0xE1,0x1,0xC5,0xA,0x89,0x74,0x1,0xCD,0xC6,0x4,0xC,0xD8,0x40,0x98,0x62,0x83,0x53,0x2,0x0,0x89,0x84,0x52,0x2,0x3,0x89,0x8,0x8D,
-0x0,0x8C,0xC5,0x4,0x0,0x7,0xC2,0xC0,0x1,0x16,0x85,0xE8,0x27,0x13,0x81,0x1,0x1A,0x85,0xD3,0xC4,0x87,0x62,0x3,0x5,0x28,0x6,0x45,0x81,0x28,0x2,0xC9,0x8,0x8B,0x60,0x3,0xD1,0x1C,0x8B,
-0xA2,0x3,0x83,0x9A,0x6,0x89,0x14,0x1,0xC3,0xCC,0x4B,0x40,0x81,0x83,0x6,0x3,0x83,0x88,0x1,0x7,0xC,0x11,0xC,0x15,0x23,0x15,0x4,0x11,0x83,0xD0,0x3,0x8B,0xD6,0x6,0x91,0x78,0x2,0xC7,
-0x4C,0x8B,0xF4,0x3,0xC3,0x18,0xC3,0xEA,0xD1,0xC4,0x85,0xA2,0x2,0xC3,0xBE,0x85,0x5C,0x4,0x0,0x45,0xC2,0x86,0xC5,0xCA,0x87,0xA2,0x2,0xCB,0x1C,0xC3,0x24,0xC5,0xDE,0x89,0x64,0x4,0x83,0x2C,
-0x2,0xC9,0xBC,0x89,0x28,0x1,0xC5,0xD0,0xB,0x1A,0x85,0x8,0x81,0x23,0x15,0x22,0x15,0xA2,0x6,0xA0,0x2,0xCB,0xBC,0x87,0x9A,0x7,0x93,0x22,0x3,0xD7,0x12,0x0,0x43,0xD2,0xC4,0x85,0x62,0x3,
-0xC3,0xBE,0xC3,0x7C,0xC5,0x8,0xC5,0xCA,0x87,0x62,0x3,0xD3,0x1C,0x8D,0x18,0x8,0x89,0x14,0x1,0x87,0x7E,0x0,0xC7,0x4,0x4,0xD,0x81,0x14,0x85,0x5,0x98,0xC7,0x4,0x91,0x5E,0x8,0x8B,0xF4,
-0x3,0x95,0x52,0x0,0x8B,0x8A,0x8,0x3,0x1D,0x81,0x8,0x89,0x87,0x10,0x2,0xC5,0x7E,0xC9,0x8,0x89,0xF8,0x1,0xC3,0x1C,0xC3,0xD4,0x87,0x2C,0x2,0x51,0x40,0x81,0x89,0x24,0x1,0x89,0x34,0x3,
-0x87,0x94,0x0,0x2,0x14,0x85,0x7,0xD8,0xC0,0x8D,0x1E,0x9,0xF0,0x25,0x64,0x2,0x89,0x86,0x8,0xC5,0x2,0x89,0x70,0x0,0x87,0x32,0x2,0x8D,0x36,0x3,0xC5,0x10,0x8B,0xB4,0x9,0x8B,0x12,0x1,
-0x87,0xB0,0x1,0x89,0x60,0x0,0x89,0x76,0x8,0xC5,0xC2,0xF0,0x31,0xC2,0x9,0xF0,0x29,0x3C,0x0,0xC9,0x78,0xC7,0xC6,0x8D,0x6A,0xA,0x89,0x2E,0x1,0x8B,0xA8,0x9,0x8B,0xB6,0x9,0xCB,0x2C,0xCB,
-0x28,0xC9,0x42,0x9F,0x82,0xA,0xE8,0x9F,0xFF,0x83,0x9F,0xC2,0x9,0xF8,0xA1,0xC0,0x85,0x84,0xA,0x3,0x2,0x85,0x0,0x85,0x89,0x4,0x7,0xC7,0x8,0xF0,0xAB,0x20,0xC,0x6,0x25,0x11,0x8,0x15,
-0xE,0x81,0x12,0x46,0x81,0x13,0x1,0x2E,0x85,0x43,0x18,0x81,0x1,0x2E,0x89,0xF0,0xA7,0xE2,0xC,0xC3,0xC4,0x4,0x2,0x15,0x8,0x15,0x1A,0x8A,0xD5,0x1,0x43,0xC,0x81,0xF0,0xAD,0x22,0xC,0x0,
-0x22,0x43,0x11,0x23,0x0,0x15,0xC5,0x4,0x5,0x2,0x11,0x5F,0x10,0x9D,0x80,0xF0,0xAB,0x62,0xE,0x93,0x2E,0x5,0xF0,0xBB,0x22,0xC,0x83,0xFE,0x5,0xF0,0xBB,0xE2,0xF,0x83,0xBE,0x6,0xF0,0xBB,
-0x22,0xC,0x83,0x7E,0x7,0xF8,0xA1,0xC0,0x87,0x4,0x7,0x3,0x1C,0x85,0x1D,0x85,0x87,0x90,0x7,0x83,0x8A,0xD,0x3,0x8,0x89,0x5F,0x80,0xF0,0xA3,0xE0,0xF,0x43,0xE,0x81,0x8F,0x48,0x8,0x8,
-0xA2,0x6,0x4,0x15,0x23,0x11,0xC,0x81,0x1A,0xF0,0xA2,0x21,0xC,0x89,0x4,0x9,0xF0,0xBB,0xCE,0xC,0xF1,0x7F,0xA,0xC,0xF0,0xB9,0xA,0xC,0x93,0xE,0x7,0xF0,0xC5,0x18,0x15,0x0,0x6,0xF0,
-0xAA,0x1F,0xC,0x8B,0x8A,0xD,0x89,0x2,0x7,0xF0,0xAB,0x60,0x17,0x8D,0x4C,0xE,0xC5,0x6,0x0,0x16,0xF0,0xAC,0x21,0x15,0x8B,0xE,0xF,0xC7,0x6,0xF0,0xB7,0x22,0xF,0x0,0x3,0xC2,0xA,0x1,
-0xC,0x11,0xF0,0xA3,0x20,0xF,0x99,0x4,0x18,0xF0,0xA5,0x9E,0x10,0x9A,0x4,0x12,0xF0,0xA4,0x5F,0x11,0x9A,0x44,0x11,0xF0,0xA4,0x1F,0x12,0x9A,0x84,0x1C,0xF0,0xBC,0xDF,0x12,0xC5,0x18,0xF8,0xA1,
-0xC0,0x0,0xE,0x83,0x8F,0x1,0x0,0x81,0x43,0xC,0x15,0x8F,0x4E,0x14,0x1,0x8,0x85,0xF0,0xBB,0x60,0x14,0x1,0xA2,0x6,0xF1,0x6B,0x1E,0x18,0xF0,0xB9,0xA,0xC,0x99,0x84,0xA,0xF0,0xA5,0xDE,
-0xC,0x99,0xC4,0x9,0xF0,0xA5,0xDE,0x18,0xF0,0xC5,0x4,0xC,0xF0,0xB9,0x8A,0x19,0x87,0x84,0xA,0xF0,0xB7,0x4C,0x1A,0x89,0xC4,0x9,0xF0,0xB5,0xE,0x1B,0x8B,0x84,0xA,0xF0,0xB3,0xD0,0x1B,0x9A,
-0xC4,0x12,0xF1,0x64,0x9F,0x1C,0x83,0x8C,0x13,0x7,0x1C,0x15,0x1D,0x15,0x20,0x11,0x21,0x11,0xF0,0xB1,0x10,0x12,0x89,0xA2,0x7,0x0,0x1A,0xD0,0xC8,0xF0,0xA3,0xDE,0x12,0x49,0xD,0x81,0xC7,0xCA,
-0xC4,0xC8,0xC8,0x4,0xF8,0xA9,0xC0,0xCF,0xC8,0xC5,0xCE,0xF8,0xB1,0xC0,0xCD,0xD2,0xFA,0xDF,0xC0,0xE5,0x46,0x0,0xA,0x93,0xD7,0x97,0x93,0x0,0xD7,0x87,0xD6,0x0,0x7,0xFF,0x2A,0x0,0xCC,0xD,
-0x39,0x0,0x0,0x83,0x43,0x0,0x80,0x0,0xC3,0xDC,0x5F,0x0,0xD2,0x27,0x0,0xA3,0xB0,0x31,0x28,0x0,0xCC,0xD,0x37,0x0,0x1,0xC3,0x80,0x3F,0x0,0xC2,0xB7,0xD5,0xB3,0xF8,0x23,0xC0,0x0,0x41,
-0xE4,0x2D,0x0,0xF8,0x2D,0xC0,0x2,0x40,0x4,0x0,0xCB,0xF0,0x0,0x92,0xE4,0x21,0x0,0xF8,0x2D,0xC0,0x3,0xFF,0x4,0x0,0xFE,0xF8,0x32,0xC0,0x0,0x6,0xC6,0x4,0xC5,0xCD,0xC7,0xE,0x32,0x0,
-0x3,0xFE,0x4,0x0,0xFD,0xE4,0x2D,0x0,0xC4,0xC0,0xC7,0x4,0xC5,0xCD,0xC7,0x12,0x32,0x0,0x1,0xFD,0x4,0xE4,0x2F,0x0,0xF0,0x31,0xB2,0x31,0x4,0x0,0x0,0x93,0x93,0xD7,0x8A,0x7,0x32,0xF0,
-0x4B,0xB4,0x32,0x23,0x0,0xF8,0x29,0x5C,0xF8,0x37,0xC0,0xE6,0x40,0x0,0x1,0x92,0x93,0xE4,0x5E,0x0,0x0,0x95,0xF8,0x5F,0x61,0x0,0x96,0x44,0x97,0xD7,0x0,0x93,0xF8,0x5F,0xC8,0x1,0x40,0x1,
-0xE4,0x5D,0x0,0x0,0xFF,0xF8,0x5E,0x60,0x0,0xFE,0xF8,0x5E,0xC0,0x0,0xFD,0xF8,0x5E,0xC0,0xE4,0x55,0x0,0x87,0x26,0x34,0x1,0x96,0x97,0xE4,0x53,0x0,0xF0,0x2D,0x84,0x34,0xE6,0x74,0x0,0xF0,
-0xC6,0x27,0x37,0x1,0x87,0x97,0xF8,0x5F,0xC8,0x1,0x40,0x2,0xE4,0x5D,0x0,0x0,0xFF,0xF8,0x5E,0x60,0x0,0xFE,0xF8,0x5E,0xC0,0x0,0xFD,0xF8,0x5E,0xC0,0xF3,0xFF,0xD0,0x39,0xF0,0x80,0xD0,0x3D,
-0x0,0x3,0xE4,0x5D,0x0,0x0,0xFF,0xF8,0x53,0x60,0x3,0x13,0x13,0x57,0x56,0x26,0x0,0x0,0xFE,0xF8,0x57,0xC0,0xC6,0x64,0x0,0xFD,0xF0,0x5E,0x51,0x44,0xE6,0x31,0x0,0x43,0xFF,0x0,0x5,0xD,
-0x3,0x2E,0x7,0x5,0x3,0xC3,0x8,0x45,0xFF,0x0,0x0,0xD,0x22,0x7,0x2,0xFF,0x0,0xE,0xC4,0xE,0x45,0x80,0x0,0x1,0xE5,0x3,0xC5,0x4,0x2,0x80,0x0,0xE6,0xCC,0x6,0xC5,0x14,0xF8,0x7B,
-0x20,0x2,0xFF,0x0,0x24,0xC2,0xBE,0x3,0xFF,0x0,0x7,0x3,0xC3,0xC6,0xC5,0xC0,0x2,0x2E,0x3,0x5,0xC2,0xC0,0x0,0x2E,0xC6,0xC0,0xC5,0xA6,0xC3,0xC2,0xC3,0xBC,0xCB,0xC,0xC5,0xCE,0xF8,0x7D,
-0x20,0x2,0xFF,0x0,0x25,0xC4,0xB6,0x2,0xE,0x7,0x2D,0x88,0xF,0x48,0xC2,0xE,0x0,0x3,0xC3,0x6,0xC3,0xCE,0xC5,0xFA,0x87,0x3E,0x48,0x91,0x32,0x48,0xF8,0x7F,0x20,0xC4,0xB2,0xC2,0xC6,0x2,
-0x2E,0x7,0xE,0x88,0xCF,0x48,0x5,0xD,0x7,0x2E,0x3,0x2C,0x7,0xC5,0xC2,0x87,0x40,0x48,0xC3,0xFE,0x8D,0x38,0x48,0x85,0xEA,0x48,0xF8,0x7F,0x20,0xC3,0xC0,0x1,0x2D,0x3,0xC5,0xC2,0x47,0xFF,
-0x0,0x0,0x2D,0xC2,0xCA,0x43,0x2D,0x7,0xC3,0xC2,0xC5,0xFE,0x8B,0xA8,0x49,0x8D,0x32,0x48,0xF8,0x7F,0x20,0x87,0x86,0x49,0xC3,0xC2,0x87,0xE,0x48,0x83,0x1C,0x48,0x2,0xE,0x3,0x5,0xC2,0xC2,
-0x85,0x20,0x48,0x43,0xE5,0x3,0xC7,0x6,0x89,0x68,0x4A,0xC5,0xC8,0xF8,0x7F,0x20,0x85,0x4,0x48,0x1,0x7,0x3,0x83,0x8C,0x49,0x89,0xCE,0x48,0x2,0xD,0x7,0x2C,0x22,0x7,0xC3,0xC8,0x8D,0xF8,
-0x48,0x8B,0xE2,0x48,0x91,0x2C,0x4B,0xF8,0x73,0x20,0x2,0xFF,0x0,0x2C,0xC2,0xBA,0x1,0x7,0x3,0x87,0x4C,0x4A,0x85,0x12,0x48,0x4,0x2D,0x7,0x2E,0x3,0x6,0xC2,0x4,0x8B,0xA0,0x49,0x89,0xBE,
-0x49,0x8B,0xA4,0x49,0xF8,0x7F,0x20,0x83,0x4,0x4B,0x5,0xFF,0x0,0x6,0x3,0x2E,0x7,0x89,0xE,0x48,0xC3,0xBC,0x1,0xFF,0x0,0x83,0xD8,0x48,0x85,0x20,0x4B,0xC5,0xC2,0x89,0x3A,0x48,0x87,0xEE,
-0x48,0x8D,0xBC,0x49,0xF8,0x75,0x20,0x83,0xC8,0x48,0xC2,0xAC,0x8C,0x8B,0x4C,0xC2,0x14,0xC2,0xC0,0x0,0x7,0x84,0x5B,0x4A,0x89,0x40,0x48,0xC5,0xC2,0xD1,0x8,0xF8,0x7D,0x20,0x83,0x6,0x4E,0xC5,
-0xC4,0x8B,0x4C,0x4D,0x83,0x18,0x4E,0x0,0x6,0x86,0xDD,0x4B,0x8B,0x0,0x49,0x8B,0x2C,0x48,0x93,0xA6,0x4C,0xF8,0x71,0x20,0x85,0xC6,0x4E,0x0,0xE,0x84,0xB,0x4E,0x87,0xE,0x48,0x0,0x2D,0x84,
-0x9D,0x4C,0x83,0xDA,0x4B,0x0,0xFF,0xC8,0xBE,0x8F,0x36,0x4E,0xC7,0x14,0xF8,0x7F,0x20,0x87,0xC8,0x48,0x83,0xA,0x4E,0x87,0xCE,0x48,0x1,0xE,0x3,0x85,0x54,0x4A,0x83,0x18,0x48,0x8B,0x0,0x4F,
-0x8D,0xEA,0x4B,0x89,0xFE,0x4B,0xF8,0x7B,0x20,0x83,0x6,0x4E,0x83,0x8C,0x49,0x0,0xD,0xC4,0x6,0x89,0x4E,0x4A,0x83,0x16,0x4B,0xC3,0xC0,0x87,0x32,0x48,0x87,0xEE,0x48,0x87,0x26,0x4E,0x85,0x66,
-0x50,0x89,0x28,0x4E,0xF8,0x77,0x20,0x83,0x88,0x49,0x83,0x4C,0x4A,0x0,0x2D,0x88,0x49,0x4D,0x83,0x94,0x49,0x83,0x56,0x50,0x0,0xD,0x86,0x9D,0x4C,0x8B,0x62,0x4A,0x89,0x2E,0x4E,0x89,0x2C,0x48,
-0xF8,0x7D,0x20,0x83,0x48,0x4A,0x83,0xA,0x4E,0x0,0x5,0x8A,0xCD,0x48,0x83,0x9A,0x4F,0x1,0x2E,0x3,0x83,0x58,0x4D,0x85,0x20,0x48,0x87,0x30,0x4B,0x89,0x28,0x4E,0x8B,0xFE,0x4E,0xF8,0x7D,0x20,
-0x9F,0x2,0x48,0xF8,0xA1,0x4,0x9D,0xC4,0x48,0xF8,0xA1,0xC4,0x9D,0x84,0x49,0xF8,0xA3,0xC4,0x9B,0x46,0x4A,0xF8,0xA3,0xC6,0x9B,0x6,0x4B,0xF8,0xA3,0xC4,0x9B,0xC6,0x4B,0xF0,0xA3,0xA4,0x55,0x9B,
-0x86,0x4C,0xF8,0xA1,0xC2,0x9D,0x44,0x4D,0xF0,0xA3,0x64,0x56,0x9B,0x6,0x4E,0xF8,0xA1,0xC2,0x9D,0xC4,0x4E,0xF8,0xA1,0xC4,0x9D,0x84,0x4F,0xF8,0xA1,0xC2,0x9D,0x44,0x50,0xF0,0xA3,0x22,0x5A,0x9B,
-0x6,0x51,0xF0,0xA3,0xE2,0x5A,0x9B,0xC6,0x51,0xF0,0xA3,0x24,0x57,0x9B,0x86,0x52,0xF8,0xA1,0xC2,0x9D,0x44,0x53,0xF0,0xA7,0xE0,0x57,0xF3,0xFF,0xA,0x54,0xF3,0xFF,0xA,0x58,0xF3,0xFF,0xA,0x5C,
-0xF3,0xFF,0xA,0x54,0xF3,0xFF,0xA,0x58,0xF3,0xF7,0xA,0x5C,0x0,0x0],
-0x23F4BC: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF],
-0x24E816: [0xF8,0x64,0x80,0x0,0x85,0xDD,0x80,0x1,0x28,0x8D,0x45,0x2D,0x89,0x2,0x26,0x89,0x26,0xCC,0xA,0x1,0x28,0x89,0xDD,0xFE,0xC3,0x38,0xC3,0x34,0x3,0x26,0x89,0x1D,0x85,0xC5,0x3A,0xC5,0x42,0xC3,0x10,
-0xC7,0x12,0xC5,0xE,0xC5,0x58,0xCD,0x50,0xC7,0x80,0x10,0x29,0x8D,0x27,0x1D,0xCF,0x6,0xCB,0x2,0xD0,0x2,0x24,0x19,0x24,0x1D,0xCC,0x2,0xCD,0xC6,0xA,0x4,0xCB,0x2,0x27,0x19,0x29,0xD9,0x82,
-0x0,0x85,0xC4,0x38,0xC4,0x34,0x2,0x24,0x19,0x30,0xC4,0x30,0xC5,0xE,0xC3,0x48,0x43,0x30,0x19,0x6,0x24,0x1D,0xD1,0x2,0xCE,0x2,0xD2,0xC4,0xE,0xC5,0x58,0xCD,0x50,0xC7,0x80,0x3,0x22,0x85,
-0xD3,0x6,0x55,0xFF,0x0,0x2,0xD8,0x2,0xA9,0xCA,0xB2,0x1,0x86,0x8D,0x43,0x82,0x89,0x0,0x86,0xC8,0xC4,0x1,0xA9,0x8D,0xE8,0x31,0xFF,0x0,0xCB,0x50,0x1,0xA6,0x8D,0xC5,0x80,0x1,0xA9,0x85,
-0xD9,0x48,0x2,0x8C,0x89,0xA0,0x43,0x89,0xA3,0x5,0x8D,0xA3,0x8D,0xA0,0x8D,0x85,0xC4,0x70,0x0,0x85,0xC6,0x12,0x2,0xA0,0x8D,0x8C,0xF8,0x32,0x80,0xC6,0x50,0xC4,0x40,0x45,0x5F,0x80,0xC2,0x88,
-0x1,0x85,0xD8,0x96,0x7,0x2,0xC3,0xE0,0x83,0x92,0x1,0x3,0xCF,0x6,0xD0,0x2,0xC9,0xEC,0x0,0xCB,0xC2,0xC,0x0,0xD0,0xC2,0x14,0xF8,0x21,0xFE,0x3,0xCC,0xA,0xCD,0xA,0xD1,0xDC,0x43,0xD0,
-0x2,0xC3,0x56,0x5,0xFF,0x0,0xC,0xC0,0x40,0x90,0xC3,0x80,0x0,0xD7,0xF8,0x22,0x4C,0xF8,0x21,0xEC,0x0,0xCF,0xCE,0x6C,0x4,0xD4,0x2,0x23,0x81,0x23,0x9A,0x85,0x2,0x4,0xFF,0x0,0x2C,0xD0,
-0x60,0xC4,0x80,0x97,0x6,0x2,0xF8,0x2D,0x96,0xCB,0x6E,0x8,0xCF,0xA,0xCF,0xE,0xD6,0x2,0x22,0x81,0x22,0x9C,0x5,0x3,0x9,0x2C,0xD8,0x60,0x98,0x1D,0x81,0x8D,0x85,0xD7,0x6,0x85,0x5E,0x3,
-0xC3,0x36,0x87,0x5C,0x3,0x89,0x5E,0x3,0x1,0xD0,0xA,0xC3,0x1E,0xC9,0xDE,0x2,0xCC,0xA,0xD2,0xC4,0x2C,0x8D,0x54,0x3,0x0,0xD3,0xC4,0x6E,0x0,0xD9,0xC6,0x4A,0xC3,0xFA,0x0,0xD5,0xC4,0x80,
-0x83,0x86,0x3,0xC9,0x56,0xC5,0x5E,0x2,0xCB,0xA,0xD0,0xC4,0x5C,0x2,0xC,0xD8,0x40,0xC2,0x80,0x3,0xA6,0x85,0xD4,0x6,0xC3,0xBC,0x0,0xD7,0x84,0xDD,0x3,0xC5,0x6,0xC5,0x12,0x4,0xFF,0x0,
-0x8C,0x81,0xA0,0x43,0x81,0xA3,0x1,0x85,0xA3,0x43,0x85,0xA0,0xC2,0x8,0xC4,0x6,0xC4,0x12,0x2,0xA0,0x85,0x8C,0xC4,0xEE,0xC3,0xB2,0xC4,0x3E,0x0,0x6,0xC3,0xEE,0x0,0xD5,0xC4,0x4A,0x0,0xD8,
-0xC6,0xFA,0xC3,0x92,0x0,0xD3,0xCA,0x5C,0xC8,0x50,0xC4,0x4A,0x87,0xFC,0x2,0x0,0xA9,0xC2,0x36,0xC5,0x2A,0xC4,0xB0,0x0,0xA,0xC5,0x48,0xC5,0x42,0x8A,0x20,0x2,0x50,0x85,0x1D,0x1,0xA9,0x8D,
-0xC5,0xB2,0xC3,0x6E,0x83,0x84,0x2,0x0,0xA9,0xC6,0x44,0xC7,0xC,0x0,0xD4,0xC5,0x86,0xC4,0x8C,0xC5,0x56,0xC2,0x50,0x4A,0x81,0x1D,0x86,0x7C,0x2,0x1,0x85,0xA9,0xC2,0xFA,0xC3,0x3C,0xC3,0xB6,
-0x2,0x26,0x85,0xA3,0x43,0x81,0x26,0xC4,0x6,0xC5,0x92,0x8E,0xDA,0x0,0xCA,0x86,0xC2,0xAC,0x0,0xE,0xC7,0x7A,0xC5,0x38,0xC2,0x4A,0x0,0xA,0xC9,0xC,0x0,0xDA,0xC2,0x56,0xCD,0x1E,0xC3,0xA4,
-0x90,0x72,0x0,0x0,0x85,0xC7,0x6E,0xC3,0xB0,0xCB,0x6E,0xC5,0x8C,0xD9,0x80,0xCB,0xAC,0xD1,0x32,0xDD,0x1E,0x91,0x78,0x0,0x2,0xA9,0x85,0xD5,0xC2,0xB0,0xF0,0x79,0x10,0x0,0xC2,0xEE,0x0,0x1,
-0xCE,0xEE,0xF0,0x6F,0x1D,0x0,0x0,0x1,0xC3,0xFE,0x1,0x1F,0x83,0xCD,0xFE,0xE8,0x5F,0xFF,0x83,0xF9,0x95,0x80,0x2,0x88,0x8D,0x80,0x84,0xA1,0x2,0x1,0x21,0x89,0xF8,0x5F,0x80,0xC2,0x6A,0x0,
-0x8D,0x43,0xA0,0x89,0x3,0xA3,0x89,0xA0,0x9,0x46,0xA3,0x89,0x84,0xB9,0x2,0x47,0x5F,0x80,0xF8,0x5F,0x80,0x3,0xAC,0x95,0xC,0xC4,0x8A,0xC2,0x3,0x0,0x6,0x83,0x20,0x3,0x0,0xD2,0x84,0x29,
-0x3,0x1,0xCF,0x6,0x83,0x7E,0x3,0xF8,0x5F,0x80,0x3,0xAD,0x95,0x2C,0xD4,0x9B,0xE6,0x3,0xF8,0x60,0x80,0x2,0x9D,0x2C,0xDC,0x9B,0x66,0x4,0xF8,0x5F,0x80,0x2,0xAC,0x9D,0xC,0xC6,0x80,0x83,
-0x90,0x4,0x89,0x5C,0x3,0x83,0xCC,0x3,0x83,0xFE,0x4,0xF8,0x5F,0x80,0x0,0x88,0x44,0x85,0x80,0x43,0xA0,0x85,0x48,0xA3,0x81,0x84,0x39,0x5,0xF0,0x67,0x9A,0xA,0x55,0x1D,0x81,0xC2,0x96,0x84,
-0x21,0x5,0x0,0x21,0xF0,0x6B,0x21,0x8,0xD4,0x8A,0xF9,0xDF,0x80,0xE4,0xC1,0x0,0x0,0xD4,0x22,0x0,0x1,0x96,0xD6,0xC5,0x5,0x0,0x94,0xD0,0x1C,0x3,0x96,0xD6,0x96,0x87,0xC2,0x1D,0xC2,0x21,
-0x1,0x96,0x87,0xC3,0x9,0xC2,0x7,0xC2,0x2C,0xCF,0x28,0xE4,0xB7,0x0,0x1,0x40,0x2,0xE4,0x3D,0x0,0x0,0xFF,0xF8,0x3E,0x40,0x0,0xFE,0xF8,0x3E,0x80,0x0,0xFD,0xF8,0x3E,0xC0,0xE6,0xC2,0x0,
-0x0,0x41,0x2B,0x0,0x1,0x40,0x1,0xE4,0x30,0x0,0x0,0xFF,0xCC,0xD,0xF8,0x31,0x40,0x0,0xFE,0xCC,0xD,0xF8,0x31,0x80,0x0,0xFD,0xCC,0xD,0xF8,0x31,0xC0,0xE5,0x7E,0x0,0x43,0xE2,0x2,0x43,
-0xE1,0x2,0xC3,0x6,0x43,0xE0,0x2,0xC3,0xA,0xC5,0x2,0xC9,0x16,0xC5,0x14,0xC9,0x20,0xD9,0x2A,0xF8,0x33,0x40,0xC7,0x78,0x47,0xE0,0x2,0xCD,0x6E,0xC5,0x80,0xDB,0x82,0xF8,0x3F,0x40,0xC5,0xEA,
-0xC5,0x82,0xC7,0xF4,0xC9,0xF0,0xC7,0x9A,0xC9,0xF8,0xC7,0xC4,0xCD,0xEA,0xF8,0x3B,0x40,0xC7,0x82,0xCD,0xF2,0xC7,0x92,0xCB,0xF4,0x8D,0x22,0x18,0xCF,0x82,0xF8,0x37,0x40,0xC9,0x72,0xC9,0x2,0x47,
-0xE1,0x2,0x91,0xFA,0x18,0xCB,0x2C,0xCB,0x8C,0xF8,0x3B,0x40,0xCB,0xEE,0xCB,0xF6,0xCB,0x8E,0xC9,0xA8,0xCD,0x7E,0xF8,0x3F,0x40,0xCD,0x6C,0xCB,0xDC,0xC7,0x84,0xCD,0xF6,0xC9,0xDA,0xF8,0x45,0x40,
-0x8B,0x1A,0x19,0x87,0x36,0x19,0xCD,0x90,0xCB,0xA4,0x89,0xA0,0x18,0x8B,0x12,0x18,0xF8,0x3B,0x40,0xC9,0xCE,0xD3,0xEC,0xCF,0xC4,0x8B,0x10,0x1A,0x85,0x14,0x19,0xF8,0x3D,0x40,0x93,0x4,0x1B,0x8B,
-0x1E,0x1A,0x8F,0x2E,0x1B,0xC9,0xC6,0xCD,0xB0,0xF8,0x37,0x40,0xD3,0x78,0xC9,0x70,0x8D,0x2C,0x19,0xC9,0xEC,0xCD,0xCA,0xF8,0x3B,0x40,0x87,0x22,0x18,0xCB,0xE8,0xCF,0xC2,0xC9,0xC4,0x91,0x28,0x1A,
-0xF8,0x3F,0x40,0x87,0x3E,0x1C,0x8D,0x32,0x1B,0x8F,0xFE,0x1C,0x8B,0x24,0x1B,0x91,0x74,0x18,0xF8,0x3D,0x40,0xCD,0x46,0x95,0x86,0x18,0x8D,0x30,0x1C,0x8D,0xBA,0x19,0xF8,0x45,0x40,0x91,0x2C,0x19,
-0xCD,0xA2,0x8D,0xA6,0x1D,0xD1,0x3E,0xF8,0x3F,0x40,0x8F,0xA6,0x1D,0xD1,0x64,0x8D,0x7A,0x19,0xF8,0x47,0x40,0x91,0x10,0x1A,0xCD,0xDA,0xE8,0x5F,0xFF,0x0,0xCF,0x80,0xCF,0xE2,0xF9,0xE7,0x80,0xD5,
-0xFE,0xF8,0x65,0x80,0x95,0xC,0x20,0xF0,0x6B,0x1C,0x20,0x8B,0x18,0x1D,0xCD,0x88,0xF8,0x67,0x80,0x8B,0xB6,0x1B,0xCB,0x82,0xF0,0x6D,0x22,0x22,0xF0,0x7F,0x10,0x20,0xF0,0x77,0x10,0x23,0xF1,0x9,
-0x88,0x20,0xF0,0x7F,0x12,0x20,0xF8,0x81,0x80,0xF0,0x6D,0x94,0x23,0x0,0x0],
-0x24EC9A: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF]},
-'bomb_torizo.ips': {0x7FDC: [0xF2,0x4A,0xD,0xB5],
-0x208A7: [0x20,0x50,0xF0],
-0x23A6F: [0x20,0x66,0xF0,0xEA,0xEA,0xEA,0xD0],
-0x2533B: [0x20,0x66,0xF0,0xEA,0xEA,0xEA,0xD0],
-0x27050: [0x48,0xAF,0x9B,0x7,0x7E,0xC9,0x4,0x98,0xD0,0x7,0xA9,0xBB,0xBB,0x8F,0x6C,0xD8,0x7E,0x68,0xD,0xE7,0x5,0x60,0xAF,0x6C,0xD8,0x7E,0xC9,0xBB,0xBB,0x60]},
-'credits_varia.ips': {0x44B: [0x5C,0x0,0xFE,0x80],
-0x490: [0x5C,0x4E,0xFE,0x80],
-0x15EA: [0xAE,0xB5,0x5,0xE8,0x8E,0xB5,0x5,0xEE,0xB6,0x5,0xC2,0x30,0xEE,0xB8,0x5,0xD0,0x3,0xEE,0xBA,0x5,0x80,0x4,0xAB,0x40,0x80,0xF0,0x7A,0xFA,0x68,0x2B,0xAB,0x40],
-0x7E00: [0xAF,0xE6,0xFF,0x7F,0xC9,0xBE,0xBA,0xF0,0x18,0xA9,0xBE,0xBA,0x8F,0xE6,0xFF,0x7F,0xA9,0x0,0x0,0x8F,0xE2,0xFF,0x7F,0x8F,0xE4,0xFF,0x7F,0x8F,0xE0,0xFF,0x7F,0x80,0xE,0xAD,0xB8,0x5,0x8F,0xE2,0xFF,
-0x7F,0xAD,0xBA,0x5,0x8F,0xE4,0xFF,0x7F,0xA2,0xFE,0x1F,0xA9,0x0,0x0,0x9E,0x0,0x0,0xCA,0xCA,0x10,0xF9,0xAF,0xE2,0xFF,0x7F,0x8D,0xB8,0x5,0xAF,0xE4,0xFF,0x7F,0x8D,0xBA,0x5,0x5C,0x55,0x84,
-0x80,0xAD,0xB8,0x5,0x8F,0xE2,0xFF,0x7F,0xAD,0xBA,0x5,0x8F,0xE4,0xFF,0x7F,0xA2,0xFE,0x1F,0x9E,0x0,0x0,0x9E,0x0,0x20,0x9E,0x0,0x40,0x9E,0x0,0x60,0x9E,0x0,0x80,0x9E,0x0,0xA0,0x9E,0x0,
-0xC0,0x9E,0x0,0xE0,0xCA,0xCA,0x10,0xE4,0xA2,0xDF,0x0,0xA9,0x0,0x0,0x9F,0x0,0xFF,0x7F,0xCA,0xCA,0x10,0xF8,0xAF,0xE2,0xFF,0x7F,0x8D,0xB8,0x5,0xAF,0xE4,0xFF,0x7F,0x8D,0xBA,0x5,0x5C,0xAF,
-0x84,0x80],
-0x807F: [0x4C,0x20,0xEF],
-0x80F7: [0x4C,0x44,0xEF],
-0xEF20: [0xAD,0xB8,0x5,0x8F,0x0,0xFC,0x7F,0xAD,0xBA,0x5,0x8F,0x2,0xFC,0x7F,0x22,0x78,0xD7,0xDF,0xAF,0x52,0x9,0x7E,0x18,0x69,0x10,0x0,0x8F,0xE0,0xFF,0x7F,0x7A,0xFA,0x18,0xAB,0x28,0x6B,0xAF,0x52,0x9,
-0x7E,0x18,0x69,0x10,0x0,0xCF,0xE0,0xFF,0x7F,0xF0,0x12,0x22,0x2F,0xD7,0xDF,0xAF,0x0,0xFC,0x7F,0x8D,0xB8,0x5,0xAF,0x2,0xFC,0x7F,0x8D,0xBA,0x5,0x7A,0xFA,0x18,0xAB,0x6B],
-0x10064: [0x27,0xF8,0x8B],
-0x59976: [0x5C,0x83,0xF7,0x8B],
-0x5999B: [0x5C,0xA3,0xF7,0x8B],
-0x599E5: [0x5C,0xB8,0xF7,0x8B],
-0x59A08: [0x5C,0xC9,0xF7,0x8B],
-0x59A19: [0x5C,0xD8,0xF7,0x8B],
-0x5E0D2: [0xE9,0xF7],
-0x5F770: [0xC2,0x30,0x8B,0xF4,0x0,0xDF,0xAB,0xAB,0xB9,0x0,0x0,0x8F,0xE8,0xFF,0x7F,0xC8,0xC8,0xAB,0x60,0xEE,0x95,0x19,0xAD,0x95,0x19,0xCF,0xE8,0xFF,0x7F,0xF0,0x7,0xAD,0x97,0x19,0x5C,0x89,0x99,0x8B,0x9C,
-0x95,0x19,0xEE,0x97,0x19,0xAD,0x97,0x19,0x5C,0x89,0x99,0x8B,0x8B,0xF4,0x0,0xDF,0xAB,0xAB,0xB9,0x0,0x0,0x10,0x5,0xAB,0x5C,0xA0,0x99,0x8B,0xAB,0x5C,0xAA,0x99,0x8B,0x8D,0x14,0x0,0x8B,0xF4,
-0x0,0xDF,0xAB,0xAB,0xB9,0x2,0x0,0xAB,0x5C,0xEB,0x99,0x8B,0x8B,0xF4,0x0,0xDF,0xAB,0xAB,0xB9,0x0,0x0,0xA8,0xAB,0x5C,0xC,0x9A,0x8B,0x8B,0xF4,0x0,0xDF,0xAB,0xAB,0xB9,0x0,0x0,0xAB,0x8D,
-0xFB,0x19,0x5C,0x1F,0x9A,0x8B,0x48,0xDA,0xA2,0x0,0x0,0xBF,0x40,0xB2,0xCE,0xC9,0x0,0x0,0xF0,0x9,0x9F,0x0,0x20,0x7F,0xE8,0xE8,0x4C,0xEE,0xF7,0xA2,0x0,0x0,0xBF,0x0,0xD2,0xDE,0xC9,0x0,
-0x0,0xF0,0x9,0x9F,0x0,0xA0,0x7F,0xE8,0xE8,0x4C,0x3,0xF8,0x22,0x35,0xD6,0xDF,0xA9,0x2,0x0,0x8F,0xE8,0xFF,0x7F,0xFA,0x68,0x22,0xCE,0x95,0x8B,0x6B,0x8,0xC2,0x30,0xAF,0x98,0x9,0x7E,0xC9,
-0x1F,0x0,0xD0,0x27,0xAD,0xDA,0x9,0xD,0xDC,0x9,0xD,0xDE,0x9,0xD,0xE0,0x9,0xD0,0x19,0xA2,0x0,0x0,0xA9,0x0,0x0,0x22,0x80,0xD8,0xDF,0xE8,0xE0,0x80,0x1,0xD0,0xF6,0xA9,0x0,0x0,0x8D,
-0xB8,0x5,0x8D,0xBA,0x5,0x28,0x22,0x79,0x9A,0x80,0x6B,0xAD,0xB8,0x5,0x8F,0x0,0xFC,0x7F,0xAD,0xBA,0x5,0x8F,0x2,0xFC,0x7F,0xAF,0x0,0xFC,0x7F,0x38,0xE9,0x3D,0x1,0x8F,0x0,0xFC,0x7F,0xA9,
-0x0,0x0,0xEF,0x2,0xFC,0x7F,0x22,0x78,0xD7,0xDF,0xA9,0xA,0x0,0x22,0x84,0xF0,0x90,0x6B],
-0x112B14: [0x60,0xF8,0x8B],
-0x273240: [0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x15,0x10,0x0,0x10,0x11,0x10,0x8,0x10,0x0,0x10,0x7F,0x0,0x11,0x10,0x0,0x10,0xD,0x10,0x3,0x10,0xE,0x10,0xC,0x10,0x8,0x10,0x19,0x10,0x4,
-0x10,0x11,0x10,0x7F,0x0,0x12,0x10,0x13,0x10,0x0,0x10,0x5,0x10,0x5,0x10,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x23,0x0,0x44,0x0,0x23,0x0,0x24,0x0,0x7F,0x0,0x20,0x0,0x2D,0x0,0x23,0x0,0x7F,0x0,0x25,0x0,0x2B,0x0,0x2E,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x33,0x0,0x54,0x0,0x33,
-0x0,0x34,0x0,0x7F,0x0,0x30,0x0,0x3D,0x0,0x33,0x0,0x7F,0x0,0x35,0x0,0x3B,0x0,0x3E,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0xE,0x1C,0x11,0x1C,0x8,0x1C,0x6,0x1C,0x8,0x1C,0xD,0x1C,0x0,0x1C,0xB,0x1C,0x7F,0x0,0x8,0x1C,0x13,0x1C,0x4,0x1C,0xC,0x1C,0x7F,0x0,0x11,
-0x1C,0x0,0x1C,0xD,0x1C,0x3,0x1C,0xE,0x1C,0xC,0x1C,0x8,0x1C,0x19,0x1C,0x4,0x1C,0x11,0x1C,0x12,0x1C,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x13,0x4,0xE,0x4,0x13,0x4,0x0,0x4,0xB,0x4,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x3,0x4,0x4,0x4,0x12,0x4,0x12,0x4,0x18,0x4,0x11,0x4,0x4,0x4,0x10,0x4,0x13,0x4,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x12,0x1C,0xD,0x1C,0x4,0x1C,0x12,0x1C,0x7F,0x0,0x2,0x1C,0xE,0x1C,0x3,0x1C,0x4,0x1C,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x13,0x4,0xE,0x4,0x13,0x4,0x0,0x4,0xB,0x4,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x5,0x4,0xE,0x4,0xE,0x4,0x12,
-0x4,0x3,0x4,0x0,0x4,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x5,0x4,0xB,0x4,0xE,0x4,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x3,0x4,0x0,
-0x4,0x11,0x4,0xA,0x4,0x12,0x4,0x7,0x4,0xE,0x4,0x2,0x4,0xA,0x4,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x11,0x4,0x0,0x4,0xA,0x4,0xA,0x4,0x8,0x4,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x12,
-0x4,0x2,0x4,0x18,0x4,0x19,0x4,0x4,0x4,0x11,0x4,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0xA,0x4,0x4,0x4,0x9,0x4,0x0,0x4,0x11,0x4,0x3,0x4,0xE,0x4,0xD,
-0x4,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x12,0x4,0xC,0x4,0x8,0x4,0xB,0x4,0x4,0x4,0x18,0x4,0x7F,0x0,0x7F,0x0,0x7F,0x0,0xB,0x4,0x8,0x4,0xE,0x4,0x11,0x4,0x0,0x4,0xD,0x4,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0xF,0x4,0x4,0x4,0x11,0x4,0x12,0x4,0xE,0x4,0xD,0x4,0x8,0x4,0x13,0x4,0x8,0x4,0x12,0x4,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0xB,0x4,0x4,0x4,0xE,0x4,0x3,0x4,0xE,0x4,0x17,0x4,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x12,0x8,0xF,0x8,0x4,0x8,0x2,0x8,0x8,0x8,0x0,0x8,0xB,0x8,0x7F,0x0,0x13,0x8,0x7,0x8,0x0,0x8,0xD,0x8,0xA,0x8,0x12,0x8,0x7F,0x0,0x13,
-0x8,0xE,0x8,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0xC,0x4,0x4,0x4,0x13,0x4,0x11,
-0x4,0xE,0x4,0x8,0x4,0x3,0x4,0x7F,0x0,0x2,0x4,0xE,0x4,0xD,0x4,0x12,0x4,0x13,0x4,0x11,0x4,0x14,0x4,0x2,0x4,0x13,0x4,0x8,0x4,0xE,0x4,0xD,0x4,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x2C,0x0,0x24,0x0,0x43,0x0,0x41,0x0,0x2E,0x0,0x28,0x0,0x23,0x0,0x22,0x0,0x2E,0x0,0x2D,0x0,0x42,
-0x0,0x43,0x0,0x41,0x0,0x44,0x0,0x22,0x0,0x43,0x0,0x28,0x0,0x2E,0x0,0x2D,0x0,0x7F,0x0,0x22,0x0,0x2E,0x0,0x2C,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x3C,0x0,0x34,0x0,0x53,0x0,0x51,0x0,0x3E,0x0,0x38,0x0,0x33,0x0,0x32,0x0,0x3E,0x0,0x3D,0x0,0x52,0x0,0x53,0x0,0x51,0x0,0x54,0x0,0x32,0x0,0x53,0x0,0x38,
-0x0,0x3E,0x0,0x3D,0x0,0x5A,0x0,0x32,0x0,0x3E,0x0,0x3C,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x12,0x4,0x14,0x4,0xF,0x4,0x4,0x4,0x11,0x4,0x7F,0x0,0xC,
-0x4,0x4,0x4,0x13,0x4,0x11,0x4,0xE,0x4,0x8,0x4,0x3,0x4,0x7F,0x0,0x12,0x4,0x11,0x4,0xB,0x4,0x7F,0x0,0x2,0x4,0xE,0x4,0xC,0x4,0xC,0x4,0x14,0x4,0xD,0x4,0x8,0x4,0x13,
-0x4,0x18,0x4,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x23,0x0,0x28,0x0,0x42,0x0,0x22,0x0,0x2E,0x0,0x41,0x0,0x23,0x0,0x7F,0x0,0x28,0x0,0x2D,0x0,0x45,
-0x0,0x28,0x0,0x43,0x0,0x24,0x0,0x7F,0x0,0x5A,0x0,0x7F,0x0,0x41,0x0,0x43,0x0,0x62,0x0,0x25,0x0,0x46,0x0,0x49,0x0,0x43,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x33,0x0,0x38,0x0,0x52,0x0,0x32,0x0,0x3E,0x0,0x51,0x0,0x33,0x0,0x7F,0x0,0x38,0x0,0x3D,0x0,0x55,0x0,0x38,0x0,0x53,0x0,0x34,0x0,0x7F,0x0,0x5A,0x0,0x7F,
-0x0,0x51,0x0,0x53,0x0,0x72,0x0,0x35,0x0,0x56,0x0,0x59,0x0,0x53,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x11,0x1C,0x0,0x1C,0xD,
-0x1C,0x3,0x1C,0xE,0x1C,0xC,0x1C,0x8,0x1C,0x19,0x1C,0x4,0x1C,0x11,0x1C,0x7F,0x0,0xF,0x1C,0x0,0x1C,0x11,0x1C,0x0,0x1C,0xC,0x1C,0x4,0x1C,0x13,0x1C,0x4,0x1C,0x11,0x1C,0x12,0x1C,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x2C,0x0,0x28,0x0,0x42,0x0,0x42,0x0,0x28,0x0,0x2B,0x0,0x24,0x0,0x7F,0x0,0x2F,0x0,0x41,0x0,0x2E,0x0,0x21,0x0,0x20,
-0x0,0x21,0x0,0x28,0x0,0x2B,0x0,0x28,0x0,0x43,0x0,0x48,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x47,0x0,0x7F,0x0,0x47,0x0,0x7F,0x0,0x7F,
-0x0,0x3C,0x0,0x38,0x0,0x52,0x0,0x52,0x0,0x38,0x0,0x3B,0x0,0x34,0x0,0x7F,0x0,0x3F,0x0,0x51,0x0,0x3E,0x0,0x31,0x0,0x30,0x0,0x31,0x0,0x38,0x0,0x3B,0x0,0x38,0x0,0x53,0x0,0x58,
-0x0,0x7F,0x0,0x5A,0x0,0x5A,0x0,0x5A,0x0,0x5A,0x0,0x5A,0x0,0x5A,0x0,0x7F,0x0,0x47,0x0,0x5A,0x0,0x47,0x0,0x7F,0x0,0x7F,0x0,0x42,0x0,0x44,0x0,0x2F,0x0,0x24,0x0,0x41,0x0,0x7F,
-0x0,0x2F,0x0,0x41,0x0,0x2E,0x0,0x21,0x0,0x20,0x0,0x21,0x0,0x28,0x0,0x2B,0x0,0x28,0x0,0x43,0x0,0x48,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x47,0x0,0x7F,0x0,0x47,0x0,0x7F,0x0,0x7F,0x0,0x52,0x0,0x54,0x0,0x3F,0x0,0x34,0x0,0x51,0x0,0x7F,0x0,0x3F,0x0,0x51,0x0,0x3E,0x0,0x31,0x0,0x30,0x0,0x31,
-0x0,0x38,0x0,0x3B,0x0,0x38,0x0,0x53,0x0,0x58,0x0,0x7F,0x0,0x5A,0x0,0x5A,0x0,0x5A,0x0,0x5A,0x0,0x5A,0x0,0x5A,0x0,0x5A,0x0,0x5A,0x0,0x7F,0x0,0x47,0x0,0x5A,0x0,0x47,0x0,0x7F,
-0x0,0x7F,0x0,0x2F,0x0,0x2E,0x0,0x46,0x0,0x24,0x0,0x41,0x0,0x7F,0x0,0x21,0x0,0x2E,0x0,0x2C,0x0,0x21,0x0,0x7F,0x0,0x2F,0x0,0x41,0x0,0x2E,0x0,0x21,0x0,0x20,0x0,0x21,0x0,0x28,
-0x0,0x2B,0x0,0x28,0x0,0x43,0x0,0x48,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x47,0x0,0x7F,0x0,0x47,0x0,0x7F,0x0,0x7F,0x0,0x3F,0x0,0x3E,0x0,0x56,0x0,0x34,0x0,0x51,
-0x0,0x7F,0x0,0x31,0x0,0x3E,0x0,0x3C,0x0,0x31,0x0,0x7F,0x0,0x3F,0x0,0x51,0x0,0x3E,0x0,0x31,0x0,0x30,0x0,0x31,0x0,0x38,0x0,0x3B,0x0,0x38,0x0,0x53,0x0,0x58,0x0,0x7F,0x0,0x5A,
-0x0,0x5A,0x0,0x5A,0x0,0x7F,0x0,0x47,0x0,0x5A,0x0,0x47,0x0,0x7F,0x0,0x7F,0x0,0x2C,0x0,0x28,0x0,0x2D,0x0,0x2E,0x0,0x41,0x0,0x42,0x0,0x7F,0x0,0x40,0x0,0x44,0x0,0x20,0x0,0x2D,
-0x0,0x43,0x0,0x28,0x0,0x43,0x0,0x48,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x47,0x0,0x47,0x0,0x47,0x0,0x75,
-0x0,0x7F,0x0,0x7F,0x0,0x3C,0x0,0x38,0x0,0x3D,0x0,0x3E,0x0,0x51,0x0,0x52,0x0,0x7F,0x0,0x50,0x0,0x54,0x0,0x30,0x0,0x3D,0x0,0x53,0x0,0x38,0x0,0x53,0x0,0x58,0x0,0x7F,0x0,0x5A,
-0x0,0x5A,0x0,0x5A,0x0,0x5A,0x0,0x5A,0x0,0x5A,0x0,0x5A,0x0,0x5A,0x0,0x5A,0x0,0x7F,0x0,0x47,0x0,0x47,0x0,0x47,0x0,0x7A,0x0,0x7F,0x0,0x7F,0x0,0x4,0x4,0xD,0x4,0x4,0x4,0x11,
-0x4,0x6,0x4,0x18,0x4,0x7F,0x0,0x10,0x4,0x14,0x4,0x0,0x4,0xD,0x4,0x13,0x4,0x8,0x4,0x13,0x4,0x18,0x4,0x7F,0x0,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x7F,
-0x0,0x17,0x4,0x17,0x4,0x17,0x4,0x17,0x4,0x17,0x4,0x17,0x4,0x17,0x4,0x7F,0x0,0x7F,0x0,0xF,0x4,0x11,0x4,0xE,0x4,0x6,0x4,0x11,0x4,0x4,0x4,0x12,0x4,0x12,0x4,0x8,0x4,0xE,
-0x4,0xD,0x4,0x7F,0x0,0x12,0x4,0xF,0x4,0x4,0x4,0x4,0x4,0x3,0x4,0x7F,0x0,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x7F,0x0,0x17,0x4,0x17,0x4,0x17,0x4,0x17,0x4,0x17,0x4,0x17,
-0x4,0x17,0x4,0x7F,0x0,0x7F,0x0,0xF,0x4,0x11,0x4,0xE,0x4,0x6,0x4,0x11,0x4,0x4,0x4,0x12,0x4,0x12,0x4,0x8,0x4,0xE,0x4,0xD,0x4,0x7F,0x0,0x3,0x4,0x8,0x4,0x5,0x4,0x5,
-0x4,0x8,0x4,0x2,0x4,0x14,0x4,0xB,0x4,0x13,0x4,0x18,0x4,0x7F,0x0,0x17,0x4,0x17,0x4,0x17,0x4,0x17,0x4,0x17,0x4,0x17,0x4,0x17,0x4,0x7F,0x0,0x7F,0x0,0x12,0x4,0xF,0x4,0x11,
-0x4,0x4,0x4,0x0,0x4,0x3,0x4,0x7F,0x0,0xF,0x4,0x11,0x4,0xE,0x4,0x6,0x4,0x7F,0x0,0x8,0x4,0x13,0x4,0x4,0x4,0xC,0x4,0x12,0x4,0x7F,0x0,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,
-0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x7F,0x0,0x17,0x4,0x17,0x4,0x17,0x4,0x7F,0x0,0x7F,0x0,0x12,0x4,0x14,0x4,0x8,0x4,0x13,0x4,0x12,0x4,0x7F,0x0,0x11,0x4,0x4,0x4,0x12,
-0x4,0x13,0x4,0x11,0x4,0x8,0x4,0x2,0x4,0x13,0x4,0x8,0x4,0xE,0x4,0xD,0x4,0x7F,0x0,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x7F,0x0,0x17,
-0x4,0x17,0x4,0x17,0x4,0x7F,0x0,0x7F,0x0,0xC,0x4,0xE,0x4,0x11,0x4,0xF,0x4,0x7,0x4,0x7F,0x0,0xF,0x4,0xB,0x4,0x0,0x4,0x2,0x4,0x4,0x4,0xC,0x4,0x4,0x4,0xD,0x4,0x13,
-0x4,0x7F,0x0,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x7F,0x0,0x17,0x4,0x17,0x4,0x17,0x4,0x17,0x4,0x17,0x4,0x17,0x4,0x7F,0x0,0x7F,0x0,0x12,0x4,0x14,
-0x4,0xF,0x4,0x4,0x4,0x11,0x4,0x7F,0x0,0x5,0x4,0x14,0x4,0xD,0x4,0x7F,0x0,0x2,0x4,0xE,0x4,0xC,0x4,0x1,0x4,0x0,0x4,0x13,0x4,0x7F,0x0,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,
-0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x7F,0x0,0x17,0x4,0x17,0x4,0x17,0x4,0x7F,0x0,0x7F,0x0,0x12,0x4,0x14,0x4,0xF,0x4,0x4,0x4,0x11,0x4,0x7F,0x0,0x5,0x4,0x14,
-0x4,0xD,0x4,0x7F,0x0,0xC,0x4,0xE,0x4,0x15,0x4,0x4,0x4,0xC,0x4,0x4,0x4,0xD,0x4,0x13,0x4,0x7F,0x0,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x7F,
-0x0,0x17,0x4,0x17,0x4,0x17,0x4,0x7F,0x0,0x7F,0x0,0x12,0x4,0x14,0x4,0xF,0x4,0x4,0x4,0x11,0x4,0x7F,0x0,0x5,0x4,0x14,0x4,0xD,0x4,0x7F,0x0,0x12,0x4,0x14,0x4,0x8,0x4,0x13,
-0x4,0x12,0x4,0x7F,0x0,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x1A,0x4,0x7F,0x0,0x17,0x4,0x17,0x4,0x17,0x4,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x13,0x1C,0x11,0x1C,0x0,0x1C,0xD,0x1C,0x12,0x1C,0x8,0x1C,0x13,0x1C,0x8,0x1C,0xE,0x1C,0xD,0x1C,0x12,
-0x1C,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x41,0x0,0x20,0x0,0x2D,0x0,0x23,0x0,0x2E,0x0,0x2C,0x0,0x2C,0x0,0x24,0x0,0x43,0x0,0x41,0x0,0x2E,0x0,0x28,0x0,0x23,0x0,0x42,0x0,0x2E,
-0x0,0x2B,0x0,0x45,0x0,0x24,0x0,0x41,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x51,0x0,0x30,
-0x0,0x3D,0x0,0x33,0x0,0x3E,0x0,0x3C,0x0,0x3C,0x0,0x34,0x0,0x53,0x0,0x51,0x0,0x3E,0x0,0x38,0x0,0x33,0x0,0x52,0x0,0x3E,0x0,0x3B,0x0,0x55,0x0,0x34,0x0,0x51,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x2F,0x0,0x48,0x0,0x43,0x0,0x27,0x0,0x2E,0x0,0x2D,0x0,0x20,
-0x0,0x2D,0x0,0x48,0x0,0x46,0x0,0x27,0x0,0x24,0x0,0x41,0x0,0x24,0x0,0x7F,0x0,0x22,0x0,0x2E,0x0,0x2C,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x5A,0x0,0x3F,0x0,0x58,0x0,0x53,0x0,0x37,0x0,0x3E,0x0,0x3D,0x0,0x30,0x0,0x3D,0x0,0x58,0x0,0x56,0x0,0x37,0x0,0x34,0x0,0x51,
-0x0,0x34,0x0,0x5A,0x0,0x32,0x0,0x3E,0x0,0x3C,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x6,0x1C,0x0,
-0x1C,0xC,0x1C,0x4,0x1C,0xF,0x1C,0xB,0x1C,0x0,0x1C,0x18,0x1C,0x7F,0x0,0x12,0x1C,0x13,0x1C,0x0,0x1C,0x13,0x1C,0x8,0x1C,0x12,0x1C,0x13,0x1C,0x8,0x1C,0x2,0x1C,0x12,0x1C,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x12,0x18,0xF,0x18,0x4,0x18,0x4,0x18,0x3,0x18,0x11,0x18,0x14,0x18,0xD,
-0x18,0xD,0x18,0x8,0x18,0xD,0x18,0x6,0x18,0x7F,0x0,0x12,0x18,0x13,0x18,0x0,0x18,0x13,0x18,0x12,0x18,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x23,0x0,0x2E,0x0,0x2E,0x0,0x41,0x0,0x7F,0x0,0x43,0x0,0x41,0x0,0x20,0x0,0x2D,0x0,0x42,0x0,0x28,0x0,0x43,0x0,0x28,0x0,0x2E,0x0,0x2D,0x0,0x42,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x33,0x0,0x3E,0x0,0x3E,0x0,0x51,0x0,0x7F,0x0,0x53,
-0x0,0x51,0x0,0x30,0x0,0x3D,0x0,0x52,0x0,0x38,0x0,0x53,0x0,0x38,0x0,0x3E,0x0,0x3D,0x0,0x52,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x43,0x0,0x28,0x0,0x2C,0x0,0x24,0x0,0x7F,0x0,0x28,0x0,0x2D,0x0,0x7F,0x0,0x23,0x0,0x2E,0x0,0x2E,0x0,0x41,
-0x0,0x42,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x60,0x0,0x60,0x0,0x4A,0x0,0x60,0x0,0x60,0x0,0x4A,0x0,0x60,0x0,0x60,0x0,0x4B,0x0,0x60,0x0,0x60,0x0,0x7F,
-0x0,0x7F,0x0,0x53,0x0,0x38,0x0,0x3C,0x0,0x34,0x0,0x7F,0x0,0x38,0x0,0x3D,0x0,0x7F,0x0,0x33,0x0,0x3E,0x0,0x3E,0x0,0x51,0x0,0x52,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x43,0x0,0x28,0x0,0x2C,0x0,0x24,0x0,0x7F,
-0x0,0x20,0x0,0x2B,0x0,0x28,0x0,0x26,0x0,0x2D,0x0,0x28,0x0,0x2D,0x0,0x26,0x0,0x7F,0x0,0x23,0x0,0x2E,0x0,0x2E,0x0,0x41,0x0,0x42,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x60,0x0,0x60,
-0x0,0x4A,0x0,0x60,0x0,0x60,0x0,0x4B,0x0,0x60,0x0,0x60,0x0,0x7F,0x0,0x7F,0x0,0x53,0x0,0x38,0x0,0x3C,0x0,0x34,0x0,0x7F,0x0,0x30,0x0,0x3B,0x0,0x38,0x0,0x36,0x0,0x3D,0x0,0x38,
-0x0,0x3D,0x0,0x36,0x0,0x7F,0x0,0x33,0x0,0x3E,0x0,0x3E,0x0,0x51,0x0,0x52,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x13,0x14,0x8,0x14,0xC,0x14,0x4,0x14,0x7F,0x0,0x12,0x14,0xF,0x14,0x4,0x14,0xD,
-0x14,0x13,0x14,0x7F,0x0,0x8,0x14,0xD,0x14,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x22,0x0,0x41,0x0,0x20,0x0,0x43,
-0x0,0x24,0x0,0x41,0x0,0x28,0x0,0x20,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x60,0x0,0x60,0x0,0x4A,0x0,0x60,
-0x0,0x60,0x0,0x4A,0x0,0x60,0x0,0x60,0x0,0x4B,0x0,0x60,0x0,0x60,0x0,0x7F,0x0,0x7F,0x0,0x32,0x0,0x51,0x0,0x30,0x0,0x53,0x0,0x34,0x0,0x51,0x0,0x38,0x0,0x30,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x21,0x0,0x41,0x0,0x28,0x0,0x2D,0x0,0x42,0x0,0x43,0x0,0x20,0x0,0x41,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x60,0x0,0x60,0x0,0x4A,0x0,0x60,0x0,0x60,0x0,0x4A,0x0,0x60,0x0,0x60,0x0,0x4B,0x0,0x60,0x0,0x60,0x0,0x7F,0x0,0x7F,0x0,0x31,0x0,0x51,0x0,0x38,
-0x0,0x3D,0x0,0x52,0x0,0x53,0x0,0x30,0x0,0x51,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x2D,0x0,0x2E,0x0,0x41,0x0,0x25,0x0,0x20,0x0,0x28,0x0,0x41,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x60,0x0,0x60,0x0,0x4A,0x0,0x60,0x0,0x60,0x0,0x4A,0x0,0x60,0x0,0x60,0x0,0x4B,
-0x0,0x60,0x0,0x60,0x0,0x7F,0x0,0x7F,0x0,0x3D,0x0,0x3E,0x0,0x51,0x0,0x35,0x0,0x30,0x0,0x38,0x0,0x51,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x46,0x0,0x41,
-0x0,0x24,0x0,0x22,0x0,0x2A,0x0,0x24,0x0,0x23,0x0,0x7F,0x0,0x42,0x0,0x27,0x0,0x28,0x0,0x2F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x60,0x0,0x60,
-0x0,0x4A,0x0,0x60,0x0,0x60,0x0,0x4A,0x0,0x60,0x0,0x60,0x0,0x4B,0x0,0x60,0x0,0x60,0x0,0x7F,0x0,0x7F,0x0,0x56,0x0,0x51,0x0,0x34,0x0,0x32,0x0,0x3A,0x0,0x34,0x0,0x33,0x0,0x7F,
-0x0,0x52,0x0,0x37,0x0,0x38,0x0,0x3F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x2C,0x0,0x20,0x0,0x41,0x0,0x28,0x0,0x23,0x0,0x28,0x0,0x20,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x60,0x0,0x60,0x0,0x4A,0x0,0x60,0x0,0x60,0x0,0x4A,0x0,0x60,0x0,0x60,0x0,0x4B,0x0,0x60,0x0,0x60,0x0,0x7F,0x0,0x7F,0x0,0x3C,
-0x0,0x30,0x0,0x51,0x0,0x38,0x0,0x33,0x0,0x38,0x0,0x30,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x43,0x0,0x2E,0x0,0x44,0x0,0x41,0x0,0x28,0x0,0x20,0x0,0x2D,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x60,0x0,0x60,0x0,0x4A,0x0,0x60,0x0,0x60,0x0,0x4A,0x0,0x60,
-0x0,0x60,0x0,0x4B,0x0,0x60,0x0,0x60,0x0,0x7F,0x0,0x7F,0x0,0x53,0x0,0x3E,0x0,0x54,0x0,0x51,0x0,0x38,0x0,0x30,0x0,0x3D,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x12,0xC,0x7,0xC,0xE,0xC,0x13,0xC,0x12,0xC,0x7F,0x0,0x0,0xC,0xD,0xC,0x3,0xC,0x7F,0x0,0x0,0xC,0xC,0xC,0xC,0xC,0xE,
-0xC,0x7F,0x0,0x5,0xC,0x8,0xC,0x11,0xC,0x4,0xC,0x3,0xC,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x22,0x0,0x27,0x0,0x20,0x0,0x41,0x0,0x26,0x0,0x24,
-0x0,0x23,0x0,0x7F,0x0,0x42,0x0,0x27,0x0,0x2E,0x0,0x43,0x0,0x42,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x32,0x0,0x37,0x0,0x30,0x0,0x51,0x0,0x36,0x0,0x34,0x0,0x33,0x0,0x7F,0x0,0x52,0x0,0x37,0x0,0x3E,0x0,0x53,
-0x0,0x52,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x42,0x0,0x2F,0x0,0x24,0x0,0x22,0x0,0x28,0x0,0x20,0x0,0x2B,0x0,0x7F,0x0,0x21,0x0,0x24,0x0,0x20,0x0,0x2C,0x0,0x7F,0x0,0x20,0x0,0x43,0x0,0x43,0x0,0x20,0x0,0x22,
-0x0,0x2A,0x0,0x42,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x52,0x0,0x3F,0x0,0x34,0x0,0x32,0x0,0x38,
-0x0,0x30,0x0,0x3B,0x0,0x7F,0x0,0x31,0x0,0x34,0x0,0x30,0x0,0x3C,0x0,0x7F,0x0,0x30,0x0,0x53,0x0,0x53,0x0,0x30,0x0,0x32,0x0,0x3A,0x0,0x52,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x2C,0x0,0x28,0x0,0x42,0x0,0x42,0x0,0x28,0x0,0x2B,0x0,0x24,0x0,0x42,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x3C,0x0,0x38,0x0,0x52,0x0,0x52,0x0,0x38,0x0,0x3B,0x0,0x34,0x0,0x52,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x42,0x0,0x44,0x0,0x2F,0x0,0x24,
-0x0,0x41,0x0,0x7F,0x0,0x2C,0x0,0x28,0x0,0x42,0x0,0x42,0x0,0x28,0x0,0x2B,0x0,0x24,0x0,0x42,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x52,0x0,0x54,0x0,0x3F,0x0,0x34,0x0,0x51,0x0,0x7F,0x0,0x3C,0x0,0x38,0x0,0x52,0x0,0x52,
-0x0,0x38,0x0,0x3B,0x0,0x34,0x0,0x52,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x2F,0x0,0x2E,0x0,0x46,0x0,0x24,0x0,0x41,0x0,0x7F,0x0,0x21,0x0,0x2E,0x0,0x2C,0x0,0x21,0x0,0x42,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x3F,0x0,0x3E,0x0,0x56,
-0x0,0x34,0x0,0x51,0x0,0x7F,0x0,0x31,0x0,0x3E,0x0,0x3C,0x0,0x31,0x0,0x52,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x21,0x0,0x2E,0x0,0x2C,0x0,0x21,0x0,0x42,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x31,0x0,0x3E,0x0,0x3C,0x0,0x31,0x0,0x52,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x25,0x0,0x28,
-0x0,0x2D,0x0,0x20,0x0,0x2B,0x0,0x7F,0x0,0x43,0x0,0x28,0x0,0x2C,0x0,0x24,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x60,0x0,0x60,
-0x0,0x4A,0x0,0x60,0x0,0x60,0x0,0x4A,0x0,0x60,0x0,0x60,0x0,0x4B,0x0,0x60,0x0,0x60,0x0,0x7F,0x0,0x7F,0x0,0x35,0x0,0x38,0x0,0x3D,0x0,0x30,0x0,0x3B,0x0,0x7F,0x0,0x53,0x0,0x38,
-0x0,0x3C,0x0,0x34,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x43,0x0,0x27,0x0,0x20,0x0,0x2D,0x0,0x2A,0x0,0x42,0x0,0x7F,0x0,0x25,
-0x0,0x2E,0x0,0x41,0x0,0x7F,0x0,0x2F,0x0,0x2B,0x0,0x20,0x0,0x48,0x0,0x28,0x0,0x2D,0x0,0x26,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x53,0x0,0x37,0x0,0x30,0x0,0x3D,0x0,0x3A,0x0,0x52,0x0,0x7F,0x0,0x35,0x0,0x3E,0x0,0x51,0x0,0x7F,0x0,0x3F,0x0,0x3B,0x0,0x30,
-0x0,0x58,0x0,0x38,0x0,0x3D,0x0,0x36,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x2F,0x0,0x20,0x0,0x44,0x0,0x42,0x0,0x24,0x0,0x7F,0x0,0x2C,
-0x0,0x24,0x0,0x2D,0x0,0x44,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x60,0x0,0x60,0x0,0x4A,0x0,0x60,0x0,0x60,0x0,0x4A,0x0,0x60,
-0x0,0x60,0x0,0x4B,0x0,0x60,0x0,0x60,0x0,0x7F,0x0,0x7F,0x0,0x3F,0x0,0x30,0x0,0x54,0x0,0x52,0x0,0x34,0x0,0x7F,0x0,0x3C,0x0,0x34,0x0,0x3D,0x0,0x54,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0xF,0x8,0xB,0x8,0x0,0x8,0x18,0x8,0x7F,0x0,0x13,0x8,0x7,0x8,0x8,0x8,0x12,0x8,0x7F,0x0,0x11,0x8,0x0,0x8,0xD,0x8,0x3,0x8,0xE,
-0x8,0xC,0x8,0x8,0x8,0x19,0x8,0x4,0x8,0x11,0x8,0x7F,0x0,0x0,0x8,0x13,0x8,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,
-0x0,0x0,0x0],
-0x2F5200: [0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0xC,0x10,0x0,0x10,0x9,0x10,0xE,0x10,0x11,0x10,0x7F,0x0,0x8,0x10,0x13,0x10,0x4,0x10,0xC,0x10,0x7F,0x0,0xB,0x10,0xE,0x10,0x2,
-0x10,0x0,0x10,0x13,0x10,0x8,0x10,0xE,0x10,0xD,0x10,0x12,0x10,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0,0x7F,0x0],
-0x2FD4F0: [0xDA,0x8B,0xF4,0x7F,0x7F,0xAB,0xAB,0xAA,0xBD,0x0,0x0,0x85,0x16,0xBD,0x2,0x0,0x85,0x14,0xA9,0x3C,0x0,0x85,0x12,0xA9,0xFF,0xFF,0x85,0x1A,0x20,0xB4,0xD6,0xC8,0xC8,0xC8,0xC8,0xC8,0xC8,0xA5,0x14,
-0x20,0xEA,0xD5,0x98,0x38,0xE9,0x10,0x0,0xA8,0xA5,0x16,0x20,0x28,0xD5,0xAB,0xFA,0x60,0xDA,0x8B,0x88,0x88,0x88,0x88,0x88,0x88,0xF4,0x7F,0x7F,0xAB,0xAB,0x8F,0x4,0x42,0x0,0xE2,0x20,0xA9,0xFF,
-0x85,0x1A,0xA9,0x3C,0x8F,0x6,0x42,0x0,0x48,0x68,0x48,0x68,0xC2,0x20,0xAF,0x16,0x42,0x0,0x85,0x12,0xAF,0x14,0x42,0x0,0x8F,0x4,0x42,0x0,0xE2,0x20,0xA9,0x3C,0x8F,0x6,0x42,0x0,0x48,0x68,
-0x48,0x68,0xC2,0x20,0xAF,0x16,0x42,0x0,0x85,0x14,0xAF,0x14,0x42,0x0,0x20,0xEA,0xD5,0xC8,0xC8,0xA5,0x14,0x20,0xEA,0xD5,0xC8,0xC8,0xA5,0x12,0x20,0xEA,0xD5,0xAB,0xFA,0x60,0xDA,0x8B,0xF4,0x7F,
-0x7F,0xAB,0xAB,0x8F,0x4,0x42,0x0,0xA9,0x0,0x0,0x85,0x1A,0xE2,0x20,0xA9,0x64,0x8F,0x6,0x42,0x0,0x48,0x68,0x48,0x68,0xC2,0x20,0xAF,0x16,0x42,0x0,0x85,0x12,0xAF,0x14,0x42,0x0,0x20,0xB8,
-0xD5,0xA5,0x12,0x20,0xEA,0xD5,0xAB,0xFA,0x60,0x8F,0x4,0x42,0x0,0xE2,0x20,0xA9,0x64,0x8F,0x6,0x42,0x0,0x48,0x68,0x48,0x68,0xC2,0x20,0xAF,0x14,0x42,0x0,0xA,0xAA,0xC5,0x1A,0xF0,0x10,0xBF,
-0xEF,0xD6,0xDF,0x99,0x34,0x0,0xBF,0xF,0xD7,0xDF,0x99,0x74,0x0,0xC6,0x1A,0xC8,0xC8,0xAF,0x16,0x42,0x0,0x8F,0x4,0x42,0x0,0xE2,0x20,0xA9,0xA,0x8F,0x6,0x42,0x0,0x48,0x68,0x48,0x68,0xC2,
-0x20,0xAF,0x14,0x42,0x0,0xA,0xAA,0xC5,0x1A,0xF0,0x10,0xBF,0xEF,0xD6,0xDF,0x99,0x34,0x0,0xBF,0xF,0xD7,0xDF,0x99,0x74,0x0,0xC6,0x1A,0xAF,0x16,0x42,0x0,0xA,0xAA,0xC5,0x1A,0xF0,0x10,0xBF,
-0xEF,0xD6,0xDF,0x99,0x36,0x0,0xBF,0xF,0xD7,0xDF,0x99,0x76,0x0,0xC6,0x1A,0xC8,0xC8,0xC8,0xC8,0x60,0x5A,0x8B,0x8,0xF4,0xDF,0xDF,0xAB,0xAB,0xC2,0x30,0x22,0x2F,0xD7,0xDF,0xA2,0x0,0x0,0xA0,
-0x0,0x0,0x98,0xA,0xA,0xA,0xAA,0xBF,0xF3,0xDF,0xDF,0xF0,0x5C,0xC9,0x1,0x0,0xF0,0xD,0xC9,0x2,0x0,0xF0,0x1F,0xC9,0x3,0x0,0xF0,0x31,0x4C,0xAC,0xD6,0xBF,0xEF,0xDF,0xDF,0x22,0xB0,0xD8,
-0xDF,0x48,0xBF,0xF1,0xDF,0xDF,0xBB,0xA8,0x68,0x20,0x85,0xD5,0x9B,0x4C,0xAC,0xD6,0xBF,0xEF,0xDF,0xDF,0x22,0xB0,0xD8,0xDF,0x48,0xBF,0xF1,0xDF,0xDF,0xBB,0xA8,0x68,0x20,0x28,0xD5,0x9B,0x4C,0xAC,
-0xD6,0xBF,0xEF,0xDF,0xDF,0xA,0x18,0x69,0x0,0xFC,0x48,0xBF,0xF1,0xDF,0xDF,0xBB,0xA8,0x68,0x20,0xF0,0xD4,0x9B,0x4C,0xAC,0xD6,0xC8,0x4C,0x49,0xD6,0x28,0xAB,0x7A,0x6B,0x5A,0xDA,0x8,0xC2,0x30,
-0xE2,0x10,0x38,0xA5,0x14,0xE5,0x12,0xB0,0x22,0xA2,0x11,0xC2,0x10,0x26,0x16,0xCA,0xF0,0x20,0x26,0x14,0xA9,0x0,0x0,0x2A,0x85,0x18,0x38,0xA5,0x14,0xE5,0x12,0xA8,0xA5,0x18,0xE9,0x0,0x0,0x90,
-0xE6,0x84,0x14,0x80,0xE2,0xA9,0xFF,0xFF,0x85,0x16,0x85,0x14,0x28,0xFA,0x7A,0x60,0x60,0x0,0x61,0x0,0x62,0x0,0x63,0x0,0x64,0x0,0x65,0x0,0x66,0x0,0x67,0x0,0x68,0x0,0x69,0x0,0x6A,0x0,
-0x6B,0x0,0x6C,0x0,0x6D,0x0,0x6E,0x0,0x6F,0x0,0x70,0x0,0x71,0x0,0x72,0x0,0x73,0x0,0x74,0x0,0x75,0x0,0x76,0x0,0x77,0x0,0x78,0x0,0x79,0x0,0x7A,0x0,0x7B,0x0,0x7C,0x0,0x7D,0x0,
-0x7E,0x0,0x7F,0x0,0xDA,0x48,0xA2,0x0,0x0,0xAF,0x52,0x9,0x7E,0xD0,0x12,0xBF,0x0,0x14,0x70,0x9F,0x0,0xFC,0x7F,0xE8,0xE8,0xE0,0x0,0x3,0xD0,0xF1,0x4C,0x75,0xD7,0xC9,0x1,0x0,0xD0,0x12,
-0xBF,0x0,0x17,0x70,0x9F,0x0,0xFC,0x7F,0xE8,0xE8,0xE0,0x0,0x3,0xD0,0xDA,0x4C,0x75,0xD7,0xBF,0x0,0x1A,0x70,0x9F,0x0,0xFC,0x7F,0xE8,0xE8,0xE0,0x0,0x3,0xD0,0xC8,0x4C,0x75,0xD7,0x68,0xFA,
-0x6B,0xDA,0x48,0xA2,0x0,0x0,0xAF,0x52,0x9,0x7E,0xD0,0x12,0xBF,0x0,0xFC,0x7F,0x9F,0x0,0x14,0x70,0xE8,0xE8,0xE0,0x0,0x3,0xD0,0xF1,0x4C,0xBE,0xD7,0xC9,0x1,0x0,0xD0,0x12,0xBF,0x0,0xFC,
-0x7F,0x9F,0x0,0x17,0x70,0xE8,0xE8,0xE0,0x0,0x3,0xD0,0xDA,0x4C,0xBE,0xD7,0xBF,0x0,0xFC,0x7F,0x9F,0x0,0x1A,0x70,0xE8,0xE8,0xE0,0x0,0x3,0xD0,0xC8,0x4C,0xBE,0xD7,0x68,0xFA,0x6B],
-0x2FD800: [0xDA,0xA,0xAA,0xBF,0x0,0xFC,0x7F,0x1A,0x9F,0x0,0xFC,0x7F,0xFA,0x6B],
-0x2FD840: [0xDA,0xA,0xAA,0xBF,0x0,0xFC,0x7F,0x3A,0x9F,0x0,0xFC,0x7F,0xFA,0x6B],
-0x2FD880: [0xDA,0x48,0x8A,0xA,0xAA,0x68,0x9F,0x0,0xFC,0x7F,0xFA,0x6B],
-0x2FD8B0: [0xDA,0xA,0xAA,0xBF,0x0,0xFC,0x7F,0xFA,0x6B],
-0x2FD91B: [0x17,0x9A,0x2,0x0,0x0,0x0,0xC0,0x1F,0xD,0x9A,0x1F,0xD9,0x0,0x0,0x0,0x0,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x1,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1,0x0,0x0,0x0,0x2,0x0,0x0,0xC0,
-0x1F,0x0,0x0,0x40,0x2,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x2,0x0,0x0,0xC0,0x2,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x3,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x3,0x0,0x0,0x80,0x3,0x0,
-0x0,0xC0,0x1F,0x0,0x0,0xC0,0x3,0x0,0x0,0x0,0x4,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x4,0x0,0x0,0x80,0x4,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x4,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,
-0x5,0x0,0x0,0x40,0x5,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x5,0x0,0x0,0xC0,0x5,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x6,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x6,0x0,0x0,0x80,0x6,0x0,
-0x0,0xC0,0x1F,0x0,0x0,0xC0,0x6,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x7,0x0,0x0,0x40,0x7,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x14,0x0,0x0,0xC0,0x1A,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,
-0x15,0x0,0x0,0x40,0x15,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x15,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x15,0x0,0x0,0x40,0x15,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x15,0x0,0x0,0x0,0x16,0x0,
-0x0,0xC0,0x1F,0x0,0x0,0x80,0x7,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x7,0x0,0x0,0x0,0x10,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x10,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x10,0x0,0x0,0xC0,
-0x10,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x11,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x11,0x0,0x0,0x80,0x11,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x11,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x12,0x0,
-0x0,0x40,0x12,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x12,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x12,0x0,0x0,0x0,0x13,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x13,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,
-0x13,0x0,0x0,0xC0,0x13,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x14,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x14,0x0,0x0,0x80,0x14,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x19,0x0,0x0,0xC0,0x1F,0x0,
-0x0,0x80,0x19,0x0,0x0,0xC0,0x19,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x1A,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x1A,0x0,0x0,0x80,0x1A,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0xF,0x0,0x0,0x0,
-0x18,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x16,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x16,0x0,0x0,0xC0,0x16,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x17,0x0,0x0,0x40,0x17,0x0,0x0,0xC0,0x1F,0x0,
-0x0,0x80,0x17,0x0,0x0,0xC0,0x17,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x18,0x0,0x0,0x0,0x19,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x1B,0x0,0x0,0x40,0x1B,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,
-0x1B,0x0,0x0,0xC0,0x1B,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x8,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x8,0x0,0x0,0x80,0x8,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x8,0x0,0x0,0x0,0x9,0x0,
-0x0,0xC0,0x1F,0x0,0x0,0xC0,0x9,0x0,0x0,0x0,0xA,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0xA,0x0,0x0,0x0,0xB,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0xB,0x0,0x0,0x0,0xC,0x0,0x0,0xC0,
-0x1F,0x0,0x0,0x40,0xC,0x0,0x0,0x80,0xC,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0xC,0x0,0x0,0x0,0xD,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0xD,0x0,0x0,0x80,0xD,0x0,0x0,0xC0,0x1F,0x0,
-0x0,0x40,0xE,0x0,0x0,0x80,0xE,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0xE,0x0,0x0,0x0,0xF,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0xF,0x0,0x0,0x80,0xF,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,
-0x18,0x0,0x0,0x80,0x18,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x1E,0x0,0x0,0xC0,0x1E,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x1F,0x0,0x0,0x40,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0xB,0x0,
-0x0,0x80,0xB,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x1C,0x0,0x0,0x40,0x1C,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x1C,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x1,0x0,0x0,0x80,0x1,0x0,0x0,0xC0,
-0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x20,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x20,0x0,0x0,0x80,0x20,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x20,0x0,
-0x0,0xC0,0x1F,0x0,0x0,0x0,0x21,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x21,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x21,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x21,0x0,0x0,0xC0,
-0x1F,0x0,0x0,0x0,0x22,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x22,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x22,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x22,0x0,0x0,0xC0,0x1F,0x0,
-0x0,0x0,0x23,0x0,0x0,0x40,0x23,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x23,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x23,0x0,0x0,0x0,0x24,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,
-0x24,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x24,0x0,0x0,0xC0,0x24,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x25,0x0,0x0,0x40,0x25,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x25,0x0,0x0,0xC0,0x25,0x0,
-0x0,0xC0,0x1F,0x0,0x0,0x0,0x26,0x0,0x0,0x40,0x26,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x26,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x26,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,
-0x27,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x27,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x27,0x0,0x0,0xC0,0x1F,0x70,0xF7,0x4,0x0,0x0,0x0,0xC0,0x27,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x28,0x0,
-0x0,0xC0,0x1F,0x0,0x0,0x40,0x28,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x28,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x28,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x29,0x0,0x0,0xC0,
-0x1F,0x0,0x0,0x40,0x29,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x29,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x29,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x2A,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x2A,0x0,
-0x0,0xC0,0x1F,0x0,0x0,0x80,0x2A,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x2A,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x2B,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x2B,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,
-0x2B,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x2B,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x2C,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x2C,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x2C,0x0,0x0,0xC0,0x1F,0x0,
-0x0,0xC0,0x1F,0x0,0x0,0xC0,0x37,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x2C,0x0,0x0,0x0,0x2D,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x2D,0x0,0x0,0x80,0x2D,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,
-0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x2D,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,
-0x0,0x0,0x2E,0x0,0x0,0xC0,0x1F,0x70,0xF7,0x3,0x0,0x0,0x0,0x40,0x2E,0x0,0x0,0x80,0x2E,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x2E,0x0,0x0,0x0,0x2F,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,
-0x2F,0x0,0x0,0x80,0x2F,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x38,0x0,0x0,0x40,0x38,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x2F,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x30,0x0,
-0x0,0x40,0x30,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x30,0x0,0x0,0xC0,0x30,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x31,0x0,0x0,0x40,0x31,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x31,0x0,0x0,0xC0,
-0x31,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x32,0x0,0x0,0x40,0x32,0x0,0x0,0xC0,0x1F,0x0,0x0,0x80,0x32,0x0,0x0,0xC0,0x32,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x37,0x0,0x0,0x80,0x37,0x0,
-0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0x33,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x33,0x0,0x0,0x80,0x33,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x33,0x0,0x0,0x0,0x34,0x0,0x0,0xC0,
-0x1F,0x0,0x0,0x40,0x34,0x0,0x0,0x80,0x34,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x34,0x0,0x0,0x0,0x35,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x35,0x0,0x0,0x80,0x35,0x0,0x0,0xC0,0x1F,0x0,
-0x0,0xC0,0x35,0x0,0x0,0x0,0x36,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0x0,0xA0,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0xA0,0x0,0x0,0x80,0xA0,0x0,0x0,0xC0,
-0x1F,0x0,0x0,0xC0,0xA0,0x0,0x0,0x0,0xA1,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0xA1,0x0,0x0,0x80,0xA1,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0xA1,0x0,0x0,0x0,0xA2,0x0,0x0,0xC0,0x1F,0x0,
-0x0,0x40,0xA2,0x0,0x0,0x80,0xA2,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0xA2,0x0,0x0,0x0,0xA3,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0xA3,0x0,0x0,0x80,0xA3,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,
-0xA3,0x0,0x0,0x0,0xA4,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0xA4,0x0,0x0,0x80,0xA4,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0xA4,0x0,0x0,0x0,0xA5,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0xA5,0x0,
-0x0,0x80,0xA5,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0xA5,0x0,0x0,0x0,0xA6,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0xA6,0x0,0x0,0x80,0xA6,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0xA6,0x0,0x0,0x0,
-0xA7,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0xA7,0x0,0x0,0x80,0xA7,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0xA7,0x0,0x0,0x0,0xA8,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0x40,0x36,0x0,
-0x0,0x80,0x36,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x36,0x0,0x0,0x0,0x37,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,
-0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x0,0x0,0xC0,0x1F,0x70,0xF7,0x4,0x0,0x17,0x9A,0x17,0x0,0x0,0x0,0xC0,0x1F,0xD,0x9A,0xE3,0xDF,0xFE,0xF6,0xFE,0x99,0x0,
-0x0,0x40,0x36,0x3,0x0,0x0,0x0,0x2,0x0,0x40,0x2E,0x1,0x0,0x0,0x0,0x3,0x0,0xC0,0x2E,0x3,0x0,0x0,0x0,0x5,0x0,0x40,0x2F,0x2,0x0,0x0,0x0,0x7,0x0,0x0,0x30,0x3,0x0,0x0,
-0x0,0x9,0x0,0x80,0x30,0x3,0x0,0x0,0x0,0xB,0x0,0x0,0x31,0x3,0x0,0x0,0x0,0xD,0x0,0x80,0x31,0x3,0x0,0x0,0x0,0xF,0x0,0x0,0x32,0x3,0x0,0x0,0x0,0x11,0x0,0x80,0x32,0x3,
-0x0,0x0,0x0,0x14,0x0,0x40,0x33,0x1,0x0,0x0,0x0,0x15,0x0,0xC0,0x33,0x1,0x0,0x0,0x0,0x16,0x0,0x40,0x34,0x1,0x0,0x0,0x0,0x17,0x0,0xC0,0x34,0x1,0x0,0x0,0x0,0x18,0x0,0x40,
-0x35,0x1,0x0,0x0,0x0,0x1A,0x0,0xC0,0x35,0x1,0x0,0x0,0x0,0x1B,0x0,0x40,0x37,0x3],
-0x2FE074: [0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0]},
-'dachora.ips': {0x22A173: [0xC9,0x4,0x45,0x4F,0x8B,0xC5,0x1E,0xC5,0x26,0xC7,0x24,0xCF,0x2A,0xD0,0x10,0x2,0x8F,0x45,0x8F,0xF8,0x25,0x7C,0xC4,0x5C,0x0,0x8F,0xC9,0x6C,0xC4,0x8C,0xC2,0x10,0xC3,0x16,0xC6,0x7E,0x0,0x8F,0xD7,
-0x4E,0xC7,0xBC,0x47,0x28,0x8B,0xC3,0x4A,0xCD,0x78,0x6,0x45,0x8B,0x29,0x8B,0x7,0x8B,0x8,0x44,0x8B,0x7,0x0,0x2F,0xC6,0xA,0xC9,0x4,0x0,0x4C,0x44,0x8B,0x2F,0xC5,0x1E,0xC5,0x26,0x0,0x4C,
-0xC8,0x2E,0xCD,0x2A,0xD0,0x10,0x1,0x8F,0x29,0xF8,0x20,0xE2,0xC5,0x7C,0xC5,0x5A,0x0,0x8,0xC4,0x6A,0x0,0x4C,0xC4,0xA,0xC5,0x10,0xC3,0x96,0xC6,0x7E,0x0,0x8F,0xD5,0x4E,0xC9,0xBC,0x47,0x8,
-0x8B,0xC2,0xC6,0xC6,0x78,0x0,0x26,0xC6,0xFA,0x19,0x29,0x1B,0x7,0x1B,0x9,0x1B,0x1,0xB,0x2,0xB,0x41,0xB,0xF,0xB,0x2,0xF,0x40,0xB,0x0,0xF,0x41,0xB,0x46,0xB,0xFF,0x0,0xC2,0x12,
-0x3,0xF,0xFF,0x0,0x10,0xC2,0x16,0x2,0xFF,0x0,0x25,0xC2,0xA,0xC3,0x1C,0x4,0xFF,0x0,0x44,0xF,0x43,0xC2,0x16,0xF8,0x21,0x2,0x5,0x9,0x1F,0x7,0x1F,0x29,0x1F,0x91,0x98,0x2,0xCC,0xDE,
-0xC4,0x7C,0x2,0x43,0xB,0x44,0xC2,0x7E,0x0,0x24,0xC2,0x7E,0x0,0x10,0xC2,0x78,0x0,0x41,0xC2,0x8A,0xC3,0x60,0x0,0x41,0xC2,0x82,0x0,0x46,0xC2,0x12,0xC2,0x94,0xC2,0x9A,0xC6,0x4E,0xCA,0xE4,
-0x83,0xCC,0x1,0xC5,0xBC,0xC7,0x8E,0x0,0x5,0xC4,0x3C,0xC5,0x78,0x2,0x26,0x8F,0x6,0xC5,0xFA,0xCA,0x22,0x0,0x0,0xC4,0x58,0x4,0x20,0x3,0xFF,0x0,0x21,0xC4,0x62,0xC2,0x8,0xC2,0xE0,0xC3,
-0xDE,0xC2,0x3C,0xC4,0xD4,0x0,0x20,0xC6,0x18,0xF8,0x25,0x6,0x3,0x9,0x1F,0x8,0x1F,0xC2,0x60,0x96,0x3,0x3,0xC7,0xDE,0xC9,0x9E,0xC5,0x6C,0xC3,0x80,0xC4,0x7C,0xC4,0xE6,0xC5,0x7E,0xC3,0x90,
-0xC4,0x4E,0x0,0x1F,0xC7,0x4C,0x84,0xAA,0x2,0x1,0x1B,0x8,0xCA,0xDE,0xC9,0x34,0xC3,0xE2,0x5,0x6,0x1F,0x40,0x94,0xC,0xC4,0xC3,0xFA,0x0,0x22,0xCE,0xB4,0xC7,0x60,0xD3,0xCA,0xDF,0xE0,0x0,
-0xF,0xCE,0x3C,0x0,0x46,0x88,0x57,0x4,0x51,0x27,0x8B,0xCD,0xDE,0xF8,0x23,0x80,0x1,0x2,0xF,0xC5,0x4C,0x1,0x45,0x8F,0xC5,0xDE,0x1,0x9,0x1B,0x85,0x1C,0x4,0xD1,0xB0,0x7,0xC,0xC0,0x40,
-0x90,0x60,0x94,0x2C,0xD4,0xD4,0xC4,0xF8,0x3A,0xE0,0x0,0x10,0xD4,0x9C,0x86,0xC4,0x4,0x4D,0x8B,0x7,0xD6,0xDE,0x87,0x72,0x4,0x9A,0xAC,0x4,0x3,0x1B,0x29,0x1F,0x29,0x90,0x25,0x5,0xCD,0xE8,
-0x7,0x2C,0xD0,0x60,0x90,0x60,0x9C,0x2C,0xDC,0xF8,0x27,0xE0,0x0,0x5,0xC6,0xF4,0xC3,0x7C,0x8F,0x96,0x5,0xF8,0x21,0xE0,0xC3,0xFE,0x83,0x90,0x3,0x5,0x46,0xB,0x1,0xF,0x57,0xF7,0x44,0x4E,
-0xFB,0x4,0xF7,0x57,0xF3,0x41,0xDB,0xE8,0x35,0xFF,0x0,0xC3,0xE2,0xD7,0xDE,0xC7,0x9C,0x6,0x2C,0xD8,0x60,0x98,0x40,0x9C,0xC,0xC4,0xE0,0x0,0x2,0xC8,0xD0,0x0,0x0,0xC4,0xDA,0xD3,0xE0,0x0,
-0x25,0xCA,0xF4,0xD3,0xC4,0x0,0x46,0xC4,0xF4,0x5,0xF,0x3,0x10,0x3,0x1,0x3,0xCF,0x50,0xCD,0xF2,0xC2,0xE0,0x0,0xF3,0xC2,0xE2,0x3,0xF3,0x57,0xF3,0x0,0xF8,0x30,0xE0,0xC3,0xBE,0x83,0x2E,
-0x7,0x3,0x41,0xB,0x2,0xF,0xC3,0xA6,0x0,0x3,0xCE,0xAA,0x3,0xF1,0x1,0x10,0x3,0xC5,0xE2,0xF,0xC,0xD8,0x40,0x98,0x6,0x83,0x7,0x83,0x8,0x83,0x7,0x13,0x8,0x13,0x9,0x13,0x89,0x54,
-0x5,0x3,0x21,0x3,0x20,0x3,0xC3,0xE8,0x89,0x96,0x5,0x0,0x21,0xC2,0xF6,0xC7,0xE0,0x2,0x0,0x3,0x5,0xC2,0xC4,0x8D,0x96,0x5,0x5,0x9,0x17,0x8,0x17,0x7,0x13,0xC3,0x4C,0x43,0x2F,0x83,
-0xC2,0x54,0xC8,0x52,0x93,0x5A,0x5,0xC6,0xE0,0x4,0xFB,0x57,0xF3,0xFF,0xD0,0x8B,0x2A,0x7,0xCF,0xEC,0x1,0x21,0x7,0x95,0x64,0x6,0xC3,0x8A,0x83,0x7E,0x4,0xC3,0xE0,0x0,0x23,0xC4,0xE0,0xC7,
-0xE6,0xC3,0x88,0x1,0x2F,0x13,0xC2,0x82,0xB,0x87,0x8,0x87,0x7,0x87,0x6,0x87,0x26,0x83,0x27,0x83,0x28,0xC2,0x4,0x2,0x29,0x13,0x7,0xC4,0xE2,0x6,0x1,0x3,0x40,0x3,0x22,0x7,0x41,0xC2,
-0x6,0x2,0x23,0x3,0x21,0xC4,0xC6,0x6,0x46,0x3,0x43,0x3,0x44,0x3,0x41,0xC2,0xD0,0x0,0x25,0x84,0x39,0x8,0xC3,0x1E,0x0,0x25,0x44,0x3,0x10,0x2,0x43,0x3,0x48,0xC3,0x10,0xC2,0x16,0x5,
-0x9,0x17,0x7,0x17,0x29,0x17,0x43,0x27,0x83,0x0,0x28,0x44,0x83,0x4F,0xC3,0x54,0xC7,0x52,0x0,0x40,0x84,0x37,0x8,0x0,0x46,0x8A,0x39,0x8,0x1,0x2,0x3,0x84,0x78,0x7,0xC2,0xE2,0xC2,0xE0,
-0x84,0x2B,0x8,0x8B,0xE,0x8,0xC5,0xEA,0xC3,0x74,0x2,0xFF,0x0,0x41,0xC8,0xE0,0x0,0x46,0x86,0x37,0x8,0x83,0x34,0x8,0x2,0x46,0x3,0x24,0xC6,0xC,0xC3,0x5C,0x4,0x23,0x3,0xF0,0x1,0x46,
-0xC2,0xAE,0x3,0xF1,0x1,0xF0,0x1,0xC5,0x88,0xC4,0x82,0x6,0x87,0x28,0x87,0x27,0x87,0x26,0x87,0x88,0xC4,0x1,0x5,0x83,0x29,0x83,0x7,0x83,0x4C,0x44,0x83,0x8,0x84,0xC4,0x8,0xC4,0x8,0x43,
-0x2F,0x83,0xC9,0xC,0xC9,0x18,0x0,0x4C,0x87,0x13,0x9,0xC6,0x34,0x4,0x7,0x87,0x29,0x87,0x45,0xC8,0x4C,0xCB,0x52,0xC9,0x4C,0xD9,0x8,0xC2,0x74,0x2,0x87,0xE6,0x82,0x4B,0x7C,0xB1,0x1,0xE6,
-0x86,0xC3,0x88,0xC4,0x5A,0xCE,0x40,0xC3,0x92,0xC7,0x18,0xC7,0x9C,0xC7,0x28,0xC3,0xBC,0xD1,0x88,0xC9,0xE2,0x0,0x27,0xC2,0xF8,0x43,0x28,0x83,0x85,0xA4,0x9,0xC3,0x8,0x43,0x4F,0x83,0xC9,0xC,
-0xCD,0x18,0xC7,0x10,0xC4,0x22,0xD4,0x56,0xC3,0x52,0xC9,0x4C,0xD9,0x8,0x5,0x28,0x83,0x29,0x83,0x57,0x83,0x4A,0x44,0x50,0x4,0x0,0x57,0x87,0x29,0x87,0x83,0xF2,0x9,0xD1,0x3C,0xC5,0x7A,0xC7,
-0xC,0xCD,0x8,0xC3,0xBC,0xD7,0xDE,0xF8,0x7D,0x16,0x1,0x6,0x8B,0xC2,0xE0,0x4A,0x0,0x44,0x2,0x57,0x87,0x6,0xF0,0x22,0x25,0x2,0xF8,0xA9,0x22,0x0,0x6,0x83,0xE9,0xB,0xF8,0x54,0xE0,0xE8,
-0x7F,0xFF,0x83,0x89,0xC2,0xC,0x3,0xA,0x3,0xB,0x3,0xC7,0x4,0xC2,0xE0,0x86,0x81,0xA,0xE8,0xBF,0xFF,0x83,0x89,0xA2,0xD,0x3,0x2A,0x3,0x2B,0x3,0xC7,0x4,0xF8,0xD3,0xE0,0x8E,0x8C,0xE,
-0x86,0x25,0x2,0xF1,0xA6,0xA2,0xE,0xF0,0xF1,0x89,0xE,0xF0,0xD0,0x5B,0x10,0xF0,0xDC,0x8C,0xE,0x0,0x8B,0xF3,0x90,0x6A,0xF,0xF0,0xDF,0x3B,0x11,0xF0,0xDF,0x5B,0x10,0xF1,0xBF,0xFB,0x12,0xF2,
-0x8D,0xFB,0x19,0x8F,0x89,0xE,0x0,0x8F,0xF0,0xDE,0x9A,0xE,0x0,0x8F,0xF0,0xDE,0x7A,0x1D,0xF1,0xAF,0x19,0x12,0xF0,0xDF,0x49,0x1E,0xF1,0xCF,0x69,0x1D,0xF0,0xD1,0x79,0x1D,0x0,0x8B,0xF2,0x9E,
-0xC,0x20,0x0,0x8B,0x8E,0x2C,0x1F,0xF1,0xAD,0x7B,0xF,0xF0,0xE1,0xA9,0x14,0x8D,0x4B,0x25,0xF0,0xD2,0x39,0x1F,0xF0,0xDE,0xEC,0x27,0x8F,0x4B,0x25,0xF0,0xD0,0x7B,0x24,0xF1,0xCC,0xEC,0x27,0xF1,
-0xB1,0x79,0x2B,0xF0,0xDF,0x6B,0x2B,0xF0,0xDF,0x8B,0xE,0x8F,0xEB,0x27,0xF1,0xBD,0x3B,0x1F,0xF0,0xDF,0x79,0x2B,0xF0,0xDF,0x99,0x2A,0xF0,0xDF,0xB9,0x29,0xF2,0x8F,0xD9,0x2F,0xF3,0xFF,0x69,0x1D,
-0xF3,0xFF,0x69,0x21,0xF3,0xFF,0x69,0x25,0xF3,0xFF,0x69,0x29,0xF3,0xFF,0x69,0x2D,0xF3,0xFF,0x69,0x31,0xF2,0x98,0x69,0x35,0xF0,0x89,0x22,0xD,0xF0,0x55,0x8C,0xE,0xF8,0x89,0xE0,0xF0,0x55,0x6C,
-0xF,0xF0,0x89,0x42,0xC,0xF0,0x55,0x4C,0x10,0xF0,0xDF,0xE2,0x54,0x83,0x82,0x3,0xCB,0x2,0xF0,0x23,0x24,0x2,0xF0,0x55,0x76,0xC,0x8C,0x4C,0x8,0xF0,0x48,0x59,0x10,0x83,0x62,0x4,0xCA,0x2,
-0xF0,0x22,0x3,0x3,0xF0,0x57,0x54,0xD,0xCE,0xE0,0xF0,0x46,0x9B,0xE,0x87,0x42,0x5,0x0,0x24,0x84,0x23,0x4,0x87,0x30,0x4,0xF8,0x6F,0x2,0x0,0x29,0xF0,0x58,0x9,0x58,0x87,0x22,0x6,0x0,
-0x25,0x86,0x7F,0x4,0x85,0x12,0x5,0x3,0x8,0x8F,0x7,0x8F,0xC3,0x4,0xF8,0x69,0x2,0xF0,0x57,0xEA,0x58,0x87,0x2,0x7,0x83,0xF2,0x4,0x89,0x6A,0x7,0xC3,0xF2,0x1,0x42,0xB,0x83,0x4A,0x5,
-0x0,0x1,0xC6,0xF8,0x0,0x22,0xC4,0x16,0x83,0xA0,0x3,0x83,0x4A,0x59,0x8D,0x24,0x7,0x83,0x22,0x4,0x4,0xFF,0x0,0x47,0xB,0x48,0xC6,0x44,0x83,0xA6,0x5,0xCF,0x4E,0xC3,0xBE,0xC3,0x58,0x1,
-0x1,0xB,0xC3,0x28,0x1,0x23,0xB,0xC5,0x46,0xC3,0x50,0xC5,0x72,0xC7,0x68,0x85,0xA2,0x8,0xF0,0x49,0x58,0x10,0x85,0xE2,0x7,0x89,0xEA,0x7,0xF8,0x21,0x8,0x8D,0x28,0xA,0x87,0x78,0x9,0xF8,
-0x2D,0x2,0x1,0x3,0xB,0x89,0xA,0x5B,0xC9,0x7A,0x83,0xEA,0x8,0x85,0x82,0x9,0xF0,0x49,0x98,0xE,0x83,0xC2,0x8,0x8B,0xC8,0x8,0x85,0x2A,0x7,0x0,0x21,0x86,0xB7,0x8,0x8B,0xA4,0x8,0xC7,
-0xC,0xC7,0x9A,0xC5,0x8E,0x8F,0x28,0xA,0xC5,0xA4,0xD7,0xBC,0xDD,0xFE,0x1,0x20,0x3,0x83,0x2E,0x7,0xF8,0x4D,0xE0,0x83,0xA2,0x9,0x87,0xA8,0x9,0x2,0xED,0x1,0x1,0x84,0x9,0xA,0x3,0x24,
-0x3,0x41,0x3,0x83,0x76,0x6,0x83,0x68,0xA,0x89,0x28,0x8,0xC3,0x78,0x0,0x1,0xC4,0xF6,0x4,0x2,0x3,0x47,0x3,0x48,0xC2,0x24,0xC3,0xFC,0x0,0x24,0xCA,0xE0,0x2,0x5,0x3,0x1,0xC6,0x16,
-0xC5,0x22,0xC3,0x2E,0x85,0xEA,0x7,0x0,0x46,0xC4,0x2E,0x83,0x8,0xA,0x0,0x22,0xC4,0x46,0x89,0xEA,0x7,0x0,0x1,0xC4,0x4C,0x0,0x2,0xC4,0x18,0x0,0x41,0xC2,0x7A,0xC3,0xE0,0x0,0x46,0xF0,
-0x50,0x57,0x56,0x85,0x8A,0xA,0x89,0x94,0xA,0x83,0xB8,0xA,0xF0,0x23,0xE2,0xA,0xF8,0x59,0x24,0xF0,0x4F,0xBA,0x53,0x83,0x6C,0xB,0x45,0x28,0x83,0x43,0x27,0x83,0x85,0x80,0xB,0xF0,0x21,0xC4,
-0xB,0xF8,0x59,0x20,0x87,0x80,0xA,0xF0,0xC5,0xC2,0x53,0xF0,0x59,0xE8,0xD,0xF8,0xDF,0xE0,0xE5,0xC3,0x0,0x2,0x93,0x93,0xD2,0xE4,0x28,0x0,0x2,0x92,0x93,0x93,0xF8,0x23,0x3E,0x2,0x92,0xD3,
-0xD3,0x27,0x0,0x1,0xD3,0xD3,0xC7,0x5E,0x1,0x92,0x93,0xC4,0x15,0xF8,0x2B,0x6F,0xD1,0x71,0xD6,0xAD,0xC8,0x71,0xC9,0x6F,0xC5,0x71,0x0,0x41,0xE4,0x31,0x0,0xCB,0xE4,0xD9,0xAD,0xC5,0xE3,0xCA,
-0x6E,0x22,0x0,0x1,0x40,0x1,0x83,0x71,0x4,0xF8,0x3A,0x71,0x9B,0xC6,0x63,0xC2,0xE3,0xCB,0xDD,0x23,0x0,0x3,0xFF,0x1,0x0,0xFE,0xE4,0x38,0x0,0x24,0x4,0x0,0x3,0xDB,0x97,0xCF,0x6F,0x4,
-0x0,0xFE,0x1,0x0,0xFD,0xF8,0x3D,0x70,0x0,0x2,0xE4,0x2C,0x0,0x1,0xFD,0x1,0x22,0x0,0x2,0x13,0x13,0x52,0x3D,0x0,0x2,0x12,0x13,0x13,0x24,0x0,0x1,0x13,0x53,0xCC,0x29,0x24,0x4,0xC3,
-0x41,0xE4,0x23,0x0,0xC7,0x44,0xC4,0x48,0xDD,0x71,0xC9,0x2B,0xCD,0x71,0x24,0x4,0xF8,0x32,0x6F,0xE4,0x41,0x0,0x25,0xF,0xE4,0x69,0x0,0x3,0x5,0x4,0x3,0x2,0xF0,0x27,0xA2,0x66,0xE7,0xFF,
-0x0,0xE7,0xFF,0x0,0xE7,0xFF,0x0,0xE7,0xFF,0x0,0xE7,0xFF,0x0,0xE7,0xFF,0x0,0xE7,0xFF,0x0,0xE7,0xFF,0x0,0xE7,0xFF,0x0,0xE6,0x7E,0x0,0x0,0x2,0x85,0xA3,0x64,0x91,0xF2,0x63,0xF8,0x57,
-0x70,0x86,0x13,0x65,0xF8,0x67,0x71,0x0,0x2,0xF0,0x39,0x83,0x65,0xF8,0x35,0xE0,0xF0,0x39,0xF3,0x65,0xE4,0x36,0x0,0xF0,0x20,0x65,0x66,0xF8,0xC0,0x71,0xE5,0xBB,0x0,0xEA,0x9F,0x44,0x0,0xE8,
-0xDF,0xB3,0xA,0x43,0xB2,0xA,0x3,0xC,0x3,0x4B,0xB,0xC3,0x8,0x7,0xD,0x3,0xC,0x7,0x4B,0xB,0xC,0x3,0xC5,0xC,0x0,0xD,0xC4,0x8,0xF8,0xBF,0x20,0x7,0x49,0xB,0x4A,0xB,0x2C,0x3,
-0x2D,0xB,0xC3,0x8,0x4,0x49,0xB,0x2C,0x7,0x2D,0xC2,0xE,0xC5,0xC,0xC9,0x4,0xF8,0xBB,0x20,0x85,0x8C,0xE,0x0,0xE,0x88,0x8F,0xE,0x0,0xE,0x8A,0x8D,0xE,0xC9,0x8,0xF8,0xB9,0x20,0x85,
-0x6C,0xF,0x0,0x2E,0x88,0x6F,0xF,0x0,0x2E,0x8A,0x6D,0xF,0xC9,0x8,0xF8,0xB9,0x20,0xF1,0xBF,0x42,0x98,0x2,0x49,0x3,0x4A,0xC2,0x4,0x0,0x2D,0xC6,0x8,0x0,0x4A,0xC2,0xA,0xC5,0x8,0xCD,
-0x4,0xF8,0xB9,0x20,0x1,0xB2,0x2,0x43,0xD,0xB,0x0,0x4B,0xC4,0x8,0x43,0xB2,0x2,0xC3,0xA,0xC7,0xC,0xC5,0x4,0xF8,0xBD,0x20,0xEA,0x9F,0x44,0x0,0x8F,0x76,0x97,0xF8,0xCF,0x10,0xE8,0x7F,
-0xFF,0x0,0x91,0x56,0x98,0xCD,0x10,0xE8,0xBF,0xFF,0x0,0x91,0x36,0x99,0xCD,0x10,0xF8,0xBF,0xE0,0xF3,0xFF,0x82,0xA1,0xF3,0xFF,0x2,0xA2,0xF3,0xFF,0x82,0xA2,0xF8,0x3F,0xFE,0x45,0x81,0x0,0x2,
-0x6,0x3,0x57,0x8C,0x55,0x98,0x3,0x57,0x7,0x6,0x7,0xC5,0x1A,0xF8,0xC6,0xE0,0x1,0xB,0x57,0x8C,0x35,0x99,0xC2,0xE0,0x0,0xF,0xF8,0xCF,0xE0,0x8C,0x8C,0xE,0x0,0xF,0xF0,0xCE,0x9A,0xAF,
-0x0,0x3,0x8E,0x6A,0xB0,0x0,0xF,0xF0,0xDE,0x7A,0xB0,0xF0,0xCF,0x99,0xAF,0x8F,0x29,0xB2,0xF1,0xAF,0x79,0xB0,0xF1,0xCF,0x69,0xB0,0xF0,0xD1,0x79,0xB0,0x86,0x41,0x98,0xF2,0x98,0x12,0xB3,0x0,
-0xB,0x8E,0x2C,0xB2,0xF0,0xD0,0x5B,0xB1,0x8E,0x8C,0xAF,0xF0,0xD0,0x7B,0xB0,0x8E,0x6C,0xB0,0xF0,0xCF,0x5B,0xB1,0x8D,0x4B,0xB8,0xF0,0xD2,0x39,0xB2,0xF0,0xDE,0xEC,0xBA,0x8F,0x4B,0xB8,0xF0,0xD0,
-0x7B,0xB7,0xF1,0xCC,0xEC,0xBA,0xF1,0xB1,0x79,0xBE,0xF0,0xDF,0x6B,0xBE,0xF0,0xDF,0xB,0xB3,0x8F,0xEB,0xBA,0xF1,0xBD,0x3B,0xB2,0xF0,0xDF,0x79,0xBE,0xF0,0xDF,0x99,0xBD,0xF0,0xDF,0xB9,0xBC,0xF2,
-0x8F,0xD9,0xC2,0xF3,0xFF,0x69,0xB0,0xF3,0xFF,0x69,0xB4,0xF3,0xFF,0x69,0xB8,0xF3,0xFF,0x69,0xBC,0xF3,0xFF,0x69,0xC0,0xF3,0xFF,0x69,0xC4,0xF2,0x98,0x69,0xC8,0xE8,0x9F,0x44,0x0,0xF9,0xFF,0xE0,
-0xE8,0x9F,0xB3,0xA,0xF8,0x3F,0xE0,0xF0,0x9F,0x82,0x96,0xF8,0x3F,0xE0,0xF0,0x9F,0x62,0x97,0xF0,0x45,0x42,0xA1,0xF0,0x99,0x48,0x98,0xF0,0x45,0x22,0xA2,0xF0,0x99,0x28,0x99,0xF1,0xFF,0x2,0xEC,
-0xF0,0x9F,0xC2,0x9B,0xF8,0x3F,0xE0,0xF0,0x9F,0xA2,0x9C,0xF2,0xDF,0xC2,0xE6,0xF0,0x55,0x22,0xA0,0xCB,0x6,0xF8,0x3D,0x40,0xF8,0x3F,0xE0,0x0,0x0],
-0x22AA79: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF]},
-'draygonimals.ips': {0x1ADA0: [0xFD,0x92,0x0,0x5,0x3E,0x26,0x3,0x2,0x0,0x80,0xA2,0xB9,0x60,0xDA,0x40,0x4,0x1,0x16,0x0,0x1,0x0,0x80,0x0,0x0,0x79,0x98,0x40,0x5,0x2E,0x6,0x2,0x0,0x0,0x80,0x0,0x0],
-0x798DC: [0x6,0xF0],
-0x7F000: [0xA0,0xAD,0xAC,0xAD],
-0x7F006: [0xA9,0x0,0x0,0x8F,0x2C,0xD8,0x7E,0xA9,0x0,0xF0,0x8F,0xB5,0x7,0x7E,0x5C,0xBB,0x91,0x8F],
-0x7DA8A: [0x18,0xF0],
-0x7EFF0: [0xB8,0xAD],
-0x7F018: [0xAF,0x20,0xD8,0x7E,0x89,0x0,0x40,0xF0,0x46,0xA9,0xF0,0xEF,0x8F,0xB5,0x7,0x7E,0xA9,0xFF,0xFF,0x8F,0xD5,0x1C,0x7E,0xA9,0xAE,0x80,0x8F,0xBE,0x1,0x7F,0xA9,0xCE,0x80,0x8F,0xFE,0x1,0x7F,0xA9,0xCE,
-0x88,0x8F,0x3E,0x2,0x7F,0xA9,0xAE,0x88,0x8F,0x7E,0x2,0x7F,0x8,0xE2,0x20,0xA9,0x0,0x8F,0xC2,0x66,0x7F,0x8F,0xE2,0x66,0x7F,0x8F,0x2,0x67,0x7F,0x8F,0x22,0x67,0x7F,0xC2,0x20,0x28,0x5C,0xDD,
-0xC8,0x8F,0x5C,0xDD,0xC8,0x8F]},
-'early_super_bridge.ips': {0x22976B: [0xC7,0x60,0x1,0xBD,0x80,0xE8,0x4F,0xFF,0x0,0x0,0xBD,0xCC,0x60,0x0,0xBE,0xF8,0x50,0x60,0x0,0xBE,0xF8,0xCC,0x60,0x3,0xBD,0x88,0x5D,0xB0,0xF8,0x5B,0xC0,0x3,0x7A,0x80,0x7B,0x0,0x95,0x6,0x1,
-0xF8,0x37,0xD8,0x1,0xBD,0x88,0xC7,0xC0,0x7,0x81,0x80,0x92,0x8D,0x70,0x89,0x6E,0x1,0x45,0x6E,0x81,0x1,0x70,0x85,0x4B,0x6E,0x81,0xC2,0x78,0xF0,0x30,0xEB,0x0,0xC5,0xFE,0x0,0x7A,0xC8,0xC0,
-0xC5,0x62,0x9,0x8F,0x1,0x90,0x81,0x8F,0x81,0x90,0x85,0x8F,0x85,0xC2,0x4,0xC3,0x8,0x3,0x81,0x90,0x81,0x93,0xC3,0x70,0x4E,0x81,0x6E,0xC2,0x8A,0xCB,0xE,0xCA,0x8E,0xC5,0x9A,0x1,0x6F,0x81,
-0xC5,0xF2,0x0,0x6F,0xC4,0xA8,0x1,0x91,0x81,0x48,0x81,0x80,0x0,0x0,0x51,0x81,0x80,0xC2,0x76,0x0,0x81,0xC2,0x70,0xC5,0x78,0xC6,0x74,0xD1,0x10,0xC3,0x24,0xC7,0x4,0x0,0x93,0xCC,0x60,0x3,
-0x70,0x81,0x7B,0x85,0xDB,0x60,0xF8,0x31,0x12,0x1,0x7B,0x89,0xCD,0xC0,0xF8,0x50,0x60,0x8E,0x11,0x4,0xF8,0x60,0xC0,0x0,0x8D,0xF8,0x4F,0x60,0x2,0x6E,0x81,0x6C,0xC4,0xC2,0xF8,0x57,0xC0,0x87,
-0x10,0x4,0xC9,0x60,0x7,0x94,0x89,0x92,0x85,0x90,0x89,0x8F,0x9,0xC2,0x4,0x0,0x89,0xD8,0x4,0x2,0x8D,0x8F,0x8D,0xC4,0x4,0xC5,0xC,0xC3,0x28,0xC3,0x10,0x50,0x89,0x90,0x0,0x93,0xC4,0x60,
-0x3,0x6A,0xC1,0x6C,0x51,0xC9,0xC0,0x0,0x91,0xC4,0xCA,0x1,0x6E,0xB1,0xE8,0x25,0x6E,0x81,0x5,0xD8,0x80,0xD6,0x80,0xD8,0x84,0xD7,0x12,0xC6,0x1E,0x2,0xD1,0x6E,0xD5,0xC7,0xC0,0x2,0x60,0x81,
-0x64,0x86,0x13,0x4,0xF8,0x51,0x6,0x6,0x6F,0x85,0x7B,0x85,0x80,0x81,0x84,0xF8,0x5B,0x60,0x4,0x8D,0x63,0x89,0x64,0x89,0xF8,0x59,0xC0,0x5,0x91,0x81,0x40,0x94,0xC,0xC4,0xF8,0x57,0xC0,0x7,
-0xC,0xC0,0x40,0x90,0x60,0x94,0x2C,0xD4,0xC5,0xFE,0x0,0x6A,0x4A,0x81,0x6B,0x5,0x6A,0x85,0x72,0x89,0x6A,0xC1,0x53,0x6B,0xB1,0x1,0x6A,0xB5,0xC2,0x1A,0xD8,0x12,0x1,0x6A,0xB5,0xC5,0x46,0x1,
-0x6A,0x85,0xC3,0xFE,0x7,0x2C,0xD0,0x60,0x90,0x60,0x9C,0x2C,0xDC,0xD3,0xFE,0x0,0x73,0x98,0x25,0x7,0xD1,0x1A,0xD7,0x2C,0x6,0x2C,0xD8,0x60,0x98,0x40,0x9C,0xC,0xF8,0x58,0x60,0xD,0xC,0xD8,
-0x40,0x98,0x63,0x81,0x64,0x81,0xB8,0x2,0xB9,0x2,0xBA,0x2,0xC3,0x6,0xCF,0xC0,0xC5,0x1A,0xC5,0xE0,0xC7,0xC,0xDB,0xC0,0xCB,0x30,0xF,0x6C,0x85,0x6B,0x81,0x89,0x85,0x65,0x89,0x66,0x89,0xD8,
-0x2,0xD9,0x2,0xB5,0xA,0xC5,0x6,0xB,0x98,0x81,0x98,0x85,0xB5,0xA,0xB7,0xA,0x73,0xF1,0xB4,0xA,0xC5,0x14,0x0,0xDA,0xC4,0x76,0x1,0xB7,0xE,0xC5,0x26,0xC3,0x1A,0x2,0xB7,0xE,0xB6,0xC2,
-0x22,0xCD,0xEC,0xC3,0x2E,0x0,0xB6,0xC6,0x30,0xC5,0x3A,0x9,0x6F,0x85,0x6F,0x89,0x6E,0x81,0x65,0x81,0x66,0x81,0x83,0xAC,0x8,0x0,0x71,0xC6,0x4,0xC7,0x6,0x0,0x70,0x4A,0x81,0x6B,0x3,0x71,
-0x85,0x5D,0x80,0xC5,0x1C,0xC7,0x1A,0xC7,0xE,0x43,0x71,0x81,0xCA,0x2C,0x44,0x85,0x71,0x0,0x6B,0xC2,0xB8,0xC3,0x48,0x0,0x8E,0x84,0x73,0x3,0x6,0x85,0x81,0x86,0x81,0x92,0x8D,0x90,0x8B,0x47,
-0x4,0x44,0x81,0x90,0xCF,0x6,0xD7,0x4,0xCB,0x20,0x85,0xD0,0x3,0xC3,0x6,0xC7,0x1A,0x4,0x90,0x81,0x67,0x81,0x68,0x89,0x21,0x4,0xF8,0x52,0x8,0x2,0x87,0x81,0x88,0xF8,0x5C,0x60,0xE7,0x59,
-0x0,0x1,0x7,0xFF,0xE4,0x2D,0x0,0xA3,0x8A,0xF,0xE4,0x92,0x0,0x0,0x41,0xE4,0x2B,0x0,0x2,0x40,0x1,0x0,0xF8,0x21,0xF6,0x24,0x4,0xC6,0xF4,0x2,0x1,0x0,0xFE,0xE4,0x2B,0x0,0x3,0xFE,
-0x1,0x0,0xFD,0xE4,0x2B,0x0,0x1,0xFD,0x1,0xE5,0x1F,0x0],
-0x2299D8: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF]},
-'elevators_doors_speed.ips': {0x2E9D: [0x8],
-0x2EA7: [0x8],
-0x2EB6: [0x20],
-0x2EE1: [0x8],
-0x2EEB: [0x8],
-0x2EFA: [0x20],
-0x2F64: [0x8],
-0x2F6E: [0x8],
-0x2F7D: [0x1D],
-0x2FE6: [0x8],
-0x2FF0: [0x8,0x0,0x8D,0x19,0x9,0xE0,0x3],
-0x302A: [0x1D],
-0x15962: [0x6],
-0x15E51: [0xF,0xAD,0x91,0x7,0x6A,0x6A,0xB0,0x5,0xA9,0xC8,0x0,0x80,0x3,0xA9,0x80,0x1,0xA],
-0x163F2: [0x3],
-0x119581: [0x22,0x20,0xF3,0xA3],
-0x119585: [0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA],
-0x1195B0: [0x3],
-0x1195D2: [0x3],
-0x1195EC: [0x3],
-0x11F320: [0x9C,0x99,0x7,0xA9,0x8,0x0,0xCD,0x98,0x9,0xD0,0x6,0x9C,0x41,0x7,0x4C,0x40,0xF3,0xA9,0x18,0x0,0xCD,0x41,0x7,0xF0,0x11,0xAD,0x41,0x7,0x1A,0x8D,0x41,0x7,0xBD,0x7E,0xF,0x18,0x69,0x3,0x0,
-0x9D,0x7E,0xF,0x6B]},
-'endingtotals.ips': {0x7FDC: [0x7B,0x3E,0x84,0xC1],
-0x208A0: [0x30,0xF0,0x84],
-0x27030: [0x48,0xAF,0x6E,0xD8,0x7E,0x1A,0x8F,0x6E,0xD8,0x7E,0x68,0x22,0x8E,0x81,0x80,0x6B],
-0x5E62F: [0xE2,0x20,0x64,0x12,0xAF,0x6E,0xD8,0x7E,0x8D,0x2,0x42,0xA9,0x64,0x8D,0x3,0x42,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xC2,0x20,0xAD,0x16,0x42,0x8D,0x4,0x42,0xE2,0x20,0xA9,0x64,0x8D,0x6,0x42,0xEA,
-0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xC2,0x20,0xAD,0x14,0x42,0x8D,0x4,0x42,0xAD,0x16,0x42,0x48,0xE2,0x20,0xA9,0xA,0x8D,0x6,0x42,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xC2,0x20,0xAD,0x14,0x42,0x8D,
-0x4,0x42,0xAD,0x16,0x42,0x85,0x16,0xE2,0x20,0xA9,0xA,0x8D,0x6,0x42],
-0x5E690: [0xEA,0xC2,0x20,0xAD,0x14,0x42,0x85,0x12,0xAD,0x16,0x42,0x85,0x14,0x68,0xE2,0x20,0x8D,0x4,0x42,0xA9,0xA,0x8D,0x6,0x42,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xC2,0x20,0xAD,0x14,0x42,0x85,0x18,0xA5,
-0x12,0xF0,0x11,0xA,0xA,0xA8,0xB9,0x41,0xE7,0x8F,0x9A,0x33,0x7E,0xB9,0x43,0xE7,0x8F,0xDA,0x33,0x7E,0xA5,0x14,0xD0,0x6,0xA5,0x12,0xF0,0x13,0xA5,0x14,0xA,0xA,0xA8,0xB9,0x41,0xE7,0x8F,0x9C,
-0x33,0x7E,0xB9,0x43,0xE7,0x8F,0xDC,0x33,0x7E,0xA5,0x16,0xA,0xA,0xA8,0xB9,0x41,0xE7,0x8F,0x9E,0x33,0x7E,0xB9,0x43,0xE7,0x8F,0xDE,0x33,0x7E,0xA9,0x5A,0x38,0x8F,0xE0,0x33,0x7E,0xA5,0x18,0xA,
-0xA,0xA8,0xB9,0x41,0xE7,0x8F,0xA2,0x33,0x7E,0xB9,0x43,0xE7,0x8F,0xE2,0x33,0x7E,0xA9,0x6A,0x38,0x8F,0xA4,0x33,0x7E,0xA9,0x7A,0x38,0x8F,0xE4,0x33,0x7E,0x7A,0xFA,0xAB,0x28,0x60]},
-'escapimals.ips': {0x1ADA0: [0xFD,0x92,0x0,0x5,0x3E,0x26,0x3,0x2,0x0,0x80,0xA2,0xB9,0x4D,0xDE,0x40,0x0,0x0,0x0,0x1,0x0,0x0,0x80,0x0,0x0],
-0x798DC: [0x6,0xF0],
-0x7F000: [0xA0,0xAD,0xAC,0xAD],
-0x7F006: [0xA9,0x0,0xF0,0x8F,0xB5,0x7,0x7E,0x5C,0xBB,0x91,0x8F]},
-'g4_skip.ips': {0x18C5C: [0x0,0xFE],
-0x7FE00: [0xAF,0x28,0xD8,0x7E,0x89,0x0,0x1,0xF0,0x20,0xAF,0x2C,0xD8,0x7E,0x89,0x1,0x0,0xF0,0x17,0xAF,0x2A,0xD8,0x7E,0x29,0x1,0x1,0xC9,0x1,0x1,0xD0,0xB,0xAF,0x20,0xD8,0x7E,0x9,0x0,0x4,0x8F,0x20,
-0xD8,0x7E,0x60]},
-'gameend.ips': {0x18BCC: [0x20,0xFF],
-0x7FF20: [0xAF,0x20,0xD8,0x7E,0x89,0x0,0x40,0xF0,0x7,0xA9,0x26,0x0,0x8F,0x98,0x9,0x7E,0x60]},
-'grey_door_animals.ips': {0x798D8: [0x0,0xFC],
-0x7FC00: [0x44,0xDB,0x8,0x8,0x10,0x0,0x42,0xC8,0x2E,0x6,0xEE,0x90,0x0,0x0],
-0x7FD30: [0xE3,0xEE,0x1D,0x7,0x0,0x0,0x0,0x0],
-0x21E186: [0x6],
-0x21E18E: [0xF8,0x59,0x60,0x2,0x8B,0xB2,0x83,0xF8,0x5B,0xC0,0x7,0x92,0x83,0x90,0x83,0x40,0x94,0xC,0xC4,0xF8,0x57,0xC0,0x7,0xC,0xC0,0x40,0x90,0x60,0x94,0x2C,0xD4,0xF8,0x57,0xC0,0x7,0x2C,0xD0,0x60,0x90,
-0x60,0x9C,0x2C,0xDC,0xF8,0x58,0x60,0x5,0xD8,0x60,0x98,0x40,0x9C,0xC,0xF8,0x58,0x60,0x3,0xC,0xD8,0x40,0x98,0x83,0x22,0x1,0xF0,0x53,0x22,0x1,0x83,0x3E,0x2,0xC3,0x4,0xC5,0x5E,0xF8,0x51,
-0x62,0x83,0x7E,0x1,0xC3,0x4,0xC7,0xC0,0xF8,0x4F,0xC4,0x83,0xDE,0x1,0xC3,0x4,0x3,0xAF,0x82,0xAD,0x82,0xF8,0x5B,0x4,0xE8,0xBF,0x44,0x80,0xE5,0x20,0x0,0x0,0x41,0xE4,0x2B,0x0,0x3,0x40,
-0x1,0x0,0xFF,0xE4,0x2B,0x0,0x3,0xFF,0x1,0x0,0xFE,0xE4,0x2B,0x0,0x3,0xFE,0x1,0x0,0xFD,0xE4,0x2B,0x0,0x1,0xFD,0x1,0xE5,0x1F,0x0],
-0x21E21D: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF]},
-'high_jump.ips': {0x23AA77: [0x4,0x16,0x8D,0x13,0x89,0x13,0xC3,0x4,0x43,0x89,0x16,0xC4,0x8,0xC5,0xE,0xC3,0x10,0xF8,0x23,0x5C,0xB,0x1A,0x8D,0x8,0x11,0x23,0x15,0x23,0x11,0x8,0x15,0x1A,0x89,0xC2,0xC,0x2,0x81,0x23,0x15,
-0x43,0x3,0x11,0xC2,0x10,0x1,0x85,0x14,0xCD,0x64,0xCE,0x2,0xC7,0x5E,0x3,0x8,0x81,0x25,0x15,0x43,0xFF,0x0,0x0,0x25,0xC2,0x32,0x3,0xE,0x81,0x5,0x81,0x47,0xFF,0x0,0x2,0x5,0x85,0x1A,
-0xC8,0x34,0xC3,0x58,0x1,0xC,0x15,0xC5,0x5A,0xC3,0x5C,0x0,0xC,0xC2,0x5E,0xC7,0x1E,0xC9,0x32,0x5,0x6,0x8D,0xE,0x81,0x6,0x89,0xC9,0xE,0x3,0xC,0x85,0xC,0x81,0xC3,0x54,0xC3,0x94,0x3,
-0x22,0x15,0xC0,0x2,0x49,0xFF,0x0,0x2,0xC0,0x2,0x22,0xC4,0xA2,0x43,0xE,0x81,0x0,0x7,0xC8,0x72,0x0,0x2,0xC2,0x30,0x0,0x2,0xC8,0x80,0xC2,0x82,0x8,0xC5,0x5,0x51,0x5,0x5,0xE,0x1,
-0x5,0x1,0xC5,0x34,0xCB,0x40,0xC7,0x30,0x2,0xC,0x81,0x6,0xCA,0x32,0xC9,0x62,0x5,0x6,0x85,0x1C,0x81,0x1D,0x81,0xC3,0x4,0xC7,0x62,0xD1,0x40,0x5,0xFF,0x0,0xC,0xC0,0x40,0x90,0xC7,0xF2,
-0x4,0x2,0x85,0x1,0x85,0x1D,0xC2,0x4E,0x9,0x5F,0x88,0x5D,0x80,0x5F,0x88,0x7,0x85,0x1A,0x81,0x43,0x13,0x85,0x0,0x1A,0x88,0xCD,0x0,0xD3,0x40,0x3,0x2C,0xD0,0x60,0x90,0xC9,0xC0,0x8,0x7,
-0x8D,0x1A,0x81,0x1A,0x85,0x1C,0x85,0x1D,0xC2,0x4,0x2,0x1A,0x81,0x16,0x44,0x81,0xD,0x0,0x14,0xC2,0xE4,0xD9,0x80,0x3,0x2C,0xD8,0x60,0x98,0x8A,0xD0,0x0,0x3,0x8D,0x14,0x81,0x16,0x46,0x85,
-0x13,0xC5,0x3E,0xC5,0x40,0xCB,0x80,0x1,0x5D,0x80,0xCC,0xC0,0x2,0xD8,0x40,0x98,0xC9,0x80,0x2,0x1F,0x11,0x1A,0x84,0x5B,0x0,0x0,0x16,0x4A,0x8D,0x13,0x9,0x1A,0x8D,0xE,0x81,0x8,0x89,0x6B,
-0x83,0x6B,0xB3,0xC6,0x4,0xC3,0x2,0x0,0xC3,0xC5,0x4,0x0,0x6,0xC3,0xAA,0x8A,0xCF,0x0,0x0,0x3F,0x86,0x99,0x0,0x3,0x14,0x85,0x8,0x81,0x83,0x1C,0x1,0xC9,0x4,0x1,0x9B,0x83,0xC5,0xF4,
-0xCB,0x4,0x1,0x9B,0x87,0xC3,0x22,0x1,0x8,0x85,0xC9,0x80,0xC2,0xC2,0xC6,0x40,0xC9,0xD4,0xC3,0xFA,0x3,0xC3,0xA,0xC3,0xE,0xD1,0x40,0xC5,0x16,0x0,0x5,0xCC,0x2C,0x0,0x7,0xC6,0x80,0xC3,
-0xD4,0x89,0x98,0x1,0xDB,0x8,0x0,0x1D,0x8A,0x41,0x1,0xC9,0x40,0xC3,0xD4,0x0,0x5,0x86,0xD9,0x1,0xC4,0x4,0x5A,0x81,0x13,0x3,0x1D,0x85,0x24,0x11,0x8D,0x84,0x2,0xC5,0x80,0xC5,0x8C,0xF8,
-0x21,0x2,0x4,0x1A,0x85,0xE,0x85,0x1,0x86,0x4F,0x1,0x85,0xCC,0x2,0xC7,0x80,0xF8,0x25,0x40,0x0,0x14,0xC2,0x40,0x8B,0xD0,0x0,0xC3,0x40,0xF8,0x2B,0x80,0xC3,0x40,0x8A,0x2,0x2,0xF8,0x34,
-0x80,0x0,0x1F,0x84,0xC5,0x0,0xC9,0x40,0xF8,0x2B,0x80,0x83,0x8E,0x0,0x0,0x3F,0xC8,0x40,0x83,0x8C,0x2,0x1,0x1A,0x8D,0xF8,0x2B,0x80,0x2,0xC,0x81,0x2B,0x8A,0x51,0x1,0x83,0xCC,0x2,0x85,
-0x40,0x1,0xF8,0x27,0x80,0x3,0x40,0x94,0xC,0xC4,0x4B,0xFF,0x0,0x0,0x5,0x86,0xCD,0x0,0xF8,0x27,0x80,0x3,0x60,0x94,0x2C,0xD4,0xCB,0x40,0x0,0x7,0xF8,0x2E,0x80,0x3,0x60,0x9C,0x2C,0xDC,
-0xF8,0x3B,0x80,0x2,0x40,0x9C,0xC,0xC4,0x40,0x2,0x2,0x85,0x1,0x86,0x5F,0x3,0xF8,0x2D,0x80,0x83,0xCE,0x1,0x8F,0x14,0x1,0xF8,0x2B,0x80,0x0,0x1A,0x8E,0x15,0x3,0xC2,0x46,0x84,0xF,0x1,
-0xF0,0x29,0x5A,0x4,0x8B,0x2,0x3,0x8F,0x4,0x3,0xF8,0x23,0x40,0x1,0x1C,0x85,0x95,0x5E,0x3,0xF8,0x25,0xC0,0x0,0x16,0x98,0xA5,0x3,0x87,0x58,0x2,0xF8,0x5D,0x6,0xE4,0x40,0x0,0x3,0x93,
-0xD7,0x97,0x93,0x22,0x0,0x3,0xD7,0x80,0x80,0x97,0x34,0x0,0x3,0xD2,0x0,0x0,0x92,0xD0,0x33,0x22,0x80,0xC4,0x36,0x33,0x0,0x1,0xD7,0xD6,0x26,0x0,0x0,0x96,0xD0,0x51,0x1,0x5,0xFF,0xE4,
-0x2E,0x0,0x0,0x40,0x3E,0x0,0xDF,0x50,0x0,0xFE,0x3E,0x0,0x0,0xFD,0x25,0x0,0x0,0x9C,0x2C,0x0,0x43,0x4,0x0,0xC7,0x6,0x25,0x0,0x0,0x9B,0xE4,0x7A,0x0,0x0,0x52,0xD1,0xA1,0x31,0x0,
-0xF8,0x5B,0xA1,0x0,0xDC,0x3E,0x0,0x0,0xDB,0xF8,0x3C,0xA1,0x1,0x1,0x41,0x3D,0x0,0x0,0x1,0x9E,0xB0,0x8,0x0,0x1,0x9E,0x20,0x9,0x0,0x1,0x86,0x40,0x9,0xE4,0xD7,0x0,0x3,0xC1,0x3,
-0xC0,0x3,0xF8,0x3B,0x4,0x2,0xE1,0x3,0xE0,0xF8,0x3C,0x4,0xF8,0x3D,0x7E,0x0,0xC1,0xF8,0x3E,0x7E,0x0,0xE1,0xF8,0x3E,0x7E,0xF3,0xFF,0x40,0xC,0xF0,0x45,0x40,0xC,0x0,0xC2,0xCC,0xFC,0x0,
-0xC3,0xC8,0xFC,0xC7,0x18,0xDB,0x20,0x0,0xE2,0xC2,0xFC,0xC7,0x4,0x2,0xE0,0x3,0xE3,0xC4,0xFC,0xCF,0xC,0xDB,0x20,0xC5,0x7E,0x0,0xC2,0xC8,0x76,0xC5,0x7E,0xC7,0x10,0xC5,0x1C,0xDB,0x20,0xC7,
-0x7E,0xC3,0x7A,0x0,0xE3,0xC8,0x86,0xC9,0x14,0xDF,0x20,0xC3,0x7A,0xF8,0x3B,0x4,0xC3,0x7A,0xF8,0x3B,0x4,0xF8,0x3D,0x7E,0x0,0xC2,0xF8,0x3E,0x7E,0x0,0xE2,0xF0,0x80,0x81,0x12,0x0,0x0,0xFF
-]},
-'itemsounds.ips': {0x16126: [0x22,0xD3,0xEF,0x84,0x80,0x8],
-0x20BF2: [0x20,0xF0,0xEF],
-0x260B3: [0x9,0xF0,0x1],
-0x260D8: [0xFE,0xEF,0x37],
-0x260FD: [0xFE,0xEF,0x37],
-0x26122: [0xFE,0xEF,0x37],
-0x2614F: [0x9,0xF0,0x7],
-0x2617D: [0x9,0xF0,0x26],
-0x261AB: [0x11,0xF0,0xA],
-0x261D9: [0xFE,0xEF,0x2A],
-0x26207: [0x11,0xF0,0xF],
-0x26235: [0x9,0xF0,0x26],
-0x26263: [0x9,0xF0,0x26],
-0x26291: [0x11,0xF0,0x4],
-0x262C3: [0xFE,0xEF],
-0x262F8: [0x9,0xF0,0xF],
-0x2632D: [0xFE,0xEF,0x37],
-0x2635A: [0x9,0xF0,0x26],
-0x26388: [0xFE,0xEF,0x37],
-0x263B5: [0xFE,0xEF,0x2A],
-0x263E3: [0x9,0xF0,0xB],
-0x26411: [0xFE,0xEF],
-0x2643F: [0x9,0xF0,0x1],
-0x2646F: [0x9,0xF0,0x1],
-0x264A1: [0xFE,0xEF,0x37],
-0x264D3: [0xFE,0xEF,0x37],
-0x26505: [0xFE,0xEF,0x37],
-0x2653F: [0x9,0xF0,0x7],
-0x2657A: [0x9,0xF0,0x26],
-0x265B5: [0x11,0xF0,0xA],
-0x265F0: [0xFE,0xEF,0x2A],
-0x2662B: [0x11,0xF0,0xF],
-0x2666F: [0x9,0xF0,0x26],
-0x266AA: [0x9,0xF0,0x26],
-0x266E5: [0x11,0xF0,0x4],
-0x26720: [0xFE,0xEF],
-0x26762: [0x9,0xF0,0xF],
-0x267A4: [0xFE,0xEF,0x37],
-0x267DE: [0x9,0xF0,0x26],
-0x26819: [0xFE,0xEF,0x37],
-0x26853: [0xFE,0xEF,0x2A],
-0x2688E: [0x9,0xF0,0xB],
-0x268C9: [0xFE,0xEF],
-0x26904: [0x9,0xF0,0x1],
-0x2693A: [0x9,0xF0,0x1],
-0x26972: [0xFE,0xEF,0x37],
-0x269AA: [0xFE,0xEF,0x37],
-0x269E2: [0xFE,0xEF,0x37],
-0x26A22: [0x9,0xF0,0x7],
-0x26A63: [0x9,0xF0,0x26],
-0x26AA4: [0x11,0xF0,0xA],
-0x26AE5: [0xFE,0xEF,0x2A],
-0x26B26: [0x11,0xF0,0xF],
-0x26B67: [0x9,0xF0,0x26],
-0x26BA8: [0x9,0xF0,0x26],
-0x26BE9: [0x11,0xF0,0x4],
-0x26C2A: [0xFE,0xEF],
-0x26C72: [0x9,0xF0,0xF],
-0x26CBA: [0xFE,0xEF,0x37],
-0x26CFA: [0x9,0xF0,0x26],
-0x26D3B: [0xFE,0xEF,0x37],
-0x26D7B: [0xFE,0xEF,0x2A],
-0x26DBC: [0x9,0xF0,0xB],
-0x26DFD: [0xFE,0xEF],
-0x26E3E: [0x9,0xF0,0x1],
-0x26FD3: [0xAD,0xD7,0x5,0xC9,0x2,0x0,0xF0,0xE,0xA9,0x0,0x0,0x22,0xF7,0x8F,0x80,0xAD,0xF5,0x7,0x22,0xC1,0x8F,0x80,0xA9,0x0,0x0,0x8D,0xD7,0x5,0x6B,0xA9,0x1,0x0,0x8D,0xD7,0x5,0x22,0x17,0xBE,0x82,
-0xA9,0x0,0x0,0x60,0x20,0x19,0xF0,0x29,0xFF,0x0,0x22,0x49,0x90,0x80,0x60,0x20,0x19,0xF0,0x22,0xCB,0x90,0x80,0x60,0x20,0x19,0xF0,0x22,0x4D,0x91,0x80,0x60,0xA9,0x2,0x0,0x8D,0xD7,0x5,0xB9,
-0x0,0x0,0xC8,0x60],
-0x28089: [0x80,0x2],
-0x28491: [0x20,0x0]},
-'ln_chozo_sj_check_disable.ips': {0x2518F: [0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA]},
-'low_timer.ips': {0x18BCC: [0x20,0xFF],
-0x7FF20: [0xAF,0x20,0xD8,0x7E,0x89,0x0,0x40,0xF0,0x7,0xA9,0x20,0x0,0x8F,0x46,0x9,0x7E,0x60]},
-'max_ammo_display.ips': {0x19E1: [0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA,0xEA],
-0x1ACE: [0xEA,0xEA,0xEA,0xEA,0xAD,0xCC,0x9,0xF0,0x4,0xEA,0xEA,0xEA,0xEA,0xAD,0xD0,0x9,0xF0,0x4,0xEA,0xEA,0xEA,0xEA],
-0x1B0D: [0xA0,0xCD],
-0x1B1B: [0xAD,0xCD],
-0x1B29: [0xBA,0xCD],
-0x1C00: [0x20,0xC7,0xCD],
-0x4DA0: [0x20,0x78,0x9D,0xAD,0xC8,0x9,0xA2,0x14,0x0,0x20,0x78,0x9D,0x60,0x20,0x98,0x9D,0xAD,0xCC,0x9,0xA2,0x1C,0x0,0x20,0x98,0x9D,0x60,0x20,0x98,0x9D,0xAD,0xD0,0x9,0xA2,0x22,0x0,0x20,0x98,0x9D,0x60,
-0x48,0xDA,0x5A,0xAD,0xC8,0x9,0xF0,0x3,0x20,0xE9,0xCD,0xAD,0xCC,0x9,0xF0,0x3,0x20,0x40,0xCE,0xAD,0xD0,0x9,0xF0,0x3,0x20,0x82,0xCE,0x7A,0xFA,0x68,0xAD,0xC8,0x9,0x60,0x20,0xC4,0xCE,0xAD,
-0xD2,0x9,0xC9,0x1,0x0,0xF0,0x7,0xA9,0x0,0x14,0x85,0x18,0x80,0x5,0xA9,0x0,0x10,0x85,0x18,0xA6,0x12,0xBF,0x17,0xCF,0x80,0x5,0x18,0x8F,0x1C,0xC6,0x7E,0xA6,0x14,0xBF,0x17,0xCF,0x80,0x5,
-0x18,0x8F,0x1E,0xC6,0x7E,0xA6,0x16,0xBF,0x17,0xCF,0x80,0x5,0x18,0x8F,0x20,0xC6,0x7E,0xA9,0x49,0x0,0x5,0x18,0x8F,0x5C,0xC6,0x7E,0xA9,0x4A,0x0,0x5,0x18,0x8F,0x5E,0xC6,0x7E,0xA9,0x4B,0x0,
-0x5,0x18,0x8F,0x60,0xC6,0x7E,0x60,0x20,0xFA,0xCE,0xAD,0xD2,0x9,0xC9,0x2,0x0,0xF0,0x7,0xA9,0x0,0x14,0x85,0x18,0x80,0x5,0xA9,0x0,0x10,0x85,0x18,0xA6,0x14,0xBF,0x17,0xCF,0x80,0x5,0x18,
-0x8F,0x24,0xC6,0x7E,0xA6,0x16,0xBF,0x17,0xCF,0x80,0x5,0x18,0x8F,0x26,0xC6,0x7E,0xA9,0x34,0x0,0x5,0x18,0x8F,0x64,0xC6,0x7E,0xA9,0x35,0x0,0x5,0x18,0x8F,0x66,0xC6,0x7E,0x60,0x20,0xFA,0xCE,
-0xAD,0xD2,0x9,0xC9,0x3,0x0,0xF0,0x7,0xA9,0x0,0x14,0x85,0x18,0x80,0x5,0xA9,0x0,0x10,0x85,0x18,0xA6,0x14,0xBF,0x17,0xCF,0x80,0x5,0x18,0x8F,0x2A,0xC6,0x7E,0xA6,0x16,0xBF,0x17,0xCF,0x80,
-0x5,0x18,0x8F,0x2C,0xC6,0x7E,0xA9,0x36,0x0,0x5,0x18,0x8F,0x6A,0xC6,0x7E,0xA9,0x37,0x0,0x5,0x18,0x8F,0x6C,0xC6,0x7E,0x60,0x8D,0x4,0x42,0xE2,0x20,0xA9,0x64,0x8D,0x6,0x42,0x48,0x68,0x48,
-0x68,0xC2,0x20,0xAD,0x14,0x42,0xA,0x85,0x12,0xAD,0x16,0x42,0x8D,0x4,0x42,0xE2,0x20,0xA9,0xA,0x8D,0x6,0x42,0x48,0x68,0x48,0x68,0xC2,0x20,0xAD,0x14,0x42,0xA,0x85,0x14,0xAD,0x16,0x42,0xA,
-0x85,0x16,0x60,0x8D,0x4,0x42,0xE2,0x20,0xA9,0xA,0x8D,0x6,0x42,0x48,0x68,0x48,0x68,0xC2,0x20,0xAD,0x14,0x42,0xA,0x85,0x14,0xAD,0x16,0x42,0xA,0x85,0x16,0x60,0x45,0x0,0x3C,0x0,0x3D,0x0,
-0x3E,0x0,0x3F,0x0,0x40,0x0,0x41,0x0,0x42,0x0,0x43,0x0,0x44,0x0],
-0x28851: [0xF,0x28,0xF,0x28,0xF,0x28],
-0x28891: [0x49,0x30,0x4A,0x30,0x4B,0x30],
-0x28951: [0xF,0x28,0xF,0x28,0xF,0x28],
-0x28993: [0x34,0x30,0x35,0x30],
-0x28A4F: [0xF,0x28,0xF,0x28],
-0x28A8F: [0x36,0x30,0x37,0x30],
-0xD3542: [0x9F,0x7F,0xB2,0x7F,0xAE,0x73,0xAE,0x73,0xB2,0x7F,0x9F,0x7F,0xFF,0x80,0xFF,0x1,0xF1,0xFE,0xFD,0x2E,0x2B,0xF6,0xFB,0x26,0x2D,0xFE,0xF1,0xFE,0xFF,0x1,0xFF,0x80,0x83,0x7F,0x86,0x7F,0x8F,0x7A,0x8E,
-0x7B,0x87,0x7E,0x83,0x7F,0xFF,0x80,0xFF,0x1,0xC1,0xFE,0x61,0xFE,0xF1,0x5E,0x71,0xDE,0xE1,0x7E,0xC1,0xFE,0xFF,0x1],
-0xD35C0: [0x3C,0xC3,0x7C,0x9B,0x7C,0xBB,0x7C,0x9B,0x3C,0xDB,0x3C,0xDB,0x3C,0xC3,0x0,0xFF,0xFE,0x1,0xFF,0x7C,0x7F,0x86,0xFF,0x3C,0xFF,0x60,0xFF,0x7E,0xFF,0x0,0x0,0xFF,0xFE,0x1,0xFF,0x7C,0xFF,0x6,0x7F,
-0xBC,0xFF,0x6,0xFF,0x7C,0xFE,0x1,0x0,0xFF,0x3E,0xC1,0x7E,0x9D,0xFE,0x2D,0xFF,0x4C,0xFF,0x7E,0xFF,0xC,0x1E,0xE1,0x0,0xFF,0xFF,0x0,0xFF,0x7C,0xFE,0x61,0xFF,0x7C,0xFF,0x6,0xFF,0x7C,0xFE,
-0x1,0x0,0xFF,0x7E,0x81,0xFE,0x3D,0xFE,0x61,0xFF,0x7C,0xFF,0x66,0xFF,0x3C,0x7E,0x81,0x0,0xFF,0xFF,0x0,0xFF,0x7E,0xFF,0x6,0x3F,0xCC,0x3E,0xD9,0x3C,0xDB,0x3C,0xC3,0x0,0xFF,0x7E,0x81,0xFF,
-0x3C,0xFF,0x66,0xFF,0x3C,0xFF,0x66,0xFF,0x3C,0x7E,0x81,0x0,0xFF,0x7E,0x81,0xFF,0x3C,0xFF,0x66,0xFF,0x3E,0x7F,0x86,0x7F,0xBC,0x7E,0x81,0x0,0xFF,0x7E,0x81,0xFF,0x3C,0xFF,0x66,0xFF,0x66,0xFF,
-0x66,0xFF,0x3C,0x7E,0x81,0x0],
-0xD3691: [0x80,0x80,0x7F,0x87,0x7F,0x89,0x7E,0x89,0x7E,0x87,0x7F,0x80,0x7F,0xFF,0x80,0xFF,0x0,0xE3,0xFF,0x1F,0xFE,0xFF,0x21,0xE1,0x3F,0x1E,0xFF,0xE3,0xFF,0xFF,0x0,0xFF,0x1,0xF9,0xFE,0xF1,0x1E,0x21,0xFE,
-0xE1,0x3E,0x11,0xFE,0xF9,0xFE,0xFF,0x1]},
-'metalimals.ips': {0x1ADA0: [0xFD,0x92,0x0,0x5,0x3E,0x26,0x3,0x2,0x0,0x80,0xA2,0xB9,0x2B,0xB6,0x40,0x4,0x1,0x6,0x0,0x0,0x0,0x80,0x0,0x0,0x79,0x98,0x40,0x5,0x2E,0x6,0x2,0x0,0x0,0x80,0x0,0x0],
-0x798DC: [0x6,0xF0],
-0x7F000: [0xA0,0xAD,0xAC,0xAD],
-0x7F006: [0xA9,0x0,0xF0,0x8F,0xB5,0x7,0x7E,0x5C,0xBB,0x91,0x8F],
-0x7B650: [0x18,0xF0],
-0x7EFF0: [0xB8,0xAD,0xAC,0xAD],
-0x7F018: [0xAF,0x20,0xD8,0x7E,0x89,0x0,0x40,0xF0,0x12,0xA9,0x0,0x0,0x8F,0xBC,0xD8,0x7E,0xA9,0xF0,0xEF,0x8F,0xB5,0x7,0x7E,0x5C,0xF7,0x91,0x8F,0x60]},
-'moat.ips': {0x21BD80: [0xD5,0x3A,0x1,0x11,0x85],
-0x21BD92: [0xC5,0x44,0xC9,0x36,0xC3,0x4E,0xC5,0x6,0x2,0x85,0x19,0x85,0x49,0x31,0x9,0x2,0x34,0xD,0x34,0xCE,0xA,0xC9,0x12,0x7,0x17,0x19,0x18,0x19,0x14,0x89,0x14,0x8D,0xC6,0x48,0xC4,0x42,0xC2,0xB8,0x4,
-0x19,0x17,0x1D,0x31,0x1,0xC5,0x3A,0x0,0x34,0x43,0xD,0x37,0x0,0x9,0xC5,0x42,0x1,0x39,0x5,0xC5,0xA,0xC3,0x8,0x0,0x38,0x43,0x9,0x34,0xC4,0x5A,0x0,0x17,0xC2,0x2E,0x0,0x17,0xC2,0x46,
-0xC3,0xF4,0x2,0x18,0x8D,0xF,0xC2,0xB8,0xC6,0x74,0x6,0x1,0x37,0xD,0x39,0x1,0x39,0x5,0x43,0xFF,0x0,0x0,0x39,0xC4,0x4E,0x1,0x37,0xD,0xC3,0xA,0xC5,0x8,0x3,0xFF,0x0,0x37,0x9,0xC3,
-0x20,0xC4,0x9E,0x5,0x5,0x31,0x9,0x16,0x89,0xF,0xC2,0xD0,0x3,0x40,0x94,0xC,0xC4,0xC3,0x6E,0xC3,0x6A,0xC3,0x2E,0xC5,0x6,0xC3,0x2C,0xC3,0x14,0xC7,0x36,0x49,0xFF,0x0,0xC7,0x44,0x0,0x38,
-0xC2,0x4C,0x7,0xC,0xC0,0x40,0x90,0x60,0x94,0x2C,0xD4,0xCF,0x24,0xC5,0x2E,0xC7,0x8A,0xD1,0x4,0xC7,0xA4,0x7,0x2C,0xD0,0x60,0x90,0x60,0x9C,0x2C,0xDC,0xD5,0x26,0xD3,0x54,0xCD,0x1A,0x6,0x2C,
-0xD8,0x60,0x98,0x40,0x9C,0xC,0xD6,0x40,0xDB,0x16,0x11,0x2A,0x1,0x2E,0x5,0x2E,0x1,0xC,0xD8,0x40,0x98,0x18,0x85,0xF,0x81,0xF,0x11,0xE,0x15,0xD3,0xAA,0x1,0x5D,0x80,0xD5,0xC0,0xA,0xD,
-0x81,0xC,0x81,0xA,0x81,0xB,0x81,0xC,0x85,0x18,0x46,0x81,0x11,0x1,0x10,0x85,0xD3,0xEA,0x0,0x5F,0xD6,0x40,0x2,0xE,0x19,0xF,0x85,0x3B,0x1,0x87,0xB9,0x0,0x2,0x81,0x14,0x85,0xD3,0x82,
-0x0,0xBD,0xD6,0x80,0xC3,0xFC,0x1,0xE2,0x8A,0xCB,0x40,0x3,0x11,0x81,0xC2,0x8E,0xD1,0xFE,0x0,0xBE,0xDA,0x40,0x2,0xC2,0x8A,0x12,0x85,0x71,0x0,0xC6,0xC2,0x1,0xA2,0x86,0xF8,0x2D,0x40,0x2,
-0xC5,0x1A,0xE5,0xC5,0x42,0xC6,0x80,0x3,0xE5,0x86,0xC5,0x16,0xD0,0xC0,0x0,0x88,0x5B,0xFF,0x0,0x1,0xA2,0x82,0xCB,0xC0,0xD3,0x82,0x9B,0x1E,0x3,0xC3,0x40,0xCB,0x80,0x0,0x12,0xD2,0xC2,0xDB,
-0xC0,0xC5,0xC2,0xCB,0x80,0xC5,0xC2,0x1,0xF7,0x2,0xF8,0x27,0x40,0x2,0xFF,0x0,0xC2,0xC3,0x82,0xCA,0x2,0x0,0xC2,0xC2,0xC2,0x1,0x17,0x3,0xF0,0x27,0xD4,0x3,0x3,0xFF,0x0,0x22,0x83,0xCB,
-0x80,0x0,0x12,0x84,0x49,0x3,0xCC,0x40,0xD2,0xC0,0xCB,0xA0,0x0,0xC2,0xCC,0xC0,0xC3,0xC2,0x1,0xA5,0x82,0x43,0xA5,0x12,0x87,0xCC,0x3,0xD3,0xC0,0xC9,0xA0,0x2,0xC5,0x12,0xE5,0xCE,0xC0,0xC3,
-0x84,0x8B,0x48,0x4,0xDD,0x40,0x0,0xC2,0x8E,0xFD,0x3,0xC7,0x3E,0x85,0x88,0x3,0xC3,0xA8,0x93,0xDE,0x3,0xCA,0x40,0x8C,0xBD,0x3,0xCB,0x84,0x83,0xCA,0x3,0xC3,0xA8,0x1,0x5F,0xC0,0xD1,0xF6,
-0xC7,0xC0,0xC3,0xBE,0xCF,0x80,0x8D,0x44,0x5,0x4,0xA4,0x86,0x5F,0x10,0xA4,0x86,0x55,0x5,0xC9,0xF6,0xC7,0xC0,0xC3,0xBE,0xD5,0x80,0xC9,0xC8,0x89,0x48,0x4,0xCF,0x40,0x2,0xE,0x11,0x14,0x87,
-0x71,0x0,0x5E,0x81,0x11,0xD1,0x40,0x3,0xC5,0x12,0xA4,0x16,0xC8,0x3E,0xF8,0x20,0x40,0x85,0xCA,0x3,0xC9,0xF6,0x0,0xA5,0x85,0x7D,0x5,0x8B,0x7D,0x0,0xD9,0x82,0xC2,0xA2,0x83,0x14,0x6,0x43,
-0xA5,0x82,0x5,0xA4,0x86,0xA3,0x82,0xA4,0x82,0x88,0x7E,0x5,0x95,0x73,0x0,0xD6,0x44,0x86,0x7C,0x6,0xC6,0x6,0xC9,0x8,0xDE,0x44,0xE8,0x24,0x85,0x11,0xE4,0x4E,0x0,0x26,0x1,0xE4,0x21,0x0,
-0x1,0x92,0x93,0x28,0x0,0x1,0x93,0xD2,0xD5,0x22,0x1,0xD2,0x92,0xE4,0x23,0x0,0x0,0x41,0x3B,0x0,0x3,0x40,0x1,0x0,0xFF,0x3B,0x0,0x3,0xFF,0x1,0x0,0xFE,0x3B,0x0,0x3,0xFE,0x1,0x0,
-0xFD,0x3B,0x0,0x0,0xFD,0xC2,0xEA,0x1,0x13,0x52,0xE4,0x35,0x0,0x89,0x7A,0x8,0xF8,0x36,0x41,0xF8,0x21,0x62,0xF8,0xC0,0x61,0x29,0x0,0x0,0x13,0x93,0x44,0x9,0x0,0x12,0xE4,0x4C,0x0,0xD0,
-0xC5,0xD1,0x5F,0xD4,0x86,0x37,0x0,0xDD,0x9E,0x1,0x12,0x13,0xDB,0x86,0xD7,0x1E,0xE4,0x50,0x0]},
-'nova_boost_platform.ips': {0x236CC3: [0xDF,0x40,0x1,0x16,0x8D,0x5D,0x13,0x89,0x1,0x16,0x89,0xD3,0x2A,0xC9,0x16,0x46,0xD,0x85,0xD8,0xA6,0x3,0x14,0x85,0x8,0x81,0x4E,0xC,0x85,0x3,0x15,0x23,0x15,0x3,0x43,0x11,0x23,0x5,0x15,0x23,
-0x11,0x8,0x15,0x14,0xCB,0x2A,0xC5,0x14,0x3,0x11,0x8,0x85,0x1A,0xC9,0x7A,0xC8,0x60,0xCD,0xAA,0xC7,0x98,0x3,0x14,0x85,0x5,0x81,0x59,0xFF,0x0,0x2,0x1F,0x11,0x1A,0xC4,0xC2,0xC3,0xE6,0x3,
-0x1A,0x8D,0x1F,0x15,0xC3,0x2A,0x2,0x6,0x81,0x22,0xC2,0x7E,0x1,0x8,0x85,0xC6,0x7A,0x46,0x85,0xD,0x3,0x16,0x8D,0x1A,0x8D,0xC3,0x80,0x43,0x3,0x11,0xC3,0x98,0xC5,0x38,0x4,0xD,0x81,0x1A,
-0x8D,0x7,0xC2,0x60,0x6,0x4,0x15,0x2,0x85,0x1,0x85,0x6,0xD0,0x6A,0x0,0x3F,0xC4,0x2A,0xC3,0x5C,0x4,0x8,0x81,0x8,0x15,0x3F,0xC4,0x60,0xC5,0x8E,0x0,0x7,0xCC,0x60,0xC5,0x5E,0x0,0x25,
-0xC8,0x20,0x0,0x25,0xC6,0xE4,0x4,0x13,0x89,0xC,0x81,0x2,0xC6,0xC0,0x4,0x1F,0x11,0x1C,0x81,0x1D,0xD0,0x64,0x1,0x9,0x1,0xC2,0x2C,0xC2,0x98,0x3,0x22,0x15,0x9,0x1,0xD3,0xDA,0xC5,0xC0,
-0x3,0x14,0x85,0xE,0x81,0xC5,0xDE,0xC7,0xFE,0x3,0x2,0x85,0x8,0x85,0x43,0xC,0x81,0x3,0x40,0x94,0xC,0xC4,0xC8,0xAC,0xC2,0x26,0xC3,0x64,0x0,0x1,0xC2,0x74,0x1,0x4,0x11,0xCB,0x64,0x51,
-0xFF,0x0,0xC7,0xDA,0xC7,0x60,0x1,0x8,0x81,0xCB,0xDE,0xC5,0x9A,0x7,0xC,0xC0,0x40,0x90,0x60,0x94,0x2C,0xD4,0xC9,0xF4,0x5,0x1A,0x81,0x13,0x81,0x1A,0x85,0x83,0x84,0x1,0xF8,0x21,0x2,0x84,
-0x56,0x1,0x85,0x79,0x1,0xC2,0xC0,0xD3,0x34,0x7,0x2C,0xD0,0x60,0x90,0x60,0x9C,0x2C,0xDC,0xC7,0xF8,0x0,0x5,0x84,0x5B,0x1,0x9D,0x22,0x1,0xCD,0xCA,0x0,0x25,0x85,0xDF,0x0,0xC2,0xC0,0xD3,
-0x34,0x6,0x2C,0xD8,0x60,0x98,0x40,0x9C,0xC,0xC8,0x60,0x83,0xBA,0x1,0x83,0x6A,0x1,0x8D,0x2C,0x2,0xDD,0xCC,0x85,0x40,0x1,0xD5,0xC0,0xF,0xC,0xD8,0x40,0x98,0x1D,0x81,0x1C,0x85,0x1D,0x81,
-0x0,0x81,0x1,0xC1,0x0,0x51,0x83,0xF6,0x0,0x0,0x2D,0x8C,0x89,0x2,0x85,0x88,0x1,0x91,0x54,0x2,0x8C,0x96,0x1,0xC2,0xF6,0x2,0x14,0x85,0x1C,0x8A,0x8D,0x1,0xC3,0x36,0x3,0x0,0x85,0x1C,
-0x81,0xC2,0x5C,0x84,0xB1,0x2,0x1,0x8,0x81,0x85,0xCE,0x1,0xC2,0xEE,0x2,0x85,0x39,0x89,0xCF,0xEA,0x3,0x5,0x85,0x19,0x81,0x9B,0x24,0x1,0xC4,0xF6,0x0,0x85,0x8F,0xB4,0x2,0x85,0xAE,0x2,
-0x0,0x13,0x84,0xBF,0x0,0xC9,0xDC,0x0,0x7,0xC2,0x60,0xCF,0xEA,0xD3,0x14,0xCD,0x80,0x93,0x44,0x3,0xC4,0x16,0x84,0x5F,0x0,0x8B,0x74,0x3,0x2,0x1F,0x11,0x19,0xD3,0xC0,0x0,0x89,0x9B,0x76,
-0x3,0xC3,0xC0,0x86,0xE6,0x2,0x0,0x4,0x91,0xB0,0x1,0x8D,0x88,0x2,0x83,0x4C,0x2,0x0,0x8,0x8E,0x57,0x2,0x0,0x7,0x92,0x89,0x2,0xF8,0x29,0xC0,0xD1,0xD8,0xD1,0xC0,0x9D,0x16,0x3,0x83,
-0x40,0x1,0x1,0x3C,0x81,0x8F,0x74,0x3,0x87,0x40,0x1,0x8F,0xE8,0x2,0x0,0x7,0x90,0xB5,0x2,0xD1,0x12,0x91,0xF4,0x3,0x1,0x39,0x81,0xCF,0xE4,0x85,0x2,0x4,0x83,0x80,0x1,0xCF,0x78,0xD1,
-0xC0,0x9F,0x76,0x3,0x0,0x7,0xC2,0x60,0xD1,0x84,0x85,0xBA,0x1,0xD1,0x78,0xCB,0xD0,0x83,0x88,0x1,0x9D,0x66,0x5,0xC5,0x82,0x0,0x39,0x92,0x47,0x4,0x85,0xE,0x3,0xD1,0xFC,0x1,0x27,0x85,
-0xDD,0x10,0xF8,0x2D,0xC0,0xD1,0x78,0x0,0x27,0xCE,0xEA,0xCF,0x10,0xDD,0xC0,0x2,0x2B,0x85,0x2B,0xC6,0xCA,0xF8,0x49,0xC0,0x2,0x1F,0x11,0x38,0x8E,0x2B,0x2,0x89,0x3C,0x1,0x2,0x8,0x89,0x24,
-0x8E,0xED,0x3,0x1,0x6,0x8D,0x8D,0x58,0x2,0x1,0x26,0x89,0xDF,0xC0,0x3,0x3F,0x11,0x8,0x11,0x91,0x68,0x5,0x85,0x2,0x4,0x0,0x1A,0x90,0x23,0x1,0x1,0xC1,0x2,0xDD,0x10,0xD3,0xCE,0xD5,
-0x24,0x83,0xBA,0x1,0x91,0xE8,0x2,0xF8,0x49,0x60,0x83,0xE,0x3,0x1,0x14,0x85,0x8F,0x42,0x8,0xF8,0x4D,0xC0,0x83,0x68,0x4,0x8D,0x24,0x1,0xF8,0x4D,0xC0,0x83,0xC0,0x0,0xE8,0x59,0x40,0x81,
-0x88,0x10,0x3,0x4A,0x80,0xFF,0x0,0x74,0xCC,0xE,0xCF,0x10,0xCF,0x1E,0xDB,0x16,0x85,0xBA,0x1,0x84,0xE8,0x2,0xF8,0x54,0x60,0x8A,0xE,0x3,0xF8,0x5C,0xC0,0x43,0x1D,0x81,0x83,0xC4,0x3,0xF8,
-0x33,0x4,0x0,0x1D,0x83,0x1B,0x4,0xD8,0x4,0x1,0x14,0x81,0xE4,0x68,0x0,0x6,0x93,0xD7,0x80,0x97,0xD7,0x97,0x93,0xC7,0xD,0xC7,0xA,0x3E,0x0,0x0,0x9C,0x25,0x0,0x0,0xDC,0x22,0x0,0x1,
-0x96,0x97,0xCC,0x4D,0x0,0x80,0xC8,0x42,0x0,0x80,0x2A,0x0,0x0,0x9B,0xC4,0x61,0x1,0x93,0xDB,0xCE,0x7C,0x0,0xD2,0x23,0x0,0x0,0x92,0xCF,0x56,0x24,0x0,0x3,0x92,0x93,0xD7,0xD6,0xCF,0x17,
-0xC3,0x6F,0x27,0x0,0x0,0x41,0xC3,0x56,0xD1,0x69,0xC9,0x6D,0x22,0x0,0xC8,0x6F,0x3,0x40,0x1,0x0,0xFF,0x3A,0x0,0x0,0x96,0xCF,0xF6,0x3,0xFF,0x1,0x0,0xFE,0x3C,0x0,0x0,0x92,0xCD,0x31,
-0x3,0xFE,0x1,0x0,0xFD,0xD3,0xA5,0x90,0x97,0xC,0x26,0x0,0x1,0xFD,0x1,0x23,0x0,0x0,0x1,0xC4,0x94,0xC4,0xA5,0xC5,0xC3,0xCA,0xC9,0xC6,0xDB,0xCB,0xDE,0x0,0xD2,0x8B,0xEB,0xC,0xE4,0x51,
-0x0,0xC4,0xB8,0xCB,0xA7,0xD5,0xC9,0x28,0x0,0xC4,0xB8,0xC3,0xA7,0xC7,0xB6,0x8E,0xD8,0xC,0xE4,0x2E,0x0,0xC3,0x7A,0xC6,0x72,0x8D,0xD2,0xD,0x36,0x0,0xC3,0x7A,0xC6,0x72,0xC3,0x85,0xD1,0x3C,
-0xF8,0x23,0xBF,0x8B,0x25,0xD,0xF8,0x3D,0xBF,0xE4,0x61,0x0,0x0,0x9C,0xC9,0xD2,0xC3,0xE5,0x0,0x52,0x91,0x3,0xE,0x8F,0x30,0xD,0xC8,0xD2,0x89,0x2,0xE,0xE4,0x5A,0x0,0xC9,0x91,0xE5,0x43,
-0x0,0x3,0xC1,0x3,0xC0,0x3,0xF8,0x5B,0x4,0x2,0xE1,0x3,0xE0,0xF8,0x5C,0x4,0xF8,0x5D,0xBE,0x0,0xC1,0xF8,0x5E,0xBE,0x0,0xE1,0xF8,0x5E,0xBE,0xF3,0xFF,0x60,0x12,0xF2,0x65,0x60,0x13,0x0,
-0xC2,0xCC,0xC6,0x0,0xC3,0xC8,0xD2,0xC7,0x18,0xF8,0x3B,0x20,0x0,0xE2,0xC2,0xC2,0xC7,0x4,0x2,0xE0,0x3,0xE3,0xC4,0xCE,0xCF,0xC,0xF8,0x3B,0x20,0xC5,0xBE,0x0,0xC2,0xC8,0xB6,0xC5,0xBE,0xC7,
-0x10,0xC5,0x1C,0xF8,0x3B,0x20,0xC7,0xBE,0xC3,0xBA,0x0,0xE3,0xC8,0xC6,0xC9,0x14,0xF8,0x3F,0x20,0xC3,0xBA,0xF8,0x5B,0x4,0xC3,0xBA,0xF8,0x5B,0x4,0xF8,0x5D,0xBE,0x0,0xC2,0xF8,0x5E,0xBE,0x0,
-0xE2,0xF0,0xC0,0xC1,0x1B,0x0,0x0],
-0x2370F4: [0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,
-0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF,0xFF]},
-'phantoonimals.ips': {0x1ADA0: [0xFD,0x92,0x0,0x5,0x3E,0x26,0x3,0x2,0x0,0x80,0xA2,0xB9,0x13,0xCD,0x40,0x4,0x1,0x6,0x0,0x0,0x0,0x80,0x0,0x0,0x79,0x98,0x40,0x5,0x2E,0x6,0x2,0x0,0x0,0x80,0x0,0x0],
-0x798DC: [0x6,0xF0],
-0x7F000: [0xA0,0xAD,0xAC,0xAD],
-0x7F006: [0xA9,0x0,0x0,0x8F,0x2B,0xD8,0x7E,0xA9,0x0,0xF0,0x8F,0xB5,0x7,0x7E,0x5C,0xBB,0x91,0x8F],
-0x7CD3D: [0x18,0xF0],
-0x7EFF0: [0xB8,0xAD],
-0x7F018: [0xAF,0x20,0xD8,0x7E,0x89,0x0,0x40,0xF0,0x12,0xA9,0x0,0x0,0x8F,0xC0,0xD8,0x7E,0xA9,0xF0,0xEF,0x8F,0xB5,0x7,0x7E,0x5C,0xD0,0xC8,0x8F,0x5C,0xD0,0xC8,0x8F]},
-'red_tower.ips': {0x2304F7: [0xC4,0x14,0x0,0x66,0xC2,0x1A,0x4,0x2,0x85,0x2,0x81,0x47,0xC6,0xC,0x0,0x67,0xC6,0x2A,0x0,0x47,0xC4,0x1A,0x2,0x65,0x81,0x27,0xC2,0x12,0x2,0x2,0x85,0x20,0x5C,0x81,0x24,0x2,0x20,0x85,0x22,
-0x44,0x81,0x42,0x10,0x43,0x81,0x4E,0x1,0x4C,0x5,0x4B,0x1,0x69,0x1,0xFF,0x0,0x69,0x5,0x4B,0x5,0x43,0x46,0x85,0x42,0xA,0x22,0x85,0x0,0x81,0x4,0x81,0x1,0x81,0xFF,0x0,0x4E,0xC2,0x1A,
-0x2,0xFF,0x0,0x4A,0xC2,0x20,0xC,0x4A,0x5,0xFF,0x0,0x4C,0x1,0x4E,0x1,0x1,0x85,0x4,0x85,0x0,0xC4,0x60,0x0,0x21,0xC8,0x20,0x4,0x4B,0x1,0x6B,0x1,0x4B,0xC2,0x20,0xC3,0x30,0x4,0x21,
-0x85,0x24,0x85,0x20,0xC2,0x40,0x3,0x1,0x81,0x2D,0x7,0xC7,0x40,0x2,0xFF,0x0,0x6C,0xC6,0x8,0xC3,0x50,0x6,0xC,0xC0,0x40,0x90,0x2,0x81,0x3,0xC2,0x5E,0xC8,0x40,0x4,0x9,0x6B,0x9,0x4B,
-0xD,0xC7,0x20,0x2,0x2C,0xD0,0x60,0xCE,0x20,0x1,0x4A,0x9,0xC2,0x84,0xC9,0x20,0x3,0xD8,0x60,0x98,0x20,0xC4,0x7E,0xC5,0xA0,0x2,0x4B,0x9,0x69,0xC2,0x20,0x1,0x69,0xD,0xC3,0x42,0xC4,0x60,
-0x5,0xD8,0x40,0x98,0x40,0x81,0x41,0x48,0x81,0x42,0x5,0x43,0x81,0x43,0xC5,0x43,0x51,0xC7,0xDC,0xA,0x42,0x85,0x41,0x85,0x40,0x85,0x60,0x81,0x61,0x81,0x8,0x44,0x81,0x62,0xC5,0x3E,0xC3,0xE6,
-0x3,0x69,0xD,0x62,0x85,0x43,0x8,0x81,0x2,0x43,0x85,0x60,0x86,0x81,0x0,0x0,0x6,0xC2,0xC6,0xC3,0x7C,0xC7,0x2,0xC3,0xFC,0xC3,0x2,0x87,0xA0,0x0,0x0,0x26,0xC2,0x86,0xC7,0x3E,0x5,0xFF,
-0x0,0x2D,0x3,0x3,0x85,0x83,0x1C,0x0,0x2,0x47,0x81,0x2,0xC4,0x40,0xC3,0x2,0x83,0x86,0x0,0xC9,0x20,0x83,0xBC,0x0,0xC3,0x2,0x0,0x20,0x88,0x41,0x0,0x0,0x21,0x84,0xC5,0x0,0xC7,0x62,
-0xC3,0x80,0xC3,0xA8,0x83,0x80,0x0,0xC5,0x7E,0x0,0x62,0xCA,0x40,0xC3,0x80,0x1,0x6,0x85,0x87,0x9C,0x0,0xC5,0x7E,0xCD,0x20,0x3,0x21,0x85,0x26,0x85,0x87,0xBC,0x0,0xD1,0x80,0xC3,0x60,0x85,
-0x78,0x0,0xA,0x22,0x85,0x2,0x81,0x65,0x85,0x47,0x8D,0x67,0x81,0x3,0xCC,0x80,0xCD,0xE0,0xC5,0xA0,0xCB,0xC0,0x6,0x3,0x85,0x47,0x81,0x27,0x81,0x66,0xC4,0xE0,0x0,0x1,0x44,0x81,0x8,0x1,
-0x62,0x81,0x83,0x70,0x0,0x8B,0xB0,0x1,0xC3,0x22,0x83,0x20,0x0,0x2,0x3,0x81,0x44,0xC4,0x20,0x83,0x90,0x0,0xC9,0xA0,0x89,0xDA,0x1,0x0,0x21,0xC2,0x40,0x43,0x44,0x81,0x85,0x6E,0x0,0xC3,
-0xFE,0x1,0x69,0x5,0xC2,0x12,0xC4,0xA2,0x85,0x80,0x0,0xC7,0xC0,0xC7,0x42,0x0,0x4A,0xC2,0x20,0xC3,0x22,0xC3,0x78,0x87,0x22,0x0,0x83,0xE4,0x0,0x89,0x6E,0x0,0xC9,0xC0,0xC2,0xE0,0xC2,0xA8,
-0x0,0x27,0xC6,0xE0,0x87,0x90,0x0,0xC3,0xA0,0x83,0x2C,0x0,0xC3,0xA0,0x0,0x7,0xC2,0xAA,0x87,0x68,0x2,0x87,0xB0,0x0,0xC3,0xE0,0x87,0x1C,0x0,0x43,0x66,0x81,0x0,0x65,0x86,0xE3,0x0,0x87,
-0xD0,0x0,0xC9,0xC0,0x0,0x2,0x84,0x9B,0x2,0xC5,0x80,0x87,0xEE,0x0,0x1,0x2D,0x3,0x45,0x8,0x81,0x0,0x43,0xC2,0xC0,0x8D,0xE2,0x1,0x87,0x10,0x1,0xC9,0xA0,0x85,0x62,0x0,0x83,0x66,0x0,
-0x8B,0x2C,0x1,0xC9,0x60,0x89,0xC2,0x1,0x1,0x2D,0x7,0x87,0x8C,0x1,0x1,0x4A,0xD,0x93,0x78,0x2,0x8B,0x6C,0x1,0xC9,0xA0,0x87,0x62,0x0,0x0,0x44,0x8C,0x8B,0x1,0x85,0xFA,0x2,0x8D,0xFE,
-0x2,0x89,0xAC,0x1,0x0,0x69,0x83,0x37,0x3,0xC4,0x78,0x83,0x40,0x3,0x85,0x36,0x0,0x87,0x8A,0x3,0xC4,0x80,0x0,0x5,0x84,0xB8,0x1,0x0,0x85,0x8B,0x3E,0x0,0x0,0x21,0x88,0xAB,0x2,0x83,
-0x74,0x0,0x1,0x3,0x85,0xC3,0x1E,0x2,0x65,0x85,0x2,0xC8,0xE0,0xC2,0xE6,0x2,0xF1,0x43,0x51,0xC5,0x3E,0x8B,0xD6,0x2,0x89,0xE2,0x3,0x89,0x6E,0x0,0x84,0x96,0x1,0xC6,0x80,0x8C,0x2,0x4,
-0x86,0x91,0x0,0x85,0x56,0x3,0xCF,0x80,0x1,0x2D,0x7,0x89,0xB0,0x0,0xC2,0x60,0xC3,0x98,0x86,0xBF,0x0,0x83,0x88,0x1,0x0,0x44,0xC4,0xC0,0x85,0xD2,0x0,0x1,0x2D,0xB,0xC9,0xE0,0x87,0x22,
-0x2,0xC3,0x20,0x87,0xF0,0x0,0x1,0x2D,0xB,0xC5,0xE0,0xC5,0xC0,0x0,0x43,0x44,0x81,0x8,0xC3,0x40,0x89,0x10,0x1,0x2,0x3,0x85,0x27,0xC6,0x80,0xCA,0xC0,0x8A,0x2F,0x1,0x2,0x3,0x85,0x7,
-0xC6,0x40,0xC2,0xC0,0x44,0x85,0x4,0x89,0x8A,0x1,0xC3,0x42,0xC6,0xA0,0x0,0x81,0x83,0xA0,0x3,0xC3,0x68,0x83,0x28,0x3,0xC3,0x3E,0x4,0x43,0xF5,0x42,0x55,0x42,0xC3,0x4,0x88,0x79,0x0,0xC2,
-0xE0,0x44,0x85,0x24,0x8B,0xEA,0x1,0x84,0x16,0x4,0x89,0xFB,0x4,0xC4,0x5E,0xC5,0xE0,0x87,0x70,0x1,0x83,0x98,0x2,0xC3,0x56,0x84,0x20,0x0,0xC4,0x5E,0xCB,0x20,0xCB,0x80,0xC5,0x60,0x85,0x68,
-0x5,0x8B,0x4E,0x4,0xC5,0x62,0xC7,0x60,0xC3,0xC0,0x8B,0xEC,0x1,0x0,0x44,0x83,0x3B,0x2,0xCA,0x40,0xC3,0xA0,0x8B,0xCC,0x1,0xDE,0xA0,0x0,0x5,0xC5,0xA0,0x83,0xBE,0x4,0xD3,0x80,0x87,0x96,
-0x4,0x83,0xBE,0x1,0x8A,0x42,0x1,0x2,0xF1,0x42,0x51,0x83,0xCC,0x4,0x87,0xB4,0x4,0x83,0xBA,0x5,0xC5,0x20,0x5,0x61,0x81,0xD,0x9,0x69,0x9,0x89,0xE,0x3,0xCB,0xE0,0xC3,0xC0,0x1,0x1,
-0x81,0x84,0x2A,0x1,0x8A,0xED,0x4,0x89,0x58,0x4,0x83,0x82,0x3,0x0,0x3,0xC4,0x20,0x89,0x8E,0x0,0x8B,0xF6,0x4,0x83,0x62,0x2,0xC7,0x20,0x87,0xB0,0x0,0x84,0xD6,0x1,0x8A,0x5B,0x6,0x0,
-0x21,0xC6,0x40,0x88,0x4E,0x5,0x88,0xB7,0x6,0x85,0xC0,0x5,0x0,0x1,0xC2,0xA0,0x8D,0xEC,0x0,0xC2,0xC0,0x84,0x23,0x0,0x85,0xE0,0x6,0xC7,0x40,0x8B,0x8E,0x5,0x85,0x36,0x0,0x85,0xA0,0x2,
-0x91,0x28,0x1,0xCB,0x80,0x87,0xA6,0x0,0x87,0x8C,0x1,0x84,0xF0,0x5,0x88,0x79,0x0,0x7,0x64,0x81,0x62,0x81,0x2D,0x7,0x4E,0x1,0x8B,0x6C,0x1,0x3,0x4B,0xD,0x69,0xD,0x83,0x28,0x7,0x2,
-0x1,0x85,0x0,0xC8,0x20,0x8B,0x8C,0x1,0xC3,0x84,0x1,0x4E,0x1,0xC3,0xE6,0x85,0xC0,0x0,0xC3,0x80,0x89,0xAC,0x1,0xC5,0x84,0xC2,0x12,0x0,0x5,0xC3,0x40,0xC9,0x80,0xCB,0x2,0x0,0x4A,0xC2,
-0x20,0x1,0x4A,0x5,0xC3,0x40,0x3,0x40,0x94,0xC,0xC4,0xD1,0x20,0x0,0x69,0xC2,0x40,0x83,0xB4,0x0,0x5,0x5,0x85,0x60,0x94,0x2C,0xD4,0xD2,0x20,0x0,0x5,0xC2,0x72,0xC2,0xF4,0x5,0x45,0x85,
-0x60,0x9C,0x2C,0xDC,0xD2,0x60,0xC2,0x20,0x83,0x90,0x0,0x4,0x45,0x85,0x40,0x9C,0xC,0xC4,0x20,0x89,0xAC,0x2,0x85,0x72,0x0,0xC2,0xF2,0xC2,0x42,0xC2,0x20,0x84,0x43,0x1,0x7,0x43,0x81,0x43,
-0xF5,0x42,0x51,0x42,0xF5,0x87,0x52,0x1,0x83,0x68,0x0,0xC2,0xE8,0xC2,0x20,0x83,0x62,0x1,0xC3,0xEE,0x8B,0xEC,0x2,0xC3,0x9A,0x85,0x48,0x7,0x0,0x45,0x88,0x41,0x8,0x8B,0xC,0x3,0x89,0xE6,
-0x0,0xC5,0x20,0xC7,0x2E,0x89,0xEE,0x4,0xC5,0xF2,0x1,0x2D,0x3,0xCB,0x20,0x8B,0x6C,0x7,0xC9,0x40,0x89,0x2,0x8,0x8B,0xAE,0x0,0xC9,0x60,0x85,0xE2,0x0,0x8F,0xCA,0x0,0x2,0xFF,0x0,0xD,
-0xC4,0xF0,0x0,0x25,0x8C,0xA1,0x8,0x89,0xF0,0x0,0x84,0xB6,0x6,0x84,0x9D,0x0,0x2,0x5,0x81,0x6D,0xC9,0x80,0x88,0x11,0x1,0x83,0xB6,0x1,0x85,0x3C,0x0,0x3,0x25,0x81,0x6D,0x89,0x91,0x28,
-0x1,0x87,0xD6,0x2,0x89,0x80,0x8,0x89,0x2A,0x8,0xC5,0x42,0x0,0x6D,0x8A,0x1B,0x2,0xC3,0xEE,0x8D,0x4A,0x8,0xC2,0x20,0x0,0x8D,0x89,0xBC,0x0,0xC3,0xEE,0xC7,0xF8,0xC7,0x42,0xC3,0xA0,0x0,
-0x8E,0x84,0x7F,0x4,0x83,0x6A,0x2,0x85,0xDA,0x8,0x8B,0x8E,0x8,0xC3,0x80,0x0,0x8C,0x84,0xDF,0x5,0xC6,0x20,0xC4,0xD8,0x87,0x98,0x1,0xC5,0x6,0x0,0x8C,0x86,0x5F,0x5,0xC4,0x60,0xCA,0xB6,
-0xC7,0x4,0xC3,0x40,0xC7,0xC0,0xC7,0xD8,0x87,0x38,0xA,0xC7,0x40,0xC7,0x80,0xC7,0xD8,0x87,0xF6,0x7,0x83,0x16,0x0,0x0,0x8C,0x84,0x3F,0x0,0x87,0xA6,0x0,0xC5,0xD8,0x83,0xD6,0x6,0x87,0x18,
-0x0,0xC3,0x20,0x8B,0xE2,0x9,0xC3,0xD8,0x83,0x96,0x4,0x85,0x38,0x0,0xCB,0x40,0x85,0x1A,0xA,0x85,0xB0,0x0,0xC5,0x40,0xC3,0x44,0xC5,0x40,0x49,0x4,0x81,0x1,0x1,0x81,0x83,0xD2,0x0,0xC3,
-0x60,0x85,0x2C,0x0,0xC3,0x80,0x8B,0x2,0x0,0x1,0x3,0x81,0x83,0xF2,0x0,0xCB,0x40,0xC3,0xC0,0x87,0x24,0x0,0x85,0x88,0x3,0x0,0x4A,0xC4,0x20,0x83,0x9C,0x2,0xC7,0xC0,0x49,0x24,0x81,0xC3,
-0xCA,0x89,0x36,0x4,0x87,0xFC,0xA,0x83,0xC4,0x0,0x7,0x4E,0x1,0x1,0xC5,0x4,0xC5,0x1,0xC1,0x89,0x90,0xA,0xC3,0xD0,0x0,0x23,0x84,0x5F,0x2,0x85,0x4,0xA,0x4,0x3,0xC5,0x65,0xC1,0x3,
-0xC4,0x20,0x85,0x34,0x1,0x3,0x1,0xC5,0x1,0x51,0x8B,0x9E,0x8,0x4,0x21,0xC5,0x24,0xC5,0x21,0xC4,0x40,0xC5,0x42,0x3,0x21,0xD5,0x21,0xD1,0x8B,0xBE,0x8,0x8A,0x10,0xB,0x2,0xC5,0x4,0x55,
-0xC7,0xC,0x0,0x0,0x88,0xE1,0x8,0x0,0x3,0x83,0xBB,0x4,0x8,0x81,0x7,0x8D,0x66,0x81,0x27,0xD5,0x65,0xD1,0x87,0x2A,0x0,0x0,0x2,0x88,0x1,0x9,0xC5,0xF6,0x83,0x9A,0x2,0x3,0x67,0xC1,
-0x65,0x51,0xC3,0x2A,0xC5,0x20,0x87,0x22,0x9,0xC9,0xD6,0x44,0x24,0xD5,0x90,0xF9,0x3,0xC2,0x6,0x4B,0x1,0x4,0xC6,0x16,0x85,0x20,0xC,0x83,0x9C,0x2,0x5,0x27,0x8D,0x65,0x1,0x7,0x5,0x43,
-0x65,0x1,0x3,0x7,0x1,0x7,0xD,0xC2,0x86,0x84,0x35,0xC,0x85,0x60,0x3,0xC3,0xA,0x4,0x7,0x89,0x67,0x1,0x47,0x44,0x1,0x65,0x0,0x66,0xC2,0x24,0x83,0xBA,0xB,0x85,0xDC,0x7,0x87,0x82,
-0x4,0xC2,0xAE,0x46,0x1,0x65,0x0,0x27,0xC3,0x26,0x88,0x19,0x0,0x87,0x2,0x6,0xC2,0x9E,0x4B,0x5,0x24,0x94,0xF9,0x3,0x1,0xFF,0x0,0x89,0x54,0x1,0x8A,0xFA,0x5,0x8C,0xE5,0x1,0x83,0x94,
-0x0,0x83,0x90,0x0,0x83,0x7A,0x8,0x83,0x5E,0x8,0x83,0xC2,0x0,0x83,0x78,0x4,0x85,0xCA,0x1,0x85,0xF2,0x4,0x83,0x6E,0x0,0x83,0x8A,0x0,0x0,0x3,0x84,0xDF,0x6,0x1,0x21,0x81,0x83,0x38,
-0x5,0x85,0x24,0x1,0x87,0xD2,0x9,0x0,0x4A,0xC8,0x20,0xC3,0x40,0x0,0x4B,0x8A,0x6D,0x0,0xC5,0x20,0x0,0x4B,0xC8,0x40,0x85,0xE2,0xA,0x8D,0xCC,0x9,0x87,0xD6,0x0,0xC7,0x20,0x8F,0xEA,0x9,
-0xC5,0x20,0x1,0x6B,0x9,0xC7,0x80,0x8F,0xA,0xA,0xC5,0x40,0x1,0x6C,0x1,0x83,0x7E,0x8,0x83,0x62,0x0,0x85,0xEA,0x3,0xC2,0xFC,0xC4,0xA,0xC3,0xE6,0x8B,0x78,0x0,0x85,0xC4,0x0,0x87,0x18,
-0x9,0xC9,0x80,0x85,0x1C,0xE,0xC5,0xA0,0x89,0x36,0x9,0x89,0xF2,0x8,0x85,0x7C,0x8,0xC5,0xA0,0xC3,0xF8,0x8D,0x88,0x9,0x85,0xBA,0x9,0x0,0x5,0xC4,0xA0,0x8B,0x74,0x9,0x87,0x70,0x0,0x8B,
-0xDA,0x9,0x8B,0x94,0x9,0x87,0x90,0x0,0xC7,0x20,0xC3,0xE0,0x89,0xB4,0x9,0xC3,0x42,0x1,0x6B,0x9,0xC7,0x4E,0x83,0xBE,0x9,0x2,0x22,0x81,0x23,0xC6,0xD4,0x88,0xCA,0x0,0x84,0x6F,0x1,0xC7,
-0x60,0xC3,0x20,0x89,0xF4,0x0,0x84,0xEE,0x0,0x84,0x9,0xB,0xC5,0x80,0x0,0x25,0xC5,0x80,0xCA,0x20,0x87,0x10,0x1,0xC5,0xA0,0x0,0x5,0xC4,0xE0,0x89,0x34,0x1,0x89,0x2E,0x1,0xC5,0xE0,0x0,
-0x25,0x87,0x41,0xF,0xC6,0x52,0x89,0xE,0x4,0xCB,0x40,0x1,0x2D,0x7,0xC5,0x32,0x8B,0x6C,0x1,0xC7,0x80,0x87,0xE2,0x0,0xC3,0x32,0x8B,0x8C,0x1,0xC3,0xEE,0x87,0x1E,0xF,0xC7,0x32,0x8B,0x8A,
-0x8,0x87,0xBA,0xE,0x87,0x82,0xE,0x8F,0xA6,0x8,0x3,0x4E,0x1,0x6C,0x9,0x83,0x7E,0x8,0x83,0x22,0x1,0xC3,0x20,0x87,0xF8,0x8,0xCA,0x40,0x0,0x1,0x83,0xBE,0x3,0x0,0x64,0x86,0xCB,0x1,
-0x93,0xA,0xF,0x83,0x7E,0xC,0xC5,0x20,0x8F,0x28,0xF,0x1,0x4B,0x9,0x87,0x1A,0xE,0x0,0x5,0x88,0x4B,0xE,0x8C,0x88,0x9,0xC2,0x20,0x85,0x3C,0xE,0x0,0x25,0xC2,0xDE,0x91,0x66,0xF,0x0,
-0x69,0xC4,0x20,0x87,0x7E,0x8,0x97,0x86,0xF,0x87,0x1E,0xF,0x8E,0xA6,0xF,0x84,0xB3,0x0,0xC7,0x40,0x91,0xC2,0x10,0x89,0xD4,0xF,0x87,0x9E,0x8,0x8E,0xE6,0xF,0x84,0xF3,0x0,0xC3,0xE0,0x87,
-0x5E,0xE,0x97,0x6,0x10,0x87,0x3E,0xE,0x97,0x26,0x10,0xC7,0x40,0x97,0x46,0x10,0x89,0x9E,0xE,0x93,0x68,0x10,0x89,0x3C,0xF,0xC3,0xC0,0x93,0x8A,0x10,0x85,0xBE,0x3,0x86,0xE4,0x10,0x90,0xAB,
-0x10,0xC5,0x20,0x85,0xC2,0x8,0x93,0xC8,0x10,0x85,0xDC,0x0,0x85,0xE2,0x8,0x85,0x36,0x11,0x85,0xF4,0x0,0xC9,0x60,0x83,0xFE,0x0,0x85,0x2,0x9,0x85,0x56,0x11,0x89,0x74,0xC,0x89,0x18,0x1,
-0x85,0x22,0x9,0xC3,0xF8,0x89,0x48,0xB,0xC5,0x4E,0x85,0x3C,0x1,0x1,0x81,0x80,0x8A,0xC2,0x4,0xCE,0xA,0x1,0x22,0x85,0x43,0x81,0x80,0x4,0x64,0x81,0x43,0x85,0x8E,0x89,0x47,0x1,0x0,0x85,
-0x89,0x46,0x1,0x0,0x64,0xC4,0x20,0x83,0x82,0x0,0x0,0x8C,0x86,0xC5,0x1,0xCB,0x1E,0xC3,0xFE,0xC3,0x40,0x83,0x42,0x0,0x0,0x8C,0x86,0xE5,0x1,0x1,0x1,0x85,0x83,0x24,0xE,0x0,0x8E,0x84,
-0x23,0xE,0x0,0x0,0xC4,0x5E,0xC3,0x62,0x0,0x22,0xC2,0x40,0xC5,0x5E,0x1,0x21,0x85,0x83,0x44,0xE,0x0,0x8C,0x84,0x43,0xE,0x0,0x20,0xC8,0x20,0x0,0x0,0xC2,0x60,0x83,0x86,0x1,0xC5,0x64,
-0x0,0x8,0xC3,0xE,0x0,0x85,0x83,0x7E,0x4,0xC4,0x7E,0xE4,0x6C,0x0,0x0,0x40,0x2E,0x0,0x0,0xFF,0x2E,0x0,0x0,0xFE,0x2E,0x0,0x0,0xFD,0x27,0x0,0x0,0x1,0xCF,0x2A,0xE5,0xAC,0x0,0x0,
-0x5,0xF0,0x90,0xAA,0x14,0x43,0x5,0xFF,0xF9,0x17,0x8E,0xF0,0x4C,0x61,0x16,0x1,0x1,0x41,0xCE,0x10,0xCE,0xE9,0x0,0x1,0x8E,0x90,0x14,0x0,0x1,0x88,0xA0,0x14,0xF0,0x9D,0x7D,0x17,0xE4,0xFB,
-0x0,0x22,0x9,0xD4,0x10,0x0,0x7,0x86,0x80,0x14,0xC7,0x20,0xA3,0x5C,0x1A,0x0,0x2,0x87,0x63,0x18,0xC6,0x1D,0x0,0x2,0xC6,0x24,0xC4,0x1D,0xC3,0x10,0x87,0x90,0x14,0xC7,0x20,0x87,0xA0,0x14,
-0xC6,0x20,0xE6,0xBF,0x0,0x0,0x4,0x8C,0x63,0x18,0x2,0x40,0x3,0x4,0x8C,0x80,0x14,0x2,0xFF,0x3,0x4,0x8C,0x90,0x14,0x2,0xFE,0x3,0x4,0x8C,0x93,0x18,0x1,0xFD,0x3,0xE4,0x5F,0x0,0xFF
-]},
-'ridleyimals.ips': {0x1ADA0: [0xFD,0x92,0x0,0x5,0x3E,0x26,0x3,0x2,0x0,0x80,0xA2,0xB9,0x2E,0xB3,0x40,0x4,0x1,0x16,0x0,0x1,0x0,0x80,0x0,0x0,0x79,0x98,0x40,0x5,0x2E,0x6,0x2,0x0,0x0,0x80,0x0,0x0],
-0x798DC: [0x6,0xF0],
-0x7F000: [0xA0,0xAD,0xAC,0xAD],
-0x7F006: [0xA9,0x0,0x0,0x8F,0x2A,0xD8,0x7E,0xA9,0x0,0xF0,0x8F,0xB5,0x7,0x7E,0x5C,0xBB,0x91,0x8F],
-0x7B358: [0x18,0xF0],
-0x7EFF0: [0xB8,0xAD],
-0x7F018: [0xAF,0x20,0xD8,0x7E,0x89,0x0,0x40,0xF0,0x35,0xA9,0x0,0x0,0x8F,0xBB,0xD8,0x7E,0xA9,0xF0,0xEF,0x8F,0xB5,0x7,0x7E,0xA9,0xAA,0xAA,0x8F,0xD5,0x1C,0x7E,0xA9,0xAE,0x80,0x8F,0xDE,0x0,0x7F,0xA9,0xCE,
-0x80,0x8F,0xFE,0x0,0x7F,0xA9,0xCE,0x88,0x8F,0x1E,0x1,0x7F,0xA9,0xAE,0x88,0x8F,0x3E,0x1,0x7F,0x5C,0xF7,0x91,0x8F,0x5C,0xF7,0x91,0x8F]},
-'seed_display.ips': {0x16CBB: [0x20,0x0,0xF9],
-0x17900: [0x48,0xDA,0x8,0xC2,0x30,0xAF,0x0,0xFF,0xDF,0x29,0x1F,0x0,0xA,0xA,0xA,0xA8,0xA2,0x0,0x0,0xB9,0x6C,0xFA,0x29,0xFF,0x0,0xA,0xDA,0xAA,0xBF,0xAC,0xF9,0x82,0xFA,0x9F,0x52,0xC0,0x7F,0xE8,0xE8,
-0xC8,0xE0,0xE,0x0,0xD0,0xE6,0xAF,0x1,0xFF,0xDF,0x29,0x1F,0x0,0xA,0xA,0xA,0xA8,0xA2,0x0,0x0,0xB9,0x6C,0xFA,0x29,0xFF,0x0,0xA,0xDA,0xAA,0xBF,0xAC,0xF9,0x82,0xFA,0x9F,0x60,0xC0,0x7F,
-0xE8,0xE8,0xC8,0xE0,0xE,0x0,0xD0,0xE6,0xAF,0x2,0xFF,0xDF,0x29,0x1F,0x0,0xA,0xA,0xA,0xA8,0xA2,0x0,0x0,0xB9,0x6C,0xFA,0x29,0xFF,0x0,0xA,0xDA,0xAA,0xBF,0xAC,0xF9,0x82,0xFA,0x9F,0x92,
-0xC0,0x7F,0xE8,0xE8,0xC8,0xE0,0xE,0x0,0xD0,0xE6,0xAF,0x3,0xFF,0xDF,0x29,0x1F,0x0,0xA,0xA,0xA,0xA8,0xA2,0x0,0x0,0xB9,0x6C,0xFA,0x29,0xFF,0x0,0xA,0xDA,0xAA,0xBF,0xAC,0xF9,0x82,0xFA,
-0x9F,0xA0,0xC0,0x7F,0xE8,0xE8,0xC8,0xE0,0xE,0x0,0xD0,0xE6,0x28,0xFA,0x68,0xA2,0xFE,0x7,0x60,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,
-0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,
-0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0x84,0x0,0x2D,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0x22,0x0,0x8A,0x0,0x8B,0x0,0xF,0x0,0x86,0x0,0x89,0x0,0x87,0x0,0x88,0x0,0xF,
-0x0,0x60,0x0,0x61,0x0,0x62,0x0,0x63,0x0,0x64,0x0,0x65,0x0,0x66,0x0,0x67,0x0,0x68,0x0,0x69,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0x85,0x0,0xF,0x0,0x6A,0x0,0x6B,
-0x0,0x6C,0x0,0x6D,0x0,0x6E,0x0,0x6F,0x0,0x70,0x0,0x71,0x0,0x72,0x0,0x73,0x0,0x74,0x0,0x75,0x0,0x76,0x0,0x77,0x0,0x78,0x0,0x79,0x0,0x7A,0x0,0x7B,0x0,0x7C,0x0,0x7D,0x0,0x7E,
-0x0,0x7F,0x0,0x80,0x0,0x81,0x0,0x82,0x0,0x83,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0xF,0x0,0x47,0x45,0x45,0x4D,0x45,0x52,0x20,0x20,0x52,0x49,0x50,0x50,0x45,0x52,0x20,0x20,0x41,
-0x54,0x4F,0x4D,0x49,0x43,0x20,0x20,0x50,0x4F,0x57,0x41,0x4D,0x50,0x20,0x20,0x53,0x43,0x49,0x53,0x45,0x52,0x20,0x20,0x4E,0x41,0x4D,0x49,0x48,0x45,0x20,0x20,0x50,0x55,0x52,0x4F,0x4D,0x49,0x20,
-0x20,0x41,0x4C,0x43,0x4F,0x4F,0x4E,0x20,0x20,0x42,0x45,0x45,0x54,0x4F,0x4D,0x20,0x20,0x4F,0x57,0x54,0x43,0x48,0x20,0x20,0x20,0x5A,0x45,0x42,0x42,0x4F,0x20,0x20,0x20,0x5A,0x45,0x45,0x4C,0x41,
-0x20,0x20,0x20,0x48,0x4F,0x4C,0x54,0x5A,0x20,0x20,0x20,0x56,0x49,0x4F,0x4C,0x41,0x20,0x20,0x20,0x57,0x41,0x56,0x45,0x52,0x20,0x20,0x20,0x52,0x49,0x4E,0x4B,0x41,0x20,0x20,0x20,0x42,0x4F,0x59,
-0x4F,0x4E,0x20,0x20,0x20,0x43,0x48,0x4F,0x4F,0x54,0x20,0x20,0x20,0x4B,0x41,0x47,0x4F,0x20,0x20,0x20,0x20,0x53,0x4B,0x52,0x45,0x45,0x20,0x20,0x20,0x43,0x4F,0x56,0x45,0x52,0x4E,0x20,0x20,0x45,
-0x56,0x49,0x52,0x20,0x20,0x20,0x20,0x54,0x41,0x54,0x4F,0x52,0x49,0x20,0x20,0x4F,0x55,0x4D,0x20,0x20,0x20,0x20,0x20,0x50,0x55,0x59,0x4F,0x20,0x20,0x20,0x20,0x59,0x41,0x52,0x44,0x20,0x20,0x20,
-0x20,0x5A,0x4F,0x41,0x20,0x20,0x20,0x20,0x20,0x46,0x55,0x4E,0x45,0x20,0x20,0x20,0x20,0x47,0x41,0x4D,0x45,0x54,0x20,0x20,0x20,0x47,0x45,0x52,0x55,0x54,0x41,0x20,0x20,0x53,0x4F,0x56,0x41,0x20,
-0x20,0x20,0x20,0x42,0x55,0x4C,0x4C,0x20,0x20,0x20,0x20,0x54,0x4F,0x55,0x52,0x4E,0x41,0x4D,0x45,0x4E,0x54,0x20,0x53,0x45,0x45,0x44,0x21]},
-'skip_ceres.ips': {0x16EDA: [0x1F],
-0x10067: [0x22,0x0,0xFF,0x80],
-0x7F00: [0xAF,0x98,0x9,0x7E,0xC9,0x1F,0x0,0xD0,0x24,0xAF,0xE2,0xD7,0x7E,0xD0,0x1E,0xAF,0xB6,0xD8,0x7E,0x9,0x4,0x0,0x8F,0xB6,0xD8,0x7E,0xAF,0xB2,0xD8,0x7E,0x9,0x1,0x0,0x8F,0xB2,0xD8,0x7E,0xAF,0x52,
-0x9,0x7E,0x22,0x0,0x80,0x81,0xA9,0x0,0x0,0x6B]},
-'skip_intro.ips': {0x5A592: [0xA9,0x2F,0xB7],
-0x10067: [0x22,0x0,0xFF,0x80],
-0x7F00: [0xAF,0x98,0x9,0x7E,0xC9,0x1F,0x0,0xD0,0x24,0xAD,0xDA,0x9,0xD,0xDC,0x9,0xD,0xDE,0x9,0xD,0xE0,0x9,0xD0,0x16,0xAF,0xB6,0xD8,0x7E,0x9,0x4,0x0,0x8F,0xB6,0xD8,0x7E,0xAF,0xB2,0xD8,0x7E,0x9,
-0x1,0x0,0x8F,0xB2,0xD8,0x7E,0xA9,0x0,0x0,0x6B]},
-'spazer.ips': {0x23392B: [0xC5,0x60,0x0,0x8,0x44,0x81,0x44,0xC5,0x18,0xC7,0x8,0xC7,0x26,0x3,0x5,0x81,0x43,0x85,0x43,0x42,0x81,0x3,0x43,0x81,0x5,0x85,0xC5,0x24,0xC5,0x26,0xE8,0x23,0x5F,0x80,0xC3,0x58,0x1,0x45,0x81,
-0x47,0xFF,0x0,0x1,0x45,0x85,0xC5,0x70,0xC3,0x78,0x3,0x5,0x81,0xBD,0x80,0x5F,0xFF,0x0,0x0,0xBD,0xC4,0xA6,0xC9,0x40,0x0,0x25,0xC2,0x40,0xC3,0xB8,0x0,0x44,0xC2,0xB8,0x3,0x25,0x81,0xBD,
-0x88,0xF8,0x20,0x40,0x0,0x88,0xC3,0xE0,0xC9,0x80,0xC5,0xC8,0xC5,0x4,0x0,0x43,0xC2,0xC0,0xDF,0x80,0xC3,0xC0,0xC3,0x6A,0xC7,0xC0,0x1,0xEB,0xC1,0xC9,0x6,0xF8,0x23,0x4,0x3,0xC,0xC0,0x40,
-0x90,0xC3,0xEA,0xCC,0x7C,0x0,0xF1,0x4B,0x42,0x81,0xDD,0x86,0x3,0x2C,0xD0,0x60,0x90,0xC7,0xC0,0x1,0x5,0x85,0x46,0x81,0x80,0x0,0x0,0x89,0x52,0x0,0x0,0x44,0x9E,0xD9,0x0,0x3,0x2C,0xD8,
-0x60,0x98,0xC7,0x40,0x0,0x45,0xD4,0x40,0x2,0x45,0x81,0xBE,0xDA,0x80,0x2,0xC,0xD8,0x40,0xD8,0x40,0x85,0x12,0x1,0xD5,0x40,0x0,0x7A,0x46,0x80,0x7B,0x1,0x7A,0x84,0x89,0x0,0x1,0xD3,0x80,
-0x85,0x18,0x1,0xC7,0x2E,0xD1,0x6,0x1,0x7A,0x84,0x89,0x40,0x1,0xD1,0xC0,0x85,0xD6,0x0,0x5D,0x5F,0x80,0xDD,0x80,0x8B,0xC2,0x0,0xD3,0x8,0x0,0x5,0x84,0xCF,0x0,0x99,0x84,0x2,0x8B,0x82,
-0x1,0xD3,0x48,0x85,0xCE,0x0,0xC5,0xC0,0x0,0x25,0x96,0xB,0x2,0xDD,0x40,0x85,0x9C,0x2,0x85,0x4C,0x1,0x0,0x43,0x85,0x61,0x0,0xC8,0x80,0x8D,0xC0,0x0,0x8B,0x4E,0x1,0x87,0x54,0x1,0xC5,
-0xF4,0xC3,0xA4,0x2,0x43,0x85,0x43,0x84,0x6B,0x0,0x3,0x8,0x81,0x8,0x1,0xC3,0x3A,0x85,0x66,0x0,0x0,0x8,0xCA,0x40,0x1,0x1,0x85,0x4F,0x4,0x81,0x0,0x1,0xC2,0x40,0xC3,0xC0,0x0,0x64,
-0xC6,0x34,0xC6,0x4,0x0,0x1,0xC5,0x8C,0xC5,0x80,0x89,0x84,0x1,0x1,0x21,0x85,0x4F,0x24,0x81,0x0,0x21,0xC4,0x80,0x5,0x44,0x81,0x64,0x81,0xEB,0xC1,0xCA,0x9E,0x0,0xB1,0xCD,0xA4,0xD5,0xBC,
-0xC7,0xC0,0x85,0xD6,0x0,0xE8,0x37,0xFF,0x0,0x1,0x45,0x85,0x43,0x44,0x81,0x9D,0xA0,0x3,0xDB,0x5C,0x83,0xCA,0x3,0x3,0x40,0x94,0xC,0xC4,0xF8,0x37,0x80,0x83,0xBE,0x1,0x3,0x60,0x94,0x2C,
-0xD4,0xF8,0x37,0xC0,0x83,0xFE,0x1,0x3,0x60,0x9C,0x2C,0xDC,0xF8,0x38,0x40,0x5,0xD8,0x60,0x98,0x40,0x9C,0xC,0xF8,0x38,0x40,0x83,0x7E,0x2,0x0,0x0,0x43,0x81,0x1,0x2,0xF5,0x1,0x51,0xD3,
-0xFE,0x87,0x6A,0x4,0x0,0x1,0x90,0x61,0x3,0xC2,0x1A,0xC4,0x2,0x2,0x0,0x85,0x20,0x43,0x81,0x21,0x2,0xD5,0x21,0xD1,0xD3,0xFE,0x87,0xAA,0x4,0x0,0x21,0xD0,0x40,0xC2,0x1A,0xC4,0x2,0x1,
-0x20,0x85,0xC3,0x80,0x89,0x76,0x1,0xC7,0x6,0xC5,0xA,0x83,0x48,0x4,0x2,0x1,0x85,0x1,0x84,0x85,0x0,0x85,0xE0,0x4,0xC7,0x22,0x2,0x62,0x81,0x44,0xC2,0x1A,0xC7,0x80,0xC7,0xFE,0x3,0xE0,
-0x21,0xE1,0x21,0xC3,0x4,0xC7,0xFE,0x43,0x62,0x81,0x2,0x21,0x85,0x21,0xC2,0x6,0xC3,0x46,0xCB,0x22,0xC3,0x5A,0xC3,0x84,0x4,0x20,0x85,0x22,0x81,0x23,0x88,0x85,0x0,0x2,0xE2,0x81,0xE3,0xC4,
-0x4,0xC5,0x70,0xC7,0x16,0x0,0x44,0xC6,0x46,0xC3,0x8E,0xCA,0x22,0xC2,0x2,0x6,0x41,0x85,0x40,0x85,0x81,0x80,0x0,0xE8,0x38,0x81,0x42,0x0,0x0,0xC3,0x3E,0xE4,0xC4,0x0,0x0,0x4,0xC4,0x3,
-0x31,0x0,0x1,0x40,0x2,0x3D,0x0,0x0,0xFF,0xDE,0x20,0x0,0xFE,0xDE,0x40,0x0,0xFD,0xDE,0x60,0xE5,0x3,0x0,0x94,0xCB,0x8,0xE4,0x49,0x0,0x0,0x41,0x3B,0x0,0x3,0x40,0x1,0x0,0xFF,0x3B,
-0x0,0x3,0xFF,0x1,0x0,0xFE,0x3B,0x0,0x3,0xFE,0x1,0x0,0xFD,0x3B,0x0,0x4,0xFD,0x1,0x0,0x0,0x7,0xDC,0x62,0xC2,0x64,0xDE,0x20,0xE4,0x23,0x0,0x23,0x2,0xDD,0x11,0xE4,0x37,0x0,0xFF
-]},
-'spinjumprestart.ips': {0x8763A: [0xAD,0x23,0xA,0x29,0xFF,0x0,0xC9,0x3,0x0,0xF0,0x13,0xC9,0x2,0x0,0xF0,0xE,0xC9,0x6,0x0,0xF0,0x9,0xC9,0x14,0x0,0xF0,0x4,0x22,0xBC,0x98,0x90,0x6B],
-0x89EE2: [0xDC,0xA0,0xEA,0xA0,0x70,0xA1,0xEA,0xA0,0x70,0xA1,0xEA,0xA0,0x70,0xA1,0xEA,0xA0,0x70,0xA1,0xF0,0xA1,0x3A,0xA2,0x84,0xA2,0xC8,0xA2,0xF0,0xA1,0x3A,0xA2,0xF0,0xA1,0x3A,0xA2,0xF0,0xA1,0x3A,0xA2,0xC,
-0xA3,0x56,0xA3,0xA0,0xA3,0xF6,0xA3,0x4C,0xA4,0xA8,0xA4,0x4,0xA5,0x4E,0xA5,0x98,0xA5,0xE2,0xA5,0x2C,0xA6,0x2C,0xA6,0x38,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x54,0xA6,0x68,
-0xA6,0x7C,0xA6,0xC0,0xA6,0x4,0xA7,0x42,0xA7,0x4,0xA7,0x42,0xA7,0x80,0xA7,0xC4,0xA7,0x52,0xA6,0x52,0xA6,0x8,0xA8,0x14,0xA8,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,
-0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x38,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x2E,0xA8,0x42,0xA8,0x52,0xA6,0x52,0xA6,0x56,0xA8,0x82,0xA8,0x52,0xA6,0x52,
-0xA6,0xA0,0xA3,0xF6,0xA3,0xAE,0xA8,0xC2,0xA8,0xA0,0xA3,0xF6,0xA3,0xD6,0xA8,0xDE,0xA8,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,
-0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0xE6,0xA8,0x24,0xA9,0xA0,0xA3,0xF6,0xA3,0xA0,0xA3,0xF6,0xA3,0x4,0xA7,0x42,0xA7,0x4,0xA7,0x42,0xA7,0x7C,0xA6,0xC0,
-0xA6,0x7C,0xA6,0xC0,0xA6,0x56,0xA8,0x82,0xA8,0x56,0xA8,0x82,0xA8,0x62,0xA9,0x6E,0xA9,0x62,0xA9,0x6E,0xA9,0x88,0xA9,0x8E,0xA9,0xA2,0xA9,0xA8,0xA9,0xBC,0xA9,0x6,0xAA,0x50,0xAA,0x76,0xAA,0x7C,
-0xA6,0xC0,0xA6,0x52,0xA6,0x52,0xA6,0x9C,0xAA,0xE0,0xAA,0x24,0xAB,0x32,0xAB,0x24,0xAB,0x32,0xAB,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,
-0xA6,0x52,0xA6,0x52,0xA6,0xDC,0xA0,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0xEA,0xA0,0x70,0xA1,0xEA,0xA0,0x70,0xA1,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,
-0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x40,0xAB,0x40,0xAB,0x40,0xAB,0x40,0xAB,0x40,
-0xAB,0x24,0xAB,0x32,0xAB,0x24,0xAB,0x32,0xAB,0x24,0xAB,0x32,0xAB,0x52,0xA6,0x52,0xA6,0x7E,0xAB,0x92,0xAB,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x9C,0xAA,0xE0,0xAA,0x9C,
-0xAA,0xE0,0xAA,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0xA6,0xAB,0xEA,0xA0,0x70,0xA1,0xEA,0xA0,0x70,0xA1,0xEA,
-0xA0,0x70,0xA1,0xEA,0xA0,0x70,0xA1,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0xAE,0xAB,0xAE,0xAB,0xAE,0xAB,0xAE,0xAB,0xAE,0xAB,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,
-0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x52,0xA6,0x0,0x0,0x0,0x1,0x26,0x0,0x0,0x0,0x0,0x2,0x25,0x0,0xFF,0xFF,0x80,0x0,0x0,0x8,0x55,0x0,0x80,0x0,0x10,0x0,0x57,0x0,0x80,
-0x0,0x20,0x0,0x59,0x0,0x80,0x0,0x0,0x0,0x4B,0x0,0x0,0x4,0x30,0x0,0xF1,0x0,0x0,0x4,0x10,0x0,0xF3,0x0,0x0,0x4,0x20,0x0,0xF5,0x0,0x0,0x4,0x0,0x0,0x35,0x0,0x0,0x0,0x60,
-0x2,0x78,0x0,0x0,0x0,0x50,0x2,0x76,0x0,0x0,0x0,0x30,0x2,0x25,0x0,0x0,0x0,0x30,0x0,0x3,0x0,0x0,0x0,0x10,0x1,0xF,0x0,0x0,0x0,0x20,0x1,0x11,0x0,0x0,0x0,0x0,0x9,0xF,
-0x0,0x0,0x0,0x0,0x5,0x11,0x0,0x0,0x0,0x40,0x2,0x4A,0x0,0x0,0x0,0x0,0x2,0x25,0x0,0x0,0x0,0x0,0x8,0x3,0x0,0x0,0x0,0x10,0x0,0x5,0x0,0x0,0x0,0x20,0x0,0x7,0x0,0x0,
-0x0,0x0,0x1,0x9,0x0,0xFF,0xFF,0x80,0x0,0x0,0x8,0x56,0x0,0x80,0x0,0x10,0x0,0x58,0x0,0x80,0x0,0x20,0x0,0x5A,0x0,0x80,0x0,0x0,0x0,0x4C,0x0,0x0,0x4,0x30,0x0,0xF2,0x0,0x0,
-0x4,0x10,0x0,0xF4,0x0,0x0,0x4,0x20,0x0,0xF6,0x0,0x0,0x4,0x0,0x0,0x36,0x0,0x0,0x0,0x60,0x1,0x77,0x0,0x0,0x0,0x50,0x1,0x75,0x0,0x0,0x0,0x40,0x1,0x49,0x0,0x0,0x0,0x0,
-0x1,0x26,0x0,0x0,0x0,0x30,0x0,0x4,0x0,0x0,0x0,0x10,0x2,0x10,0x0,0x0,0x0,0x20,0x2,0x12,0x0,0x0,0x0,0x0,0xA,0x10,0x0,0x0,0x0,0x0,0x6,0x12,0x0,0x0,0x0,0x0,0x8,0x4,
-0x0,0x0,0x0,0x10,0x0,0x6,0x0,0x0,0x0,0x20,0x0,0x8,0x0,0x0,0x0,0x0,0x2,0xA,0x0,0xFF,0xFF,0x0,0x4,0x0,0x0,0x35,0x0,0x80,0x0,0x0,0x0,0x19,0x0,0x0,0x0,0x10,0x1,0xF,
-0x0,0x0,0x0,0x20,0x1,0x11,0x0,0x0,0x0,0x0,0x9,0xF,0x0,0x0,0x0,0x0,0x5,0x11,0x0,0x0,0x0,0x40,0x1,0xB,0x0,0x0,0x0,0x0,0x1,0x9,0x0,0x0,0x0,0x0,0x2,0x25,0x0,0x0,
-0x0,0x0,0x8,0x3,0x0,0x0,0x0,0x10,0x0,0x5,0x0,0x0,0x0,0x20,0x0,0x7,0x0,0xFF,0xFF,0x0,0x4,0x0,0x0,0x36,0x0,0x80,0x0,0x0,0x0,0x1A,0x0,0x0,0x0,0x10,0x2,0x10,0x0,0x0,
-0x0,0x20,0x2,0x12,0x0,0x0,0x0,0x0,0xA,0x10,0x0,0x0,0x0,0x0,0x6,0x12,0x0,0x0,0x0,0x40,0x2,0xC,0x0,0x0,0x0,0x0,0x2,0xA,0x0,0x0,0x0,0x0,0x1,0x26,0x0,0x0,0x0,0x0,
-0x8,0x4,0x0,0x0,0x0,0x10,0x0,0x6,0x0,0x0,0x0,0x20,0x0,0x8,0x0,0xFF,0xFF,0x0,0x4,0x0,0x0,0x35,0x0,0x80,0x0,0x0,0x0,0x19,0x0,0x0,0x0,0x10,0x1,0xF,0x0,0x0,0x0,0x20,
-0x1,0x11,0x0,0x0,0x0,0x0,0x9,0xF,0x0,0x0,0x0,0x0,0x5,0x11,0x0,0x0,0x0,0x0,0x1,0xB,0x0,0x0,0x0,0x0,0x2,0x25,0x0,0x0,0x0,0x0,0x8,0x3,0x0,0x0,0x0,0x10,0x0,0x5,
-0x0,0x0,0x0,0x20,0x0,0x7,0x0,0xFF,0xFF,0x0,0x4,0x0,0x0,0x36,0x0,0x80,0x0,0x0,0x0,0x1A,0x0,0x0,0x0,0x10,0x2,0x10,0x0,0x0,0x0,0x20,0x2,0x12,0x0,0x0,0x0,0x0,0xA,0x10,
-0x0,0x0,0x0,0x0,0x6,0x12,0x0,0x0,0x0,0x0,0x2,0xC,0x0,0x0,0x0,0x0,0x1,0x26,0x0,0x0,0x0,0x0,0x8,0x4,0x0,0x0,0x0,0x10,0x0,0x6,0x0,0x0,0x0,0x20,0x0,0x8,0x0,0xFF,
-0xFF,0x80,0x0,0x0,0x0,0x19,0x0,0x0,0x0,0x0,0x9,0x69,0x0,0x0,0x0,0x0,0x5,0x6B,0x0,0x0,0x0,0x90,0x1,0x69,0x0,0x0,0x0,0xA0,0x1,0x6B,0x0,0x0,0x0,0x0,0x2,0x2F,0x0,0x0,
-0x0,0x0,0x8,0x15,0x0,0x0,0x0,0x0,0x4,0x17,0x0,0x0,0x0,0x10,0x0,0x69,0x0,0x0,0x0,0x20,0x0,0x6B,0x0,0x0,0x0,0x0,0x1,0x51,0x0,0x0,0x0,0x40,0x0,0x13,0x0,0xFF,0xFF,0x80,
-0x0,0x0,0x0,0x1A,0x0,0x0,0x0,0x0,0xA,0x6A,0x0,0x0,0x0,0x0,0x6,0x6C,0x0,0x0,0x0,0x90,0x2,0x6A,0x0,0x0,0x0,0xA0,0x2,0x6C,0x0,0x0,0x0,0x0,0x1,0x30,0x0,0x0,0x0,0x0,
-0x8,0x16,0x0,0x0,0x0,0x0,0x4,0x18,0x0,0x0,0x0,0x10,0x0,0x6A,0x0,0x0,0x0,0x20,0x0,0x6C,0x0,0x0,0x0,0x0,0x2,0x52,0x0,0x0,0x0,0x40,0x0,0x14,0x0,0xFF,0xFF,0x80,0x0,0x0,
-0x0,0x19,0x0,0x0,0x0,0x0,0x9,0x69,0x0,0x0,0x0,0x0,0x5,0x6B,0x0,0x0,0x0,0x90,0x1,0x69,0x0,0x0,0x0,0xA0,0x1,0x6B,0x0,0x0,0x0,0x0,0x2,0x2F,0x0,0x0,0x0,0x0,0x8,0x15,
-0x0,0x0,0x0,0x0,0x4,0x17,0x0,0x0,0x0,0x10,0x0,0x69,0x0,0x0,0x0,0x20,0x0,0x6B,0x0,0x0,0x0,0x0,0x1,0x51,0x0,0x0,0x0,0xC0,0x0,0x13,0x0,0x0,0x0,0x80,0x0,0x4D,0x0,0x0,
-0x0,0x40,0x0,0x13,0x0,0xFF,0xFF,0x80,0x0,0x0,0x0,0x1A,0x0,0x0,0x0,0x0,0xA,0x6A,0x0,0x0,0x0,0x0,0x6,0x6C,0x0,0x0,0x0,0x90,0x2,0x6A,0x0,0x0,0x0,0xA0,0x2,0x6C,0x0,0x0,
-0x0,0x0,0x1,0x30,0x0,0x0,0x0,0x0,0x8,0x16,0x0,0x0,0x0,0x0,0x4,0x18,0x0,0x0,0x0,0x10,0x0,0x6A,0x0,0x0,0x0,0x20,0x0,0x6C,0x0,0x0,0x0,0x0,0x2,0x52,0x0,0x0,0x0,0xC0,
-0x0,0x14,0x0,0x0,0x0,0x80,0x0,0x4E,0x0,0x0,0x0,0x40,0x0,0x14,0x0,0xFF,0xFF,0x80,0x0,0x0,0x0,0x19,0x0,0x0,0x4,0x0,0x0,0x37,0x0,0x0,0x0,0x0,0x9,0x69,0x0,0x0,0x0,0x0,
-0x5,0x6B,0x0,0x0,0x0,0x90,0x1,0x69,0x0,0x0,0x0,0xA0,0x1,0x6B,0x0,0x0,0x0,0x0,0x2,0x2F,0x0,0x0,0x0,0x0,0x8,0x15,0x0,0x0,0x0,0x0,0x4,0x17,0x0,0x0,0x0,0x10,0x0,0x69,
-0x0,0x0,0x0,0x20,0x0,0x6B,0x0,0x0,0x0,0x0,0x1,0x51,0x0,0x0,0x0,0xC0,0x0,0x13,0x0,0x0,0x0,0x80,0x0,0x17,0x0,0x0,0x0,0x40,0x0,0x13,0x0,0xFF,0xFF,0x80,0x0,0x0,0x0,0x1A,
-0x0,0x0,0x4,0x0,0x0,0x38,0x0,0x0,0x0,0x0,0xA,0x6A,0x0,0x0,0x0,0x0,0x6,0x6C,0x0,0x0,0x0,0x90,0x2,0x6A,0x0,0x0,0x0,0xA0,0x2,0x6C,0x0,0x0,0x0,0x0,0x1,0x30,0x0,0x0,
-0x0,0x0,0x8,0x16,0x0,0x0,0x0,0x0,0x4,0x18,0x0,0x0,0x0,0x10,0x0,0x6A,0x0,0x0,0x0,0x20,0x0,0x6C,0x0,0x0,0x0,0x0,0x2,0x52,0x0,0x0,0x0,0xC0,0x0,0x14,0x0,0x0,0x0,0x80,
-0x0,0x18,0x0,0x0,0x0,0x40,0x0,0x14,0x0,0xFF,0xFF,0x40,0x0,0x0,0x0,0x13,0x0,0x0,0x0,0x40,0x8,0x15,0x0,0x0,0x0,0x40,0x4,0x17,0x0,0x0,0x0,0x50,0x0,0x69,0x0,0x0,0x0,0x60,
-0x0,0x6B,0x0,0x0,0x0,0x80,0x1,0x19,0x0,0x0,0x0,0x0,0x8,0x15,0x0,0x0,0x0,0x10,0x0,0x69,0x0,0x0,0x0,0x20,0x0,0x6B,0x0,0x0,0x0,0x0,0x4,0x17,0x0,0x0,0x0,0x0,0x1,0x19,
-0x0,0x0,0x0,0x0,0x2,0x1A,0x0,0xFF,0xFF,0x40,0x0,0x0,0x0,0x14,0x0,0x0,0x0,0x40,0x8,0x16,0x0,0x0,0x0,0x40,0x4,0x18,0x0,0x0,0x0,0x50,0x0,0x6A,0x0,0x0,0x0,0x60,0x0,0x6C,
-0x0,0x0,0x0,0x80,0x2,0x1A,0x0,0x0,0x0,0x0,0x8,0x16,0x0,0x0,0x0,0x10,0x0,0x6A,0x0,0x0,0x0,0x20,0x0,0x6C,0x0,0x0,0x0,0x0,0x4,0x18,0x0,0x0,0x0,0x0,0x2,0x1A,0x0,0x0,
-0x0,0x0,0x1,0x19,0x0,0xFF,0xFF,0x40,0x0,0x0,0x0,0x13,0x0,0x0,0x0,0x40,0x8,0x15,0x0,0x0,0x0,0x40,0x4,0x17,0x0,0x0,0x0,0x50,0x0,0x69,0x0,0x0,0x0,0x60,0x0,0x6B,0x0,0x0,
-0x0,0x80,0x1,0x1B,0x0,0x0,0x0,0x0,0x8,0x15,0x0,0x0,0x0,0x10,0x0,0x69,0x0,0x0,0x0,0x20,0x0,0x6B,0x0,0x0,0x0,0x0,0x4,0x17,0x0,0x0,0x0,0x0,0x1,0x1B,0x0,0x0,0x0,0x0,
-0x2,0x1C,0x0,0xFF,0xFF,0x40,0x0,0x0,0x0,0x14,0x0,0x0,0x0,0x40,0x8,0x16,0x0,0x0,0x0,0x40,0x4,0x18,0x0,0x0,0x0,0x50,0x0,0x6A,0x0,0x0,0x0,0x60,0x0,0x6C,0x0,0x0,0x0,0x80,
-0x2,0x1C,0x0,0x0,0x0,0x0,0x8,0x16,0x0,0x0,0x0,0x10,0x0,0x6A,0x0,0x0,0x0,0x20,0x0,0x6C,0x0,0x0,0x0,0x0,0x4,0x18,0x0,0x0,0x0,0x0,0x2,0x1C,0x0,0x0,0x0,0x0,0x1,0x1B,
-0x0,0xFF,0xFF,0x0,0x8,0x0,0x0,0x3D,0x0,0x80,0x0,0x0,0x0,0x3D,0x0,0x0,0x8,0x0,0x0,0x3E,0x0,0x80,0x0,0x0,0x0,0x3E,0x0,0x0,0x0,0x0,0x1,0x1E,0x0,0x0,0x0,0x0,0x2,0x1F,
-0x0,0xFF,0xFF,0xFF,0xFF,0x0,0x0,0x80,0x2,0x1A,0x0,0x80,0x0,0x0,0x0,0x4C,0x0,0x0,0x0,0x0,0x2,0x25,0x0,0xFF,0xFF,0x0,0x0,0x80,0x1,0x19,0x0,0x80,0x0,0x0,0x0,0x4B,0x0,0x0,
-0x0,0x0,0x1,0x26,0x0,0xFF,0xFF,0x0,0x8,0x30,0x0,0xF7,0x0,0x0,0x8,0x10,0x0,0xF9,0x0,0x0,0x8,0x20,0x0,0xFB,0x0,0x0,0x8,0x0,0x0,0x3B,0x0,0x0,0x2,0x0,0x0,0x43,0x0,0x0,
-0x4,0x0,0x0,0x37,0x0,0x80,0x0,0x0,0x0,0x4B,0x0,0x0,0x0,0x30,0x0,0x85,0x0,0x0,0x0,0x0,0x1,0x1,0x0,0x0,0x0,0x10,0x0,0x71,0x0,0x0,0x0,0x20,0x0,0x73,0x0,0xFF,0xFF,0x0,
-0x8,0x30,0x0,0xF8,0x0,0x0,0x8,0x10,0x0,0xFA,0x0,0x0,0x8,0x20,0x0,0xFC,0x0,0x0,0x8,0x0,0x0,0x3C,0x0,0x0,0x1,0x0,0x0,0x44,0x0,0x0,0x4,0x0,0x0,0x38,0x0,0x80,0x0,0x0,
-0x0,0x4C,0x0,0x0,0x0,0x30,0x0,0x86,0x0,0x0,0x0,0x0,0x2,0x2,0x0,0x0,0x0,0x10,0x0,0x72,0x0,0x0,0x0,0x20,0x0,0x74,0x0,0xFF,0xFF,0x80,0x0,0x0,0x0,0x19,0x0,0x0,0x0,0x0,
-0x9,0x6D,0x0,0x0,0x0,0x0,0x5,0x6F,0x0,0x0,0x0,0x0,0x2,0x87,0x0,0x0,0x0,0x0,0x8,0x2B,0x0,0x0,0x0,0x0,0x4,0x2D,0x0,0x0,0x0,0x10,0x0,0x6D,0x0,0x0,0x0,0x20,0x0,0x6F,
-0x0,0x0,0x0,0x40,0x0,0x67,0x0,0x0,0x0,0x0,0x1,0x29,0x0,0xFF,0xFF,0x80,0x0,0x0,0x0,0x1A,0x0,0x0,0x0,0x0,0xA,0x6E,0x0,0x0,0x0,0x0,0x6,0x70,0x0,0x0,0x0,0x0,0x1,0x88,
-0x0,0x0,0x0,0x0,0x8,0x2C,0x0,0x0,0x0,0x0,0x4,0x2E,0x0,0x0,0x0,0x10,0x0,0x6E,0x0,0x0,0x0,0x20,0x0,0x70,0x0,0x0,0x0,0x40,0x0,0x68,0x0,0x0,0x0,0x0,0x2,0x2A,0x0,0xFF,
-0xFF,0x80,0x0,0x0,0x0,0x19,0x0,0x0,0x4,0x0,0x0,0x37,0x0,0x0,0x0,0x0,0x9,0x6D,0x0,0x0,0x0,0x0,0x5,0x6F,0x0,0x0,0x0,0x0,0x8,0x2B,0x0,0x0,0x0,0x0,0x4,0x2D,0x0,0x0,
-0x0,0x0,0x2,0x87,0x0,0x0,0x0,0x10,0x0,0x6D,0x0,0x0,0x0,0x20,0x0,0x6F,0x0,0x0,0x0,0x40,0x0,0x67,0x0,0x0,0x0,0x0,0x1,0x29,0x0,0xFF,0xFF,0x80,0x0,0x0,0x0,0x1A,0x0,0x0,
-0x4,0x0,0x0,0x38,0x0,0x0,0x0,0x0,0xA,0x6E,0x0,0x0,0x0,0x0,0x6,0x70,0x0,0x0,0x0,0x0,0x8,0x2C,0x0,0x0,0x0,0x0,0x4,0x2E,0x0,0x0,0x0,0x0,0x1,0x88,0x0,0x0,0x0,0x10,
-0x0,0x6E,0x0,0x0,0x0,0x20,0x0,0x70,0x0,0x0,0x0,0x40,0x0,0x68,0x0,0x0,0x0,0x0,0x2,0x2A,0x0,0xFF,0xFF,0x0,0x8,0x0,0x0,0x3D,0x0,0x80,0x0,0x0,0x0,0x3D,0x0,0x0,0x8,0x0,
-0x0,0x3E,0x0,0x80,0x0,0x0,0x0,0x3E,0x0,0x0,0x0,0x0,0x1,0x31,0x0,0x0,0x0,0x0,0x2,0x32,0x0,0xFF,0xFF,0x0,0x0,0x40,0x2,0x45,0x0,0x0,0x0,0x0,0x1,0x9,0x0,0x0,0x0,0x0,
-0x2,0x25,0x0,0xFF,0xFF,0x0,0x0,0x40,0x1,0x46,0x0,0x0,0x0,0x0,0x2,0xA,0x0,0x0,0x0,0x0,0x1,0x26,0x0,0xFF,0xFF,0x0,0x4,0x0,0x0,0x36,0x0,0x80,0x0,0x0,0x0,0xC0,0x0,0x0,
-0x0,0x60,0x1,0x77,0x0,0x0,0x0,0x50,0x1,0x75,0x0,0x0,0x0,0x40,0x1,0x49,0x0,0x0,0x0,0x0,0x2,0xA,0x0,0x0,0x0,0x0,0x1,0x26,0x0,0xFF,0xFF,0x0,0x4,0x0,0x0,0x35,0x0,0x80,
-0x0,0x0,0x0,0xBF,0x0,0x0,0x0,0x50,0x2,0x76,0x0,0x0,0x0,0x60,0x2,0x78,0x0,0x0,0x0,0x40,0x2,0x4A,0x0,0x0,0x0,0x0,0x1,0x9,0x0,0x0,0x0,0x0,0x2,0x25,0x0,0xFF,0xFF,0x0,
-0x0,0x80,0x2,0x52,0x0,0x0,0x0,0x80,0x1,0x4F,0x0,0x0,0x0,0x80,0x0,0x4E,0x0,0xFF,0xFF,0x0,0x0,0x80,0x2,0x50,0x0,0x0,0x0,0x80,0x1,0x51,0x0,0x0,0x0,0x80,0x0,0x4D,0x0,0xFF,
-0xFF,0x0,0x0,0x80,0x2,0x50,0x0,0xFF,0xFF,0x0,0x0,0x80,0x1,0x4F,0x0,0xFF,0xFF,0x80,0x0,0x0,0x0,0x19,0x0,0x0,0x0,0x0,0x9,0x6D,0x0,0x0,0x0,0x0,0x5,0x6F,0x0,0x0,0x0,0x0,
-0x8,0x2B,0x0,0x0,0x0,0x0,0x4,0x2D,0x0,0x0,0x0,0x0,0x2,0x87,0x0,0x0,0x0,0x10,0x0,0x6D,0x0,0x0,0x0,0x20,0x0,0x6F,0x0,0x0,0x0,0x40,0x0,0x67,0x0,0x0,0x0,0x0,0x1,0x67,
-0x0,0xFF,0xFF,0x80,0x0,0x0,0x0,0x1A,0x0,0x0,0x0,0x0,0xA,0x6E,0x0,0x0,0x0,0x0,0x6,0x70,0x0,0x0,0x0,0x0,0x8,0x2C,0x0,0x0,0x0,0x0,0x4,0x2E,0x0,0x0,0x0,0x0,0x1,0x88,
-0x0,0x0,0x0,0x10,0x0,0x6E,0x0,0x0,0x0,0x20,0x0,0x70,0x0,0x0,0x0,0x40,0x0,0x68,0x0,0x0,0x0,0x0,0x2,0x68,0x0,0xFF,0xFF,0x0,0x8,0x0,0x0,0x3D,0x0,0x80,0x0,0x0,0x0,0x7F,
-0x0,0x0,0x8,0x0,0x0,0x3E,0x0,0x80,0x0,0x0,0x0,0x80,0x0,0x0,0x0,0x0,0x1,0x7B,0x0,0x0,0x0,0x0,0x2,0x7C,0x0,0xFF,0xFF,0x0,0x8,0x0,0x0,0x3D,0x0,0x0,0x8,0x0,0x0,0x3E,
-0x0,0x0,0x0,0x0,0x1,0x7D,0x0,0x0,0x0,0x0,0x2,0x7E,0x0,0xFF,0xFF,0x0,0x8,0x0,0x0,0x3D,0x0,0x0,0x8,0x0,0x0,0x3E,0x0,0x0,0x0,0x0,0x1,0x7F,0x0,0x0,0x0,0x0,0x2,0x80,
-0x0,0xFF,0xFF,0x40,0x0,0x0,0x0,0x13,0x0,0x0,0x0,0x40,0x8,0x15,0x0,0x0,0x0,0x40,0x4,0x17,0x0,0x0,0x0,0x50,0x0,0x69,0x0,0x0,0x0,0x60,0x0,0x6B,0x0,0x0,0x0,0x80,0x1,0x81,
-0x0,0x0,0x0,0x0,0x8,0x15,0x0,0x0,0x0,0x10,0x0,0x69,0x0,0x0,0x0,0x20,0x0,0x6B,0x0,0x0,0x0,0x0,0x4,0x17,0x0,0x0,0x0,0x0,0x1,0x81,0x0,0x0,0x0,0x0,0x2,0x82,0x0,0xFF,
-0xFF,0x40,0x0,0x0,0x0,0x14,0x0,0x0,0x0,0x40,0x8,0x16,0x0,0x0,0x0,0x40,0x4,0x18,0x0,0x0,0x0,0x50,0x0,0x6A,0x0,0x0,0x0,0x60,0x0,0x6C,0x0,0x0,0x0,0x80,0x2,0x82,0x0,0x0,
-0x0,0x0,0x8,0x16,0x0,0x0,0x0,0x10,0x0,0x6A,0x0,0x0,0x0,0x20,0x0,0x6C,0x0,0x0,0x0,0x0,0x4,0x18,0x0,0x0,0x0,0x0,0x2,0x82,0x0,0x0,0x0,0x0,0x1,0x81,0x0,0xFF,0xFF,0x0,
-0x4,0x0,0x0,0x37,0x0,0x0,0x0,0x0,0x2,0x1A,0x0,0x0,0x0,0x10,0x0,0x69,0x0,0x0,0x0,0x20,0x0,0x6B,0x0,0x0,0x0,0x40,0x0,0x13,0x0,0x0,0x0,0x80,0x0,0x83,0x0,0xFF,0xFF,0x0,
-0x4,0x0,0x0,0x38,0x0,0x0,0x0,0x0,0x1,0x19,0x0,0x0,0x0,0x10,0x0,0x6A,0x0,0x0,0x0,0x20,0x0,0x6C,0x0,0x0,0x0,0x40,0x0,0x14,0x0,0x0,0x0,0x80,0x0,0x84,0x0,0xFF,0xFF,0x80,
-0x0,0x0,0x0,0x4B,0x0,0x0,0x0,0x0,0x9,0xF,0x0,0x0,0x0,0x0,0x5,0x11,0x0,0x0,0x4,0x0,0x0,0x35,0x0,0x0,0x0,0x20,0x2,0x78,0x0,0x0,0x0,0x10,0x2,0x76,0x0,0x0,0x0,0x0,
-0x8,0x3,0x0,0x0,0x0,0x10,0x0,0x5,0x0,0x0,0x0,0x20,0x0,0x7,0x0,0x0,0x0,0x0,0x2,0x25,0x0,0x0,0x0,0x0,0x1,0x9,0x0,0xFF,0xFF,0x80,0x0,0x0,0x0,0x4C,0x0,0x0,0x0,0x0,
-0xA,0x10,0x0,0x0,0x0,0x0,0x6,0x12,0x0,0x0,0x4,0x0,0x0,0x36,0x0,0x0,0x0,0x20,0x1,0x77,0x0,0x0,0x0,0x10,0x1,0x75,0x0,0x0,0x0,0x0,0x8,0x4,0x0,0x0,0x0,0x10,0x0,0x6,
-0x0,0x0,0x0,0x20,0x0,0x8,0x0,0x0,0x0,0x0,0x1,0x26,0x0,0x0,0x0,0x0,0x2,0xA,0x0,0xFF,0xFF,0x80,0x0,0x0,0x2,0x1A,0x0,0x80,0x0,0x0,0x0,0x4C,0x0,0xFF,0xFF,0x80,0x0,0x0,
-0x1,0x19,0x0,0x80,0x0,0x0,0x0,0x4B,0x0,0xFF,0xFF,0x0,0x0,0x40,0xA,0xBB,0x0,0x0,0x0,0x40,0x6,0xBD,0x0,0x0,0x0,0x40,0x2,0xBC,0x0,0x0,0x0,0x10,0x0,0xBB,0x0,0x0,0x0,0x20,
-0x0,0xBD,0x0,0x0,0x0,0x40,0x0,0xBC,0x0,0x0,0x0,0x0,0x2,0xBE,0x0,0x0,0x0,0x0,0x1,0xBE,0x0,0x0,0x0,0x0,0x8,0xBE,0x0,0x0,0x0,0x0,0x4,0xBE,0x0,0xFF,0xFF,0x0,0x0,0x80,
-0x8,0xCB,0x0,0x0,0x0,0x90,0x0,0xCD,0x0,0x0,0x0,0x80,0x1,0xC9,0x0,0xFF,0xFF,0x0,0x0,0x80,0x8,0xCC,0x0,0x0,0x0,0x90,0x0,0xCE,0x0,0x0,0x0,0x80,0x2,0xCA,0x0,0xFF,0xFF,0x0,
-0x8,0x0,0x0,0xDE,0x0,0xFF,0xFF,0x0,0x0,0x40,0x9,0xED,0x0,0x0,0x0,0x40,0x5,0xEF,0x0,0x0,0x0,0x40,0x1,0xEE,0x0,0x0,0x0,0x10,0x0,0xED,0x0,0x0,0x0,0x20,0x0,0xEF,0x0,0x0,
-0x0,0x40,0x0,0xEE,0x0,0x0,0x0,0x0,0x2,0xF0,0x0,0x0,0x0,0x0,0x1,0xF0,0x0,0x0,0x0,0x0,0x8,0xF0,0x0,0x0,0x0,0x0,0x4,0xF0,0x0,0xFF,0xFF],
-0x8FC99: [0x22,0x3A,0xF6,0x90,0x60]},
-'supermetroid_msu1.ips': {0xF27: [0x20,0x30,0xCF],
-0x4F30: [0x8,0xC2,0x30,0x48,0xDA,0x5A,0x8B,0xE2,0x30,0xA9,0x80,0x48,0xAB,0xAD,0x2,0x20,0xC9,0x53,0xD0,0x69,0xAD,0x3D,0x6,0x29,0x7F,0xF0,0x5A,0xC9,0x4,0xF0,0x5E,0xCD,0x4C,0x6,0xF0,0x49,0xC9,0x5,0x30,
-0x22,0x38,0xE9,0x5,0xA8,0xAD,0xF3,0x7,0xA2,0x0,0x38,0xE9,0x3,0x90,0x3,0xE8,0xD0,0xF9,0x8A,0xA,0xAA,0xC2,0x20,0xBF,0xB8,0xCF,0x80,0x85,0x0,0xE2,0x20,0xB1,0x0,0xF0,0x33,0xA8,0x8D,0x4,
-0x20,0x9C,0x5,0x20,0xAD,0x0,0x20,0x29,0x40,0xD0,0xF9,0xAD,0x0,0x20,0x29,0x8,0xD0,0x16,0x20,0x13,0xD0,0x8D,0x7,0x20,0xA9,0xFF,0x8D,0x6,0x20,0x9C,0x40,0x21,0xC2,0x30,0xAB,0x7A,0xFA,0x68,
-0x28,0x60,0xA9,0x0,0x8D,0x7,0x20,0x8D,0x6,0x20,0xC2,0x30,0xAB,0x7A,0xFA,0x68,0x28,0x8D,0x40,0x21,0x60,0xEA,0xCF,0xEC,0xCF,0xEE,0xCF,0xF1,0xCF,0xF3,0xCF,0xF4,0xCF,0xF5,0xCF,0xF6,0xCF,0xF7,
-0xCF,0xF8,0xCF,0xFA,0xCF,0xFC,0xCF,0xFD,0xCF,0x0,0xD0,0x2,0xD0,0x3,0xD0,0x6,0xD0,0x8,0xD0,0xB,0xD0,0xC,0xD0,0xD,0xD0,0xE,0xD0,0xF,0xD0,0x10,0xD0,0x12,0xD0,0x4,0x5,0x4,0x5,0x6,
-0x0,0x7,0x8,0x9,0xA,0xB,0xC,0xD,0xE,0xF,0x10,0x11,0x0,0x12,0x13,0x15,0x14,0x16,0x17,0x18,0x0,0x19,0x0,0x1A,0x1B,0x0,0x0,0x0,0x1C,0x1D,0x1E,0x0,0x0,0x16,0x17,0xA,0xC0,0x1,
-0xF0,0xF,0xC0,0x2,0xF0,0xB,0xC0,0x1D,0xF0,0x7,0xC0,0x1E,0xF0,0x3,0xA9,0x3,0x60,0xA9,0x1,0x60]},
-'tracking.ips': {0x10CEA: [0x4C,0x0,0xFC],
-0x1139C: [0x4C,0x4,0xFC],
-0x16176: [0x5C,0x73,0xEC,0xA1],
-0x16309: [0x5C,0xC7,0xEC,0xA1],
-0x1634C: [0x5C,0xD8,0xEC,0xA1],
-0x16764: [0x5C,0xA0,0xEC,0xA1],
-0x17C00: [0x5C,0x51,0xED,0xA1,0x5C,0x69,0xED,0xA1],
-0x839A1: [0x5C,0xED,0xEC,0xA1],
-0x83EB7: [0x5C,0x13,0xED,0xA1],
-0x84107: [0x5C,0x35,0xED,0xA1],
-0x84CDE: [0x4C,0x0,0xF8],
-0x87800: [0x5C,0xFE,0xEC,0xA1],
-0x8EB05: [0x4C,0xF0,0xFF],
-0x8FFF0: [0x5C,0x7E,0xED,0xA1],
-0x10EC00: [0x8F,0x4,0xFF,0x7F,0xAD,0xB8,0x5,0x38,0xEF,0x4,0xFF,0x7F,0x8F,0x4,0xFF,0x7F,0x8A,0x22,0xB0,0xD8,0xDF,0x18,0x6F,0x4,0xFF,0x7F,0x90,0xA,0x22,0x80,0xD8,0xDF,0xE8,0x8A,0x22,0x0,0xD8,0xDF,0x22,
-0x80,0xD8,0xDF,0x60,0xBF,0x0,0x0,0x7F,0x8F,0xE,0xFF,0x7F,0xE8,0xE8,0xBF,0x0,0x0,0x7F,0x8F,0x1A,0xFF,0x7F,0x38,0xAD,0xB8,0x5,0xEF,0xE,0xFF,0x7F,0x8F,0xE,0xFF,0x7F,0xAD,0xBA,0x5,0xEF,
-0x1A,0xFF,0x7F,0x8F,0x1A,0xFF,0x7F,0x98,0xA,0xAA,0xBF,0x0,0xFC,0x7F,0x18,0x6F,0xE,0xFF,0x7F,0x9F,0x0,0xFC,0x7F,0xE8,0xE8,0xBF,0x0,0xFC,0x7F,0x6F,0x1A,0xFF,0x7F,0x9F,0x0,0xFC,0x7F,0x60,
-0xA9,0x2,0x0,0x22,0x0,0xD8,0xDF,0xAD,0xB8,0x5,0x8F,0x0,0xFF,0x7F,0x28,0xEE,0x98,0x9,0x5C,0xB7,0xE1,0x82,0xAF,0x8,0xFF,0x7F,0xF0,0x8,0xAA,0xAF,0x6,0xFF,0x7F,0x20,0x0,0xEC,0x60,0xAD,
-0xB8,0x5,0x8F,0x6,0xFF,0x7F,0x60,0xAF,0x0,0xFF,0x7F,0xA2,0x3,0x0,0x20,0x0,0xEC,0x20,0x89,0xEC,0x20,0x98,0xEC,0xAF,0x9F,0x7,0x7E,0xA,0x18,0x69,0x7,0x0,0x8F,0x8,0xFF,0x7F,0xA9,0x8,
-0x0,0x8D,0x98,0x9,0x5C,0x6A,0xE7,0x82,0xAD,0xB8,0x5,0x8F,0x2,0xFF,0x7F,0xA9,0x10,0xE3,0x8D,0x9C,0x9,0x5C,0xF,0xE3,0x82,0xAF,0x2,0xFF,0x7F,0x1A,0xA2,0x5,0x0,0x20,0x0,0xEC,0xA9,0x53,
-0xE3,0x8D,0x9C,0x9,0x5C,0x52,0xE3,0x82,0xA9,0x14,0x0,0x22,0x0,0xD8,0xDF,0xA2,0x0,0x0,0xBD,0x2C,0xC,0x5C,0xA7,0xB9,0x90,0xCD,0xCE,0x9,0xF0,0x9,0x48,0xA9,0x15,0x0,0x22,0x0,0xD8,0xDF,
-0x68,0x8D,0xCE,0x9,0x5C,0xE1,0xCC,0x90,0xAD,0xD2,0x9,0xC9,0x2,0x0,0xF0,0xC,0xCE,0xC6,0x9,0xA9,0x16,0x0,0x22,0x0,0xD8,0xDF,0x80,0xA,0xCE,0xCA,0x9,0xA9,0x17,0x0,0x22,0x0,0xD8,0xDF,
-0x5C,0xC7,0xBE,0x90,0xAD,0xD2,0x9,0xC9,0x3,0x0,0xF0,0x5,0xA9,0x1A,0x0,0x80,0x3,0xA9,0x18,0x0,0x22,0x0,0xD8,0xDF,0xAD,0xD2,0xC,0x1A,0x5C,0xB,0xC1,0x90,0xAD,0xB8,0x5,0x8F,0xA,0xFF,
-0x7F,0xAD,0xBA,0x5,0x8F,0xC,0xFF,0x7F,0x20,0x89,0xEC,0xEE,0x98,0x9,0x5C,0xED,0x8C,0x82,0x5A,0xA0,0x1B,0x0,0xA2,0xA,0xFF,0x20,0x2B,0xEC,0x7A,0x20,0x98,0xEC,0xEE,0x98,0x9,0x5C,0x9F,0x93,
-0x82,0xAD,0x23,0xA,0x29,0xFF,0x0,0x3A,0xD0,0x8,0xAD,0x46,0xB,0xC9,0x2,0x0,0xB0,0x3,0x4C,0xF4,0xED,0xAD,0x42,0xB,0x18,0x6D,0x46,0xB,0xA,0xA,0xA,0xA,0x8F,0x1E,0xFF,0x7F,0xAD,0x45,
-0xB,0x29,0xFF,0x0,0x4A,0x4A,0x4A,0x4A,0x6F,0x1E,0xFF,0x7F,0x8F,0x1E,0xFF,0x7F,0xAD,0x49,0xB,0x29,0xFF,0x0,0x4A,0x4A,0x4A,0x4A,0x6F,0x1E,0xFF,0x7F,0x8F,0x1E,0xFF,0x7F,0x18,0xA9,0x10,0x0,
-0x6F,0x1C,0xFF,0x7F,0x8D,0x4,0x42,0xE2,0x20,0xAF,0x1E,0xFF,0x7F,0x8D,0x6,0x42,0xC2,0x20,0xA9,0x1D,0x0,0x22,0xB0,0xD8,0xDF,0x18,0x6D,0x14,0x42,0xA2,0x1D,0x0,0x22,0x80,0xD8,0xDF,0xAD,0x16,
-0x42,0x8F,0x1C,0xFF,0x7F,0xAD,0x1E,0xA,0x5C,0x8,0xEB,0x91]},
-'wake_zebes.ips': {0x18EB4: [0x0,0xFF],
-0x7FF00: [0xAF,0x72,0xD8,0x7E,0x89,0x0,0x4,0xF0,0xB,0xAF,0x20,0xD8,0x7E,0x9,0x1,0x0,0x8F,0x20,0xD8,0x7E,0x60]},
-'ws_etank.ips': {0x7CC4D: [0x37,0xC3]},
-"Removes_Gravity_Suit_heat_protection": {
-0x06e37d: [0x01],
-0x0869dd: [0x01]},
-"Mother_Brain_Cutscene_Edits": {
-0x148824: [0x01,0x00],
-0x148848: [0x01,0x00],
-0x148867: [0x01,0x00],
-0x14887f: [0x01,0x00],
-0x148bdb: [0x04,0x00],
-0x14897d: [0x10,0x00],
-0x1489af: [0x10,0x00],
-0x1489e1: [0x10,0x00],
-0x148a09: [0x10,0x00],
-0x148a31: [0x10,0x00],
-0x148a63: [0x10,0x00],
-0x148a95: [0x10,0x00],
-0x148b33: [0x10,0x00],
-0x148dc6: [0xb0],
-0x148b8d: [0x12,0x00],
-0x148d74: [0x00,0x00],
-0x148d86: [0x00,0x00],
-0x148daf: [0x00,0x01],
-0x148e51: [0x01,0x00],
-0x14b93a: [0x00,0x01],
-0x148eef: [0x0a,0x00],
-0x148f0f: [0x60,0x00],
-0x14af4e: [0x0a,0x00],
-0x14af0d: [0x0a,0x00],
-0x14b00d: [0x00,0x00],
-0x14b132: [0x40,0x00],
-0x14b16d: [0x00,0x00],
-0x14b19f: [0x20,0x00],
-0x14b1b2: [0x30,0x00],
-0x14b20c: [0x03,0x00]},
-"Suit_acquisition_animation_skip":{
-0x020717: [0xea,0xea,0xea,0xea]},
-"Fix_Morph_and_Missiles_Room_State":{
-0x07e655: [0xea,0xea,0xea,0xf0,0x0c,0x4c,0x5f,0xe6]},
-"Fix_heat_damage_speed_echoes_bug":{
-0x08b629: [0x01]},
-"Disable_GT_Code":{
-0x15491c: [0x80]},
-"Disable_Space_Time_select_in_menu":{
-0x013175: [0x01]},
-"Fix_Morph_Ball_Hidden_Chozo_PLMs":{
-0x0268ce: [0x04],
-0x026e02: [0x04]},
-"Fix_Screw_Attack_selection_in_menu":{
-0x0134c5: [0x0c]},
-"No_Music":{
-0x278413: [0x6f]}
-}
+# the IPS patches data, stored in patches.bin and loaded on first use.
+#
+# patches.bin format (little endian):
+#   header: 'VPAT', u16 version, u16 patches count
+#   index: for each patch: u8 name length, name, u32 data offset, u32 data length
+#   data: for each patch, its records: u32 address, u16 length, bytes
+#
+# patches.bin is generated by patches/generate_patches.sh, which calls this
+# module with the python dict of the patches:
+#   python patches.py patches_dict.py patches.bin
+
+import os, sys, struct, mmap
+
+class PatchStore(object):
+    magic = 'VPAT'
+    version = 1
+
+    def __init__(self, fileName):
+        self.fileName = fileName
+        # loaded on first use
+        self.data = None
+        # {patch name: (offset, length)}
+        self.index = None
+
+    def load(self):
+        with open(self.fileName, 'rb') as binFile:
+            self.data = mmap.mmap(binFile.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, count) = struct.unpack_from('<4sHH', self.data, 0)
+        if magic != PatchStore.magic or version != PatchStore.version:
+            raise Exception("Wrong patches file {}".format(self.fileName))
+        self.index = {}
+        pos = 8
+        for i in range(count):
+            nameLength = struct.unpack_from('<B', self.data, pos)[0]
+            name = self.data[pos+1:pos+1+nameLength]
+            self.index[name] = struct.unpack_from('<II', self.data, pos+1+nameLength)
+            pos += 1 + nameLength + 8
+
+    def __contains__(self, patchName):
+        if self.index is None:
+            self.load()
+        return patchName in self.index
+
+    def keys(self):
+        if self.index is None:
+            self.load()
+        return self.index.keys()
+
+    def getRecords(self, patchName):
+        # return [(address, data string)]
+        if self.index is None:
+            self.load()
+        (offset, length) = self.index[patchName]
+        records = []
+        pos = offset
+        while pos < offset + length:
+            (address, size) = struct.unpack_from('<IH', self.data, pos)
+            records.append((address, self.data[pos+6:pos+6+size]))
+            pos += 6 + size
+        return records
+
+    def __getitem__(self, patchName):
+        # like the old dict: {address: [bytes]}
+        return dict([(address, [ord(c) for c in data]) for (address, data) in self.getRecords(patchName)])
+
+    @staticmethod
+    def build(patchesDict, fileName):
+        # the records are stored in the dict iteration order, which is the
+        # order they were applied in
+        names = sorted(patchesDict.keys())
+        datas = []
+        for name in names:
+            data = []
+            for (address, values) in patchesDict[name].items():
+                data.append(struct.pack('<IH', address, len(values)) + struct.pack('{}B'.format(len(values)), *values))
+            datas.append(''.join(data))
+
+        indexLength = sum([1 + len(name) + 8 for name in names])
+        offset = 8 + indexLength
+        out = [struct.pack('<4sHH', PatchStore.magic, PatchStore.version, len(names))]
+        for (name, data) in zip(names, datas):
+            out.append(struct.pack('<B', len(name)) + name + struct.pack('<II', offset, len(data)))
+            offset += len(data)
+        out += datas
+
+        with open(fileName, 'wb') as binFile:
+            binFile.write(''.join(out))
+
+patches = PatchStore(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'patches.bin'))
+
+if __name__ == "__main__":
+    # convert the python dict generated from the IPS files
+    # (executed like the old patches module to keep its dicts iteration order)
+    namespace = {}
+    execfile(sys.argv[1], namespace)
+    PatchStore.build(namespace['patches'], sys.argv[2])
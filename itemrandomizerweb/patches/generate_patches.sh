@@ -2,6 +2,10 @@
 
 [ -z "$SOLVER_DIR" ] && SOLVER_DIR=~/RandomMetroidSolver
 
+# the python dict generated from the IPS files
+PATCHES_DICT=$(mktemp) || exit 1
+trap 'rm -f "${PATCHES_DICT}"' EXIT
+
 (
 echo "patches = {"
 
@@ -61,4 +65,7 @@ echo '"Removes_Gravity_Suit_heat_protection": {
 "No_Music":{
 0x278413: [0x6f]}
 }'
-) > $SOLVER_DIR/itemrandomizerweb/patches.py
+) > "${PATCHES_DICT}"
+
+# compact binary store loaded by itemrandomizerweb/patches.py
+python2 $SOLVER_DIR/itemrandomizerweb/patches.py "${PATCHES_DICT}" $SOLVER_DIR/itemrandomizerweb/patches.bin
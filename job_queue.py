@@ -0,0 +1,301 @@
+#!/usr/bin/python
+
+# local job queue for the web site randomizer and solver, so that a web2py
+# worker doesn't wait for the whole generation or solving of a rom.
+#
+# the jobs are stored in a sqlite db: the web services insert them and return
+# the job key, a fixed pool of workers started with this script runs them, and
+# the clients poll the job status to get the result.
+#
+# a job is a randomizer.py or solver.py command line. the workers are forked
+# from a process which has already imported the modules and compiled the
+# logic. each job runs in a new process forked from its worker with the same
+# command line as the web site used to call, so the global state changed by a
+# job never leaks to the next one.
+#
+# the queue depth, wait time and run time are given by JobQueue.stats(), on
+# the web site stats page or with: job_queue.py --stats
+
+import sys, os, time, json, sqlite3, argparse, runpy, signal, multiprocessing
+
+import log
+
+defaultDB = os.path.expanduser("~/RandomMetroidSolver/jobs.db")
+
+scripts = {
+    'randomizer': 'randomizer.py',
+    'solver': 'solver.py'
+}
+
+class JobQueue(object):
+    # a worker which didn't update its heartbeat for this time (s) is dead
+    workerTimeout = 30
+    # the finished jobs are removed after this time (s)
+    keepTime = 24*3600
+    # a job still running after this time (s) is stopped and failed
+    maxRunTime = 300
+
+    def __init__(self, dbFileName=defaultDB):
+        # autocommit, the transactions are explicit
+        self.conn = sqlite3.connect(dbFileName, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        # status: queued, running, done, collected (result sent to the client)
+        self.conn.execute("""create table if not exists jobs (
+                               id integer primary key autoincrement,
+                               key text unique, type text, cwd text, args text, data text,
+                               status text, ret integer, worker text,
+                               queued real, started real, finished real, files text)""")
+        # db created before the files column
+        if 'files' not in [column[1] for column in self.conn.execute("pragma table_info(jobs)")]:
+            self.conn.execute("alter table jobs add column files text")
+        self.conn.execute("create index if not exists jobs_status on jobs (status, id)")
+        self.conn.execute("create table if not exists workers (name text primary key, pid integer, seen real, job integer)")
+
+    def close(self):
+        self.conn.close()
+
+    def getJob(self, row):
+        if row is None:
+            return None
+        job = dict(row)
+        job['args'] = json.loads(job['args'])
+        job['data'] = json.loads(job['data'])
+        return job
+
+    # web site side
+
+    # args: the script command line parameters, data: for the caller to
+    # process the result, files: the temporary files of the job, removed
+    # with the job if its result is never collected. return the job key
+    def submit(self, type, args, data=None, files=[]):
+        key = os.urandom(16).encode('hex')
+        self.conn.execute("insert into jobs (key, type, cwd, args, data, status, queued, files) values (?, ?, ?, ?, ?, 'queued', ?, ?)",
+                          (key, type, os.getcwd(), json.dumps(args), json.dumps(data), time.time(), json.dumps(files)))
+        return key
+
+    def get(self, key):
+        job = self.getJob(self.conn.execute("select * from jobs where key = ?", (key,)).fetchone())
+        if job is not None and job['status'] == 'queued':
+            # number of jobs before it
+            job['position'] = self.conn.execute("select count(*) from jobs where status = 'queued' and id < ?", (job['id'],)).fetchone()[0]
+        return job
+
+    # long poll: wait for the end of the job, at most timeout seconds
+    def wait(self, key, timeout, interval=0.25):
+        end = time.time() + timeout
+        job = self.get(key)
+        while job is not None and job['status'] in ['queued', 'running'] and time.time() < end:
+            time.sleep(interval)
+            job = self.get(key)
+        return job
+
+    def collect(self, key):
+        # only one caller gets the result of a job, return True for this caller
+        cursor = self.conn.execute("update jobs set status = 'collected' where key = ? and status = 'done'", (key,))
+        return cursor.rowcount == 1
+
+    def workersAlive(self):
+        return self.conn.execute("select count(*) from workers where seen > ?",
+                                 (time.time() - JobQueue.workerTimeout,)).fetchone()[0]
+
+    # workers side
+
+    def take(self, worker):
+        # the queue is empty most of the time, check it without the write lock
+        if self.conn.execute("select id from jobs where status = 'queued' limit 1").fetchone() is None:
+            return None
+        # get the oldest queued job, the lock prevents two workers from taking it
+        self.conn.execute("begin immediate")
+        try:
+            row = self.conn.execute("select * from jobs where status = 'queued' order by id limit 1").fetchone()
+            if row is not None:
+                self.conn.execute("update jobs set status = 'running', worker = ?, started = ? where id = ?",
+                                  (worker, time.time(), row['id']))
+                # in the same transaction, so the job is never seen without its worker
+                self.heartbeat(worker, row['id'])
+            self.conn.execute("commit")
+        except:
+            self.conn.execute("rollback")
+            raise
+        return self.getJob(row)
+
+    def finish(self, id, ret):
+        # the job can have been failed by failLostJobs
+        self.conn.execute("update jobs set status = 'done', ret = ?, finished = ? where id = ? and status = 'running'",
+                          (ret, time.time(), id))
+
+    def heartbeat(self, worker, job=None):
+        self.conn.execute("insert or replace into workers (name, pid, seen, job) values (?, ?, ?, ?)",
+                          (worker, os.getpid(), time.time(), job))
+
+    def recover(self):
+        # jobs running when the workers were stopped are lost
+        now = time.time()
+        self.conn.execute("update jobs set status = 'done', ret = -1, finished = ? where status = 'running'", (now,))
+        self.conn.execute("delete from workers")
+
+    def failLostJobs(self):
+        # the running jobs which are not the job of a live worker: their
+        # worker died or was restarted, they will never finish
+        now = time.time()
+        self.conn.execute("""update jobs set status = 'done', ret = -1, finished = ?
+                               where status = 'running' and id not in
+                                 (select job from workers where seen > ? and job is not null)""",
+                          (now, now - JobQueue.workerTimeout))
+
+    def purge(self):
+        limit = time.time() - JobQueue.keepTime
+        # the collected jobs files are removed when their result is processed
+        self.conn.execute("delete from jobs where status = 'collected' and finished < ?", (limit,))
+        rows = self.conn.execute("select id, cwd, files from jobs where status = 'done' and finished < ?", (limit,)).fetchall()
+        for row in rows:
+            # not collected in the meantime
+            if self.conn.execute("delete from jobs where id = ? and status = 'done'", (row['id'],)).rowcount == 0:
+                continue
+            for fileName in json.loads(row['files'] or '[]'):
+                try:
+                    os.remove(os.path.join(row['cwd'], fileName))
+                except OSError:
+                    pass
+
+    # capacity planning: queue depth, and wait/run times of the jobs started
+    # in the last period (s)
+    def stats(self, period=3600):
+        ret = {
+            'queued': self.conn.execute("select count(*) from jobs where status = 'queued'").fetchone()[0],
+            'running': self.conn.execute("select count(*) from jobs where status = 'running'").fetchone()[0],
+            'workers': self.workersAlive(),
+            'oldestQueued': 0.0,
+            'types': {}
+        }
+        oldest = self.conn.execute("select min(queued) from jobs where status = 'queued'").fetchone()[0]
+        if oldest is not None:
+            ret['oldestQueued'] = round(time.time() - oldest, 3)
+        rows = self.conn.execute("""select type, count(*), sum(ret != 0),
+                                           avg(started - queued), max(started - queued),
+                                           avg(finished - started), max(finished - started)
+                                    from jobs where started > ? and finished is not null
+                                    group by type""", (time.time() - period,))
+        for (type, count, errors, waitAvg, waitMax, runAvg, runMax) in rows:
+            ret['types'][type] = {
+                'count': count,
+                'errors': errors,
+                'waitAvg': round(waitAvg, 3),
+                'waitMax': round(waitMax, 3),
+                'runAvg': round(runAvg, 3),
+                'runMax': round(runMax, 3)
+            }
+        return ret
+
+# in the job process
+def runJob(cwd, script, args):
+    # relative file names are from the web site directory
+    os.chdir(cwd)
+    # the exit code is the one of the script
+    sys.argv = [script] + args
+    runpy.run_path(script, run_name='__main__')
+
+def runJobProcess(queue, name, job, maxRunTime):
+    baseDir = os.path.dirname(os.path.abspath(__file__))
+    process = multiprocessing.Process(target=runJob,
+                                      args=(job['cwd'], os.path.join(baseDir, scripts[job['type']]), job['args']))
+    process.start()
+    end = time.time() + maxRunTime
+    while process.is_alive():
+        process.join(min(JobQueue.workerTimeout / 3, max(end - time.time(), 0)))
+        if process.is_alive() and time.time() >= end:
+            log.get('JobQueue').error("worker {}: job {} still running after {}s, stopped".format(name, job['id'], maxRunTime))
+            process.terminate()
+            process.join()
+            queue.finish(job['id'], -1)
+            return
+        try:
+            queue.heartbeat(name, job['id'])
+        except sqlite3.Error as e:
+            # the next heartbeat can succeed, the job is failed if none does
+            log.get('JobQueue').warning("worker {} heartbeat: {}".format(name, e))
+    queue.finish(job['id'], process.exitcode)
+
+def worker(dbFileName, name, pollInterval, maxRunTime):
+    log.get('JobQueue').info("worker {} started".format(name))
+    queue = JobQueue(dbFileName)
+    lastHeartbeat = 0
+    while True:
+        # a db error (locked for too long) doesn't stop the worker, a job
+        # it couldn't finish is failed by failLostJobs
+        try:
+            # when idle, only heartbeat often enough to be seen alive
+            if time.time() - lastHeartbeat >= JobQueue.workerTimeout / 3:
+                queue.heartbeat(name)
+                lastHeartbeat = time.time()
+            job = queue.take(name)
+            if job is None:
+                time.sleep(pollInterval)
+                continue
+            runJobProcess(queue, name, job, maxRunTime)
+            lastHeartbeat = 0
+        except sqlite3.Error as e:
+            log.get('JobQueue').error("worker {}: {}".format(name, e))
+            time.sleep(pollInterval)
+
+def startWorker(dbFileName, name, pollInterval, maxRunTime):
+    process = multiprocessing.Process(target=worker, args=(dbFileName, name, pollInterval, maxRunTime), name=name)
+    process.start()
+    return process
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Randomizer and solver jobs workers")
+    parser.add_argument('--db', help="the jobs sqlite db", dest='db', nargs='?', default=defaultDB)
+    parser.add_argument('--jobs', '-j', help="number of workers, default is the number of CPUs",
+                        dest='jobs', nargs='?', default=multiprocessing.cpu_count(), type=int)
+    parser.add_argument('--poll', help="interval between two checks of the queue when it's empty (s)",
+                        dest='poll', nargs='?', default=0.5, type=float)
+    parser.add_argument('--maxRunTime', help="max run time of a job (s), it's stopped and failed after it",
+                        dest='maxRunTime', nargs='?', default=JobQueue.maxRunTime, type=int)
+    parser.add_argument('--stats', help="display the queue stats and exit", dest='stats', action='store_true')
+    parser.add_argument('--debug', '-d', help="activate debug logging", dest='debug', action='store_true')
+    args = parser.parse_args()
+
+    if args.stats == True:
+        queue = JobQueue(args.db)
+        print(json.dumps(queue.stats(), indent=4, sort_keys=True))
+        queue.close()
+        sys.exit(0)
+
+    log.init(args.debug)
+
+    # warm up the workers: the modules and the compiled logic are inherited
+    import randomizer, solver
+    from logic_compiler import compileLogic
+    compileLogic()
+
+    queue = JobQueue(args.db)
+    queue.recover()
+    queue.close()
+
+    # to stop the workers in the finally
+    def stop(signum, frame):
+        sys.exit(0)
+    signal.signal(signal.SIGTERM, stop)
+
+    workers = [startWorker(args.db, "worker{}".format(i), args.poll, args.maxRunTime) for i in range(args.jobs)]
+    print("{} workers started on {}".format(args.jobs, args.db))
+
+    try:
+        while True:
+            time.sleep(JobQueue.workerTimeout)
+            # restart the workers which died
+            for i in range(len(workers)):
+                if not workers[i].is_alive():
+                    workers[i] = startWorker(args.db, workers[i].name, args.poll, args.maxRunTime)
+            queue = JobQueue(args.db)
+            try:
+                queue.failLostJobs()
+                queue.purge()
+            except sqlite3.Error as e:
+                log.get('JobQueue').error("maintenance: {}".format(e))
+            finally:
+                queue.close()
+    finally:
+        for process in workers:
+            process.terminate()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+# compare the compiled logic with the lambdas: results must be the same,
+# and display the time taken by each one.
+# usage: logic_bench.py [preset] [inventories count] [evaluations per inventory] [debug]
+
+import sys, random, time
+
+from parameters import *
+from helpers import Bosses
+from smboolmanager import SMBoolManager
+from graph_locations import locations
+from graph_access import accessPoints
+from logic_compiler import LogicCompiler
+from logic_context import getContext
+from utils import PresetLoader
+from itemrandomizerweb.Items import getItemPool
+
+def getRules():
+    # the lambdas, as (name, function)
+    rules = []
+    for loc in locations:
+        for key in ['Available', 'PostAvailable']:
+            if key in loc:
+                rules.append((loc['Name']+' '+key, loc[key]))
+        for apName in sorted(loc['AccessFrom'].keys()):
+            rules.append((loc['Name']+' from '+apName, loc['AccessFrom'][apName]))
+    for ap in accessPoints:
+        rules.append((ap.Name+' traverse', ap.traverse))
+        for dstName in sorted(ap.transitions.keys()):
+            rules.append((ap.Name+' -> '+dstName, ap.transitions[dstName]))
+    return rules
+
+def getInventories(count):
+    # random subsets of the items pool, with random dead bosses
+    qty = {'energy': 'vanilla', 'minors': 100,
+           'ammo': {'Missile': 3, 'Super': 2, 'PowerBomb': 1},
+           'strictMinors': False}
+    pool = [item['Type'] for item in getItemPool(qty, [])]
+    inventories = []
+    for i in range(count):
+        random.shuffle(pool)
+        items = pool[0:random.randint(0, len(pool))]
+        bosses = [boss for boss in getContext().golden4Dead if random.random() < 0.5]
+        inventories.append((items, bosses))
+    return inventories
+
+def evalRules(sm, rules, inventories, passes):
+    results = []
+    start = time.clock()
+    for (items, bosses) in inventories:
+        sm.resetItems()
+        sm.addItems(items)
+        Bosses.reset()
+        for boss in bosses:
+            Bosses.beatBoss(boss)
+        # the randomizer and the solver evaluate the rules several times
+        # with the same inventory
+        for i in range(passes):
+            for (name, rule) in rules:
+                ret = sm.eval(rule)
+                results.append((ret.bool, ret.difficulty, ret.knows, ret.items))
+    return (time.clock() - start, results)
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 2:
+        PresetLoader.factory(sys.argv[1]).load()
+    count = 200
+    if len(sys.argv) >= 3:
+        count = int(sys.argv[2])
+    passes = 1
+    if len(sys.argv) >= 4:
+        passes = int(sys.argv[3])
+    debug = len(sys.argv) >= 5 and sys.argv[4] == 'debug'
+
+    random.seed(0)
+    inventories = getInventories(count)
+    sm = SMBoolManager()
+
+    lambdas = getRules()
+    sm.ctx.cache.reset()
+    (lambdasTime, lambdasResults) = evalRules(sm, lambdas, inventories, passes)
+
+    start = time.clock()
+    compiler = LogicCompiler()
+    compiler.compileLocations(locations)
+    compiler.compileAccessPoints(accessPoints)
+    compiler.finalize()
+    compileTime = time.clock() - start
+    compiled = getRules()
+    print("rules: {} compiled: {} nodes: {}".format(len(compiled), len(compiler.rules), len(compiler.nodes)))
+    if debug == True:
+        print(compiler.source)
+
+    sm.ctx.cache.reset()
+    (compiledTime, compiledResults) = evalRules(sm, compiled, inventories, passes)
+
+    errors = 0
+    for i in range(len(lambdasResults)):
+        if lambdasResults[i] != compiledResults[i]:
+            (name, rule) = compiled[i % len(compiled)]
+            print("ERROR: {}: lambda {} compiled {}".format(name, lambdasResults[i], compiledResults[i]))
+            errors += 1
+
+    print("inventories: {} evaluations: {} errors: {}".format(count, passes, errors))
+    print("lambdas: {:.3f}s compilation: {:.3f}s compiled: {:.3f}s".format(lambdasTime, compileTime, compiledTime))
+
+    sys.exit(1 if errors > 0 else 0)
@@ -0,0 +1,309 @@
+# compiles the locations and access points lambdas into a shared logic DAG.
+#
+# the source of each lambda is parsed and translated into nodes (wand/wor/wnot
+# operators, helpers calls leaves, constants). identical sub expressions are
+# merged, so a sub expression used by several lambdas (canPassBombPassages,
+# canHellRun('MainUpperNorfair'), ...) is computed once per inventory state.
+#
+# a python function is then generated for each rule and replaces the lambda.
+# the results of the shared nodes and of the whole rules are stored in the
+# helpers cache with the smbm state key, like the cached helpers.
+#
+# lambdas which can't be translated (python conditions, non constant
+# parameters...) are left untouched.
+
+import ast, inspect
+
+from smbool import SMBool
+from graph_helpers import HelpersGraph
+import log
+
+class UnsupportedRule(Exception):
+    pass
+
+class LogicNode(object):
+    __slots__ = ('id', 'op', 'children', 'func', 'args', 'kwargs', 'parents', 'memoize')
+
+    def __init__(self, id, op, children=(), func=None, args=(), kwargs=None):
+        self.id = id
+        # wand, wor, wnot, sm (smbm function), call (other function), const
+        self.op = op
+        self.children = children
+        # function name for sm, function for call, value for const
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        # number of nodes and rules using this node
+        self.parents = 0
+        # if true the node result is stored in the cache
+        self.memoize = False
+
+class LogicCompiler(object):
+    # smbm functions cheaper to call than to look up in the cache
+    cheapFunctions = ['haveItem', 'itemCountOk', 'energyReserveCountOk']
+
+    def __init__(self):
+        self.log = log.get('LogicCompiler')
+        self.nodes = {}
+        # compiled rules: (container, key, node)
+        self.rules = []
+        self.unsupported = 0
+        # parsed lambdas for each source file: {file: {line: [lambda ast]}}
+        self.sources = {}
+        # python source generated by finalize
+        self.source = None
+
+    def compileLocations(self, locations):
+        for loc in locations:
+            for key in ['Available', 'PostAvailable']:
+                if key in loc:
+                    self.compileRule(loc, key, loc[key])
+            if 'AccessFrom' in loc:
+                for apName in loc['AccessFrom']:
+                    self.compileRule(loc['AccessFrom'], apName, loc['AccessFrom'][apName])
+
+    def compileAccessPoints(self, accessPoints):
+        for ap in accessPoints:
+            self.compileRule(ap, 'traverse', ap.traverse)
+            for dstName in ap.transitions:
+                self.compileRule(ap.transitions, dstName, ap.transitions[dstName])
+
+    def finalize(self):
+        # generate a python function for each compiled rule and put it in
+        # place of the lambda.
+        # only the nodes used several times and the rules themselves are
+        # worth storing in the cache.
+        for node in self.nodes.values():
+            node.memoize = node.parents > 1 and self.isExpensive(node)
+        for (container, key, node) in self.rules:
+            node.memoize = self.isExpensive(node)
+
+        namespace = {}
+        lines = []
+        # children are created before their parents
+        for node in sorted(self.nodes.values(), key=lambda node: node.id):
+            if node.memoize == True:
+                namespace['n{}'.format(node.id)] = node
+                (expr, usesKey) = self.expression(node, namespace, inline=True)
+                lines += ["def m{}(sm, key):".format(node.id),
+                          "    cache = sm.ctx.cache",
+                          "    k = (n{}, key)".format(node.id),
+                          "    ret = cache.get(k)",
+                          "    if ret is None:",
+                          "        ret = {}".format(expr),
+                          "        cache.add(k, ret)",
+                          "    return ret"]
+
+        roots = set([node for (container, key, node) in self.rules])
+        for node in sorted(roots, key=lambda node: node.id):
+            (expr, usesKey) = self.expression(node, namespace)
+            lines.append("def r{}(sm):".format(node.id))
+            if usesKey == True:
+                lines.append("    key = sm.getStateKey()")
+            lines.append("    return {}".format(expr))
+
+        self.source = '\n'.join(lines) + '\n'
+        exec(compile(self.source, '<compiled logic>', 'exec'), namespace)
+
+        for (container, key, node) in self.rules:
+            function = namespace['r{}'.format(node.id)]
+            if isinstance(container, dict):
+                container[key] = function
+            else:
+                setattr(container, key, function)
+
+        shared = len([node for node in self.nodes.values() if node.parents > 1])
+        self.log.debug("compiled rules: {} unsupported: {} nodes: {} shared nodes: {}".format(len(self.rules), self.unsupported, len(self.nodes), shared))
+
+    def expression(self, node, namespace, inline=False):
+        # python expression for the node, returns (expression, uses the state key)
+        if node.memoize == True and inline == False:
+            return ("m{}(sm, key)".format(node.id), True)
+
+        if node.op in ['wand', 'wor', 'wnot']:
+            children = [self.expression(child, namespace) for child in node.children]
+            return ("sm.{}({})".format(node.op, ', '.join([expr for (expr, usesKey) in children])),
+                    True in [usesKey for (expr, usesKey) in children])
+        elif node.op == 'sm':
+            return ("sm.{}({})".format(node.func, self.arguments(node)), False)
+        elif node.op == 'call':
+            namespace['c{}'.format(node.id)] = node.func
+            return ("c{}({})".format(node.id, self.arguments(node)), False)
+        else:
+            namespace['k{}'.format(node.id)] = node.func
+            return ("k{}".format(node.id), False)
+
+    def arguments(self, node):
+        args = [repr(arg) for arg in node.args]
+        if node.kwargs is not None:
+            args += ["{}={}".format(k, repr(v)) for (k, v) in sorted(node.kwargs.items())]
+        return ', '.join(args)
+
+    def isExpensive(self, node):
+        if node.op in ['wand', 'wor', 'wnot']:
+            return True
+        elif node.op == 'sm':
+            if node.func in self.cheapFunctions or node.func[0:5] == 'knows':
+                return False
+            # helpers already in the cache
+            if len(node.args) == 0 and node.kwargs is None:
+                return getattr(getattr(HelpersGraph, node.func, None), 'cached', False) == False
+            return True
+        else:
+            return False
+
+    def compileRule(self, container, key, function):
+        try:
+            lambdaAst = self.getLambdaAst(function)
+            node = self.compileNode(lambdaAst.body, function)
+        except UnsupportedRule as e:
+            self.log.debug("can't compile lambda at {}:{}: {}".format(function.__code__.co_filename, function.__code__.co_firstlineno, e))
+            self.unsupported += 1
+            return
+
+        node.parents += 1
+        self.rules.append((container, key, node))
+
+    def getLambdaAst(self, function):
+        code = function.__code__
+        if function.__name__ != '<lambda>' or code.co_argcount != 1 or function.__defaults__ is not None or function.__closure__ is not None:
+            raise UnsupportedRule("not a simple lambda")
+
+        fileName = code.co_filename
+        if fileName not in self.sources:
+            self.sources[fileName] = self.parseLambdas(function)
+
+        candidates = self.sources[fileName].get(code.co_firstlineno, [])
+        if len(candidates) != 1:
+            raise UnsupportedRule("{} lambdas on the line".format(len(candidates)))
+
+        return candidates[0]
+
+    def parseLambdas(self, function):
+        lambdas = {}
+        try:
+            source = inspect.getsource(inspect.getmodule(function))
+        except (IOError, TypeError):
+            return lambdas
+        for node in ast.walk(ast.parse(source)):
+            if isinstance(node, ast.Lambda):
+                if node.lineno not in lambdas:
+                    lambdas[node.lineno] = []
+                lambdas[node.lineno].append(node)
+        return lambdas
+
+    def getNode(self, key, op, children=(), func=None, args=(), kwargs=None):
+        # common sub expressions elimination
+        if key in self.nodes:
+            return self.nodes[key]
+
+        node = LogicNode(len(self.nodes), op, children, func, args, kwargs)
+        for child in children:
+            child.parents += 1
+        self.nodes[key] = node
+        return node
+
+    def compileNode(self, expr, function):
+        argName = function.__code__.co_varnames[0]
+
+        if isinstance(expr, ast.Call):
+            if getattr(expr, 'starargs', None) is not None or getattr(expr, 'kwargs', None) is not None:
+                raise UnsupportedRule("*args/**kwargs")
+            if not isinstance(expr.func, ast.Attribute):
+                raise UnsupportedRule("call of {}".format(type(expr.func).__name__))
+
+            funcName = expr.func.attr
+            if isinstance(expr.func.value, ast.Name) and expr.func.value.id == argName:
+                if funcName in ['wand', 'wor', 'wnot']:
+                    if len(expr.keywords) > 0:
+                        raise UnsupportedRule("keywords in {}".format(funcName))
+                    children = tuple([self.compileNode(arg, function) for arg in expr.args])
+                    return self.getNode((funcName, tuple([child.id for child in children])),
+                                        funcName, children=children)
+                else:
+                    (args, kwargs) = self.getArgs(expr, function)
+                    return self.getNode(('sm', funcName, self.typedKey(args), self.typedKey(kwargs)),
+                                        'sm', func=funcName, args=args, kwargs=kwargs)
+            else:
+                # Bosses.bossDead('Kraid'), RomPatches.has(RomPatches.BlueBrinstarBlueDoor)...
+                func = self.getConstant(expr.func, function)
+                if not callable(func):
+                    raise UnsupportedRule("{} is not callable".format(funcName))
+                (args, kwargs) = self.getArgs(expr, function)
+                return self.getNode(('call', func, self.typedKey(args), self.typedKey(kwargs)),
+                                    'call', func=func, args=args, kwargs=kwargs)
+        else:
+            value = self.getValue(expr, function)
+            return self.getNode(('const', type(value), id(value)), 'const', func=value)
+
+    def getArgs(self, expr, function):
+        args = tuple([self.getValue(arg, function) for arg in expr.args])
+        if len(expr.keywords) > 0:
+            kwargs = dict([(keyword.arg, self.getValue(keyword.value, function)) for keyword in expr.keywords])
+        else:
+            kwargs = None
+        return (args, kwargs)
+
+    def typedKey(self, values):
+        # 1 and 1.0 and True are equal but must not be merged
+        if values is None:
+            return None
+        elif isinstance(values, dict):
+            return tuple(sorted([(k, type(v), v) for k, v in values.items()]))
+        else:
+            return tuple([(type(v), v) for v in values])
+
+    def getValue(self, expr, function):
+        # only immutable values can be used, the others (like the Knows)
+        # can change after the compilation
+        value = self.getConstant(expr, function)
+        if isinstance(value, (int, long, float, str, unicode, bool, type(None))):
+            return value
+        elif isinstance(value, SMBool) and isinstance(expr, ast.Name):
+            # module level smbool constant
+            return value
+        else:
+            raise UnsupportedRule("mutable value {}".format(type(value).__name__))
+
+    def getConstant(self, expr, function):
+        # values known at compile time: literals and module level names
+        if isinstance(expr, ast.Num):
+            return expr.n
+        elif isinstance(expr, ast.Str):
+            return expr.s
+        elif isinstance(expr, ast.UnaryOp) and isinstance(expr.op, ast.USub):
+            return -self.getConstant(expr.operand, function)
+        elif isinstance(expr, ast.Name):
+            if expr.id in ['True', 'False', 'None']:
+                return {'True': True, 'False': False, 'None': None}[expr.id]
+            elif expr.id == function.__code__.co_varnames[0]:
+                raise UnsupportedRule("smbm used as a value")
+            elif expr.id in function.__globals__:
+                return function.__globals__[expr.id]
+            else:
+                raise UnsupportedRule("unknown name {}".format(expr.id))
+        elif isinstance(expr, ast.Attribute):
+            value = self.getConstant(expr.value, function)
+            if not hasattr(value, expr.attr):
+                raise UnsupportedRule("unknown attribute {}".format(expr.attr))
+            return getattr(value, expr.attr)
+        else:
+            raise UnsupportedRule("expression {}".format(type(expr).__name__))
+
+# compile the locations and access points lambdas, done once
+compiled = False
+
+def compileLogic():
+    global compiled
+    if compiled == True:
+        return
+    from graph_locations import locations
+    from graph_access import accessPoints
+    from item_dependencies import getItemDependencies
+    # the items dependencies index is built from the lambdas source
+    getItemDependencies()
+    compiler = LogicCompiler()
+    compiler.compileLocations(locations)
+    compiler.compileAccessPoints(accessPoints)
+    compiler.finalize()
+    compiled = True
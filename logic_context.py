@@ -0,0 +1,74 @@
+# the mutable state the logic depends on: the knows and settings of the loaded
+# preset, the active rom patches, the dead bosses and the helpers cache.
+#
+# the Knows, Settings and Controller classes only hold the default values.
+# each thread uses the context it activated, or the default context shared by
+# the threads which didn't activate one, so several seeds can be solved or
+# generated at the same time in one process:
+#
+#   with LogicContext():
+#       PresetLoader.factory(presetFileName).load()
+#       solver = StandardSolver(args)
+#       ...
+#
+# an SMBoolManager uses the context active when it's created, it has to be
+# used while this context is active.
+#
+# the locations and access points are still module level dicts, the solvers
+# and randomizers running at the same time can't share them.
+
+import threading
+
+from parameters import Knows, Settings, Controller, isKnows, isButton
+from cache import Cache
+
+class LogicContext(object):
+    def __init__(self):
+        # {knows name: SMBool}
+        self.knows = dict((knows, Knows.__dict__[knows]) for knows in Knows.__dict__ if isKnows(knows))
+
+        # settings tables
+        self.hardRooms = dict(Settings.hardRooms)
+        self.bossesDifficulty = dict(Settings.bossesDifficulty)
+        self.hellRuns = dict(Settings.hellRuns)
+
+        self.controller = dict((button, Controller.__dict__[button]) for button in Controller.__dict__ if isButton(button))
+
+        # RomPatches ids
+        self.activePatches = []
+
+        self.golden4Dead = {
+            'Kraid' : False,
+            'Phantoon' : False,
+            'Draygon' : False,
+            'Ridley' : False
+        }
+        # the dead bosses, used in the helpers cache key
+        self.deadKey = frozenset()
+
+        self.cache = Cache()
+
+        # context active before this one in the thread, when used with 'with'
+        self.previous = []
+
+    def activate(self):
+        # for the current thread
+        LogicContext.local.current = self
+
+    def __enter__(self):
+        self.previous.append(getattr(LogicContext.local, 'current', None))
+        self.activate()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        LogicContext.local.current = self.previous.pop()
+
+LogicContext.local = threading.local()
+LogicContext.default = LogicContext()
+
+# the context of the current thread
+def getContext():
+    ctx = getattr(LogicContext.local, 'current', None)
+    if ctx is None:
+        return LogicContext.default
+    return ctx
@@ -1,6 +1,7 @@
 
-import re, struct, sys, random, os, json, copy
+import re, struct, sys, random, os, json, copy, base64, operator, mmap
 from smbool import SMBool
+from logic_context import getContext
 from itemrandomizerweb import Items
 from itemrandomizerweb.patches import patches
 from itemrandomizerweb import Items
@@ -13,9 +14,7 @@ def readWord(romFile):
     return word
 
 def writeWord(romFile, w):
-    (w0, w1) = (w & 0x00FF, (w & 0xFF00) >> 8)
-    romFile.write(struct.pack('B', w0))
-    romFile.write(struct.pack('B', w1))
+    romFile.write(struct.pack('<H', w & 0xFFFF))
 
 # layout patches added by randomizers
 class RomPatches:
@@ -81,12 +80,10 @@ class RomPatches:
     # dessyreqt randomizer
     Dessy = []
 
-    ### Active patches
-    ActivePatches = []
-
+    ### Active patches: in the logic context
     @staticmethod
     def has(patch):
-        return SMBool(patch in RomPatches.ActivePatches)
+        return SMBool(patch in getContext().activePatches)
 
 class RomReader:
     # read the items in the rom
@@ -171,28 +168,81 @@ class RomReader:
         'areaLayout': {'address': 0x252FA7, 'value': 0xF8, 'desc': "Area layout additional modifications"}
     }
 
+    # the addresses read by getDict
+    dictItemsAddresses = [0x78264, 0x78404, 0x78432, 0x7852C, 0x78614, 0x786DE, 0x7879E, 0x787C2, 0x787FA, 0x78824, 0x78876, 0x7896E, 0x7899C, 0x78ACA, 0x78B24, 0x78BA4, 0x78BAC, 0x78C36, 0x78C3E, 0x78C82, 0x78CCA, 0x79108, 0x79110, 0x79184, 0x7C2E9, 0x7C337, 0x7C365, 0x7C36D, 0x7C47D, 0x7C559, 0x7C5E3, 0x7C6E5, 0x7C755, 0x7C7A7, 0x781CC, 0x781E8, 0x781EE, 0x781F4, 0x78248, 0x783EE, 0x78464, 0x7846A, 0x78478, 0x78486, 0x784AC, 0x784E4, 0x78518, 0x7851E, 0x78532, 0x78538, 0x78608, 0x7860E, 0x7865C, 0x78676, 0x7874C, 0x78798, 0x787D0, 0x78802, 0x78836, 0x7883C, 0x788CA, 0x7890E, 0x78914, 0x789EC, 0x78AE4, 0x78B46, 0x78BC0, 0x78BE6, 0x78BEC, 0x78C04, 0x78C14, 0x78C2A, 0x78C44, 0x78C52, 0x78C66, 0x78C74, 0x78CBC, 0x78E6E, 0x78E74, 0x78F30, 0x78FCA, 0x78FD2, 0x790C0, 0x79100, 0x7C265, 0x7C2EF, 0x7C319, 0x7C357, 0x7C437, 0x7C43D, 0x7C483, 0x7C4AF, 0x7C4B5, 0x7C533, 0x7C5DD, 0x7C5EB, 0x7C5F1, 0x7C603, 0x7C609, 0x7C74D]
+    dictDoorsAddresses = [0x18c22, 0x18aea, 0x18a42, 0x18e9e, 0x18bfe, 0x18e86, 0x18f0a, 0x189ca, 0x18aae, 0x196d2, 0x19a4a, 0x1922e, 0x195fa, 0x1967e, 0x1a39c, 0x1a510, 0x18aa2, 0x1a480, 0x1902a, 0x190c6, 0x18af6, 0x1a384, 0x1a390, 0x1a330, 0x18c52, 0x191e6]
+
+    # all the addresses read from the rom, computed on first use
+    addresses = None
+
     def __init__(self, romFile, magic=None):
         self.romFile = romFile
         self.race = None
         if magic is not None:
             from race_mode import RaceModeReader
             self.race = RaceModeReader(self, magic)
+        # {address: value}, read in one pass on first use
+        self.data = None
+
+    @staticmethod
+    def getAddresses():
+        # item bytes and morph ball marker of each location, room ptr and
+        # entry screen of each door, patches markers
+        if RomReader.addresses is None:
+            from graph_locations import locations
+            from graph_access import accessPoints
+            addresses = set()
+            # the interactive solver adds locations without address (mother brain)
+            locsAddresses = [loc['Address'] for loc in locations if 'Address' in loc]
+            for address in RomReader.dictItemsAddresses + locsAddresses:
+                addresses.update([address, address+1, address+4])
+            doors = [0x10000 | ap.ExitInfo['DoorPtr'] for ap in accessPoints if ap.Name != 'Landing Site' and ap.Internal == False]
+            for address in RomReader.dictDoorsAddresses + doors:
+                addresses.update([address, address+1, address+6, address+7])
+            addresses.update([patch['address'] for patch in RomReader.patches.values()])
+            RomReader.addresses = sorted(addresses)
+        return RomReader.addresses
+
+    def readData(self):
+        addresses = RomReader.getAddresses()
+        if isinstance(self.romFile, FakeROM):
+            # only the uploaded addresses are available
+            self.data = dict([(address, self.romFile[address]) for address in addresses if address in self.romFile])
+        else:
+            # map the rom to only read the pages of the addresses
+            rom = mmap.mmap(self.romFile.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                romSize = len(rom)
+                addresses = [address for address in addresses if address < romSize]
+                values = bytearray(''.join(operator.itemgetter(*addresses)(rom)))
+            finally:
+                rom.close()
+            self.data = dict(zip(addresses, values))
+
+    def readByte(self, address):
+        # not in the rom or not a known address
+        self.romFile.seek(address)
+        return struct.unpack("B", self.romFile.read(1))[0]
+
+    def getBytes(self, addresses):
+        if self.data is None:
+            self.readData()
+        data = self.data
+        return [data[address] if address in data else self.readByte(address) for address in addresses]
+
+    def getByte(self, address):
+        return self.getBytes([address])[0]
 
     def readWord(self):
         return readWord(self.romFile)
 
-    def getItemBytes(self):
-        value1 = struct.unpack("B", self.romFile.read(1))[0]
-        value2 = struct.unpack("B", self.romFile.read(1))[0]
-        return (value1, value2)
-
     def getItem(self, address, visibility):
         # return the hex code of the object at the given address
-        self.romFile.seek(address)
         # value is in two bytes
-        if self.race is None:
-            (value1, value2) = self.getItemBytes()
-        else:
+        # the fifth byte is used to detect dessyreqt missiles
+        (value1, value2, value3) = self.getBytes([address, address+1, address+4])
+        if self.race is not None:
+            self.romFile.seek(address)
             (value1, value2) = self.race.getItemBytes(address)
 
         # match itemVisibility with
@@ -212,11 +262,9 @@ class RomReader:
         # 0x1a is to say that the item is a morphball
         # 0xeedb is missile item
         # 0x786de is Morphing Ball location
-        self.romFile.seek(address+4)
-        value3 = struct.unpack("B", self.romFile.read(1))[0]
-        if (value3 == int('0x1a', 16)
-            and int(itemCode, 16) == int('0xeedb', 16)
-            and address != int('0x786DE', 16)):
+        if (value3 == 0x1a
+            and itemCode == '0xeedb'
+            and address != 0x786DE):
             return hex(0)
         else:
             return itemCode
@@ -296,21 +344,15 @@ class RomReader:
             return transitions
 
     def getTransition(self, doorPtr):
-        self.romFile.seek(0x10000 | doorPtr)
-
-        # room ptr is in two bytes
-        v1 = struct.unpack("B", self.romFile.read(1))[0]
-        v2 = struct.unpack("B", self.romFile.read(1))[0]
+        address = 0x10000 | doorPtr
 
-        self.romFile.seek((0x10000 | doorPtr) + 6)
-        sx = struct.unpack("B", self.romFile.read(1))[0]
-        sy = struct.unpack("B", self.romFile.read(1))[0]
+        # room ptr is in two bytes, then entry screen at +6
+        (v1, v2, sx, sy) = self.getBytes([address, address+1, address+6, address+7])
 
         return (v1 | (v2 << 8), (sx, sy))
 
     def patchPresent(self, patchName):
-        self.romFile.seek(self.patches[patchName]['address'])
-        value = struct.unpack("B", self.romFile.read(1))[0]
+        value = self.getByte(self.patches[patchName]['address'])
         return value == self.patches[patchName]['value']
 
     def getPatches(self):
@@ -325,8 +367,7 @@ class RomReader:
         # for interactive solver
         result = {}
         for patchName in self.patches:
-            self.romFile.seek(self.patches[patchName]['address'])
-            value = struct.unpack("B", self.romFile.read(1))[0]
+            value = self.getByte(self.patches[patchName]['address'])
             result[self.patches[patchName]['address']] = value
         return result
 
@@ -335,55 +376,19 @@ class RomReader:
         romData = {}
 
         # locations items
-        addresses = [0x78264, 0x78404, 0x78432, 0x7852C, 0x78614, 0x786DE, 0x7879E, 0x787C2, 0x787FA, 0x78824, 0x78876, 0x7896E, 0x7899C, 0x78ACA, 0x78B24, 0x78BA4, 0x78BAC, 0x78C36, 0x78C3E, 0x78C82, 0x78CCA, 0x79108, 0x79110, 0x79184, 0x7C2E9, 0x7C337, 0x7C365, 0x7C36D, 0x7C47D, 0x7C559, 0x7C5E3, 0x7C6E5, 0x7C755, 0x7C7A7, 0x781CC, 0x781E8, 0x781EE, 0x781F4, 0x78248, 0x783EE, 0x78464, 0x7846A, 0x78478, 0x78486, 0x784AC, 0x784E4, 0x78518, 0x7851E, 0x78532, 0x78538, 0x78608, 0x7860E, 0x7865C, 0x78676, 0x7874C, 0x78798, 0x787D0, 0x78802, 0x78836, 0x7883C, 0x788CA, 0x7890E, 0x78914, 0x789EC, 0x78AE4, 0x78B46, 0x78BC0, 0x78BE6, 0x78BEC, 0x78C04, 0x78C14, 0x78C2A, 0x78C44, 0x78C52, 0x78C66, 0x78C74, 0x78CBC, 0x78E6E, 0x78E74, 0x78F30, 0x78FCA, 0x78FD2, 0x790C0, 0x79100, 0x7C265, 0x7C2EF, 0x7C319, 0x7C357, 0x7C437, 0x7C43D, 0x7C483, 0x7C4AF, 0x7C4B5, 0x7C533, 0x7C5DD, 0x7C5EB, 0x7C5F1, 0x7C603, 0x7C609, 0x7C74D]
-        for address in addresses:
-            self.romFile.seek(address)
-            romData[address] = struct.unpack("B", self.romFile.read(1))[0]
-            romData[address+1] = struct.unpack("B", self.romFile.read(1))[0]
-            self.romFile.seek(address+4)
-            romData[address+4] = struct.unpack("B", self.romFile.read(1))[0]
-
-        # start ceres
-        self.romFile.seek(0x7F1F)
-        romData[0x7F1F] = struct.unpack("B", self.romFile.read(1))[0]
-
-        # start landing site
-        self.romFile.seek(0x7F17)
-        romData[0x7F17] = struct.unpack("B", self.romFile.read(1))[0]
-
-        # layout
-        self.romFile.seek(0x21BD80)
-        romData[0x21BD80] = struct.unpack("B", self.romFile.read(1))[0]
-
-        # casual
-        self.romFile.seek(0x22E879)
-        romData[0x22E879] = struct.unpack("B", self.romFile.read(1))[0]
+        for address in RomReader.dictItemsAddresses:
+            for offset in [0, 1, 4]:
+                romData[address+offset] = self.getByte(address+offset)
 
-        # no grav heat
-        self.romFile.seek(0x06e37d)
-        romData[0x06e37d] = struct.unpack("B", self.romFile.read(1))[0]
-
-        # varia tweaks
-        self.romFile.seek(0x7CC4D)
-        romData[0x7CC4D] = struct.unpack("B", self.romFile.read(1))[0]
-
-        # area
-        self.romFile.seek(0x22D564)
-        romData[0x22D564] = struct.unpack("B", self.romFile.read(1))[0]
-
-        # area more layout
-        self.romFile.seek(0x252FA7)
-        romData[0x252FA7] = struct.unpack("B", self.romFile.read(1))[0]
+        # patches: start ceres, start landing site, layout, casual, no grav heat,
+        # varia tweaks, area, area more layout
+        for patch in self.patches.values():
+            romData[patch['address']] = self.getByte(patch['address'])
 
         # transitions
-        addresses = [0x18c22, 0x18aea, 0x18a42, 0x18e9e, 0x18bfe, 0x18e86, 0x18f0a, 0x189ca, 0x18aae, 0x196d2, 0x19a4a, 0x1922e, 0x195fa, 0x1967e, 0x1a39c, 0x1a510, 0x18aa2, 0x1a480, 0x1902a, 0x190c6, 0x18af6, 0x1a384, 0x1a390, 0x1a330, 0x18c52, 0x191e6]
-        for address in addresses:
-            self.romFile.seek(address)
-            romData[address] = struct.unpack("B", self.romFile.read(1))[0]
-            romData[address+1] = struct.unpack("B", self.romFile.read(1))[0]
-            self.romFile.seek(address+6)
-            romData[address+6] = struct.unpack("B", self.romFile.read(1))[0]
-            romData[address+7] = struct.unpack("B", self.romFile.read(1))[0]
+        for address in RomReader.dictDoorsAddresses:
+            for offset in [0, 1, 6, 7]:
+                romData[address+offset] = self.getByte(address+offset)
 
         return romData
 
@@ -472,7 +477,7 @@ class RomPatcher:
         if romFileName == None:
             self.romFile = FakeROM()
         else:
-            self.romFile = open(romFileName, 'r+')
+            self.romFile = RealROM(romFileName)
         if magic is not None:
             from race_mode import RaceModePatcher
             self.race = RaceModePatcher(self, magic)
@@ -561,10 +566,7 @@ class RomPatcher:
         self.romFile.seek(0x1410E6)
         self.romFile.write(struct.pack('B', cat))
         self.romFile.seek(0x1410E8)
-        self.romFile.write(struct.pack('B', comp))
-        self.romFile.write(struct.pack('B', op0))
-        self.romFile.write(struct.pack('B', op1))
-        self.romFile.write(struct.pack('B', branch))
+        self.romFile.write(struct.pack('BBBB', comp, op0, op1, branch))
 
     def applyIPSPatches(self, optionalPatches=[], noLayout=False, noGravHeat=False, area=False, areaLayoutBase=False, noVariaTweaks=False):
         try:
@@ -606,16 +608,15 @@ class RomPatcher:
 
     def applyIPSPatch(self, patchName):
         print("Apply patch {}".format(patchName))
-        patchData = patches[patchName]
-        for address in patchData:
+        for (address, data) in patches.getRecords(patchName):
             self.romFile.seek(address)
-            for byte in patchData[address]:
-                self.romFile.write(struct.pack('B', byte))
+            self.romFile.write(data)
 
     def writeSeed(self, seed):
-        random.seed(seed)
-        seedInfo = random.randint(0, 0xFFFF)
-        seedInfo2 = random.randint(0, 0xFFFF)
+        # don't change the state of the random module
+        rnd = random.Random(seed)
+        seedInfo = rnd.randint(0, 0xFFFF)
+        seedInfo2 = rnd.randint(0, 0xFFFF)
         self.romFile.seek(0x2FFF00)
         self.writeWord(seedInfo)
         self.writeWord(seedInfo2)
@@ -842,10 +843,10 @@ class RomPatcher:
 
     def patchBytes(self, address, array, isRace=False):
         self.romFile.seek(address)
-        for w in array:
-            if not isRace:
-                self.writeWord(w)
-            else:
+        if not isRace:
+            self.romFile.write(struct.pack('<{}H'.format(len(array)), *[w & 0xFFFF for w in array]))
+        else:
+            for w in array:
                 self.race.writeWordMagic(w)
 
     # write area randomizer transitions to ROM
@@ -868,31 +869,14 @@ class RomPatcher:
                 self.patchWestOcean(conn['DoorPtr'])
             self.romFile.seek(0x10000+conn['DoorPtr'])
 
-            # write room ptr
-            self.romFile.write(struct.pack('B', roomPtr & 0x000FF))
-            self.romFile.write(struct.pack('B', (roomPtr & 0x0FF00) >> 8))
-
-            # write bitflag (if area switch we have to set bit 0x40, and remove it if same area)
-            self.romFile.write(struct.pack('B', conn['bitFlag']))
-
-            # write direction
-            self.romFile.write(struct.pack('B', conn['direction']))
-
-            # write door cap x
-            self.romFile.write(struct.pack('B', conn['cap'][0]))
-
-            # write door cap y
-            self.romFile.write(struct.pack('B', conn['cap'][1]))
-
-            # write screen x
-            self.romFile.write(struct.pack('B', conn['screen'][0]))
-
-            # write screen y
-            self.romFile.write(struct.pack('B', conn['screen'][1]))
-
-            # write distance to spawn
-            self.romFile.write(struct.pack('B', conn['distanceToSpawn'] & 0x00FF))
-            self.romFile.write(struct.pack('B', (conn['distanceToSpawn'] & 0xFF00) >> 8))
+            # write room ptr, bitflag (if area switch we have to set bit 0x40,
+            # and remove it if same area), direction, door cap x/y, screen x/y
+            # and distance to spawn
+            self.romFile.write(struct.pack('<HBBBBBBH', roomPtr & 0xFFFF,
+                                           conn['bitFlag'], conn['direction'],
+                                           conn['cap'][0], conn['cap'][1],
+                                           conn['screen'][0], conn['screen'][1],
+                                           conn['distanceToSpawn'] & 0xFFFF))
 
             # write door asm
             asmPatch = []
@@ -922,12 +906,10 @@ class RomPatcher:
                 asmPatch += [ 0x20, 0x47,         0XEA ]       # JSR change_song
             # return
             asmPatch += [ 0x60 ]   # RTS
-            self.romFile.write(struct.pack('B', self.asmAddress & 0x00FF))
-            self.romFile.write(struct.pack('B', (self.asmAddress & 0xFF00) >> 8))
+            self.writeWord(self.asmAddress)
 
             self.romFile.seek(self.asmAddress)
-            for byte in asmPatch:
-                self.romFile.write(struct.pack('B', byte))
+            self.romFile.write(struct.pack('{}B'.format(len(asmPatch)), *asmPatch))
 
             self.asmAddress += 0x20
         self.writeTourianRefill()
@@ -944,8 +926,7 @@ class RomPatcher:
         self.romFile.seek(tourianDoor + 10) # go to door ASM ptr field
         # write full_refill routine address
         # aseemble area_rando_door_transition.asm to print it if modified
-        self.romFile.write(struct.pack('B', 0x5C))
-        self.romFile.write(struct.pack('B', 0xEA))
+        self.romFile.write(struct.pack('BB', 0x5C, 0xEA))
 
     def writeTransitionsCredits(self, transitions):
         address = 0x273B40
@@ -997,31 +978,142 @@ class RomPatcher:
                 raise ValueError("Invalid button name : " + str(button))
             for addr in RomPatcher.controls[ctrl]:
                 self.romFile.seek(addr)
-                self.romFile.write(struct.pack('B', RomPatcher.buttons[button][0]))
-                self.romFile.write(struct.pack('B', RomPatcher.buttons[button][1]))
+                self.romFile.write(struct.pack('BB', *RomPatcher.buttons[button]))
+
+class RealROM:
+    # the ROM file loaded in a bytearray, the patches are written in memory
+    # and the file is written once when closed
+    def __init__(self, romFileName):
+        self.romFileName = romFileName
+        self.curAddress = 0
+        with open(romFileName, 'rb') as romFile:
+            self.data = bytearray(romFile.read())
+
+    def seek(self, address):
+        self.curAddress = address
+
+    def write(self, bytes):
+        end = self.curAddress + len(bytes)
+        if end > len(self.data):
+            # like a file, zero filled
+            self.data.extend(bytearray(end - len(self.data)))
+        self.data[self.curAddress:end] = bytes
+        self.curAddress = end
+
+    def read(self, byteCount):
+        ret = str(self.data[self.curAddress:self.curAddress+byteCount])
+        self.curAddress += byteCount
+        return ret
+
+    def close(self):
+        with open(self.romFileName, 'wb') as romFile:
+            romFile.write(self.data)
 
 class FakeROM:
-    # to have the same code for real ROM and the webservice
-    def __init__(self, data={}):
+    # to have the same code for real ROM and the webservice.
+    # the written bytes are stored in a sparse array of pages with a mask of
+    # the written addresses, to export them as runs of consecutive bytes
+    # instead of one value per address.
+    pageSize = 0x1000
+    fullMask = bytearray('\x01' * pageSize)
+
+    def __init__(self, data=None):
         self.curAddress = 0
-        self.data = data
+        # {page number: bytearray}
+        self.pages = {}
+        # {page number: bytearray with 1 for the written bytes}
+        self.masks = {}
+        # data is a dict of address: value
+        if data is not None:
+            for address in data:
+                self.seek(int(address))
+                self.write(struct.pack("B", data[address]))
 
     def seek(self, address):
         self.curAddress = address
 
-    def write(self, byte):
-        self.data[self.curAddress] = struct.unpack("B", byte)[0]
-        self.curAddress += 1
+    def write(self, bytes):
+        bytes = bytearray(bytes)
+        pos = 0
+        while pos < len(bytes):
+            (page, offset) = divmod(self.curAddress, FakeROM.pageSize)
+            if page not in self.pages:
+                self.pages[page] = bytearray(FakeROM.pageSize)
+                self.masks[page] = bytearray(FakeROM.pageSize)
+            size = min(len(bytes) - pos, FakeROM.pageSize - offset)
+            self.pages[page][offset:offset+size] = bytes[pos:pos+size]
+            self.masks[page][offset:offset+size] = FakeROM.fullMask[0:size]
+            pos += size
+            self.curAddress += size
 
     def read(self, byteCount):
         # in our case byteCount is always equals to 1
-        ret = struct.pack("B", self.data[self.curAddress])
+        ret = struct.pack("B", self[self.curAddress])
         self.curAddress += 1
         return ret
 
     def close(self):
         pass
 
+    def __contains__(self, address):
+        (page, offset) = divmod(address, FakeROM.pageSize)
+        return page in self.masks and self.masks[page][offset] == 1
+
+    def __getitem__(self, address):
+        # like the old dict, raise KeyError for bytes not written
+        if address not in self:
+            raise KeyError(address)
+        (page, offset) = divmod(address, FakeROM.pageSize)
+        return self.pages[page][offset]
+
+    def getRuns(self):
+        # [(address, bytearray)] of the consecutive written bytes, sorted by address
+        runs = []
+        for page in sorted(self.pages.keys()):
+            mask = self.masks[page]
+            data = self.pages[page]
+            base = page * FakeROM.pageSize
+            start = mask.find('\x01')
+            while start != -1:
+                end = mask.find('\x00', start)
+                if end == -1:
+                    end = FakeROM.pageSize
+                if len(runs) > 0 and runs[-1][0] + len(runs[-1][1]) == base + start:
+                    runs[-1][1].extend(data[start:end])
+                else:
+                    runs.append((base + start, data[start:end]))
+                start = mask.find('\x01', end)
+        return runs
+
+    def getDict(self):
+        # the old format: {address: value}
+        dictROM = {}
+        for (address, data) in self.getRuns():
+            for byte in data:
+                dictROM[address] = byte
+                address += 1
+        return dictROM
+
+    def toJson(self):
+        # {"runs": [[address, base64 bytes]]}
+        return {"runs": [[address, base64.b64encode(str(data))] for (address, data) in self.getRuns()]}
+
+    @staticmethod
+    def fromJson(jsonData):
+        # load the runs or the old dict of address: value (the keys are strings in json).
+        # the other keys (like fileName and errorMsg in the randomizer output) are ignored.
+        fakeROM = FakeROM()
+        if "runs" in jsonData:
+            for (address, data) in jsonData["runs"]:
+                fakeROM.seek(address)
+                fakeROM.write(base64.b64decode(data))
+        else:
+            for address in jsonData:
+                if address.isdigit():
+                    fakeROM.seek(int(address))
+                    fakeROM.write(struct.pack("B", jsonData[address]))
+        return fakeROM
+
 def isString(string):
     # unicode only exists in python2
     if sys.version[0] == '2':
@@ -1054,40 +1146,41 @@ class RomLoader(object):
         return self.romReader.patchPresent(patchName)
 
     def loadPatches(self):
-        RomPatches.ActivePatches = []
+        ctx = getContext()
+        ctx.activePatches = []
         isArea = False
 
         # check total base (blue bt and red tower blue door)
         if self.hasPatch("startCeres") or self.hasPatch("startLS"):
-            RomPatches.ActivePatches += [RomPatches.BlueBrinstarBlueDoor,
-                                         RomPatches.RedTowerBlueDoors]
+            ctx.activePatches += [RomPatches.BlueBrinstarBlueDoor,
+                                  RomPatches.RedTowerBlueDoors]
 
         # check total soft lock protection
         if self.hasPatch("layout"):
-            RomPatches.ActivePatches += RomPatches.TotalLayout
+            ctx.activePatches += RomPatches.TotalLayout
 
         # check total casual (blue brinstar missile swap)
         if self.hasPatch("casual"):
-            RomPatches.ActivePatches.append(RomPatches.BlueBrinstarMissile)
+            ctx.activePatches.append(RomPatches.BlueBrinstarMissile)
 
         # check gravity heat protection
         if self.hasPatch("gravityNoHeatProtection"):
-            RomPatches.ActivePatches.append(RomPatches.NoGravityEnvProtection)
+            ctx.activePatches.append(RomPatches.NoGravityEnvProtection)
 
         # check varia tweaks
         if self.hasPatch("variaTweaks"):
-            RomPatches.ActivePatches += RomPatches.VariaTweaks
+            ctx.activePatches += RomPatches.VariaTweaks
 
         # check area
         if self.hasPatch("area"):
-            RomPatches.ActivePatches += [RomPatches.SingleChamberNoCrumble,
-                                         RomPatches.AreaRandoGatesBase,
-                                         RomPatches.AreaRandoBlueDoors]
+            ctx.activePatches += [RomPatches.SingleChamberNoCrumble,
+                                  RomPatches.AreaRandoGatesBase,
+                                  RomPatches.AreaRandoBlueDoors]
             isArea = True
 
         # check area layout
         if self.hasPatch("areaLayout"):
-            RomPatches.ActivePatches.append(RomPatches.AreaRandoGatesOther)
+            ctx.activePatches.append(RomPatches.AreaRandoGatesOther)
 
         return isArea
 
@@ -1115,21 +1208,21 @@ class RomLoaderDict(RomLoader):
     # when called from the website (the js in the browser uploads a dict of address: value)
     def __init__(self, dictROM, magic=None):
         super(RomLoaderDict, self).__init__()
-        self.dictROM = dictROM
-        fakeROM = FakeROM(self.dictROM)
-        self.romReader = RomReader(fakeROM, magic)
+        # can also be an already loaded FakeROM
+        if isinstance(dictROM, FakeROM):
+            self.fakeROM = dictROM
+        else:
+            self.fakeROM = FakeROM(dictROM)
+        self.romReader = RomReader(self.fakeROM, magic)
 
     def dump(self, fileName):
         with open(fileName, 'w') as jsonFile:
-            json.dump(self.dictROM, jsonFile)
+            json.dump(self.fakeROM.getDict(), jsonFile)
 
 class RomLoaderJson(RomLoaderDict):
-    # when called from the test suite and the website (when loading already uploaded roms converted to json)
+    # when called from the test suite and the website (when loading already uploaded roms converted to json).
+    # also loads the runs generated by the randomizer web service.
     def __init__(self, jsonFileName, magic=None):
         with open(jsonFileName) as jsonFile:
-            tmpDictROM = json.load(jsonFile)
-            dictROM = {}
-            # in json keys are strings
-            for address in tmpDictROM:
-                dictROM[int(address)] = tmpDictROM[address]
-            super(RomLoaderJson, self).__init__(dictROM, magic)
+            fakeROM = FakeROM.fromJson(json.load(jsonFile))
+        super(RomLoaderJson, self).__init__(fakeROM, magic)
@@ -1,14 +1,60 @@
 # super metroid boolean
-class SMBool:
-    def __init__(self, bool, difficulty=0, knows=[], items=[]):
+class SMBool(object):
+    # no __dict__ as a lot of them are created when evaluating the logic
+    __slots__ = ('bool', 'difficulty', '_knows', '_items', 'operands')
+
+    def __init__(self, bool, difficulty=0, knows=(), items=()):
         # to avoid storing an SMBool as the bool attribute of the SMBool
         if bool == True:
             self.bool = True
         else:
             self.bool = False
         self.difficulty = difficulty
-        self.knows = knows
-        self.items = items
+        # tuples, they can be shared between smbools
+        self._knows = tuple(knows)
+        self._items = tuple(items)
+        self.operands = None
+
+    @staticmethod
+    def merge(bool, difficulty, a, b):
+        # the knows and items of the new smbool are the ones of a followed by
+        # the ones of b. they're only concatenated when they're read, most of
+        # the smbools created when evaluating the logic are never read.
+        ret = SMBool.__new__(SMBool)
+        ret.bool = bool
+        ret.difficulty = difficulty
+        ret.operands = (a, b)
+        return ret
+
+    def materialize(self):
+        (a, b) = self.operands
+        self._knows = a.knows + b.knows
+        self._items = a.items + b.items
+        self.operands = None
+
+    @property
+    def knows(self):
+        if self.operands is not None:
+            self.materialize()
+        return self._knows
+
+    @knows.setter
+    def knows(self, knows):
+        if self.operands is not None:
+            self.materialize()
+        self._knows = tuple(knows)
+
+    @property
+    def items(self):
+        if self.operands is not None:
+            self.materialize()
+        return self._items
+
+    @items.setter
+    def items(self, items):
+        if self.operands is not None:
+            self.materialize()
+        self._items = tuple(items)
 
     def __repr__(self):
         # to display the smbool as a string
@@ -36,3 +82,30 @@ class SMBool:
     def __ne__(self, other):
         # for !=
         return self.bool != other
+
+class FrozenSMBool(SMBool):
+    # smbool which can't be modified, to share it between the results
+    __slots__ = ()
+
+    def __init__(self, bool, difficulty=0):
+        object.__setattr__(self, 'bool', bool == True)
+        object.__setattr__(self, 'difficulty', difficulty)
+        object.__setattr__(self, '_knows', ())
+        object.__setattr__(self, '_items', ())
+        object.__setattr__(self, 'operands', None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("shared {} can't be modified".format(self))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (FrozenSMBool, (self.bool, self.difficulty))
+
+# shared smbools for the most common results
+smboolFalse = FrozenSMBool(False)
+smboolTrue = FrozenSMBool(True)
@@ -2,17 +2,21 @@
 
 from functools import reduce
 
-from smbool import SMBool
-from rom import RomPatches
+from smbool import SMBool, smboolFalse
 from graph_helpers import HelpersGraph
-from cache import Cache
+from logic_context import getContext
 
 class SMBoolManager(object):
     items = ['ETank', 'Missile', 'Super', 'PowerBomb', 'Bomb', 'Charge', 'Ice', 'HiJump', 'SpeedBooster', 'Wave', 'Spazer', 'SpringBall', 'Varia', 'Plasma', 'Grapple', 'Morph', 'Reserve', 'Gravity', 'XRayScope', 'SpaceJump', 'ScrewAttack']
     countItems = ['ETank', 'Reserve', 'Missile', 'Super', 'PowerBomb']
-
-    def __init__(self):
-        Cache.reset()
+    # the inventory is stored in an int with one bit per item and a list with
+    # the count of each count item, so it can be copied and hashed quickly.
+    itemsBits = dict((item, 1 << i) for i, item in enumerate(items))
+    countItemsIndex = dict((item, i) for i, item in enumerate(countItems))
+
+    # ctx: the logic context, the one of the current thread by default
+    def __init__(self, ctx=None):
+        self.ctx = ctx if ctx is not None else getContext()
         self.helpers = HelpersGraph(self)
         self.createFacadeFunctions()
         self.createKnowsFunctions()
@@ -22,9 +26,9 @@ class SMBoolManager(object):
         # get a dict of collected items and how many (to be displayed on the solver spoiler)
         itemsDict = {}
         for item in self.items:
-            itemsDict[item] = getattr(self, item)
+            itemsDict[item] = self.itemsMask & self.itemsBits[item] != 0
         for item in self.countItems:
-            itemsDict[item] = getattr(self, item+"Count")
+            itemsDict[item] = self.itemsCount[self.countItemsIndex[item]]
         return itemsDict
 
     def eval(self, func, item=None):
@@ -40,43 +44,74 @@ class SMBoolManager(object):
 
     def resetItems(self):
         # start without items
-        for item in SMBoolManager.items:
-            setattr(self, item, False)
-
-        for item in SMBoolManager.countItems:
-            setattr(self, item+'Count', 0)
+        self.itemsMask = 0
+        self.itemsCount = [0] * len(self.countItems)
 
-        Cache.reset()
+        self.updateItemsKey()
 
     def addItem(self, item):
-        # a new item is available
-        setattr(self, item, True)
-        if item in self.countItems:
-            setattr(self, item+'Count', getattr(self, item+'Count') + 1)
+        # a new item is available.
+        # items not used in the logic (Nothing, NoEnergy) have no bit.
+        self.itemsMask |= self.itemsBits.get(item, 0)
+        index = self.countItemsIndex.get(item)
+        if index is not None:
+            self.itemsCount[index] += 1
 
-        Cache.reset()
+        self.updateItemsKey()
 
     def addItems(self, items):
         if len(items) == 0:
             return
         for item in items:
-            setattr(self, item, True)
-            if item in self.countItems:
-                setattr(self, item+'Count', getattr(self, item+'Count') + 1)
+            self.itemsMask |= self.itemsBits.get(item, 0)
+            index = self.countItemsIndex.get(item)
+            if index is not None:
+                self.itemsCount[index] += 1
 
-        Cache.reset()
+        self.updateItemsKey()
 
     def removeItem(self, item):
         # randomizer removed an item (or the item was added to test a post available)
-        if item in self.countItems:
-            count = getattr(self, item+'Count') - 1
-            setattr(self, item+'Count', count)
-            if count == 0:
-                setattr(self, item, False)
+        index = self.countItemsIndex.get(item)
+        if index is not None:
+            self.itemsCount[index] -= 1
+            if self.itemsCount[index] == 0:
+                self.itemsMask &= ~self.itemsBits[item]
         else:
-            setattr(self, item, False)
-
-        Cache.reset()
+            self.itemsMask &= ~self.itemsBits.get(item, 0)
+
+        self.updateItemsKey()
+
+    def updateItemsKey(self):
+        # compact snapshot of the inventory: items bits + counts
+        self.itemsKey = (self.itemsMask, tuple(self.itemsCount))
+
+    def getItemsState(self):
+        # snapshot of the inventory, to be restored with setItemsState
+        return self.itemsKey
+
+    def setItemsState(self, state):
+        (self.itemsMask, itemsCount) = state
+        self.itemsCount = list(itemsCount)
+        self.itemsKey = state
+
+    def getStateKey(self):
+        # key used by the helpers cache: the helpers results depend on
+        # the inventory, the active patches and the dead bosses
+        return (self.itemsKey, self.ctx.deadKey, tuple(self.ctx.activePatches))
+
+    @staticmethod
+    def isSubState(state, other):
+        # true if the state key 'state' has less or the same items, counts
+        # and dead bosses than 'other' (with the same patches)
+        ((mask, counts), bosses, patches) = state
+        ((otherMask, otherCounts), otherBosses, otherPatches) = other
+        if mask & otherMask != mask or patches != otherPatches or not bosses <= otherBosses:
+            return False
+        for i in range(len(counts)):
+            if counts[i] > otherCounts[i]:
+                return False
+        return True
 
     def createFacadeFunctions(self):
         for fun in dir(self.helpers):
@@ -86,29 +121,28 @@ class SMBoolManager(object):
     def createKnowsFunctions(self):
         # for each knows we have a function knowsKnows (ex: knowsAlcatrazEscape()) which
         # take no parameter
-        from parameters import Knows, isKnows
-        for knows in Knows.__dict__:
-            if isKnows(knows):
-                setattr(self, 'knows'+knows, lambda knows=knows: self.knowsKnows(knows,
-                                                                                 (Knows.__dict__[knows].bool,
-                                                                                  Knows.__dict__[knows].difficulty)))
+        # the knows values are read in the context when called, the cached
+        # results are reset or switched when a preset is loaded
+        for knows in self.ctx.knows:
+            setattr(self, 'knows'+knows, lambda knows=knows: self.knowsKnows(knows,
+                                                                             (self.ctx.knows[knows].bool,
+                                                                              self.ctx.knows[knows].difficulty)))
 
     def itemCount(self, item):
         # return integer
-        return getattr(self, item+'Count')
+        return self.itemsCount[self.countItemsIndex[item]]
 
     def haveItem(self, item, difficulty=0):
-        return SMBool(getattr(self, item), difficulty, items=[item])
+        return SMBool(self.itemsMask & self.itemsBits[item] != 0, difficulty, items=[item])
 
     def knowsKnows(self, knows, smKnows):
         return SMBool(smKnows[0], smKnows[1], knows=[knows])
 
     def wand2(self, a, b):
         if a.bool is True and b.bool is True:
-            return SMBool(True, a.difficulty + b.difficulty,
-                          a.knows + b.knows, a.items + b.items)
+            return SMBool.merge(True, a.difficulty + b.difficulty, a, b)
         else:
-            return SMBool(False)
+            return smboolFalse
 
     def wand(self, a, b, c=None, d=None):
         if c is None and d is None:
@@ -123,17 +157,18 @@ class SMBoolManager(object):
         return ret
 
     def wor2(self, a, b):
+        # smbools are not modified once created, no need to copy them
         if a.bool is True and b.bool is True:
             if a.difficulty <= b.difficulty:
-                return SMBool(True, a.difficulty, a.knows, a.items)
+                return a
             else:
-                return SMBool(True, b.difficulty, b.knows, b.items)
+                return b
         elif a.bool is True:
-            return SMBool(True, a.difficulty, a.knows, a.items)
+            return a
         elif b.bool is True:
-            return SMBool(True, b.difficulty, b.knows, b.items)
+            return b
         else:
-            return SMBool(False)
+            return smboolFalse
 
     def wor(self, a, b, c=None, d=None):
         if c is None and d is None:
@@ -155,10 +190,10 @@ class SMBoolManager(object):
         if self.itemCount(item) >= count:
             return SMBool(True, difficulty, items = [item])
         else:
-            return SMBool(False)
+            return smboolFalse
 
     def energyReserveCountOk(self, count, difficulty=0):
         if self.energyReserveCount() >= count:
             return SMBool(True, difficulty, items = ['ETank', 'Reserve'])
         else:
-            return SMBool(False)
+            return smboolFalse
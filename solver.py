@@ -1,13 +1,13 @@
 #!/usr/bin/python
 
-import sys, math, argparse, re, json, os, subprocess, logging
+import sys, math, argparse, re, json, os, subprocess, logging, time, multiprocessing, heapq
 
 # the difficulties for each technics
-from parameters import Knows, Settings, isKnows, isSettings
+from parameters import Knows, isSettings
 from parameters import easy, medium, hard, harder, hardcore, mania, god, samus, impossibru, infinity, diff2text
 
 # the helper functions
-from smbool import SMBool
+from smbool import SMBool, smboolTrue
 from smboolmanager import SMBoolManager
 from helpers import Pickup, Bosses
 from rom import RomLoader
@@ -15,6 +15,8 @@ from graph_locations import locations as graphLocations
 from graph import AccessGraph
 from graph_access import vanillaTransitions, accessPoints
 from utils import PresetLoader
+from logic_compiler import compileLogic
+from item_dependencies import getItemDependencies
 import log
 
 class Conf:
@@ -55,7 +57,7 @@ class SolverState(object):
         # string of last access point
         self.state["lastLoc"] = solver.lastLoc
         # list of killed bosses: ["boss1", "boss2"]
-        self.state["bosses"] = [boss for boss in Bosses.golden4Dead if Bosses.golden4Dead[boss] == True]
+        self.state["bosses"] = Bosses.deadBosses()
         # dict {locNameWeb: {infos}, ...}
         self.state["availableLocationsWeb"] = self.getAvailableLocationsWeb(solver.majorLocations)
         # dict {locNameWeb: {infos}, ...}
@@ -214,7 +216,80 @@ class SolverState(object):
 #                print("{}: {}".format(key, self.state[key]))
 #        print("")
 
+class LocationsRulesCache(object):
+    # results of the locations rules (AccessFrom, Available and PostAvailable)
+    # with the state they were evaluated in. as the rules of most of the
+    # locations don't depend on the item just collected, a result is reused
+    # while the items the rule depends on (see item_dependencies, with their
+    # count when it's used), the dead bosses, the patches and the knows are
+    # the same as when it was evaluated: only the locations made dirty by the
+    # pickup are evaluated again.
+    # with check, the reused results are compared to a full evaluation.
+    def __init__(self, smbm, check=False):
+        self.log = log.get('RulesCache')
+        self.smbm = smbm
+        self.check = check
+        self.itemDependencies = getItemDependencies()
+        # {(loc name, rule name): [(items bits, count items indices), state key, cache version, result]}
+        self.results = {}
+
+    def getDependencies(self, locName, post):
+        # return (bits of the items, indices of the count items)
+        allItems = self.itemDependencies.allItems
+        if post == True:
+            items = self.itemDependencies.postLocations.get(locName, allItems)
+            countItems = self.itemDependencies.postLocationsCounts.get(locName, allItems)
+        else:
+            items = self.itemDependencies.locations.get(locName, allItems)
+            countItems = self.itemDependencies.locationsCounts.get(locName, allItems)
+        bits = 0
+        for item in items:
+            bits |= SMBoolManager.itemsBits[item]
+        # only the collected status of the other items is used
+        indices = [SMBoolManager.countItemsIndex[item] for item in countItems if item in SMBoolManager.countItemsIndex]
+        return (bits, indices)
+
+    def isClean(self, dependencies, state, oldState):
+        ((mask, counts), bosses, patches) = state
+        ((oldMask, oldCounts), oldBosses, oldPatches) = oldState
+        if bosses != oldBosses or patches != oldPatches:
+            return False
+        (bits, indices) = dependencies
+        if (mask ^ oldMask) & bits != 0:
+            return False
+        for i in indices:
+            if counts[i] != oldCounts[i]:
+                return False
+        return True
+
+    # item: added to the items during the evaluation (for PostAvailable)
+    def eval(self, loc, ruleName, func, item=None):
+        if item is not None:
+            self.smbm.addItem(item)
+        state = self.smbm.getStateKey()
+        key = (loc['Name'], ruleName)
+        entry = self.results.get(key)
+        if entry is None:
+            entry = [self.getDependencies(loc['Name'], ruleName == 'PostAvailable'), None, None, None]
+            self.results[key] = entry
+        (dependencies, oldState, version, ret) = entry
+        if oldState is not None and version == self.smbm.ctx.cache.version and self.isClean(dependencies, state, oldState):
+            if self.check == True:
+                fresh = func(self.smbm)
+                if (fresh.bool, fresh.difficulty, sorted(fresh.knows), sorted(fresh.items)) != (ret.bool, ret.difficulty, sorted(ret.knows), sorted(ret.items)):
+                    self.log.error("{} {}: reused {} instead of {}".format(loc['Name'], ruleName, ret, fresh))
+                    ret = fresh
+        else:
+            ret = func(self.smbm)
+            entry[1:] = [state, self.smbm.ctx.cache.version, ret]
+        if item is not None:
+            self.smbm.removeItem(item)
+        return ret
+
 class CommonSolver(object):
+    # only used by the standard solver
+    rulesCache = None
+
     def loadRom(self, rom, interactive=False, magic=None):
         self.romFileName = rom
         self.romLoader = RomLoader.factory(rom, magic)
@@ -248,17 +323,25 @@ class CommonSolver(object):
             presetLoader.printToScreen()
 
     def computeLocationsDifficulty(self, locations):
-        self.areaGraph.getAvailableLocations(locations, self.smbm, infinity, self.lastLoc)
+        self.areaGraph.getAvailableLocations(locations, self.smbm, infinity, self.lastLoc, self.rulesCache)
         # check post available functions too
         for loc in locations:
             if 'PostAvailable' in loc:
-                self.smbm.addItem(loc['itemName'])
-                postAvailable = loc['PostAvailable'](self.smbm)
-                self.smbm.removeItem(loc['itemName'])
+                if self.rulesCache is None:
+                    self.smbm.addItem(loc['itemName'])
+                    postAvailable = loc['PostAvailable'](self.smbm)
+                    self.smbm.removeItem(loc['itemName'])
+                else:
+                    postAvailable = self.rulesCache.eval(loc, 'PostAvailable', loc['PostAvailable'], loc['itemName'])
                 loc['difficulty'] = self.smbm.wand(loc['difficulty'], postAvailable)
-            # also check if we can come back to landing site from the location
-            if loc['difficulty'].bool == True:
-                loc['comeBack'] = self.areaGraph.canAccess(self.smbm, loc['accessPoint'], self.lastLoc, infinity, loc['itemName'])
+
+        # also check if we can come back to landing site from the locations,
+        # all the locations with the same item are checked at once
+        availLocs = [loc for loc in locations if loc['difficulty'].bool == True]
+        items = sorted(set([loc['itemName'] for loc in availLocs]))
+        reaching = self.areaGraph.getAccessPointsReaching(self.smbm, self.lastLoc, infinity, items)
+        for loc in availLocs:
+            loc['comeBack'] = loc['accessPoint'] in reaching[loc['itemName']]
 
         if self.log.getEffectiveLevel() == logging.DEBUG:
             self.log.debug("available locs:")
@@ -311,10 +394,15 @@ class InteractiveSolver(CommonSolver):
         self.outputFileName = output
         self.firstLogFile = None
 
-    def dumpState(self):
+    def getState(self):
         state = SolverState()
         state.fromSolver(self)
-        state.toJson(self.outputFileName)
+        return state
+
+    def dumpState(self):
+        # no output file in the solver daemon, it sends the state on its socket
+        if self.outputFileName is not None:
+            self.getState().toJson(self.outputFileName)
 
     def initialize(self, rom, presetFileName, magic=None):
         # load rom and preset, return first state
@@ -335,11 +423,19 @@ class InteractiveSolver(CommonSolver):
         self.dumpState()
 
     def iterate(self, stateJson, locName, action):
+        state = SolverState()
+        state.fromJson(stateJson)
+        self.loadState(state)
+
+        self.doAction(locName, action)
+
+        # return them
+        self.dumpState()
+
+    def loadState(self, state):
         self.locations = self.addMotherBrainLoc(graphLocations)
         self.smbm = SMBoolManager()
 
-        state = SolverState()
-        state.fromJson(stateJson)
         state.toSolver(self)
 
         RomLoader.factory(self.patches).loadPatches()
@@ -347,10 +443,12 @@ class InteractiveSolver(CommonSolver):
         self.loadPreset(self.presetFileName)
         self.areaGraph = AccessGraph(accessPoints, self.graphTransitions)
 
+    def doAction(self, locName, action):
         if action == 'clear':
             self.clear(True)
         else:
             # add already collected items to smbm
+            self.smbm.resetItems()
             self.smbm.addItems(self.collectedItems)
 
             if action == 'add':
@@ -363,9 +461,6 @@ class InteractiveSolver(CommonSolver):
         # compute new available locations
         self.computeLocationsDifficulty(self.majorLocations)
 
-        # return them
-        self.dumpState()
-
     def locNameWeb2Internal(self, locNameWeb):
         locs = {
           "EnergyTankGauntlet": "Energy Tank, Gauntlet",
@@ -528,6 +623,9 @@ class InteractiveSolver(CommonSolver):
 
     def addMotherBrainLoc(self, locations):
         # in the interactive solver mother brain is a new loc
+        # (added once, the solver daemon uses the same locations for all the solvers)
+        if locations[-1]['Name'] == 'Mother Brain':
+            return locations
         locations.append({
             'Area': "Tourian",
             'GraphArea': "Tourian",
@@ -537,16 +635,36 @@ class InteractiveSolver(CommonSolver):
             'Room': 'Mother Brain Room',
             'itemName': "Nothing",
             'AccessFrom' : {
-                'Statues Hallway Left': lambda sm: SMBool(True)
+                'Statues Hallway Left': lambda sm: smboolTrue
             },
             'Available': lambda sm: sm.wand(Bosses.allBossesDead(sm), sm.enoughStuffTourian())
         })
         return locations
 
+class LocationsQueue(object):
+    # the available locations of a solver step, ordered on their keys.
+    # only the first locations are taken, so instead of sorting all of them
+    # they're put in a heap (built in linear time). the ties are broken with
+    # the locations order, like with a stable sort.
+    def __init__(self, keyedLocations):
+        # keyedLocations: [(key, loc)]
+        self.heap = [(key, i, loc) for (i, (key, loc)) in enumerate(keyedLocations)]
+        heapq.heapify(self.heap)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def first(self):
+        return self.heap[0][2]
+
+    def pop(self):
+        return heapq.heappop(self.heap)[2]
+
 class StandardSolver(CommonSolver):
     # given a rom and parameters returns the estimated difficulty
 
-    def __init__(self, rom, presetFileName, difficultyTarget, pickupStrategy, itemsForbidden=[], type='console', firstItemsLog=None, displayGeneratedPath=False, outputFileName=None, magic=None):
+    # smbm: in batch mode, the SMBoolManager created after the preset loading is reused
+    def __init__(self, rom, presetFileName, difficultyTarget, pickupStrategy, itemsForbidden=[], type='console', firstItemsLog=None, displayGeneratedPath=False, outputFileName=None, magic=None, smbm=None):
         self.log = log.get('Solver')
 
         self.setConf(difficultyTarget, pickupStrategy, itemsForbidden, displayGeneratedPath)
@@ -562,10 +680,12 @@ class StandardSolver(CommonSolver):
         self.outputFileName = outputFileName
 
         self.locations = graphLocations
-        self.smbm = SMBoolManager()
-
         self.presetFileName = presetFileName
-        self.loadPreset(self.presetFileName)
+        if smbm is None:
+            self.smbm = SMBoolManager()
+            self.loadPreset(self.presetFileName)
+        else:
+            self.smbm = smbm
 
         self.loadRom(rom, magic=magic)
 
@@ -579,6 +699,7 @@ class StandardSolver(CommonSolver):
 
     def solveRom(self):
         self.lastLoc = 'Landing Site'
+        self.rulesCache = LocationsRulesCache(self.smbm, check=self.log.getEffectiveLevel() == logging.DEBUG)
 
         (self.difficulty, self.itemsOk) = self.computeDifficulty()
         if self.firstLogFile is not None:
@@ -688,7 +809,7 @@ class StandardSolver(CommonSolver):
                     self.log.debug("HARD END")
                 break
 
-            # sort them on difficulty and proximity
+            # order them on difficulty and proximity
             majorsAvailable = self.getAvailableItemsList(majorsAvailable, area, diffThreshold)
             if self.fullRando == True:
                 minorsAvailable = majorsAvailable
@@ -722,7 +843,7 @@ class StandardSolver(CommonSolver):
         for loc in self.majorLocations:
             self.log.debug("{} ({})".format(loc['Name'], loc['itemName']))
 
-        self.log.debug("bosses: {}".format(Bosses.golden4Dead))
+        self.log.debug("bosses: {}".format(self.smbm.ctx.golden4Dead))
 
         return (difficulty, itemsOk)
 
@@ -759,143 +880,149 @@ class StandardSolver(CommonSolver):
 
         cleanAreaWeight = self.handleNoComeBack(locations)
 
-        around = [loc for loc in locations if (loc['SolveArea'] == area or loc['distance'] < 3) and loc['difficulty'].difficulty <= threshold and not Bosses.areaBossDead(area) and 'comeBack' in loc and loc['comeBack'] == True]
         # pickup action means beating a boss, so do that first if possible
-        around.sort(key=lambda loc: (loc["areaWeight"] if "areaWeight" in loc
-                                     else 0,
-                                     0 if 'Pickup' in loc
-                                     else 1,
-                                     0 if 'comeBack' in loc and loc['comeBack'] == True
-                                     else 1,
-                                     0 if loc['SolveArea'] == area and loc['difficulty'].difficulty <= threshold
-                                     else 1,
-                                     loc['distance'] if loc['difficulty'].difficulty <= threshold
-                                     else 100000,
-                                     loc['difficulty'].difficulty))
-
-        outside = [loc for loc in locations if not loc in around]
-        self.log.debug("around1 = " + str([(loc['Name'], loc['difficulty'], loc['distance'], loc['comeBack'], loc['SolveArea']) for loc in around]))
-        self.log.debug("outside1 = " + str([(loc['Name'], loc['difficulty'], loc['distance'], loc['comeBack'], loc['SolveArea']) for loc in outside]))
+        aroundKey = lambda loc: (loc["areaWeight"] if "areaWeight" in loc
+                                 else 0,
+                                 0 if 'Pickup' in loc
+                                 else 1,
+                                 0 if 'comeBack' in loc and loc['comeBack'] == True
+                                 else 1,
+                                 0 if loc['SolveArea'] == area and loc['difficulty'].difficulty <= threshold
+                                 else 1,
+                                 loc['distance'] if loc['difficulty'].difficulty <= threshold
+                                 else 100000,
+                                 loc['difficulty'].difficulty)
         # we want to sort the outside locations by putting the ones is the same
         # area first if we don't have enough items,
         # then we sort the remaining areas starting whith boss dead status
-        outside.sort(key=lambda loc: (loc["areaWeight"] if "areaWeight" in loc
-                                      else 0,
-                                      0 if 'comeBack' in loc and loc['comeBack'] == True
-                                      else 1,
-                                      0 if loc['SolveArea'] == area and loc['difficulty'].difficulty <= threshold
-                                      else 1,
-                                      loc['distance'] if loc['difficulty'].difficulty <= threshold
-                                      else 100000,
-                                      loc['difficulty'].difficulty if not Bosses.areaBossDead(loc['Area'])
-                                                                      and loc['difficulty'].difficulty <= threshold
-                                                                      and 'Pickup' in loc
-                                      else 100000,
-                                      loc['difficulty'].difficulty if not Bosses.areaBossDead(loc['Area'])
-                                                                      and loc['difficulty'].difficulty <= threshold
-                                      else 100000,
-                                      loc['difficulty'].difficulty))
-        self.log.debug("around2 = " + str([(loc['Name'], loc['difficulty'], loc['distance'], loc['comeBack'], loc['SolveArea']) for loc in around]))
-        self.log.debug("outside2 = " + str([(loc['Name'], loc['difficulty'], loc['distance'], loc['comeBack'], loc['SolveArea']) for loc in outside]))
+        outsideKey = lambda loc: (loc["areaWeight"] if "areaWeight" in loc
+                                  else 0,
+                                  0 if 'comeBack' in loc and loc['comeBack'] == True
+                                  else 1,
+                                  0 if loc['SolveArea'] == area and loc['difficulty'].difficulty <= threshold
+                                  else 1,
+                                  loc['distance'] if loc['difficulty'].difficulty <= threshold
+                                  else 100000,
+                                  loc['difficulty'].difficulty if not Bosses.areaBossDead(loc['Area'])
+                                                                  and loc['difficulty'].difficulty <= threshold
+                                                                  and 'Pickup' in loc
+                                  else 100000,
+                                  loc['difficulty'].difficulty if not Bosses.areaBossDead(loc['Area'])
+                                                                  and loc['difficulty'].difficulty <= threshold
+                                  else 100000,
+                                  loc['difficulty'].difficulty)
+
+        # the around locations come before the outside ones
+        keyedLocations = []
+        for loc in locations:
+            if (loc['SolveArea'] == area or loc['distance'] < 3) and loc['difficulty'].difficulty <= threshold and not Bosses.areaBossDead(area) and 'comeBack' in loc and loc['comeBack'] == True:
+                keyedLocations.append(((0, aroundKey(loc)), loc))
+            else:
+                keyedLocations.append(((1, outsideKey(loc)), loc))
+        queue = LocationsQueue(keyedLocations)
+
+        if self.log.getEffectiveLevel() == logging.DEBUG:
+            for (name, side) in [("around", 0), ("outside", 1)]:
+                self.log.debug(name + " = " + str([(loc['Name'], loc['difficulty'], loc['distance'], loc['comeBack'], loc['SolveArea']) for (key, loc) in sorted(keyedLocations, key=lambda keyedLoc: keyedLoc[0]) if key[0] == side]))
 
         if cleanAreaWeight == True:
             for loc in locations:
                 del loc["areaWeight"]
 
-        return around + outside
+        return queue
 
     def nextDecision(self, majorsAvailable, minorsAvailable, hasEnoughMinors, diffThreshold, area):
         # first take major items of acceptable difficulty in the current area
         if (len(majorsAvailable) > 0
-            and majorsAvailable[0]['SolveArea'] == area
-            and majorsAvailable[0]['difficulty'].difficulty <= diffThreshold
-            and majorsAvailable[0]['comeBack'] == True):
-            return self.collectMajor(majorsAvailable.pop(0))
+            and majorsAvailable.first()['SolveArea'] == area
+            and majorsAvailable.first()['difficulty'].difficulty <= diffThreshold
+            and majorsAvailable.first()['comeBack'] == True):
+            return self.collectMajor(majorsAvailable.pop())
         # next item decision
         if len(minorsAvailable) == 0 and len(majorsAvailable) > 0:
             self.log.debug('MAJOR')
-            return self.collectMajor(majorsAvailable.pop(0))
+            return self.collectMajor(majorsAvailable.pop())
         elif len(majorsAvailable) == 0 and len(minorsAvailable) > 0:
             # we don't check for hasEnoughMinors here, because we would be stuck, so pickup
             # what we can and hope it gets better
             self.log.debug('MINOR')
-            return self.collectMinor(minorsAvailable.pop(0))
+            return self.collectMinor(minorsAvailable.pop())
         elif len(majorsAvailable) > 0 and len(minorsAvailable) > 0:
-            self.log.debug('BOTH|M=' + majorsAvailable[0]['Name'] + ', m=' + minorsAvailable[0]['Name'])
+            self.log.debug('BOTH|M=' + majorsAvailable.first()['Name'] + ', m=' + minorsAvailable.first()['Name'])
             # if both are available, decide based on area, difficulty and comeBack
-            nextMajDifficulty = majorsAvailable[0]['difficulty'].difficulty
-            nextMinArea = minorsAvailable[0]['SolveArea']
-            nextMinDifficulty = minorsAvailable[0]['difficulty'].difficulty
-            nextMajComeBack = majorsAvailable[0]['comeBack']
-            nextMinComeBack = minorsAvailable[0]['comeBack']
-            nextMajDistance = majorsAvailable[0]['distance']
-            nextMinDistance = minorsAvailable[0]['distance']
+            nextMajDifficulty = majorsAvailable.first()['difficulty'].difficulty
+            nextMinArea = minorsAvailable.first()['SolveArea']
+            nextMinDifficulty = minorsAvailable.first()['difficulty'].difficulty
+            nextMajComeBack = majorsAvailable.first()['comeBack']
+            nextMinComeBack = minorsAvailable.first()['comeBack']
+            nextMajDistance = majorsAvailable.first()['distance']
+            nextMinDistance = minorsAvailable.first()['distance']
 
             self.log.debug("diff area back dist - diff area back dist")
-            self.log.debug("maj: {} '{}' {} {}, min: {} '{}' {} {}".format(nextMajDifficulty, majorsAvailable[0]['SolveArea'], nextMajComeBack, nextMajDistance, nextMinDifficulty, nextMinArea, nextMinComeBack, nextMinDistance))
+            self.log.debug("maj: {} '{}' {} {}, min: {} '{}' {} {}".format(nextMajDifficulty, majorsAvailable.first()['SolveArea'], nextMajComeBack, nextMajDistance, nextMinDifficulty, nextMinArea, nextMinComeBack, nextMinDistance))
 
             if hasEnoughMinors == True and self.haveAllMinorTypes() == True and self.smbm.haveItem('Charge'):
                 # we have charge, no longer need minors
-                return self.collectMajor(majorsAvailable.pop(0))
+                return self.collectMajor(majorsAvailable.pop())
             else:
                 # first take item from loc where you can come back
                 if nextMajComeBack != nextMinComeBack:
                     self.log.debug("!= combeback")
                     if nextMajComeBack == True:
-                        return self.collectMajor(majorsAvailable.pop(0))
+                        return self.collectMajor(majorsAvailable.pop())
                     else:
-                        return self.collectMinor(minorsAvailable.pop(0))
+                        return self.collectMinor(minorsAvailable.pop())
                 # if not all the minors type are collected, start with minors
                 elif nextMinDifficulty <= diffThreshold and not self.haveAllMinorTypes():
                     self.log.debug("not all minors types")
-                    return self.collectMinor(minorsAvailable.pop(0))
+                    return self.collectMinor(minorsAvailable.pop())
                 elif nextMinArea == area and nextMinDifficulty <= diffThreshold:
                     self.log.debug("not enough minors")
-                    return self.collectMinor(minorsAvailable.pop(0))
+                    return self.collectMinor(minorsAvailable.pop())
                 # difficulty over area (this is a difficulty estimator, not a speedrunning simulator)
                 elif nextMinDifficulty <= diffThreshold and nextMajDistance <= diffThreshold:
                     # take the closer one
                     if nextMajDistance != nextMinDistance:
                         self.log.debug("!= distance")
                         if nextMajDistance < nextMinDistance:
-                            return self.collectMajor(majorsAvailable.pop(0))
+                            return self.collectMajor(majorsAvailable.pop())
                         else:
-                            return self.collectMinor(minorsAvailable.pop(0))
+                            return self.collectMinor(minorsAvailable.pop())
                     # take the easier
                     elif nextMinDifficulty < nextMajDifficulty:
                         self.log.debug("min easier and not enough minors")
-                        return self.collectMinor(minorsAvailable.pop(0))
+                        return self.collectMinor(minorsAvailable.pop())
                     elif nextMajDifficulty < nextMinDifficulty:
                         self.log.debug("maj easier")
-                        return self.collectMajor(majorsAvailable.pop(0))
+                        return self.collectMajor(majorsAvailable.pop())
                     # same difficulty and distance for minor and major, take major first
                     else:
-                        return self.collectMajor(majorsAvailable.pop(0))
+                        return self.collectMajor(majorsAvailable.pop())
                 elif nextMinDifficulty > diffThreshold and nextMajDistance > diffThreshold:
                     # take the easier
                     if nextMinDifficulty < nextMajDifficulty:
                         self.log.debug("min easier and not enough minors")
-                        return self.collectMinor(minorsAvailable.pop(0))
+                        return self.collectMinor(minorsAvailable.pop())
                     elif nextMajDifficulty < nextMinDifficulty:
                         self.log.debug("maj easier")
-                        return self.collectMajor(majorsAvailable.pop(0))
+                        return self.collectMajor(majorsAvailable.pop())
                     # take the closer one
                     elif nextMajDistance != nextMinDistance:
                         self.log.debug("!= distance")
                         if nextMajDistance < nextMinDistance:
-                            return self.collectMajor(majorsAvailable.pop(0))
+                            return self.collectMajor(majorsAvailable.pop())
                         else:
-                            return self.collectMinor(minorsAvailable.pop(0))
+                            return self.collectMinor(minorsAvailable.pop())
                     # same difficulty and distance for minor and major, take major first
                     else:
-                        return self.collectMajor(majorsAvailable.pop(0))
+                        return self.collectMajor(majorsAvailable.pop())
                 else:
                     if nextMinDifficulty < nextMajDifficulty:
                         self.log.debug("min easier and not enough minors")
-                        return self.collectMinor(minorsAvailable.pop(0))
+                        return self.collectMinor(minorsAvailable.pop())
                     else:
                         self.log.debug("maj easier")
-                        return self.collectMajor(majorsAvailable.pop(0))
+                        return self.collectMajor(majorsAvailable.pop())
 
         raise Exception("Can't take a decision")
 
@@ -927,8 +1054,9 @@ class StandardSolver(CommonSolver):
         knowsUsed = len(list(set(knowsUsed)))
 
         # get total of known knows
-        knowsKnown = len([knows for  knows in Knows.__dict__ if isKnows(knows) and getattr(Knows, knows)[0] == True])
-        knowsKnown += len([hellRun for hellRun in Settings.hellRuns if Settings.hellRuns[hellRun] is not None])
+        ctx = self.smbm.ctx
+        knowsKnown = len([knows for knows in ctx.knows if ctx.knows[knows][0] == True])
+        knowsKnown += len([hellRun for hellRun in ctx.hellRuns if ctx.hellRuns[hellRun] is not None])
 
         return (knowsUsed, knowsKnown)
 
@@ -969,6 +1097,8 @@ class Out(object):
             return OutWeb(solver)
         elif output == 'console':
             return OutConsole(solver)
+        elif output == 'batch':
+            return OutBatch(solver)
         else:
             raise Exception("Wrong output type for the Solver: {}".format(output))
 
@@ -1059,6 +1189,22 @@ class OutWeb:
 
         return (pngFileName, pngThumbFileName)
 
+class OutBatch:
+    def __init__(self, solver):
+        self.solver = solver
+
+    def out(self):
+        # the result is written by the batch mode
+        s = self.solver
+        s.batchResult = {
+            'difficulty': s.difficulty,
+            'itemsOk': s.itemsOk,
+            'knowsUsed': s.knowsUsed,
+            'knowsKnown': s.knowsKnown,
+            'collectedItems': len(s.collectedItems),
+            'remainMajors': len(s.getRemainMajors())
+        }
+
 class OutConsole:
     def __init__(self, solver):
         self.solver = solver
@@ -1228,7 +1374,7 @@ def interactiveSolver(args):
         sys.exit(1)
 
 def standardSolver(args):
-    if args.romFileName is None:
+    if args.romFileName is None and args.batch is None:
         print("Parameter --romFileName mandatory when not in interactive mode")
         sys.exit(1)
 
@@ -1245,6 +1391,9 @@ def standardSolver(args):
     # itemsForbidden is like that: [['Varia'], ['Reserve'], ['Gravity']], fix it
     args.itemsForbidden = [item[0] for item in args.itemsForbidden]
 
+    if args.batch is not None:
+        batchSolver(args, difficultyTarget, pickupStrategy)
+
     solver = StandardSolver(args.romFileName, args.presetFileName, difficultyTarget,
                             pickupStrategy, args.itemsForbidden, type=args.type,
                             firstItemsLog=args.firstItemsLog,
@@ -1253,6 +1402,119 @@ def standardSolver(args):
 
     solver.solveRom()
 
+class BatchWorker(object):
+    # state of a batch mode process. the preset and the smbm are kept between
+    # the roms, only the per rom state is reset (locations dicts, bosses,
+    # items, the active patches are set when loading the rom).
+    presetFileName = None
+    smbm = None
+    # copy of the locations dicts before any solving
+    locationsData = None
+
+    @staticmethod
+    def init():
+        # the output of the solver must not be mixed with the results
+        sys.stdout = sys.stderr
+
+    @staticmethod
+    def loadPreset(presetFileName):
+        if BatchWorker.presetFileName != presetFileName:
+            PresetLoader.factory(presetFileName).load()
+            BatchWorker.smbm = SMBoolManager()
+            BatchWorker.presetFileName = presetFileName
+
+    @staticmethod
+    def resetState():
+        for (loc, data) in zip(graphLocations, BatchWorker.locationsData):
+            loc.clear()
+            loc.update(data)
+        Bosses.reset()
+        BatchWorker.smbm.resetItems()
+
+    @staticmethod
+    def solve(params):
+        (romFileName, presetFileName, difficultyTarget, pickupStrategy, itemsForbidden, magic) = params
+        result = {'rom': romFileName, 'preset': presetFileName}
+        start = time.time()
+        try:
+            BatchWorker.loadPreset(presetFileName)
+            BatchWorker.resetState()
+            solver = StandardSolver(romFileName, presetFileName, difficultyTarget,
+                                    pickupStrategy, itemsForbidden, type='batch',
+                                    magic=magic, smbm=BatchWorker.smbm)
+            solver.solveRom()
+            result.update(solver.batchResult)
+            result['error'] = None
+        except Exception as e:
+            result['error'] = "{}: {}".format(type(e).__name__, e)
+            # reload the preset for the next rom
+            BatchWorker.presetFileName = None
+        result['time'] = round(time.time() - start, 3)
+        return result
+
+# the pool can only call module functions
+def batchInit():
+    BatchWorker.init()
+
+def batchSolve(params):
+    return BatchWorker.solve(params)
+
+def getBatchRoms(batch):
+    # a directory of roms/jsons or a manifest file with a rom/json per line
+    # (relative to the manifest directory)
+    if os.path.isdir(batch):
+        return [os.path.join(batch, fileName) for fileName in sorted(os.listdir(batch))
+                if os.path.splitext(fileName)[1].lower() in ['.sfc', '.smc', '.json']]
+    else:
+        baseDir = os.path.dirname(batch)
+        with open(batch) as manifest:
+            return [os.path.join(baseDir, line.strip()) for line in manifest
+                    if line.strip() != '' and not line.startswith('#')]
+
+def batchSolver(args, difficultyTarget, pickupStrategy):
+    # solve each rom with each preset, one JSON result per line in the output
+    roms = getBatchRoms(args.batch)
+    presets = args.presets if args.presets is not None else [args.presetFileName]
+    # grouped by preset to reload it as few times as possible
+    params = [(rom, preset, difficultyTarget, pickupStrategy, args.itemsForbidden, args.raceMagic)
+              for preset in presets for rom in roms]
+
+    BatchWorker.locationsData = [dict(loc) for loc in graphLocations]
+    if args.output is not None:
+        outFile = open(args.output, 'w')
+    else:
+        outFile = sys.stdout
+
+    start = time.time()
+    errors = 0
+    if args.jobs > 1:
+        pool = multiprocessing.Pool(processes=args.jobs, initializer=batchInit)
+        results = pool.imap(batchSolve, params, chunksize=max(1, min(16, len(params) / (args.jobs * 4))))
+    else:
+        pool = None
+        BatchWorker.init()
+        results = (BatchWorker.solve(param) for param in params)
+    try:
+        for result in results:
+            if result['error'] is not None:
+                errors += 1
+            outFile.write(json.dumps(result) + '\n')
+            outFile.flush()
+        if pool is not None:
+            pool.close()
+    except:
+        if pool is not None:
+            pool.terminate()
+        raise
+    finally:
+        if pool is not None:
+            pool.join()
+        if args.output is not None:
+            outFile.close()
+
+    sys.stderr.write("solved: {} roms x {} presets, {} errors in {:.1f}s\n".format(len(roms), len(presets), errors, time.time() - start))
+    sys.exit(0 if errors == 0 else 1)
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Random Metroid Solver")
     parser.add_argument('--romFileName', '-r', help="the input rom", nargs='?',
@@ -1291,12 +1553,21 @@ if __name__ == "__main__":
     parser.add_argument('--action', help="Pickup item at location, remove last pickedup location, clear all (used in interactive mode)",
                         dest="action", nargs="?", default=None, choices=['init', 'add', 'remove', 'clear', 'get'])
 
+    # batch mode
+    parser.add_argument('--batch', help="directory of roms/jsons or manifest file (one rom/json per line) to solve, the results are written in --output (or stdout) with one JSON line per rom and preset",
+                        dest='batch', nargs='?', default=None)
+    parser.add_argument('--presets', help="the preset files for the batch mode, default is --preset",
+                        dest='presets', nargs='+', default=None)
+    parser.add_argument('--jobs', '-j', help="number of processes for the batch mode",
+                        dest='jobs', nargs='?', default=1, type=int)
+
     args = parser.parse_args()
 
     if args.presetFileName is None:
         args.presetFileName = 'standard_presets/regular.json'
 
     log.init(args.debug)
+    compileLogic()
 
     if args.interactive == True:
         interactiveSolver(args)
@@ -0,0 +1,113 @@
+# cache of the web site solver results, so that the popular seeds (races,
+# community seeds) are solved only once for each preset and solver options.
+#
+# the key is content addressed: the hash of the rom bytes given to the solver
+# (items, transitions, patches), of the preset content, of the solver options
+# and of the solver code (the results are not reused after an update).
+# the results are stored in a sqlite db, the least recently used ones are
+# evicted when the results total size is above maxSize.
+
+import os, time, json, hashlib, sqlite3
+
+from rom import FakeROM
+from utils import PresetLoader
+
+defaultDB = os.path.expanduser("~/RandomMetroidSolver/solver_cache.db")
+
+# the solver code: {directory: files extensions}, the directories are
+# relative to this file
+codeFiles = {
+    '.': ['.py'],
+    # items and patches used by rom.py
+    'itemrandomizerweb': ['.py', '.bin']
+}
+
+# hash of the solver code, computed once
+codeKey = None
+
+def getCodeKey():
+    global codeKey
+    if codeKey is None:
+        baseDir = os.path.dirname(os.path.abspath(__file__))
+        md5 = hashlib.md5()
+        for directory in sorted(codeFiles):
+            for fileName in sorted(os.listdir(os.path.join(baseDir, directory))):
+                if os.path.splitext(fileName)[1] in codeFiles[directory]:
+                    md5.update(os.path.join(directory, fileName))
+                    with open(os.path.join(baseDir, directory, fileName), 'rb') as codeFile:
+                        md5.update(codeFile.read())
+        codeKey = md5.hexdigest()
+    return codeKey
+
+class SolverCache(object):
+    # max total size of the results json (bytes)
+    maxSize = 256*1024*1024
+
+    def __init__(self, dbFileName=defaultDB):
+        self.conn = sqlite3.connect(dbFileName, timeout=30, isolation_level=None)
+        self.conn.execute("create table if not exists results (key text primary key, result text, size integer, used real)")
+        self.conn.execute("create index if not exists results_used on results (used)")
+        # hits and misses counters
+        self.conn.execute("create table if not exists counters (name text primary key, value integer)")
+
+    def close(self):
+        self.conn.close()
+
+    # romDict: the json rom given to the solver, options: the solver options
+    @staticmethod
+    def getKey(romDict, presetFileName, options):
+        romKey = hashlib.md5(json.dumps(FakeROM.fromJson(romDict).toJson())).hexdigest()
+        presetKey = PresetLoader.factory(presetFileName).getKey()
+        return hashlib.md5(json.dumps([romKey, presetKey, options, getCodeKey()], sort_keys=True)).hexdigest()
+
+    def count(self, name):
+        self.conn.execute("insert or ignore into counters (name, value) values (?, 0)", (name,))
+        self.conn.execute("update counters set value = value + 1 where name = ?", (name,))
+
+    def get(self, key):
+        # return the result or None
+        row = self.conn.execute("select result from results where key = ?", (key,)).fetchone()
+        if row is None:
+            self.count('misses')
+            return None
+        self.conn.execute("update results set used = ? where key = ?", (time.time(), key))
+        self.count('hits')
+        return json.loads(row[0])
+
+    def add(self, key, result):
+        data = json.dumps(result)
+        self.conn.execute("begin immediate")
+        try:
+            self.conn.execute("insert or replace into results (key, result, size, used) values (?, ?, ?, ?)",
+                              (key, data, len(data), time.time()))
+            self.evict()
+            self.conn.execute("commit")
+        except:
+            self.conn.execute("rollback")
+            raise
+
+    def evict(self):
+        size = self.conn.execute("select coalesce(sum(size), 0) from results").fetchone()[0]
+        if size <= SolverCache.maxSize:
+            return
+        # least recently used first
+        keys = []
+        for (key, resultSize) in self.conn.execute("select key, size from results order by used"):
+            keys.append(key)
+            size -= resultSize
+            if size <= SolverCache.maxSize:
+                break
+        self.conn.executemany("delete from results where key = ?", [(key,) for key in keys])
+
+    def stats(self):
+        counters = dict(self.conn.execute("select name, value from counters").fetchall())
+        hits = counters.get('hits', 0)
+        misses = counters.get('misses', 0)
+        (entries, size) = self.conn.execute("select count(*), coalesce(sum(size), 0) from results").fetchone()
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hitRate': float(hits)/(hits + misses) if hits + misses > 0 else 0.0,
+            'entries': entries,
+            'size': size
+        }
@@ -0,0 +1,190 @@
+#!/usr/bin/python
+
+# long lived interactive solver for the web site item tracker, to avoid
+# starting a new solver process for each click.
+#
+# listens on a unix socket, one JSON request per connection:
+#   {"session": id, "action": "init", "romFileName": xxx, "presetFileName": xxx, "magic": xxx}
+#   {"session": id, "action": "add|remove|clear|get", "loc": xxx, "stateHash": xxx, "state": optional full state}
+# and answers with one JSON line:
+#   {"state": full state} for init,
+#   {"diff": {key: value}} with the state keys which have changed for the other actions,
+#   {"unknownSession": true} if the session solver is not in the daemon (evicted or
+#   daemon restarted) or if its state is not the one of the caller (stateHash, see
+#   getStateHash, the caller changed it without the daemon), the request has to be
+#   sent again with the full state,
+#   {"error": msg} if something wrong happened.
+#
+# the solvers are kept warm (preset, access graph, collected items). as the
+# locations, bosses, active patches and knows are global, when a request is for
+# another session than the previous one they're put back from the session state.
+# requests are handled one at a time.
+
+import os, json, time, copy, hashlib, argparse, socket, SocketServer
+from collections import OrderedDict
+
+from graph_locations import locations as graphLocations
+from graph_access import accessPoints
+from graph import AccessGraph
+from rom import RomLoader
+from solver import InteractiveSolver, SolverState
+from logic_compiler import compileLogic
+import log
+
+defaultSocket = os.path.expanduser("~/RandomMetroidSolver/solver_daemon.sock")
+
+# max time (s) for the daemon to answer, the web site uses solver.py after it
+clientTimeout = 10
+
+# to check that the caller and the daemon have the same session state
+def getStateHash(state):
+    return hashlib.md5(json.dumps(state, sort_keys=True)).hexdigest()
+
+class SolverSessions(object):
+    def __init__(self, maxSessions):
+        self.log = log.get('SolverDaemon')
+        self.maxSessions = maxSessions
+        # {session: (solver, state, state hash)}, least recently used first
+        self.sessions = OrderedDict()
+        # preset and transitions currently in the global state
+        self.presetFileName = None
+        self.graphTransitions = None
+
+        # copy of the locations dicts before any solving
+        self.locationsData = [dict(loc) for loc in graphLocations]
+
+    def resetLocations(self):
+        # also remove the mother brain loc added by the interactive solver
+        del graphLocations[len(self.locationsData):]
+        for (loc, data) in zip(graphLocations, self.locationsData):
+            loc.clear()
+            loc.update(data)
+
+    def store(self, session, solver, state):
+        if session in self.sessions:
+            del self.sessions[session]
+        self.sessions[session] = (solver, state, getStateHash(state))
+        if len(self.sessions) > self.maxSessions:
+            self.sessions.popitem(last=False)
+
+    def getState(self, solver):
+        # as sent to the web site (the state contains references to the solver lists)
+        return json.loads(json.dumps(solver.getState().state))
+
+    def restore(self, solver, state):
+        # put back the global state of the session. the locations are always
+        # reset to only keep what's in the state (like the solver process did),
+        # the preset and the access graph are changed only if needed.
+        self.resetLocations()
+        solver.addMotherBrainLoc(graphLocations)
+        # the solver uses the lists of the state
+        solverState = SolverState()
+        solverState.state = copy.deepcopy(state)
+        solverState.toSolver(solver)
+        RomLoader.factory(solver.patches).loadPatches()
+        if self.presetFileName != solver.presetFileName:
+            solver.loadPreset(solver.presetFileName)
+            self.presetFileName = solver.presetFileName
+        # the access graph connects the access points
+        if self.getTransitions(solver) != self.graphTransitions:
+            solver.areaGraph = AccessGraph(accessPoints, solver.graphTransitions)
+            self.graphTransitions = self.getTransitions(solver)
+
+    def getTransitions(self, solver):
+        return [tuple(transition) for transition in solver.graphTransitions]
+
+    def handle(self, request):
+        session = request['session']
+        action = request['action']
+
+        if action == 'init':
+            self.resetLocations()
+            solver = InteractiveSolver(None)
+            solver.initialize(request['romFileName'], request['presetFileName'], magic=request.get('magic'))
+            self.presetFileName = solver.presetFileName
+            self.graphTransitions = self.getTransitions(solver)
+            state = self.getState(solver)
+            self.store(session, solver, state)
+            return {'state': state}
+
+        if request.get('state') is not None:
+            # sent again by the caller, it replaces the one of the daemon
+            self.resetLocations()
+            state = request['state']
+            solverState = SolverState()
+            solverState.state = copy.deepcopy(state)
+            solver = InteractiveSolver(None)
+            solver.loadState(solverState)
+            self.presetFileName = solver.presetFileName
+            self.graphTransitions = self.getTransitions(solver)
+        elif session in self.sessions and self.sessions[session][2] == request.get('stateHash'):
+            (solver, state, stateHash) = self.sessions[session]
+            self.restore(solver, state)
+        else:
+            return {'unknownSession': True}
+
+        solver.doAction(request.get('loc'), action)
+        newState = self.getState(solver)
+        self.store(session, solver, newState)
+        return {'diff': dict([(key, value) for (key, value) in newState.items() if state.get(key) != value])}
+
+class SolverRequestHandler(SocketServer.StreamRequestHandler):
+    def handle(self):
+        sessions = self.server.sessions
+        start = time.time()
+        request = {}
+        try:
+            request = json.loads(self.rfile.readline())
+            response = sessions.handle(request)
+            sessions.log.debug("{} {}: {:.3f}s".format(request['session'], request['action'], time.time()-start))
+        except Exception as e:
+            # the session solver can be in an inconsistent state
+            if request.get('session') in sessions.sessions:
+                del sessions.sessions[request['session']]
+            response = {'error': "{}: {}".format(type(e).__name__, e)}
+        self.wfile.write(json.dumps(response) + '\n')
+
+class SolverServer(SocketServer.UnixStreamServer):
+    def __init__(self, socketFileName, maxSessions):
+        if os.path.exists(socketFileName):
+            os.remove(socketFileName)
+        SocketServer.UnixStreamServer.__init__(self, socketFileName, SolverRequestHandler)
+        self.sessions = SolverSessions(maxSessions)
+
+# client side, return None if the daemon is not running, busy or died
+# while processing the request
+def callSolverDaemon(request, socketFileName=defaultSocket, timeout=clientTimeout):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(socketFileName)
+        sock.sendall(json.dumps(request) + '\n')
+        response = sock.makefile('r').readline()
+    except socket.error:
+        # socket.timeout is a socket.error
+        return None
+    finally:
+        sock.close()
+    # empty or truncated if the daemon died
+    if not response.endswith('\n'):
+        return None
+    return json.loads(response)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Interactive solver daemon")
+    parser.add_argument('--socket', help="the unix socket to listen on",
+                        dest='socket', nargs='?', default=defaultSocket)
+    parser.add_argument('--maxSessions', help="number of solvers kept in memory",
+                        dest='maxSessions', nargs='?', default=256, type=int)
+    parser.add_argument('--debug', '-d', help="activate debug logging", dest='debug', action='store_true')
+    args = parser.parse_args()
+
+    log.init(args.debug)
+    compileLogic()
+
+    server = SolverServer(args.socket, args.maxSessions)
+    print("listening on {}".format(args.socket))
+    try:
+        server.serve_forever()
+    finally:
+        os.remove(args.socket)
@@ -1,15 +1,18 @@
 #!/usr/bin/python
 
-import os, json, random
-from parameters import Knows, Settings, Controller, isKnows, isSettings, isButton
+import os, json, random, hashlib
+from collections import OrderedDict
+from parameters import Knows, Settings, isKnows, isButton
 from parameters import easy, medium, hard, harder, hardcore, mania
 from smbool import SMBool
+from logic_context import getContext
 
 # gauss random in [0, r] range
 # the higher the slope, the less probable extreme values are.
-def randGaussBounds(r, slope=5):
+# rnd: the random generator to use (a random.Random or the random module)
+def randGaussBounds(r, slope=5, rnd=random):
     r = float(r)
-    n = int(round(random.gauss(r/2, r/slope), 0))
+    n = int(round(rnd.gauss(r/2, r/slope), 0))
     if n < 0:
         n = 0
     if n > r:
@@ -30,8 +33,8 @@ def getRangeDict(weightDict):
 
     return rangeDict
 
-def chooseFromRange(rangeDict):
-    r = random.random()
+def chooseFromRange(rangeDict, rnd=random):
+    r = rnd.random()
     val = None
     for v in sorted(rangeDict, key=rangeDict.get):
         val = v
@@ -40,6 +43,10 @@ def chooseFromRange(rangeDict):
     return val
 
 class PresetLoader(object):
+    # compiled presets, keyed on the preset content hash, least recently used first
+    compiled = OrderedDict()
+    maxCompiled = 64
+
     @staticmethod
     def factory(params):
         # can be a json, a python file or a dict with the parameters
@@ -63,35 +70,27 @@ class PresetLoader(object):
             self.params['Controller'] = {}
         self.params['score'] = self.computeScore()
 
-    def load(self):
-        # update the parameters in the parameters classes: Knows, Settings
+    def getKey(self):
+        # hash of the preset content, the same preset can come from several
+        # files or from the web site dicts
+        content = dict([(part, self.params[part]) for part in ['Knows', 'Settings', 'Controller']])
+        return hashlib.md5(json.dumps(content, sort_keys=True)).hexdigest()
 
-        # Knows
-        for param in self.params['Knows']:
-            if isKnows(param) and hasattr(Knows, param):
-                setattr(Knows, param, SMBool(self.params['Knows'][param][0],
-                                             self.params['Knows'][param][1],
-                                             ['{}'.format(param)]))
-        # Settings
-        ## hard rooms
-        for hardRoom in ['X-Ray', 'Gauntlet']:
-            if hardRoom in self.params['Settings']:
-                Settings.hardRooms[hardRoom] = Settings.hardRoomsPresets[hardRoom][self.params['Settings'][hardRoom]]
+    def compile(self):
+        key = self.getKey()
+        compiled = PresetLoader.compiled.pop(key, None)
+        if compiled is None:
+            compiled = CompiledPreset(self.params, key)
+            if len(PresetLoader.compiled) >= PresetLoader.maxCompiled:
+                PresetLoader.compiled.popitem(last=False)
+        # most recently used last
+        PresetLoader.compiled[key] = compiled
+        return compiled
 
-        ## bosses
-        for boss in ['Kraid', 'Phantoon', 'Draygon', 'Ridley', 'MotherBrain']:
-            if boss in self.params['Settings']:
-                Settings.bossesDifficulty[boss] = Settings.bossesDifficultyPresets[boss][self.params['Settings'][boss]]
-
-        ## hellruns
-        for hellRun in ['Ice', 'MainUpperNorfair', 'LowerNorfair']:
-            if hellRun in self.params['Settings']:
-                Settings.hellRuns[hellRun] = Settings.hellRunPresets[hellRun][self.params['Settings'][hellRun]]
-
-        # Controller
-        for button in self.params['Controller']:
-            if isButton(button):
-                setattr(Controller, button, self.params['Controller'][button])
+    # ctx: the logic context to update, the one of the current thread by default
+    def load(self, ctx=None):
+        # update the knows and settings in the logic context
+        self.compile().apply(ctx if ctx is not None else getContext())
 
     def dump(self, fileName):
         with open(fileName, 'w') as jsonFile:
@@ -100,18 +99,16 @@ class PresetLoader(object):
     def printToScreen(self):
         print("self.params: {}".format(self.params))
 
+        ctx = getContext()
         print("loaded knows: ")
-        for knows in Knows.__dict__:
-            if isKnows(knows):
-                print("{}: {}".format(knows, Knows.__dict__[knows]))
+        for knows in ctx.knows:
+            print("{}: {}".format(knows, ctx.knows[knows]))
         print("loaded settings:")
-        for setting in Settings.__dict__:
-            if isSettings(setting):
-                print("{}: {}".format(setting, Settings.__dict__[setting]))
+        for setting in ['hardRooms', 'bossesDifficulty', 'hellRuns']:
+            print("{}: {}".format(setting, getattr(ctx, setting)))
         print("loaded controller:")
-        for button in Controller.__dict__:
-            if isButton(button):
-                print("{}: {}".format(button, Controller.__dict__[button]))
+        for button in ctx.controller:
+            print("{}: {}".format(button, ctx.controller[button]))
         print("loaded score: {}".format(self.params['score']))
 
     def computeScore(self):
@@ -173,15 +170,15 @@ class PresetLoader(object):
         score = 0
 
         # knows
-        for know in Knows.__dict__:
-            if isKnows(know):
-                if know in self.params['Knows']:
-                    if self.params['Knows'][know][0] == True:
-                        score += diff2score[self.params['Knows'][know][1]]
-                else:
-                    # if old preset with not all the knows, use default values for the know
-                    if Knows.__dict__[know][0] == True:
-                        score += diff2score[Knows.__dict__[know][1]]
+        knows = getContext().knows
+        for know in knows:
+            if know in self.params['Knows']:
+                if self.params['Knows'][know][0] == True:
+                    score += diff2score[self.params['Knows'][know][1]]
+            else:
+                # if old preset with not all the knows, use default values for the know
+                if knows[know][0] == True:
+                    score += diff2score[knows[know][1]]
 
         # hard rooms
         hardRoom = 'X-Ray'
@@ -208,6 +205,59 @@ class PresetLoader(object):
 
         return score
 
+class CompiledPreset(object):
+    # the knows and settings values of a preset, resolved once, so that loading
+    # it again is only setting them in a logic context.
+    # only plain values, can be pickled.
+    def __init__(self, params, key):
+        self.key = key
+
+        # [(knows, bool, difficulty)]
+        self.knows = []
+        for param in params['Knows']:
+            if isKnows(param) and hasattr(Knows, param):
+                self.knows.append(('{}'.format(param), params['Knows'][param][0], params['Knows'][param][1]))
+        # Settings
+        self.hardRooms = {}
+        for hardRoom in ['X-Ray', 'Gauntlet']:
+            if hardRoom in params['Settings']:
+                self.hardRooms[hardRoom] = Settings.hardRoomsPresets[hardRoom][params['Settings'][hardRoom]]
+
+        self.bossesDifficulty = {}
+        for boss in ['Kraid', 'Phantoon', 'Draygon', 'Ridley', 'MotherBrain']:
+            if boss in params['Settings']:
+                self.bossesDifficulty[boss] = Settings.bossesDifficultyPresets[boss][params['Settings'][boss]]
+
+        self.hellRuns = {}
+        for hellRun in ['Ice', 'MainUpperNorfair', 'LowerNorfair']:
+            if hellRun in params['Settings']:
+                self.hellRuns[hellRun] = Settings.hellRunPresets[hellRun][params['Settings'][hellRun]]
+
+        self.controller = [(button, params['Controller'][button]) for button in params['Controller'] if isButton(button)]
+
+        # the knows and settings not in the preset keep the values of the
+        # previously loaded preset, so the logic only depends on the preset
+        # if it sets all of them
+        allKnows = [knows for knows in Knows.__dict__ if isKnows(knows)]
+        self.complete = (len(self.knows) == len(allKnows)
+                         and len(self.hardRooms) == len(Settings.hardRooms)
+                         and len(self.bossesDifficulty) == len(Settings.bossesDifficulty)
+                         and len(self.hellRuns) == len(Settings.hellRuns))
+
+    def apply(self, ctx):
+        for (knows, bool, difficulty) in self.knows:
+            ctx.knows[knows] = SMBool(bool, difficulty, [knows])
+        ctx.hardRooms.update(self.hardRooms)
+        ctx.bossesDifficulty.update(self.bossesDifficulty)
+        ctx.hellRuns.update(self.hellRuns)
+        ctx.controller.update(self.controller)
+
+        # cached helpers results depend on the knows and settings
+        if self.complete == True:
+            ctx.cache.switch(self.key)
+        else:
+            ctx.cache.reset()
+
 class PresetLoaderJson(PresetLoader):
     # when called from the test suite
     def __init__(self, jsonFileName):
@@ -5,7 +5,7 @@ path = os.path.expanduser('~/RandomMetroidSolver')
 if os.path.exists(path) and path not in sys.path:
     sys.path.append(path)
 
-import datetime, os, hashlib, json, subprocess, tempfile, glob, random
+import datetime, os, hashlib, json, subprocess, tempfile, glob, random, re
 from datetime import datetime, date
 from collections import OrderedDict
 
@@ -15,7 +15,10 @@ from parameters import Knows, Settings, Controller, isKnows, isButton
 from solver import Conf
 from parameters import diff2text, text2diff
 from solver import StandardSolver, DifficultyDisplayer, InteractiveSolver
-from rom import RomLoader
+from solver_daemon import callSolverDaemon, getStateHash
+from job_queue import JobQueue, defaultDB as jobsDB
+from solver_cache import SolverCache, defaultDB as solverCacheDB
+from rom import RomLoader, FakeROM
 from utils import PresetLoader
 import db
 
@@ -465,11 +468,7 @@ def validateSolverParams():
 
 def canSolveROM(jsonRomFileName):
     with open(jsonRomFileName) as jsonFile:
-        tempDictROM = json.load(jsonFile)
-
-    romDict = {}
-    for address in tempDictROM:
-        romDict[int(address)] = tempDictROM[address]
+        romDict = FakeROM.fromJson(json.load(jsonFile))
 
     # check if the ROM is not a race one protected against solving
     md5sum = getMd5sum(romDict)
@@ -547,6 +546,11 @@ def solver():
 
         redirect(URL(r=request, f='solver'))
 
+    # rom solved by the job queue
+    solvingPosition = None
+    if session.solver.get('jobKey') is not None:
+        solvingPosition = checkSolverJob()
+
     # display result
     result = prepareResult()
 
@@ -564,7 +568,7 @@ def solver():
     # send values to view
     return dict(desc=Knows.desc, stdPresets=stdPresets, comPresets=comPresets, roms=ROMs,
                 lastRomFile=lastRomFile, difficulties=diff2text, categories=Knows.categories,
-                result=result,
+                result=result, solvingPosition=solvingPosition,
                 easy=easy, medium=medium, hard=hard, harder=harder, hardcore=hardcore, mania=mania)
 
 def genJsonFromParams(vars):
@@ -616,10 +620,35 @@ def computeDifficulty(jsonRomFileName, preset):
         return (False, "Race seed is protected from solving")
 
     presetFileName = "{}/{}.json".format(getPresetDir(preset), preset)
-    (fd, jsonFileName) = tempfile.mkstemp()
+
+    # the same rom solved with the same preset and options gives the same result
+    with open(jsonRomFileName) as jsonFile:
+        romDict = json.load(jsonFile)
+    options = [session.solver['difficultyTarget'], session.solver['pickupStrategy'],
+               sorted(session.solver['itemsForbidden']), magic]
+    cacheKey = SolverCache.getKey(romDict, presetFileName, options)
+    solverCache = SolverCache()
+    result = solverCache.get(cacheKey)
+    solverCache.close()
 
     DB = db.DB()
     id = DB.initSolver()
+    DB.addSolverParams(id, randomizedRom, preset, session.solver['difficultyTarget'],
+                       session.solver['pickupStrategy'], session.solver['itemsForbidden'])
+
+    if result is not None:
+        print("solver result from cache: {}".format(cacheKey))
+        # the rom file name is not part of the key
+        result['randomizedRom'] = randomizedRom
+        # no duration, not to count it in the solver durations
+        DB.addSolverResult(id, 0, None, result)
+        DB.close()
+        return (True, result)
+
+    DB.close()
+
+    (fd, jsonFileName) = tempfile.mkstemp()
+    os.close(fd)
 
     params = [
         'python2',  os.path.expanduser("~/RandomMetroidSolver/solver.py"),
@@ -637,8 +666,17 @@ def computeDifficulty(jsonRomFileName, preset):
     for item in session.solver['itemsForbidden']:
         params += ['--itemsForbidden', item]
 
-    DB.addSolverParams(id, randomizedRom, preset, session.solver['difficultyTarget'],
-                       session.solver['pickupStrategy'], session.solver['itemsForbidden'])
+    # to process the result
+    data = {'id': id, 'jsonFileName': jsonFileName, 'cacheKey': cacheKey}
+
+    # the job queue workers solve the rom if they're running,
+    # the result is got when displaying the solver page
+    jobQueue = getJobQueue()
+    if jobQueue is not None:
+        session.solver['jobKey'] = jobQueue.submit('solver', params[2:], data, [jsonFileName])
+        jobQueue.close()
+        print("solver job queued: {}".format(session.solver['jobKey']))
+        return (True, None)
 
     print("before calling solver: {}".format(params))
     start = datetime.now()
@@ -647,20 +685,53 @@ def computeDifficulty(jsonRomFileName, preset):
     duration = (end - start).total_seconds()
     print("ret: {}, duration: {}s".format(ret, duration))
 
+    return solverResult(ret, duration, data)
+
+def solverResult(ret, duration, data):
+    # data: the solver parameters needed to process its result
+    jsonFileName = data['jsonFileName']
     if ret == 0:
         with open(jsonFileName) as jsonFile:
             result = json.load(jsonFile)
+        # failures are not cached, they can come from the server
+        if 'cacheKey' in data:
+            solverCache = SolverCache()
+            solverCache.add(data['cacheKey'], result)
+            solverCache.close()
     else:
         result = "Solver: something wrong happened while solving the ROM"
 
-    DB.addSolverResult(id, ret, duration, result)
+    DB = db.DB()
+    DB.addSolverResult(data['id'], ret, duration, result)
     DB.close()
 
-    os.close(fd)
     os.remove(jsonFileName)
 
     return (ret == 0, result)
 
+def checkSolverJob():
+    # get the result of the solver job of the session, return the job
+    # position in the queue if it's not finished, None if it is.
+    # don't wait for the job here, the solver page reloads itself.
+    jobKey = session.solver['jobKey']
+    jobQueue = JobQueue(jobsDB)
+    try:
+        job = jobQueue.get(jobKey)
+        if job is not None and job['status'] in ['queued', 'running']:
+            return job.get('position', 0)
+        collected = job is not None and jobQueue.collect(jobKey)
+    finally:
+        jobQueue.close()
+
+    session.solver['jobKey'] = None
+    if collected == True:
+        (ok, result) = solverResult(job['ret'], job['finished'] - job['started'], job['data'])
+        if ok == True:
+            session.solver['result'] = result
+        else:
+            response.flash = result
+    return None
+
 def infos():
     # set title
     response.title = 'Super Metroid VARIA Randomizer and Solver'
@@ -1012,6 +1083,22 @@ def randomizerWebService():
         params += ['--controls', controlParam]
 
     DB.addRandoParams(id, params + ['--complexity', request.vars.complexity])
+    DB.close()
+
+    os.close(fd1)
+    os.close(fd2)
+
+    # to process the result
+    data = {'id': id, 'presetFileName': presetFileName, 'jsonFileName': jsonFileName,
+            'magic': magic if useRace == True else None, 'raceMode': request.vars.raceMode}
+
+    # the job queue workers generate the seed if they're running
+    jobQueue = getJobQueue()
+    if jobQueue is not None:
+        jobKey = jobQueue.submit('randomizer', params[2:], data, [presetFileName, jsonFileName])
+        jobQueue.close()
+        print("randomizer job queued: {}".format(jobKey))
+        return json.dumps({'jobKey': jobKey, 'status': 'queued'})
 
     print("before calling: {}".format(params))
     start = datetime.now()
@@ -1020,6 +1107,12 @@ def randomizerWebService():
     duration = (end - start).total_seconds()
     print("ret: {}, duration: {}s".format(ret, duration))
 
+    return randomizerResult(ret, duration, data)
+
+def randomizerResult(ret, duration, data):
+    # data: the randomizer parameters needed to process its result
+    DB = db.DB()
+    jsonFileName = data['jsonFileName']
     if ret == 0:
         with open(jsonFileName) as jsonFile:
             locsItems = json.load(jsonFile)
@@ -1029,25 +1122,17 @@ def randomizerWebService():
         if len(locsItems['errorMsg']) > 0:
             msg = locsItems['errorMsg']
 
-        DB.addRandoResult(id, ret, duration, msg)
+        DB.addRandoResult(data['id'], ret, duration, msg)
 
-        if useRace == True:
-            dictROM = {}
-            # in json keys are strings
-            for address in locsItems:
-                if address in ["fileName", "errorMsg"]:
-                    continue
-                dictROM[int(address)] = locsItems[address]
-            md5sum = getMd5sum(dictROM)
+        if data['magic'] is not None:
+            md5sum = getMd5sum(FakeROM.fromJson(locsItems))
 
-            interval = int(request.vars.raceMode)
-            DB.addRace(md5sum, interval, magic)
+            interval = int(data['raceMode'])
+            DB.addRace(md5sum, interval, data['magic'])
 
         DB.close()
 
-        os.close(fd1)
-        os.remove(presetFileName)
-        os.close(fd2)
+        os.remove(data['presetFileName'])
         os.remove(jsonFileName)
 
         return json.dumps(locsItems)
@@ -1059,15 +1144,53 @@ def randomizerWebService():
         except:
             msg = "randomizerWebService: something wrong happened"
 
-        DB.addRandoResult(id, ret, duration, msg)
+        DB.addRandoResult(data['id'], ret, duration, msg)
         DB.close()
 
-        os.close(fd1)
-        os.remove(presetFileName)
-        os.close(fd2)
+        os.remove(data['presetFileName'])
         os.remove(jsonFileName)
         raise HTTP(400, json.dumps(msg))
 
+def getJobQueue():
+    # the job queue if its workers are running, None to run the job in the web2py process
+    if not os.path.exists(jobsDB):
+        return None
+    jobQueue = JobQueue(jobsDB)
+    if jobQueue.workersAlive() == 0:
+        jobQueue.close()
+        return None
+    return jobQueue
+
+def jobWebService():
+    # status of a randomizer job, and its result when it's finished.
+    # wait: optional, to wait for the end of the job (at most 10s)
+    response.headers['Access-Control-Allow-Origin'] = '*'
+
+    jobKey = request.vars.jobKey
+    if jobKey is None or re.match('^[0-9a-f]{32}$', jobKey) is None:
+        raiseHttp(400, "Wrong value for jobKey", True)
+    try:
+        wait = min(max(float(request.vars.wait or 0), 0), 10)
+    except ValueError:
+        raiseHttp(400, "Wrong value for wait", True)
+
+    if not os.path.exists(jobsDB):
+        raiseHttp(404, "Unknown job", True)
+    jobQueue = JobQueue(jobsDB)
+    try:
+        job = jobQueue.wait(jobKey, wait)
+        if job is None or job['type'] != 'randomizer':
+            raiseHttp(404, "Unknown job", True)
+        if job['status'] in ['queued', 'running']:
+            return json.dumps({'jobKey': jobKey, 'status': job['status'], 'position': job.get('position', 0)})
+        # the result is sent only once, the files are removed
+        if jobQueue.collect(jobKey) == False:
+            raiseHttp(410, "Job result already sent", True)
+    finally:
+        jobQueue.close()
+
+    return randomizerResult(job['ret'], job['finished'] - job['started'], job['data'])
+
 def presetWebService():
     # web service to get the content of the preset file
     if request.vars.preset == None:
@@ -1186,11 +1309,26 @@ def stats():
 
     (fsStatus, fsPercent) = getFsUsage()
 
+    # job queue depth and times of the last hour
+    jobsStats = None
+    if os.path.exists(jobsDB):
+        jobQueue = JobQueue(jobsDB)
+        jobsStats = jobQueue.stats()
+        jobQueue.close()
+
+    # solver results cache hit rate
+    solverCacheStats = None
+    if os.path.exists(solverCacheDB):
+        solverCache = SolverCache(solverCacheDB)
+        solverCacheStats = solverCache.stats()
+        solverCache.close()
+
     return dict(solverPresets=solverPresets, randomizerPresets=randomizerPresets,
                 solverDurations=solverDurations, randomizerDurations=randomizerDurations,
                 solverData=solverData, randomizerData=randomizerData,
                 isolver=isolver, isolverData=isolverData, errors=errors,
-                fsStatus=fsStatus, fsPercent=fsPercent)
+                fsStatus=fsStatus, fsPercent=fsPercent, jobsStats=jobsStats,
+                solverCacheStats=solverCacheStats)
 
 def tracker():
     response.title = 'Super Metroid VARIA Randomizer and Solver Area and Item Tracker'
@@ -1348,11 +1486,46 @@ def returnState(state):
     else:
         raiseHttp(200, "OK", True)
 
+def callDaemonSolver(params):
+    # use the solver daemon if it's running, return None if not
+    if response.session_id is None:
+        return None
+    params['session'] = response.session_id
+    if params['action'] != 'init':
+        # the daemon doesn't have the session state if the previous action
+        # was done by solver.py
+        params['stateHash'] = getStateHash(session.tracker["item"]["state"])
+
+    start = datetime.now()
+    ret = callSolverDaemon(params)
+    if ret is not None and ret.get('unknownSession') == True:
+        # daemon restarted, session evicted or not the same state, send the whole state
+        params['state'] = session.tracker["item"]["state"]
+        ret = callSolverDaemon(params)
+    end = datetime.now()
+    duration = (end - start).total_seconds()
+    print("daemon: {}, duration: {}s".format(params['action'], duration))
+
+    if ret is not None and 'error' in ret:
+        print("daemon error: {}".format(ret['error']))
+        raiseHttp(400, "Something wrong happened while solving the ROM", True)
+    return ret
+
 def callSolverInit(jsonRomFileName, presetFileName, preset, romFileName):
     (canSolve, magic) = canSolveROM(jsonRomFileName)
     if canSolve == False:
         raiseHttp(400, "Race seed is protected from solving")
 
+    ret = callDaemonSolver({'action': 'init', 'romFileName': str(jsonRomFileName),
+                            'presetFileName': presetFileName, 'magic': magic})
+    if ret is not None:
+        DB = db.DB()
+        DB.addISolver(preset, romFileName)
+        DB.close()
+
+        session.tracker["item"]["state"] = ret['state']
+        return returnState(ret['state'])
+
     (fd, jsonOutFileName) = tempfile.mkstemp()
     params = [
         'python2',  os.path.expanduser("~/RandomMetroidSolver/solver.py"),
@@ -1394,6 +1567,14 @@ def callSolverAction(action, locName=None):
     if "state" not in session.tracker["item"]:
         raiseHttp(400, "Missing Solver state in the session", True)
 
+    ret = callDaemonSolver({'action': action, 'loc': locName})
+    if ret is not None:
+        # only the changed parts of the state are returned
+        state = session.tracker["item"]["state"]
+        state.update(ret['diff'])
+        session.tracker["item"]["state"] = state
+        return returnState(state)
+
     (fd1, jsonInFileName) = tempfile.mkstemp()
     (fd2, jsonOutFileName) = tempfile.mkstemp()
     params = [
@@ -1469,6 +1650,7 @@ def getMagic():
     return random.randint(1, 0xffff)
 
 def getMd5sum(romDict):
+    # romDict is a dict of address: value or a FakeROM
     # keep only the items bytes
     addresses = [0x78264, 0x78404, 0x78432, 0x7852C, 0x78614, 0x786DE, 0x7879E, 0x787C2, 0x787FA, 0x78824, 0x78876, 0x7896E, 0x7899C, 0x78ACA, 0x78B24, 0x78BA4, 0x78BAC, 0x78C36, 0x78C3E, 0x78C82, 0x78CCA, 0x79108, 0x79110, 0x79184, 0x7C2E9, 0x7C337, 0x7C365, 0x7C36D, 0x7C47D, 0x7C559, 0x7C5E3, 0x7C6E5, 0x7C755, 0x7C7A7, 0x781CC, 0x781E8, 0x781EE, 0x781F4, 0x78248, 0x783EE, 0x78464, 0x7846A, 0x78478, 0x78486, 0x784AC, 0x784E4, 0x78518, 0x7851E, 0x78532, 0x78538, 0x78608, 0x7860E, 0x7865C, 0x78676, 0x7874C, 0x78798, 0x787D0, 0x78802, 0x78836, 0x7883C, 0x788CA, 0x7890E, 0x78914, 0x789EC, 0x78AE4, 0x78B46, 0x78BC0, 0x78BE6, 0x78BEC, 0x78C04, 0x78C14, 0x78C2A, 0x78C44, 0x78C52, 0x78C66, 0x78C74, 0x78CBC, 0x78E6E, 0x78E74, 0x78F30, 0x78FCA, 0x78FD2, 0x790C0, 0x79100, 0x7C265, 0x7C2EF, 0x7C319, 0x7C357, 0x7C437, 0x7C43D, 0x7C483, 0x7C4AF, 0x7C4B5, 0x7C533, 0x7C5DD, 0x7C5EB, 0x7C5F1, 0x7C603, 0x7C609, 0x7C74D]
     values = []